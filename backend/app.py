@@ -17,6 +17,8 @@ import glob
 # Añadir directorio scripts al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
+from run_metrics import RunMetricsStore
+
 app = Flask(__name__)
 CORS(app)
 
@@ -25,6 +27,7 @@ BASE_DIR = Path(__file__).parent.parent
 SITES_DIR = BASE_DIR / 'sites'
 METADATA_DIR = BASE_DIR / 'data' / 'sites_metadata'
 SCRIPTS_DIR = BASE_DIR / 'scripts'
+GENERATED_SITES_DIR = Path(os.getenv('OUTPUT_BASE_DIR', str(BASE_DIR / 'generated_sites')))
 
 # Asegurar que los directorios existen
 SITES_DIR.mkdir(exist_ok=True)
@@ -93,14 +96,22 @@ def get_stats():
             latest_file = max(site_files, key=os.path.getmtime)
             last_generation = datetime.fromtimestamp(os.path.getmtime(latest_file)).isoformat()
         
+        # Métricas reales: el orquestador ingiere sus run_summary al terminar
+        metrics = RunMetricsStore(GENERATED_SITES_DIR)
+        run_stats = metrics.obtener_estadisticas()
+        
         return jsonify({
             'success': True,
             'stats': {
                 'totalSites': total_sites,
                 'recentSites': recent_sites,
-                'totalArticles': total_sites * 15,  # Aproximación
-                'lastGeneration': last_generation,
-                'metadataFiles': len(metadata_files)
+                'totalArticles': run_stats['total_articulos'],
+                'lastGeneration': last_generation or run_stats['ultimo_run'],
+                'metadataFiles': len(metadata_files),
+                'totalRuns': run_stats['total_runs'],
+                'articlesPerMinute': run_stats['articulos_por_minuto'],
+                'runDuration': run_stats['duracion_total'],
+                'stageDurations': run_stats['pasos']
             }
         })
     except Exception as e:
@@ -110,6 +121,24 @@ def get_stats():
         }), 500
 
 
+@app.route('/api/metrics/sites', methods=['GET'])
+def get_site_metrics():
+    """Obtiene estadísticas reales por sitio generado"""
+    try:
+        metrics = RunMetricsStore(GENERATED_SITES_DIR)
+        
+        return jsonify({
+            'success': True,
+            'sites': metrics.obtener_sitios(),
+            'stats': metrics.obtener_estadisticas()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/sites/generate', methods=['POST'])
 def generate_sites():
     """Genera nuevos sitios de noticias"""
@@ -111,7 +111,7 @@ def servir_sitio(site_path: Path, port: int = 8000):
     print(f"{Colors.CYAN}{'═'*70}{Colors.ENDC}\n")
     
     try:
-        subprocess.run(['python3', '-m', 'http.server', str(port)], cwd=site_path)
+        subprocess.run(['python3', 'scripts/serve_sites.py', '--site', site_path.name, '--port', str(port)])
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}🛑 Servidor detenido{Colors.ENDC}")
     except Exception as e:
@@ -134,7 +134,7 @@ def menu_servir_sitios():
         print_menu("🌐 SERVIR SITIOS EN NAVEGADOR", [
             ('1', f'🚀 Servir último sitio (site_1) en puerto 8000'),
             ('2', f'📋 Seleccionar sitio específico'),
-            ('3', f'🌍 Servir todos los sitios (puertos múltiples)'),
+            ('3', f'🌍 Servir todos los sitios (un solo servidor)'),
             ('4', f'📊 Listar todos los sitios disponibles ({len(sites)} sitios)')
         ])
         
@@ -184,35 +184,23 @@ def menu_servir_sitios():
                 pause()
         
         elif choice == '3':
-            # Servir todos los sitios
+            # Servir todos los sitios desde un solo servidor
+            print(f"\n{Colors.GREEN}🌍 Sirviendo {len(sites)} sitios en http://localhost:8000{Colors.ENDC}\n")
+            for site in sites[:10]:
+                print(f"  🌐 {site.name}: http://localhost:8000/{site.name}/")
             if len(sites) > 10:
-                print(f"\n{Colors.YELLOW}⚠️  Hay {len(sites)} sitios. Esto abrirá muchos servidores.{Colors.ENDC}")
-                confirm = input(f"{Colors.CYAN}¿Continuar? (s/N): {Colors.ENDC}").strip().lower()
-                if confirm != 's':
-                    continue
-            
-            print(f"\n{Colors.GREEN}🌍 Iniciando servidores para {len(sites)} sitios...{Colors.ENDC}\n")
-            print(f"{Colors.YELLOW}IMPORTANTE:{Colors.ENDC}")
-            print(f"  - Cada sitio se servirá en un puerto diferente")
-            print(f"  - Los servidores se ejecutarán en segundo plano")
-            print(f"  - Para detener, usa: pkill -f 'http.server'")
-            print(f"\n{Colors.CYAN}{'═'*70}{Colors.ENDC}\n")
+                print(f"  ... y {len(sites) - 10} más (índice en http://localhost:8000/)")
             
-            for idx, site in enumerate(sites):
-                port = 8000 + idx
-                print(f"  🌐 {site.name}: http://localhost:{port}")
-                
-                # Ejecutar en segundo plano
-                subprocess.Popen(
-                    ['python3', '-m', 'http.server', str(port)],
-                    cwd=site,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+            # Ejecutar en segundo plano
+            subprocess.Popen(
+                ['python3', 'scripts/serve_sites.py', '--all', '--port', '8000'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
             
-            print(f"\n{Colors.GREEN}✅ {len(sites)} servidores iniciados{Colors.ENDC}")
-            print(f"\n{Colors.YELLOW}Para detener todos los servidores:{Colors.ENDC}")
-            print(f"  pkill -f 'http.server'")
+            print(f"\n{Colors.GREEN}✅ Servidor iniciado{Colors.ENDC}")
+            print(f"\n{Colors.YELLOW}Para detenerlo:{Colors.ENDC}")
+            print(f"  pkill -f 'serve_sites.py'")
             pause()
         
         elif choice == '4':
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Cliente de Generación de Imágenes con IA
+Envía muchos prompts a un modelo de imagen (Flux Schnell vía Blackbox) con
+concurrencia acotada y guarda cada resultado en una cache por hash de
+prompt, compartida entre ejecuciones: un prompt idéntico (en el mismo
+lote, en otro hilo o en una ejecución posterior) no se vuelve a pagar.
+
+La respuesta se lee en streaming: si la imagen viene en base64 dentro del
+mensaje, se decodifica por bloques directo al archivo sin armar el JSON ni
+el string completo en memoria; si viene como URL, se descarga por bloques.
+
+BLACKBOX_BASE_URL (o base_url) permite apuntar a mock_llm_server.py.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import requests
+from dotenv import load_dotenv
+
+from pipeline_tracer import trazar
+from storage_backend import DiskStorage, StorageBackend
+from utils.blackbox import api_url
+
+load_dotenv()
+
+# Flux Schnell: rápido y económico ($0.003/imagen)
+DEFAULT_MODEL = 'blackboxai/black-forest-labs/flux-schnell'
+
+# Bloque de lectura de la red (múltiplo de 4 para no partir grupos base64 sin necesidad)
+BLOQUE_RED = 64 * 1024
+
+# Caracteres del valor que se inspeccionan para decidir si es una imagen en base64
+VENTANA_CLASIFICACION = 256
+
+# Inicio en base64 de JPEG, PNG, WEBP y GIF (imagen sin prefijo data:)
+PREFIJOS_BASE64 = (b'/9j/', b'iVBOR', b'UklGR', b'R0lGOD')
+
+# Claves JSON que traen la imagen: mensaje de chat o b64_json estilo /images
+_RE_CLAVE = re.compile(rb'"(?:content|b64_json)"\s*:\s*"')
+_RE_NO_BASE64 = re.compile(rb'[^A-Za-z0-9+/=]')
+_RE_URL = re.compile(r'https?://[^\s<>")]+')
+
+
+def ruta_cache_por_defecto() -> Path:
+    """data/ai_image_cache en la raíz del proyecto (o AI_IMAGE_CACHE_DIR)"""
+    ruta = os.getenv('AI_IMAGE_CACHE_DIR')
+    if ruta:
+        return Path(ruta)
+    return Path(__file__).parent.parent / 'data' / 'ai_image_cache'
+
+
+def clave_prompt(prompt: str, modelo: str = DEFAULT_MODEL) -> str:
+    """
+    Hash de un prompt para la cache (los espacios repetidos no cuentan)
+
+    Args:
+        prompt: Prompt de la imagen
+        modelo: Modelo que la genera
+
+    Returns:
+        SHA-256 hexadecimal
+    """
+    normalizado = ' '.join(prompt.split())
+    return hashlib.sha256(f"{modelo}\n{normalizado}".encode('utf-8')).hexdigest()
+
+
+class DecodificadorBase64:
+    """
+    Decodifica base64 que llega por fragmentos (bytes de un string JSON,
+    con escapes como \\/ o \\n) y escribe los bytes en un archivo
+    """
+
+    def __init__(self, archivo):
+        """
+        Args:
+            archivo: Destino con write(bytes)
+        """
+        self.archivo = archivo
+        self.bytes = 0
+        self._pendiente = b''
+        self._escape = b''
+
+    def escribir(self, fragmento: bytes):
+        """Decodifica y escribe los grupos completos de 4 caracteres"""
+        fragmento = self._escape + fragmento
+        self._escape = b''
+        if fragmento.endswith(b'\\'):
+            # Escape partido entre dos fragmentos
+            fragmento, self._escape = fragmento[:-1], b'\\'
+        fragmento = fragmento.replace(b'\\/', b'/')
+        for escape in (b'\\n', b'\\r', b'\\t'):
+            fragmento = fragmento.replace(escape, b'')
+        datos = self._pendiente + _RE_NO_BASE64.sub(b'', fragmento)
+        corte = len(datos) - len(datos) % 4
+        self._pendiente = datos[corte:]
+        if corte:
+            self._escribir(base64.b64decode(datos[:corte]))
+
+    def cerrar(self) -> int:
+        """
+        Decodifica el resto (base64 sin padding)
+
+        Returns:
+            Bytes escritos
+        """
+        if self._pendiente.rstrip(b'='):
+            self._escribir(base64.b64decode(self._pendiente + b'=' * (-len(self._pendiente) % 4)))
+        self._pendiente = b''
+        return self.bytes
+
+    def _escribir(self, datos: bytes):
+        self.archivo.write(datos)
+        self.bytes += len(datos)
+
+
+def _inicio_base64(ventana: bytes) -> Optional[int]:
+    """
+    Posición donde empieza la imagen dentro del valor, o None si el valor
+    no es una imagen en base64 (texto con una URL)
+    """
+    marcador = ventana.find(b'base64,')
+    if marcador >= 0 and b'http' not in ventana[:marcador]:
+        return marcador + len(b'base64,')
+    if ventana.replace(b'\\/', b'/').startswith(PREFIJOS_BASE64):
+        return 0
+    return None
+
+
+def _contenido_json(cuerpo: bytes) -> str:
+    """Contenido del mensaje (o b64_json) de una respuesta completa"""
+    resultado = json.loads(cuerpo)
+    if resultado.get('choices'):
+        return resultado['choices'][0].get('message', {}).get('content') or ''
+    if resultado.get('data'):
+        return resultado['data'][0].get('b64_json') or resultado['data'][0].get('url') or ''
+    return ''
+
+
+class AIImageClient:
+    """Generación de imágenes por lotes con cache por hash de prompt"""
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        model: str = DEFAULT_MODEL,
+        cache_dir: Union[str, Path] = None,
+        max_concurrencia: int = 4,
+        timeout: int = 60,
+        reintentos: int = 3,
+        storage: StorageBackend = None
+    ):
+        """
+        Args:
+            api_key: Key de Blackbox (default: BLACKBOX_API_KEY)
+            base_url: Servidor compatible (default: BLACKBOX_BASE_URL)
+            model: Modelo de imagen
+            cache_dir: Directorio de la cache (default: ruta_cache_por_defecto())
+            max_concurrencia: Generaciones simultáneas
+            timeout: Segundos por request
+            reintentos: Intentos ante 429/5xx o errores de red
+            storage: Storage donde se copian las imágenes a su destino
+        """
+        self.api_key = api_key or os.getenv('BLACKBOX_API_KEY')
+        if not self.api_key:
+            raise ValueError("BLACKBOX_API_KEY no encontrada en .env")
+
+        self.api_url = api_url(base_url)
+        self.model = model
+        self.cache_dir = Path(cache_dir) if cache_dir else ruta_cache_por_defecto()
+        self.max_concurrencia = max(1, max_concurrencia)
+        self.timeout = timeout
+        self.reintentos = max(1, reintentos)
+        self.storage = storage or DiskStorage()
+        # La cache es siempre local, aunque el sitio se publique en otro storage
+        self._cache = DiskStorage()
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._en_vuelo: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._sesiones = threading.local()
+        self.stats = {
+            'solicitudes': 0,
+            'generadas': 0,
+            'desde_cache': 0,
+            'duplicadas': 0,
+            'errores': 0,
+            'reintentos': 0,
+            'bytes': 0,
+        }
+
+    # -- Cache ------------------------------------------------------------------
+
+    def ruta_cache(self, clave: str) -> Path:
+        """Archivo de la cache para una clave (dos niveles para no saturar un directorio)"""
+        return self.cache_dir / clave[:2] / clave
+
+    def en_cache(self, prompt: str) -> Optional[Path]:
+        """Imagen ya generada para el prompt, o None"""
+        ruta = self.ruta_cache(clave_prompt(prompt, self.model))
+        return ruta if ruta.is_file() and ruta.stat().st_size else None
+
+    # -- Lotes --------------------------------------------------------------------
+
+    def generar_lote(
+        self,
+        prompts: Sequence[str],
+        destinos: Sequence[Optional[Union[str, Path]]] = None,
+        progreso: Callable[[int, int], None] = None
+    ) -> List[Dict]:
+        """
+        Genera una imagen por prompt con a lo sumo max_concurrencia requests
+        en vuelo; los prompts repetidos o ya generados no se envían
+
+        Args:
+            prompts: Prompts de las imágenes
+            destinos: Ruta de salida de cada imagen (None = solo la cache)
+            progreso: Callback (imágenes listas, total)
+
+        Returns:
+            Por prompt, en orden: dict con clave, ruta, bytes, desde_cache y
+            error (None si se generó)
+        """
+        destinos = list(destinos) if destinos is not None else [None] * len(prompts)
+        if len(destinos) != len(prompts):
+            raise ValueError("prompts y destinos deben tener el mismo largo")
+
+        futuros = [self._solicitar(prompt) for prompt in prompts]
+        resultados = []
+        for hechas, (futuro, destino) in enumerate(zip(futuros, destinos), 1):
+            resultados.append(self._resultado(futuro, destino))
+            if progreso:
+                progreso(hechas, len(prompts))
+        return resultados
+
+    def generar(self, prompt: str, destino: Union[str, Path] = None) -> Dict:
+        """Genera una imagen (ver generar_lote)"""
+        return self.generar_lote([prompt], [destino])[0]
+
+    def _solicitar(self, prompt: str) -> Future:
+        """Future con la ruta en cache del prompt: cache, request en vuelo o request nuevo"""
+        clave = clave_prompt(prompt, self.model)
+        with self._lock:
+            self.stats['solicitudes'] += 1
+            futuro = self._en_vuelo.get(clave)
+            if futuro is not None:
+                self.stats['duplicadas'] += 1
+                return futuro
+
+            ruta = self.ruta_cache(clave)
+            if ruta.is_file() and ruta.stat().st_size:
+                self.stats['desde_cache'] += 1
+                with trazar("llm.imagen", "llm", modelo=self.model) as span:
+                    span.marcar_cache_hit()
+                futuro = Future()
+                futuro.set_result((clave, ruta, True))
+                return futuro
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_concurrencia)
+            futuro = self._pool.submit(self._generar_en_cache, clave, prompt)
+            self._en_vuelo[clave] = futuro
+        futuro.add_done_callback(lambda _: self._liberar(clave))
+        return futuro
+
+    def _liberar(self, clave: str):
+        with self._lock:
+            self._en_vuelo.pop(clave, None)
+
+    def _resultado(self, futuro: Future, destino) -> Dict:
+        """Espera una imagen y la copia a su destino"""
+        try:
+            clave, ruta, desde_cache = futuro.result()
+            if destino is not None:
+                self.storage.copiar(ruta, destino)
+            return {
+                'clave': clave,
+                'ruta': str(destino if destino is not None else ruta),
+                'bytes': ruta.stat().st_size,
+                'desde_cache': desde_cache,
+                'error': None,
+            }
+        except Exception as e:
+            return {'clave': None, 'ruta': None, 'bytes': 0, 'desde_cache': False, 'error': str(e)}
+
+    # -- Requests -----------------------------------------------------------------
+
+    def _sesion(self) -> requests.Session:
+        """Sesión por hilo: reutiliza conexiones entre requests"""
+        sesion = getattr(self._sesiones, 'sesion', None)
+        if sesion is None:
+            sesion = self._sesiones.sesion = requests.Session()
+        return sesion
+
+    def _contar(self, campo: str, delta: int = 1):
+        with self._lock:
+            self.stats[campo] += delta
+
+    def _generar_en_cache(self, clave: str, prompt: str):
+        """
+        Pide la imagen y la deja en la cache (corre en el pool)
+
+        Returns:
+            (clave, ruta en cache, False)
+        """
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.7,
+            "max_tokens": 1000
+        }
+        ruta = self.ruta_cache(clave)
+        error = None
+        for intento in range(self.reintentos):
+            espera = 2 ** intento
+            with trazar("llm.imagen", "llm", modelo=self.model) as span:
+                try:
+                    with self._sesion().post(
+                        self.api_url, headers=self.headers, json=payload, timeout=self.timeout, stream=True
+                    ) as response:
+                        if response.status_code == 429 or response.status_code >= 500:
+                            error = f"HTTP {response.status_code}"
+                            espera = float(response.headers.get('Retry-After') or espera)
+                        else:
+                            response.raise_for_status()
+                            bytes_imagen = self._guardar_respuesta(response, ruta, span)
+                            self._contar('generadas')
+                            self._contar('bytes', bytes_imagen)
+                            return clave, ruta, False
+                except (requests.HTTPError, ValueError) as e:
+                    # 4xx o respuesta sin imagen: reintentar volvería a cobrar lo mismo
+                    self._contar('errores')
+                    raise Exception(f"Error en API: {e}")
+                except requests.RequestException as e:
+                    error = str(e)
+                if intento < self.reintentos - 1:
+                    span.marcar_reintento()
+            if intento < self.reintentos - 1:
+                self._contar('reintentos')
+                time.sleep(min(espera, 30))
+        self._contar('errores')
+        raise Exception(f"No se pudo generar la imagen tras {self.reintentos} intentos: {error}")
+
+    def _guardar_respuesta(self, response: requests.Response, ruta: Path, span) -> int:
+        """
+        Lee la respuesta en streaming y escribe la imagen en la ruta (atómico)
+
+        Returns:
+            Bytes de la imagen
+        """
+        bloques = response.iter_content(BLOQUE_RED)
+        cabecera = bytearray()
+        inicio_valor = None
+        for bloque in bloques:
+            span.registrar_bytes(entrada=len(bloque))
+            cabecera += bloque
+            if inicio_valor is None:
+                encontrado = _RE_CLAVE.search(cabecera)
+                inicio_valor = encontrado.end() if encontrado else None
+            if inicio_valor is not None and len(cabecera) - inicio_valor >= VENTANA_CLASIFICACION:
+                break
+        else:
+            # Respuesta corta: se interpreta completa
+            return self._guardar_contenido(_contenido_json(bytes(cabecera)), ruta, span)
+
+        inicio = _inicio_base64(bytes(cabecera[inicio_valor:inicio_valor + VENTANA_CLASIFICACION]))
+        if inicio is None:
+            # Texto largo (sin imagen inline): se lee completo para buscar la URL
+            for bloque in bloques:
+                span.registrar_bytes(entrada=len(bloque))
+                cabecera += bloque
+            return self._guardar_contenido(_contenido_json(bytes(cabecera)), ruta, span)
+
+        # Imagen inline: se decodifica por bloques hasta la comilla que cierra el valor
+        with self._cache.abrir(ruta, 'wb') as f:
+            decodificador = DecodificadorBase64(f)
+            pendiente = bytes(cabecera[inicio_valor + inicio:])
+            del cabecera
+            while True:
+                fin = pendiente.find(b'"')
+                if fin >= 0:
+                    decodificador.escribir(pendiente[:fin])
+                    break
+                decodificador.escribir(pendiente)
+                pendiente = next(bloques, None)
+                if pendiente is None:
+                    raise requests.exceptions.ChunkedEncodingError("Respuesta cortada antes del final de la imagen")
+                span.registrar_bytes(entrada=len(pendiente))
+            total = decodificador.cerrar()
+            if not total:
+                raise ValueError("La respuesta no contiene una imagen")
+        return total
+
+    def _guardar_contenido(self, contenido: str, ruta: Path, span) -> int:
+        """
+        Guarda la imagen de un mensaje ya leído: URL a descargar o base64
+
+        Returns:
+            Bytes de la imagen
+        """
+        inicio = _inicio_base64(contenido[:VENTANA_CLASIFICACION].encode('utf-8'))
+        if inicio is None:
+            urls = _RE_URL.findall(contenido)
+            if urls:
+                return self._descargar(urls[0], ruta, span)
+            if len(contenido) <= 1000:
+                raise ValueError("No se pudo extraer imagen de la respuesta")
+            # base64 sin prefijo reconocible
+            inicio = 0
+
+        with self._cache.abrir(ruta, 'wb') as f:
+            decodificador = DecodificadorBase64(f)
+            decodificador.escribir(contenido[inicio:].encode('ascii', 'ignore'))
+            total = decodificador.cerrar()
+            if not total:
+                raise ValueError("La respuesta no contiene una imagen")
+        return total
+
+    def _descargar(self, url: str, ruta: Path, span) -> int:
+        """Descarga una imagen por bloques a la ruta (atómico)"""
+        with self._sesion().get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            with self._cache.abrir(ruta, 'wb') as f:
+                for bloque in response.iter_content(BLOQUE_RED):
+                    span.registrar_bytes(entrada=len(bloque))
+                    f.write(bloque)
+        if not f.bytes:
+            ruta.unlink(missing_ok=True)
+            raise ValueError(f"Descarga vacía: {url}")
+        return f.bytes
+
+    # -- Ciclo de vida --------------------------------------------------------------
+
+    def cerrar(self):
+        """Espera los requests en vuelo y termina el pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
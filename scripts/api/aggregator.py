@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Agregador Multi-Proveedor de Noticias
+Consulta a la vez todos los proveedores configurados (NewsAPI, APITube,
+Newsdata y WorldNews), cada uno con su propio timeout y paginación, normaliza
+con normalize_article y entrega un solo flujo de artículos sin duplicados
+entre proveedores, en el orden en que van llegando.
+"""
+
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Directorio api/ (fetchers) y scripts/ (utils, registro) en el path
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, API_DIR)
+sys.path.insert(0, os.path.dirname(API_DIR))
+
+import apitube
+import newsapi
+import newsdata
+import worldnews
+from article_registry import canonicalizar_url
+from near_duplicate_clusterer import normalizar
+from utils.utils import completar_texto_completo, normalize_article
+
+
+def _pagina_newsapi(consulta: Dict, pagina: int, page_size: int, timeout: float) -> List[Dict]:
+    crudos = newsapi.fetch_newsapi(
+        query=consulta["query"],
+        language=consulta["language"],
+        page_size=page_size,
+        enrich=False,
+        silent=True,
+        page=pagina,
+        timeout=timeout,
+    )
+    return [normalize_article(a, "newsapi") for a in crudos]
+
+
+def _pagina_apitube(consulta: Dict, pagina: int, page_size: int, timeout: float) -> List[Dict]:
+    return apitube.fetch_apitube(
+        country=consulta["country"],
+        category=consulta["category"],
+        language=consulta["language"],
+        page_size=page_size,
+        silent=True,
+        page=pagina,
+        timeout=timeout,
+    )
+
+
+def _pagina_newsdata(consulta: Dict, pagina: int, page_size: int, timeout: float) -> List[Dict]:
+    # Newsdata pagina con un token (nextPage) que el fetcher no expone: solo la primera
+    if pagina > 1:
+        return []
+    return newsdata.fetch_newsdata(
+        query=consulta["query"],
+        country=consulta["country"],
+        language=consulta["language"],
+        category=consulta["category"],
+        page_size=page_size,
+        silent=True,
+        timeout=timeout,
+    )
+
+
+def _pagina_worldnews(consulta: Dict, pagina: int, page_size: int, timeout: float) -> List[Dict]:
+    return worldnews.fetch_worldnews(
+        query=consulta["query"],
+        source_country=consulta["country"],
+        language=consulta["language"],
+        number=page_size,
+        silent=True,
+        offset=(pagina - 1) * page_size,
+        timeout=timeout,
+    )
+
+
+# nombre -> (módulo con API_KEY, función de página)
+PROVEEDORES = {
+    "newsapi": (newsapi, _pagina_newsapi),
+    "apitube": (apitube, _pagina_apitube),
+    "newsdata": (newsdata, _pagina_newsdata),
+    "worldnews": (worldnews, _pagina_worldnews),
+}
+
+_FIN = object()
+
+
+def proveedores_configurados() -> List[str]:
+    """Proveedores con API key en el entorno"""
+    return [nombre for nombre, (modulo, _) in PROVEEDORES.items() if modulo.API_KEY]
+
+
+class NewsAggregator:
+    """Fan-out de descargas a varios proveedores con deduplicación entre ellos"""
+
+    def __init__(
+        self,
+        proveedores: Optional[List[str]] = None,
+        timeout_proveedor: float = 20.0,
+        max_paginas: int = 3,
+        page_size: int = 20,
+    ):
+        """
+        Args:
+            proveedores: Nombres a consultar (default: todos los configurados)
+            timeout_proveedor: Segundos máximos por proveedor (todas sus páginas)
+            max_paginas: Páginas máximas por proveedor
+            page_size: Artículos por página
+        """
+        self.proveedores = proveedores if proveedores is not None else proveedores_configurados()
+        desconocidos = set(self.proveedores) - set(PROVEEDORES)
+        if desconocidos:
+            raise ValueError(f"Proveedores desconocidos: {', '.join(sorted(desconocidos))}")
+
+        self.timeout_proveedor = timeout_proveedor
+        self.max_paginas = max_paginas
+        self.page_size = page_size
+        self.stats: Dict[str, Dict] = {}
+
+    def _descargar_proveedor(self, nombre: str, consulta: Dict, cola: queue.Queue):
+        """Pagina un proveedor hasta agotar páginas, resultados o su tiempo"""
+        _, pagina_fn = PROVEEDORES[nombre]
+        stats = self.stats[nombre]
+        inicio = time.monotonic()
+        limite = inicio + self.timeout_proveedor
+
+        try:
+            for pagina in range(1, self.max_paginas + 1):
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    stats["agotado_tiempo"] = True
+                    break
+
+                articulos = pagina_fn(consulta, pagina, self.page_size, restante)
+                stats["paginas"] += 1
+                if articulos:
+                    cola.put((nombre, articulos))
+                if len(articulos) < self.page_size:
+                    break
+        except Exception as e:
+            stats["error"] = str(e)
+        finally:
+            stats["segundos"] = round(time.monotonic() - inicio, 3)
+            cola.put((nombre, _FIN))
+
+    def _clave_titulo(self, article: Dict) -> str:
+        return normalizar(article.get("title") or "")
+
+    def iterar(
+        self,
+        query: str = "política México",
+        language: str = "es",
+        country: str = "mx",
+        category: str = "politics",
+    ) -> Iterator[Dict]:
+        """
+        Consulta todos los proveedores en paralelo y entrega artículos a medida
+        que llegan, descartando los ya entregados por otro proveedor (misma
+        URL canónica o mismo título normalizado)
+
+        Args:
+            query: Términos de búsqueda (proveedores con búsqueda libre)
+            language: Código de idioma
+            country: Código de país
+            category: Categoría (proveedores con categorías)
+
+        Yields:
+            Artículos normalizados
+        """
+        consulta = {"query": query, "language": language, "country": country, "category": category}
+        self.stats = {
+            nombre: {"paginas": 0, "articulos": 0, "duplicados": 0, "segundos": 0.0, "error": None, "agotado_tiempo": False}
+            for nombre in self.proveedores
+        }
+        if not self.proveedores:
+            return
+
+        cola: queue.Queue = queue.Queue()
+        urls_vistas, titulos_vistos = set(), set()
+        pendientes = set(self.proveedores)
+        # Margen para que un proveedor colgado no bloquee al resto
+        limite_global = time.monotonic() + self.timeout_proveedor + 2
+
+        executor = ThreadPoolExecutor(max_workers=len(self.proveedores))
+        try:
+            for nombre in self.proveedores:
+                executor.submit(self._descargar_proveedor, nombre, consulta, cola)
+
+            while pendientes:
+                restante = limite_global - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    nombre, articulos = cola.get(timeout=restante)
+                except queue.Empty:
+                    break
+
+                if articulos is _FIN:
+                    pendientes.discard(nombre)
+                    continue
+
+                for article in articulos:
+                    url = canonicalizar_url(article.get("url", ""))
+                    titulo = self._clave_titulo(article)
+                    if (url and url in urls_vistas) or (titulo and titulo in titulos_vistos):
+                        self.stats[nombre]["duplicados"] += 1
+                        continue
+                    if url:
+                        urls_vistas.add(url)
+                    if titulo:
+                        titulos_vistos.add(titulo)
+                    self.stats[nombre]["articulos"] += 1
+                    yield article
+        finally:
+            for nombre in pendientes:
+                self.stats[nombre]["agotado_tiempo"] = True
+            # No esperar a proveedores colgados: sus resultados se descartan
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def descargar(
+        self,
+        max_articulos: int = 100,
+        enrich: bool = True,
+        filtrar: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+        silent: bool = False,
+        **consulta,
+    ) -> List[Dict]:
+        """
+        Descarga, deduplica y enriquece hasta max_articulos artículos
+
+        Args:
+            max_articulos: Artículos máximos a retornar
+            enrich: Si debe extraer el texto completo faltante (en paralelo)
+            filtrar: Recibe los artículos normalizados y retorna los que se
+                deben enriquecer (p. ej. descartar los ya procesados)
+            silent: No imprimir progreso
+            **consulta: query, language, country, category (ver iterar)
+
+        Returns:
+            Lista de artículos normalizados
+        """
+        if not silent:
+            print(f"\n{'=' * 70}")
+            print(f"📥 Descargando de {len(self.proveedores)} proveedores en paralelo: {', '.join(self.proveedores)}")
+            print(f"{'=' * 70}")
+
+        articles = []
+        for article in self.iterar(**consulta):
+            articles.append(article)
+            if len(articles) >= max_articulos:
+                break
+
+        if not silent:
+            for nombre, stats in self.stats.items():
+                estado = f"❌ {stats['error']}" if stats["error"] else ("⏱️ timeout" if stats["agotado_tiempo"] else "✅")
+                print(
+                    f"  {estado} {nombre}: {stats['articulos']} artículos, "
+                    f"{stats['duplicados']} duplicados, {stats['paginas']} páginas, {stats['segundos']}s"
+                )
+
+        if filtrar is not None:
+            articles = filtrar(articles)
+
+        if enrich and articles:
+            if not silent:
+                print("\n📝 Extrayendo texto completo...")
+            completar_texto_completo(articles, verbose=not silent)
+
+        return articles
+
+
+def main():
+    """Función principal para ejecutar el script"""
+    import argparse
+
+    from utils.utils import print_summary, save_articles
+
+    parser = argparse.ArgumentParser(description="Descargar noticias de todos los proveedores configurados")
+    parser.add_argument("--query", type=str, default="política México", help="Términos de búsqueda")
+    parser.add_argument("--language", type=str, default="es", help="Código de idioma (default: es)")
+    parser.add_argument("--max", type=int, default=100, help="Artículos máximos (default: 100)")
+    parser.add_argument("--timeout", type=float, default=20.0, help="Segundos por proveedor (default: 20)")
+    parser.add_argument("--paginas", type=int, default=3, help="Páginas por proveedor (default: 3)")
+    parser.add_argument("--no-enrich", action="store_true", help="No extraer texto completo")
+    parser.add_argument("--exportar", action="store_true", help="Exportar además a JSON y CSV")
+
+    args = parser.parse_args()
+
+    aggregator = NewsAggregator(timeout_proveedor=args.timeout, max_paginas=args.paginas)
+    if not aggregator.proveedores:
+        print("❌ No hay proveedores configurados en .env")
+        exit(1)
+
+    articles = aggregator.descargar(
+        max_articulos=args.max,
+        enrich=not args.no_enrich,
+        query=args.query,
+        language=args.language,
+    )
+    rutas = save_articles(articles, "multi", exportar=args.exportar)
+    print_summary(articles, "Multi-proveedor", *rutas)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 # Agregar directorio padre al path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.utils import normalize_article, save_articles, print_summary
+from pipeline_tracer import trazar
 
 load_dotenv()
 
@@ -26,7 +27,9 @@ def fetch_apitube(country: str = 'mx',
                   category: str = 'politics',
                   language: str = 'es',
                   page_size: int = 20,
-                  silent: bool = False) -> list:
+                  silent: bool = False,
+                  page: int = 1,
+                  timeout: float = 30) -> list:
     """
     Descarga noticias de APITube.io
     
@@ -35,6 +38,8 @@ def fetch_apitube(country: str = 'mx',
         category: Categoría de noticias (politics, business, etc.)
         language: Código de idioma
         page_size: Número de artículos a obtener
+        page: Página de resultados (1 = la primera)
+        timeout: Timeout HTTP en segundos
         
     Returns:
         Lista de artículos descargados
@@ -56,12 +61,15 @@ def fetch_apitube(country: str = 'mx',
         'category': category,
         'language': language,
         'pageSize': page_size,
+        'page': page,
         'apiKey': API_KEY
     }
     
     try:
-        response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        with trazar("http.apitube", "http") as span:
+            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=timeout)
+            span.registrar_respuesta(response)
+            response.raise_for_status()
         
         data = response.json()
         articles = data.get('data', [])
@@ -79,18 +87,21 @@ def fetch_apitube(country: str = 'mx',
         for article in articles:
             normalized.append(normalize_article(article, 'apitube'))
         
-        # Guardar resultados solo si no es modo silencioso
+        # Guardar resultados solo si no es modo silencioso. La CLI sigue
+        # exportando apitube_*.json: paraphrase.py y flujo-completo.sh lo leen
         if not silent:
-            json_file, csv_file = save_articles(normalized, 'apitube')
-            print_summary(normalized, 'APITube.io', json_file, csv_file)
+            rutas = save_articles(normalized, 'apitube', exportar=True)
+            print_summary(normalized, 'APITube.io', *rutas)
         
         return normalized
         
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error de conexión: {e}")
+        if not silent:
+            print(f"❌ Error de conexión: {e}")
         raise
     except Exception as e:
-        print(f"❌ Error procesando datos: {e}")
+        if not silent:
+            print(f"❌ Error procesando datos: {e}")
         raise
 
 
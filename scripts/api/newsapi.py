@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 # Agregar directorio padre al path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.utils import enrich_with_full_text, print_summary, save_articles
+from pipeline_tracer import trazar
 
 load_dotenv()
 
@@ -28,6 +29,8 @@ def fetch_newsapi(
     page_size: int = 20,
     enrich: bool = True,
     silent: bool = False,
+    page: int = 1,
+    timeout: float = 30,
 ) -> list:
     """
     Descarga noticias de NewsAPI.org
@@ -37,6 +40,8 @@ def fetch_newsapi(
         language: Código de idioma
         page_size: Número de artículos a obtener
         enrich: Si debe extraer texto completo
+        page: Página de resultados (1 = la primera)
+        timeout: Timeout HTTP en segundos
 
     Returns:
         Lista de artículos descargados
@@ -58,11 +63,14 @@ def fetch_newsapi(
         "language": language,
         "sortBy": "publishedAt",
         "pageSize": page_size,
+        "page": page,
     }
 
     try:
-        response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        with trazar("http.newsapi", "http") as span:
+            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=timeout)
+            span.registrar_respuesta(response)
+            response.raise_for_status()
 
         data = response.json()
 
@@ -94,16 +102,20 @@ def fetch_newsapi(
                 str(generated_sites_dir) if generated_sites_dir.exists() else "."
             )
 
-            json_file, csv_file = save_articles(articles, "newsapi", output_dir)
-            print_summary(articles, "NewsAPI.org", json_file, csv_file)
+            # La CLI sigue exportando newsapi_*.json: paraphrase.py,
+            # blackbox_parallel.py, gemini_paraphraser.py y flujo-completo.sh lo leen
+            rutas = save_articles(articles, "newsapi", output_dir, exportar=True)
+            print_summary(articles, "NewsAPI.org", *rutas)
 
         return articles
 
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error de conexión: {e}")
+        if not silent:
+            print(f"❌ Error de conexión: {e}")
         raise
     except Exception as e:
-        print(f"❌ Error procesando datos: {e}")
+        if not silent:
+            print(f"❌ Error procesando datos: {e}")
         raise
 
 
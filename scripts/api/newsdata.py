@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 # Agregar directorio padre al path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.utils import normalize_article, save_articles, print_summary
+from pipeline_tracer import trazar
 
 load_dotenv()
 
@@ -27,7 +28,8 @@ def fetch_newsdata(query: str = 'política México',
                    language: str = 'es',
                    category: str = 'politics',
                    page_size: int = 10,
-                   silent: bool = False) -> list:
+                   silent: bool = False,
+                   timeout: float = 30) -> list:
     """
     Descarga noticias de Newsdata.io
     
@@ -37,6 +39,7 @@ def fetch_newsdata(query: str = 'política México',
         language: Código de idioma
         category: Categoría de noticias
         page_size: Número de artículos (máx 10 en plan gratuito)
+        timeout: Timeout HTTP en segundos
         
     Returns:
         Lista de artículos descargados
@@ -63,8 +66,10 @@ def fetch_newsdata(query: str = 'política México',
     }
     
     try:
-        response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        with trazar("http.newsdata", "http") as span:
+            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=timeout)
+            span.registrar_respuesta(response)
+            response.raise_for_status()
         
         data = response.json()
         
@@ -86,18 +91,21 @@ def fetch_newsdata(query: str = 'política México',
         for article in articles:
             normalized.append(normalize_article(article, 'newsdata'))
         
-        # Guardar resultados solo si no es modo silencioso
+        # Guardar resultados solo si no es modo silencioso. La CLI sigue
+        # exportando newsdata_*.json: paraphrase.py y flujo-completo.sh lo leen
         if not silent:
-            json_file, csv_file = save_articles(normalized, 'newsdata')
-            print_summary(normalized, 'Newsdata.io', json_file, csv_file)
+            rutas = save_articles(normalized, 'newsdata', exportar=True)
+            print_summary(normalized, 'Newsdata.io', *rutas)
         
         return normalized
         
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error de conexión: {e}")
+        if not silent:
+            print(f"❌ Error de conexión: {e}")
         raise
     except Exception as e:
-        print(f"❌ Error procesando datos: {e}")
+        if not silent:
+            print(f"❌ Error procesando datos: {e}")
         raise
 
 
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 # Agregar directorio padre al path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.utils import normalize_article, save_articles, print_summary
+from pipeline_tracer import trazar
 
 load_dotenv()
 
@@ -30,7 +31,9 @@ def fetch_worldnews(query: str = 'política México',
                     language: str = 'es',
                     number: int = 20,
                     earliest_publish_date: str = None,
-                    silent: bool = False) -> list:
+                    silent: bool = False,
+                    offset: int = 0,
+                    timeout: float = 30) -> list:
     """
     Descarga noticias de WorldNewsAPI
     
@@ -40,6 +43,8 @@ def fetch_worldnews(query: str = 'política México',
         language: Código de idioma
         number: Número de artículos a obtener
         earliest_publish_date: Fecha mínima (YYYY-MM-DD)
+        offset: Resultados a saltar (paginación)
+        timeout: Timeout HTTP en segundos
         
     Returns:
         Lista de artículos descargados
@@ -60,7 +65,8 @@ def fetch_worldnews(query: str = 'política México',
         'text': query,
         'source-countries': source_country,
         'language': language,
-        'number': number
+        'number': number,
+        'offset': offset
     }
     
     if earliest_publish_date:
@@ -69,8 +75,10 @@ def fetch_worldnews(query: str = 'política México',
             print(f"📅 Desde: {earliest_publish_date}")
     
     try:
-        response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        with trazar("http.worldnews", "http") as span:
+            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=timeout)
+            span.registrar_respuesta(response)
+            response.raise_for_status()
         
         data = response.json()
         articles = data.get('news', [])
@@ -88,19 +96,22 @@ def fetch_worldnews(query: str = 'política México',
         for article in articles:
             normalized.append(normalize_article(article, 'worldnews'))
         
-        # Guardar resultados solo si no es modo silencioso
+        # Guardar resultados solo si no es modo silencioso. La CLI sigue
+        # exportando worldnews_*.json: paraphrase.py y flujo-completo.sh lo leen
         if not silent:
-            json_file, csv_file = save_articles(normalized, 'worldnews')
-            print_summary(normalized, 'WorldNewsAPI', json_file, csv_file)
+            rutas = save_articles(normalized, 'worldnews', exportar=True)
+            print_summary(normalized, 'WorldNewsAPI', *rutas)
         
         return normalized
         
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error de conexión: {e}")
-        print(f"💡 Verifica que tu API key de WorldNewsAPI sea válida")
+        if not silent:
+            print(f"❌ Error de conexión: {e}")
+            print(f"💡 Verifica que tu API key de WorldNewsAPI sea válida")
         raise
     except Exception as e:
-        print(f"❌ Error procesando datos: {e}")
+        if not silent:
+            print(f"❌ Error procesando datos: {e}")
         raise
 
 
@@ -12,17 +12,20 @@ from typing import Dict, List
 import requests
 from dotenv import load_dotenv
 
+from pipeline_tracer import trazar
+from utils.blackbox import api_url
+
 load_dotenv()
 
 API_KEY = os.getenv("BLACKBOX_API_KEY")
-API_URL = "https://api.blackbox.ai/chat/completions"
 
 
 class ArticleExpander:
     """Expande noticias cortas a artículos periodísticos completos"""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None):
         self.api_key = api_key or API_KEY
+        self.api_url = api_url(base_url)
         if not self.api_key:
             raise ValueError("BLACKBOX_API_KEY no encontrada en .env")
 
@@ -153,10 +156,12 @@ Escribe SOLO el artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
         }
 
         try:
-            response = requests.post(
-                API_URL, headers=self.headers, json=payload, timeout=90
-            )
-            response.raise_for_status()
+            with trazar("llm.article_expander", "llm", modelo=payload["model"]) as span:
+                response = requests.post(
+                    self.api_url, headers=self.headers, json=payload, timeout=90
+                )
+                span.registrar_respuesta(response)
+                response.raise_for_status()
 
             result = response.json()
             expanded = result["choices"][0]["message"]["content"].strip()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Generador de Páginas de Artículo
+HTML de article_N.html: contenido con párrafos semánticos, etiquetas y
+sidebar con los artículos relacionados. No guarda estado, así que se puede
+usar tanto en el orquestador como en los procesos de render_executor.py
+"""
+
+from typing import Dict, List
+
+
+class ArticlePageGenerator:
+    """Genera el HTML de las páginas individuales de artículos"""
+
+    def generar_sidebar(
+        self, otras_noticias: List[Dict], metadata: Dict
+    ) -> str:
+        """
+        Genera sidebar con miniaturas de otros artículos
+
+        Args:
+            otras_noticias: Lista de otras noticias con índices
+            metadata: Metadata del sitio
+
+        Returns:
+            str: HTML del sidebar
+        """
+        items_html = []
+        for i, noticia in enumerate(otras_noticias):
+            # Usar el índice de la noticia original si existe
+            article_idx = noticia.get("_display_index", i + 1)
+            title = noticia.get("title", "")
+            title_truncated = title if len(title) <= 80 else title[:80] + "..."
+
+            items_html.append(f"""
+                    <article class="sidebar-article">
+                        <a href="article_{article_idx}.html" class="sidebar-article-link">
+                            <div class="sidebar-article-image">
+                                <img src="images/news_{article_idx}.jpg" alt="{title[:50]}">
+                                <span class="sidebar-category">{noticia.get("category", "General")}</span>
+                            </div>
+                            <div class="sidebar-article-content">
+                                <h3 class="sidebar-article-title">{title_truncated}</h3>
+                                <span class="sidebar-article-date">{noticia.get("published_at", "")[:10]}</span>
+                            </div>
+                        </a>
+                    </article>""")
+
+        sidebar_html = f"""
+                <aside class="article-sidebar">
+                    <div class="sidebar-section">
+                        <h2 class="sidebar-title">Más Noticias</h2>
+                        <div class="sidebar-articles">
+{"".join(items_html)}
+                        </div>
+                    </div>
+
+                    <div class="sidebar-section sidebar-newsletter">
+                        <h3>Suscríbete</h3>
+                        <p>Recibe las últimas noticias en tu correo</p>
+                        <form class="newsletter-form">
+                            <input type="email" placeholder="Tu email" required>
+                            <button type="submit">Suscribirse</button>
+                        </form>
+                    </div>
+                </aside>"""
+
+        return sidebar_html
+
+    def formatear_contenido_html(self, texto: str) -> str:
+        """
+        Convierte texto plano en HTML con estructura semántica y marcado
+        """
+        if not texto:
+            return ""
+
+        # Limpiar el texto: normalizar espacios y saltos de línea
+        texto = texto.strip()
+
+        # Si no hay dobles saltos de línea, intentar dividir por saltos simples
+        # pero solo si hay múltiples líneas
+        if "\n\n" not in texto and "\n" in texto:
+            # Si hay saltos simples pero no dobles, asumir que cada línea es un párrafo
+            parrafos = [p.strip() for p in texto.split("\n") if p.strip()]
+        else:
+            # Dividir por líneas vacías (doble salto de línea)
+            parrafos = [p.strip() for p in texto.split("\n\n") if p.strip()]
+
+        # Si solo hay un párrafo y es muy largo, dividirlo en párrafos más pequeños
+        # pero asegurándonos de no cortar oraciones a la mitad
+        if len(parrafos) == 1 and len(parrafos[0].split()) > 150:
+            # Dividir párrafo largo en segmentos de ~100 palabras, pero respetando oraciones completas
+            palabras = parrafos[0].split()
+            parrafos = []
+            current_parrafo = []
+            current_length = 0
+
+            # Procesar palabra por palabra para encontrar puntos seguidos de espacio o fin de oración
+            for i, palabra in enumerate(palabras):
+                current_parrafo.append(palabra)
+                current_length += len(palabra) + 1  # +1 por el espacio
+
+                # Si hemos alcanzado ~100 palabras y encontramos un punto (posible fin de oración)
+                if len(current_parrafo) >= 100 and (
+                    palabra.endswith(".")
+                    or palabra.endswith("!")
+                    or palabra.endswith("?")
+                ):
+                    # Verificar que no sea una abreviatura común
+                    if not (
+                        palabra.lower().endswith("dr.")
+                        or palabra.lower().endswith("sr.")
+                        or palabra.lower().endswith("sra.")
+                        or palabra.lower().endswith("etc.")
+                        or palabra.lower().endswith("ej.")
+                        or palabra.lower().endswith("e.g.")
+                        or palabra.lower().endswith("i.e.")
+                        or palabra.lower().endswith("u.s.")
+                        or palabra.lower().endswith("u.k.")
+                        or palabra.lower().endswith("a.m.")
+                        or palabra.lower().endswith("p.m.")
+                    ):
+                        # Completar el párrafo y empezar uno nuevo
+                        parrafos.append(" ".join(current_parrafo))
+                        current_parrafo = []
+                        current_length = 0
+
+            # Agregar el último párrafo si hay contenido restante
+            if current_parrafo:
+                parrafos.append(" ".join(current_parrafo))
+
+        # Envolver cada párrafo en tags <p> con clases semánticas
+        html_parrafos = []
+        for i, parrafo in enumerate(parrafos):
+            if parrafo:
+                # Limpiar saltos de línea internos y espacios múltiples
+                parrafo = " ".join(parrafo.split())
+
+                # Primer párrafo como lead/intro
+                if i == 0:
+                    html_parrafos.append(f'<p class="lead">{parrafo}</p>')
+                else:
+                    html_parrafos.append(f"<p>{parrafo}</p>")
+
+        return "\n                    ".join(html_parrafos)
+
+    def generar_html(
+        self,
+        noticia: Dict,
+        idx: int,
+        metadata: Dict,
+        seo_meta_tags: str,
+        sidebar_html: str,
+        etiquetas_html: str,
+        logo_path: str = None,
+    ) -> str:
+        """
+        HTML completo de un artículo
+
+        Args:
+            noticia: Artículo
+            idx: Posición (base 1) del artículo en el sitio
+            metadata: Metadata del sitio
+            seo_meta_tags: Meta tags SEO de la página
+            sidebar_html: HTML del sidebar (generar_sidebar)
+            etiquetas_html: Etiquetas adicionales del artículo
+            logo_path: Logo del sitio (None si no tiene)
+
+        Returns:
+            str: HTML de la página
+        """
+        return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+{seo_meta_tags}
+    <title>{noticia.get("title", "Artículo")} - {metadata["nombre"]}</title>
+    <link rel="stylesheet" href="style.css">
+</head>
+<body>
+    <header class="header">
+        <div class="container">
+            <div class="header-branding">
+                {'<img src="logo.jpg" alt="' + metadata["nombre"] + '" class="logo-img">' if logo_path else ""}
+                <h1 class="logo"><a href="index.html">{metadata["nombre"]}</a></h1>
+            </div>
+            <nav class="nav">
+                <a href="index.html" class="nav-link">Inicio</a>
+                <a href="buscar.html" class="nav-link">Buscar</a>
+            </nav>
+        </div>
+    </header>
+
+    <main class="main article-page">
+        <div class="container">
+            <div class="article-layout">
+                <article class="article-full">
+                    <header class="article-header">
+                        <div class="article-category-badge">{noticia.get("category", "General")}</div>
+                        <h1 class="article-title">{noticia.get("title", "")}</h1>
+                        <div class="article-meta">
+                            <span class="author">Por {noticia.get("author", "Redacción")}</span>
+                            <span class="separator">•</span>
+                            <time class="date">{noticia.get("published_at", "")}</time>
+                        </div>
+                    </header>
+
+                    <figure class="article-image-wrapper">
+                        <img src="images/news_{idx}.jpg" alt="{noticia.get("title", "")}" class="article-image">
+                    </figure>
+
+                    <div class="article-content">
+                    {f'<h2 class="article-subtitle">{noticia.get("description", "")[:200]}{"..." if len(noticia.get("description", "")) > 200 else ""}</h2>' if noticia.get("description") else ""}
+                    {self.formatear_contenido_html(noticia.get("full_article", noticia.get("full_text", noticia.get("content", noticia.get("description", "")))))}
+                    </div>
+
+                    <footer class="article-footer">
+                        <div class="article-tags">
+                            <span class="tag">{noticia.get("category", "General")}</span>{etiquetas_html}
+                        </div>
+                        <div class="article-share">
+                            <span>Compartir:</span>
+                            <a href="#" class="share-link">Facebook</a>
+                            <a href="#" class="share-link">Twitter</a>
+                            <a href="#" class="share-link">WhatsApp</a>
+                        </div>
+                    </footer>
+                </article>
+
+                {sidebar_html}
+            </div>
+        </div>
+    </main>
+
+    <footer class="footer">
+        <div class="container">
+            <p><a href="index.html">← Volver al inicio</a></p>
+            <p>&copy; 2026 {metadata["nombre"]}</p>
+        </div>
+    </footer>
+</body>
+</html>"""
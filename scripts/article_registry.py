@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Registro Persistente de Artículos
+Recuerda entre ejecuciones qué noticias ya se procesaron (SQLite con índices
+por URL, URL canónica y bandas de SimHash del contenido) para que las etapas
+de descarga descarten lo ya conocido antes de enriquecer y parafrasear, y
+reutilicen la salida ya generada.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from near_duplicate_clusterer import normalizar
+
+# Parámetros de tracking que no cambian el contenido de la página
+PARAMETROS_TRACKING = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|ref_src|cmpid|ocid)$", re.I)
+PALABRA = re.compile(r"\w+")
+
+BITS_SIMHASH = 64
+BANDAS_SIMHASH = 4
+BITS_BANDA = BITS_SIMHASH // BANDAS_SIMHASH
+_MASCARA_BANDA = (1 << BITS_BANDA) - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articulos (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL DEFAULT '',
+    url_canonica TEXT NOT NULL DEFAULT '',
+    simhash TEXT NOT NULL,
+    banda_0 INTEGER NOT NULL,
+    banda_1 INTEGER NOT NULL,
+    banda_2 INTEGER NOT NULL,
+    banda_3 INTEGER NOT NULL,
+    titulo TEXT NOT NULL DEFAULT '',
+    primera_vez TEXT NOT NULL,
+    ultima_vez TEXT NOT NULL,
+    veces_visto INTEGER NOT NULL DEFAULT 1,
+    run_id TEXT NOT NULL DEFAULT '',
+    salida TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articulos_url ON articulos(url);
+CREATE INDEX IF NOT EXISTS idx_articulos_url_canonica ON articulos(url_canonica);
+CREATE INDEX IF NOT EXISTS idx_articulos_banda_0 ON articulos(banda_0);
+CREATE INDEX IF NOT EXISTS idx_articulos_banda_1 ON articulos(banda_1);
+CREATE INDEX IF NOT EXISTS idx_articulos_banda_2 ON articulos(banda_2);
+CREATE INDEX IF NOT EXISTS idx_articulos_banda_3 ON articulos(banda_3);
+"""
+
+
+def canonicalizar_url(url: str) -> str:
+    """
+    Normaliza una URL para reconocer la misma nota con distinto tracking
+
+    Args:
+        url: URL tal como la entrega la API
+
+    Returns:
+        URL sin esquema, www, fragmento, barra final ni parámetros de tracking
+        ('' si no hay URL)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    partes = urlsplit(url if "://" in url else f"http://{url}")
+    host = partes.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+
+    query = sorted(
+        (clave, valor)
+        for clave, valor in parse_qsl(partes.query, keep_blank_values=True)
+        if not PARAMETROS_TRACKING.match(clave)
+    )
+    path = partes.path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, urlencode(query), ""))[2:]
+
+
+def simhash(texto: str) -> int:
+    """
+    SimHash de 64 bits sobre pares de palabras del texto normalizado
+
+    Args:
+        texto: Texto a resumir (título + descripción)
+
+    Returns:
+        Huella de 64 bits (textos casi iguales difieren en pocos bits)
+    """
+    palabras = PALABRA.findall(normalizar(texto))
+    rasgos = [f"{a} {b}" for a, b in zip(palabras, palabras[1:])] or palabras
+    if not rasgos:
+        return 0
+
+    pesos = [0] * BITS_SIMHASH
+    for rasgo in rasgos:
+        h = int.from_bytes(hashlib.blake2b(rasgo.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(BITS_SIMHASH):
+            pesos[bit] += 1 if h >> bit & 1 else -1
+
+    return sum(1 << bit for bit, peso in enumerate(pesos) if peso > 0)
+
+
+def bandas_simhash(huella: int) -> List[int]:
+    """Divide la huella en BANDAS_SIMHASH bloques de 16 bits"""
+    return [(huella >> (banda * BITS_BANDA)) & _MASCARA_BANDA for banda in range(BANDAS_SIMHASH)]
+
+
+def distancia_hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class ArticleRegistry:
+    """
+    Registro SQLite de artículos vistos. Un artículo es conocido si coincide
+    su URL, su URL canónica o si su SimHash está a max_distancia bits o menos
+    de uno registrado. Con max_distancia < BANDAS_SIMHASH, dos huellas cercanas
+    comparten al menos una banda completa, así que basta consultar por bandas.
+    """
+
+    def __init__(self, db_path: str, max_distancia: int = 3):
+        """
+        Args:
+            db_path: Archivo SQLite del registro
+            max_distancia: Bits distintos máximos para considerar mismo contenido
+        """
+        if max_distancia >= BANDAS_SIMHASH:
+            raise ValueError(f"max_distancia debe ser menor que {BANDAS_SIMHASH}")
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_distancia = max_distancia
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+        self.stats = {"consultados": 0, "nuevos": 0, "reutilizados": 0, "duplicados_lote": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self.conn.close()
+
+    @staticmethod
+    def _huella(article: Dict) -> Dict:
+        """Claves de búsqueda de un artículo (crudo de la API o normalizado)"""
+        url = (article.get("url") or article.get("link") or "").strip()
+        texto = f"{article.get('title') or ''} {article.get('description') or ''}"
+        huella = simhash(texto)
+        return {
+            "url": url,
+            "url_canonica": canonicalizar_url(url),
+            "simhash": huella,
+            "bandas": bandas_simhash(huella),
+            "titulo": (article.get("title") or "")[:300],
+        }
+
+    def _buscar_fila(self, huella: Dict) -> Optional[sqlite3.Row]:
+        if huella["url"]:
+            fila = self.conn.execute(
+                "SELECT * FROM articulos WHERE url = ? OR url_canonica = ? ORDER BY id LIMIT 1",
+                (huella["url"], huella["url_canonica"]),
+            ).fetchone()
+            if fila is not None:
+                return fila
+
+        if huella["simhash"] == 0:
+            # Sin texto: la huella no distingue nada
+            return None
+
+        filas = self.conn.execute(
+            "SELECT * FROM articulos WHERE banda_0 = ? OR banda_1 = ? OR banda_2 = ? OR banda_3 = ? ORDER BY id",
+            huella["bandas"],
+        )
+        for fila in filas:
+            if distancia_hamming(int(fila["simhash"], 16), huella["simhash"]) <= self.max_distancia:
+                return fila
+        return None
+
+    def buscar(self, article: Dict) -> Optional[Dict]:
+        """
+        Busca un artículo en el registro
+
+        Args:
+            article: Artículo con url/title/description
+
+        Returns:
+            Registro (con 'salida' ya decodificada) o None si es desconocido
+        """
+        self.stats["consultados"] += 1
+        fila = self._buscar_fila(self._huella(article))
+        if fila is None:
+            return None
+        registro = dict(fila)
+        registro["salida"] = json.loads(fila["salida"]) if fila["salida"] else None
+        return registro
+
+    def _insertar(self, huella: Dict, run_id: str, ahora: str, salida: Optional[str] = None) -> int:
+        cursor = self.conn.execute(
+            """INSERT INTO articulos
+               (url, url_canonica, simhash, banda_0, banda_1, banda_2, banda_3,
+                titulo, primera_vez, ultima_vez, run_id, salida)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                huella["url"], huella["url_canonica"], f"{huella['simhash']:016x}",
+                *huella["bandas"], huella["titulo"], ahora, ahora, run_id, salida,
+            ),
+        )
+        return cursor.lastrowid
+
+    def filtrar_nuevos(self, articles: List[Dict], run_id: str = "") -> Tuple[List[Dict], List[Dict]]:
+        """
+        Separa artículos nuevos de los ya procesados y registra los vistos
+
+        Un artículo conocido cuya ejecución anterior no guardó salida (p. ej.
+        porque falló) se vuelve a procesar. Los repetidos dentro del mismo
+        lote se descartan.
+
+        Args:
+            articles: Artículos recién descargados
+            run_id: Identificador de la ejecución actual
+
+        Returns:
+            Tupla (nuevos a procesar, salidas previas reutilizables)
+        """
+        ahora = datetime.now().isoformat()
+        nuevos, reutilizables = [], []
+        vistos_lote = set()
+
+        for article in articles:
+            self.stats["consultados"] += 1
+            huella = self._huella(article)
+            fila = self._buscar_fila(huella)
+
+            if fila is None:
+                vistos_lote.add(self._insertar(huella, run_id, ahora))
+                nuevos.append(article)
+                self.stats["nuevos"] += 1
+                continue
+
+            if fila["id"] in vistos_lote:
+                self.stats["duplicados_lote"] += 1
+                continue
+            vistos_lote.add(fila["id"])
+
+            self.conn.execute(
+                "UPDATE articulos SET ultima_vez = ?, veces_visto = veces_visto + 1, run_id = ? WHERE id = ?",
+                (ahora, run_id, fila["id"]),
+            )
+            if fila["salida"]:
+                salida = json.loads(fila["salida"])
+                salida["reused_from_registry"] = True
+                reutilizables.append(salida)
+                self.stats["reutilizados"] += 1
+            else:
+                nuevos.append(article)
+                self.stats["nuevos"] += 1
+
+        self.conn.commit()
+        return nuevos, reutilizables
+
+    def guardar_salidas(self, salidas: List[Dict], run_id: str = "") -> int:
+        """
+        Guarda la salida final (parafraseada y categorizada) de cada artículo
+
+        La salida se asocia por URL, que los parafraseadores conservan.
+        Las salidas con error no se guardan, para reintentarlas luego.
+
+        Args:
+            salidas: Artículos procesados
+            run_id: Identificador de la ejecución actual
+
+        Returns:
+            Número de salidas guardadas
+        """
+        ahora = datetime.now().isoformat()
+        guardadas = 0
+
+        for salida in salidas:
+            if salida.get("paraphrase_method") == "error" or salida.get("paraphrased") is False:
+                continue
+            url = (salida.get("url") or "").strip()
+            if not url:
+                continue
+
+            datos = {k: v for k, v in salida.items() if k != "reused_from_registry"}
+            serializada = json.dumps(datos, ensure_ascii=False, default=str)
+            cursor = self.conn.execute(
+                "UPDATE articulos SET salida = ?, ultima_vez = ? WHERE url = ? OR url_canonica = ?",
+                (serializada, ahora, url, canonicalizar_url(url)),
+            )
+            if cursor.rowcount == 0:
+                self._insertar(self._huella(salida), run_id, ahora, serializada)
+            guardadas += 1
+
+        self.conn.commit()
+        return guardadas
+
+    def total(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articulos").fetchone()[0]
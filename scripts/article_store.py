@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Almacén de Artículos
+Archivo append-only de todas las descargas en SQLite (en lugar de un JSON y
+un CSV por ejecución): columnas indexadas por fecha, fuente y categoría para
+filtrar sin leer el resto, proyección de columnas (títulos y categorías sin
+full_text), lecturas con memory-map y búsqueda de texto completo con FTS5.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# Columnas del artículo normalizado (utils.normalize_article + categorías),
+# separadas en ligeras (filas cortas, se escanean rápido) y de texto
+COLUMNAS_LIGERAS = (
+    "url",
+    "source",
+    "source_name",
+    "title",
+    "author",
+    "image_url",
+    "published_at",
+    "category_id",
+    "category_name",
+)
+COLUMNAS_TEXTO = ("description", "content", "full_text")
+COLUMNAS = COLUMNAS_LIGERAS + COLUMNAS_TEXTO
+COLUMNAS_RESUMEN = ("url", "source", "title", "published_at", "category_id", "category_name")
+# Valores que se repiten entre artículos: al cargar se internan para que
+# miles de artículos compartan un solo objeto por valor
+COLUMNAS_REPETIDAS = ("source", "source_name", "author", "category_id", "category_name")
+# Columnas propias del almacén
+COLUMNAS_ALMACEN = ("id", "fecha", "lote", "ingestado", "extra")
+
+FECHA_ISO = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS articulos (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in COLUMNAS_LIGERAS)},
+    fecha TEXT NOT NULL DEFAULT '',
+    lote TEXT NOT NULL DEFAULT '',
+    ingestado TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articulos_texto (
+    id INTEGER PRIMARY KEY REFERENCES articulos(id),
+    {", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in COLUMNAS_TEXTO)},
+    extra TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articulos_url ON articulos(url) WHERE url != '';
+CREATE INDEX IF NOT EXISTS idx_articulos_fecha ON articulos(fecha);
+CREATE INDEX IF NOT EXISTS idx_articulos_source_fecha ON articulos(source, fecha);
+CREATE INDEX IF NOT EXISTS idx_articulos_categoria_fecha ON articulos(category_id, fecha);
+CREATE INDEX IF NOT EXISTS idx_articulos_lote ON articulos(lote);
+"""
+
+# Índice de texto completo sin copia del contenido (se lee de articulos_texto)
+SCHEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articulos_fts USING fts5(
+    title, description, full_text,
+    content='', tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+
+def ruta_por_defecto() -> Path:
+    """data/articles.sqlite3 en la raíz del proyecto (o ARTICLE_STORE_PATH)"""
+    ruta = os.getenv("ARTICLE_STORE_PATH")
+    if ruta:
+        return Path(ruta)
+    return Path(__file__).parent.parent / "data" / "articles.sqlite3"
+
+
+def _texto(valor) -> str:
+    if valor is None:
+        return ""
+    if isinstance(valor, str):
+        return valor
+    if isinstance(valor, dict) and "name" in valor:
+        # source de NewsAPI sin normalizar: {"id": ..., "name": ...}
+        return valor.get("name") or ""
+    return json.dumps(valor, ensure_ascii=False, default=str)
+
+
+class ArticleStore:
+    """Almacén append-only de artículos con filtros por columna indexada"""
+
+    def __init__(self, db_path: Optional[str] = None, mmap_mb: int = 256):
+        """
+        Args:
+            db_path: Archivo SQLite (default: ruta_por_defecto())
+            mmap_mb: Tamaño del memory-map para lecturas (0 = desactivado)
+        """
+        self.db_path = Path(db_path) if db_path else ruta_por_defecto()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA mmap_size={mmap_mb * 1024 * 1024}")
+        self.conn.executescript(SCHEMA)
+
+        try:
+            self.conn.executescript(SCHEMA_FTS)
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite compilado sin FTS5: buscar_texto cae a LIKE
+            self.fts = False
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self.conn.close()
+
+    def agregar(self, articles: List[Dict], lote: str = "") -> int:
+        """
+        Agrega artículos (las URLs ya almacenadas se ignoran)
+
+        Args:
+            articles: Artículos normalizados (claves extra se guardan en 'extra')
+            lote: Identificador de la descarga (p. ej. newsapi_20250101_1200)
+
+        Returns:
+            Número de artículos nuevos almacenados
+        """
+        ingestado = datetime.now().isoformat(timespec="seconds")
+        nuevos = 0
+
+        with self.conn:
+            for article in articles:
+                ligeras = [_texto(article.get(c)) for c in COLUMNAS_LIGERAS]
+                published_at = ligeras[COLUMNAS_LIGERAS.index("published_at")]
+                fecha = published_at[:10] if FECHA_ISO.match(published_at) else ""
+
+                cursor = self.conn.execute(
+                    f"INSERT OR IGNORE INTO articulos ({', '.join(COLUMNAS_LIGERAS)}, fecha, lote, ingestado) "
+                    f"VALUES ({', '.join('?' * (len(COLUMNAS_LIGERAS) + 3))})",
+                    (*ligeras, fecha, lote, ingestado),
+                )
+                if cursor.rowcount == 0:
+                    continue
+
+                article_id = cursor.lastrowid
+                textos = [_texto(article.get(c)) for c in COLUMNAS_TEXTO]
+                extra = {k: v for k, v in article.items() if k not in COLUMNAS}
+                self.conn.execute(
+                    f"INSERT INTO articulos_texto (id, {', '.join(COLUMNAS_TEXTO)}, extra) "
+                    f"VALUES ({', '.join('?' * (len(COLUMNAS_TEXTO) + 2))})",
+                    (article_id, *textos, json.dumps(extra, ensure_ascii=False, default=str) if extra else None),
+                )
+                if self.fts:
+                    self.conn.execute(
+                        "INSERT INTO articulos_fts (rowid, title, description, full_text) VALUES (?, ?, ?, ?)",
+                        (article_id, ligeras[COLUMNAS_LIGERAS.index("title")], textos[0], textos[2]),
+                    )
+                nuevos += 1
+
+        return nuevos
+
+    @staticmethod
+    def _seleccion(columnas: List[str]):
+        """SELECT de las columnas pedidas; la tabla de texto solo se une si hace falta"""
+        invalidas = set(columnas) - set(COLUMNAS) - set(COLUMNAS_ALMACEN)
+        if invalidas:
+            raise ValueError(f"Columnas desconocidas: {', '.join(sorted(invalidas))}")
+
+        de_texto = set(COLUMNAS_TEXTO) | {"extra"}
+        seleccion = ", ".join(f"t.{c}" if c in de_texto else f"a.{c}" for c in columnas)
+        union = " JOIN articulos_texto t ON t.id = a.id" if de_texto & set(columnas) else ""
+        return seleccion, union
+
+    def _consulta(
+        self,
+        columnas: Optional[Sequence[str]],
+        desde: Optional[str],
+        hasta: Optional[str],
+        fuentes: Optional[Sequence[str]],
+        categorias: Optional[Sequence[str]],
+        lote: Optional[str],
+        limite: Optional[int],
+        recientes_primero: bool,
+    ):
+        columnas = list(columnas) if columnas else list(COLUMNAS) + ["extra"]
+        condiciones, parametros = [], []
+        if desde:
+            condiciones.append("fecha >= ?")
+            parametros.append(desde[:10])
+        if hasta:
+            condiciones.append("fecha <= ?")
+            parametros.append(hasta[:10])
+        if fuentes:
+            condiciones.append(f"source IN ({', '.join('?' * len(fuentes))})")
+            parametros.extend(fuentes)
+        if categorias:
+            condiciones.append(f"category_id IN ({', '.join('?' * len(categorias))})")
+            parametros.extend(categorias)
+        if lote is not None:
+            condiciones.append("lote = ?")
+            parametros.append(lote)
+
+        seleccion, union = self._seleccion(columnas)
+        sql = f"SELECT {seleccion} FROM articulos a{union}"
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+        sql += f" ORDER BY a.id {'DESC' if recientes_primero else 'ASC'}"
+        if limite:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+        return columnas, sql, parametros
+
+    @staticmethod
+    def _fila_a_dict(columnas: List[str], fila: tuple) -> Dict:
+        article = dict(zip(columnas, fila))
+        extra = article.pop("extra", None)
+        if extra:
+            article.update(json.loads(extra))
+        for columna in COLUMNAS_REPETIDAS:
+            valor = article.get(columna)
+            if type(valor) is str:
+                article[columna] = sys.intern(valor)
+        return article
+
+    def iterar(
+        self,
+        columnas: Optional[Sequence[str]] = None,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        fuentes: Optional[Sequence[str]] = None,
+        categorias: Optional[Sequence[str]] = None,
+        lote: Optional[str] = None,
+        limite: Optional[int] = None,
+        recientes_primero: bool = True,
+        tamano_bloque: int = 1000,
+    ) -> Iterator[Dict]:
+        """
+        Recorre artículos filtrados sin cargarlos todos en memoria
+
+        Args:
+            columnas: Columnas a leer (default: todas); 'extra' agrega las claves no estándar
+            desde: Fecha mínima de publicación (YYYY-MM-DD, inclusive)
+            hasta: Fecha máxima de publicación (YYYY-MM-DD, inclusive)
+            fuentes: Valores de 'source' aceptados
+            categorias: Valores de 'category_id' aceptados
+            lote: Solo artículos de esta descarga
+            limite: Máximo de artículos
+            recientes_primero: Orden de ingesta descendente
+            tamano_bloque: Filas por lectura
+
+        Yields:
+            Artículos con las columnas pedidas
+        """
+        columnas, sql, parametros = self._consulta(
+            columnas, desde, hasta, fuentes, categorias, lote, limite, recientes_primero
+        )
+        cursor = self.conn.execute(sql, parametros)
+        while True:
+            filas = cursor.fetchmany(tamano_bloque)
+            if not filas:
+                return
+            for fila in filas:
+                yield self._fila_a_dict(columnas, fila)
+
+    def cargar(self, **filtros) -> List[Dict]:
+        """Como iterar(), pero retorna una lista"""
+        return list(self.iterar(**filtros))
+
+    def contar(
+        self,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        fuentes: Optional[Sequence[str]] = None,
+        categorias: Optional[Sequence[str]] = None,
+        lote: Optional[str] = None,
+    ) -> int:
+        """Número de artículos que cumplen los filtros (solo usa índices)"""
+        _, sql, parametros = self._consulta(["id"], desde, hasta, fuentes, categorias, lote, None, True)
+        sql = sql.replace("SELECT a.id FROM", "SELECT COUNT(*) FROM", 1).rsplit(" ORDER BY", 1)[0]
+        return self.conn.execute(sql, parametros).fetchone()[0]
+
+    def ultimo_lote(self, prefijo: str = "") -> Optional[str]:
+        """Lote de la descarga más reciente (opcionalmente con un prefijo)"""
+        fila = self.conn.execute(
+            "SELECT lote FROM articulos WHERE lote != '' AND lote LIKE ? ORDER BY id DESC LIMIT 1",
+            (f"{prefijo}%",),
+        ).fetchone()
+        return fila[0] if fila else None
+
+    def buscar_texto(
+        self, consulta: str, columnas: Optional[Sequence[str]] = None, limite: int = 20
+    ) -> List[Dict]:
+        """
+        Búsqueda de texto completo en título, descripción y full_text
+
+        Args:
+            consulta: Términos (sintaxis FTS5; palabras sueltas = AND)
+            columnas: Columnas a retornar (default: COLUMNAS_RESUMEN)
+            limite: Máximo de resultados
+
+        Returns:
+            Artículos ordenados por relevancia (bm25)
+        """
+        columnas = list(columnas or COLUMNAS_RESUMEN)
+        seleccion, union = self._seleccion(columnas)
+
+        if self.fts:
+            filas = self.conn.execute(
+                f"SELECT {seleccion} FROM articulos_fts f JOIN articulos a ON a.id = f.rowid{union} "
+                "WHERE articulos_fts MATCH ? ORDER BY bm25(articulos_fts) LIMIT ?",
+                (consulta, limite),
+            ).fetchall()
+        else:
+            patron = f"%{consulta}%"
+            filas = self.conn.execute(
+                f"SELECT {seleccion} FROM articulos a{union} WHERE a.title LIKE ? "
+                "ORDER BY a.id DESC LIMIT ?",
+                (patron, limite),
+            ).fetchall()
+
+        return [self._fila_a_dict(columnas, fila) for fila in filas]
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Pipeline Offline
+Corpus sintéticos de artículos en español (100, 1k, 10k) para medir
+throughput y memoria de las etapas que no dependen de red, y comparar
+contra un baseline guardado para detectar regresiones de rendimiento.
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+SCRIPTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+BASELINE_PATH = SCRIPTS_DIR.parent / "data" / "benchmarks" / "baseline.json"
+TAMANOS_DEFAULT = [100, 1000, 10000]
+
+# Vocabulario para los corpus sintéticos (incluye keywords de las categorías)
+TEMAS = [
+    ("política-nacional", "Política Nacional", ["gobierno", "presidente", "reforma", "congreso", "senado", "diputados"]),
+    ("política-internacional", "Política Internacional", ["diplomacia", "embajador", "estados unidos", "onu", "acuerdo"]),
+    ("economía-política", "Economía y Política", ["presupuesto", "fiscal", "impuestos", "inversión", "hacienda"]),
+    ("seguridad", "Seguridad y Justicia", ["seguridad", "policía", "crimen", "guardia", "delitos"]),
+    ("elecciones", "Elecciones y Partidos", ["elecciones", "partido", "voto", "campaña", "candidato"]),
+    ("derechos-sociales", "Derechos y Políticas Sociales", ["derechos", "educación", "salud", "pensiones", "bienestar"]),
+    ("medio-ambiente", "Medio Ambiente y Energía", ["energía", "pemex", "cfe", "clima", "renovable"]),
+    ("judicial", "Poder Judicial", ["corte", "juez", "tribunal", "scjn", "sentencia"]),
+    ("corrupción", "Anticorrupción y Transparencia", ["corrupción", "transparencia", "auditoría", "asf"]),
+    ("análisis-opinión", "Análisis y Opinión", ["análisis", "opinión", "editorial", "perspectiva"]),
+]
+SUJETOS = ["El gobierno federal", "La Secretaría de Hacienda", "El Senado de la República",
+           "La Suprema Corte", "El Instituto Nacional Electoral", "La oposición",
+           "Los legisladores", "La presidenta", "El gabinete de seguridad", "Los gobernadores"]
+VERBOS = ["anunció", "presentó", "aprobó", "cuestionó", "analizó", "propuso", "rechazó", "defendió"]
+COMPLEMENTOS = ["una nueva iniciativa", "el plan de trabajo", "los cambios al reglamento",
+                "un paquete de medidas", "la estrategia nacional", "el informe trimestral"]
+CONECTORES = ["Además,", "Sin embargo,", "Por otra parte,", "En ese sentido,", "Asimismo,", "De acuerdo con especialistas,"]
+CIUDADES = ["Ciudad de México", "Guadalajara", "Monterrey", "Puebla", "Mérida", "Oaxaca"]
+FUENTES = ["El Universal", "Milenio", "La Jornada", "Reforma", "Excélsior", "Proceso"]
+
+
+class BenchmarkOmitido(Exception):
+    """El benchmark no puede correr en este entorno (falta una dependencia)"""
+
+
+def generar_corpus(num_articulos: int, seed: int = 42) -> List[Dict]:
+    """
+    Genera un corpus determinista de artículos con la forma normalizada del pipeline
+
+    Args:
+        num_articulos: Número de artículos
+        seed: Semilla para que el corpus sea reproducible
+
+    Returns:
+        Lista de artículos (incluye categoría asignada)
+    """
+    rng = random.Random(seed)
+    fecha_base = datetime(2026, 1, 1)
+    corpus = []
+
+    for i in range(num_articulos):
+        cat_id, cat_nombre, keywords = TEMAS[i % len(TEMAS)]
+        tema = rng.choice(keywords)
+
+        def oracion() -> str:
+            return (
+                f"{rng.choice(SUJETOS)} {rng.choice(VERBOS)} {rng.choice(COMPLEMENTOS)} "
+                f"sobre {tema} en {rng.choice(CIUDADES)}, según fuentes consultadas el "
+                f"{rng.randint(1, 28)} de enero."
+            )
+
+        parrafos = [
+            " ".join(
+                ([rng.choice(CONECTORES)] if p else []) + [oracion() for _ in range(rng.randint(3, 6))]
+            )
+            for p in range(rng.randint(6, 12))
+        ]
+        full_text = "\n\n".join(parrafos)
+        publicado = fecha_base + timedelta(minutes=i * 37)
+
+        corpus.append({
+            "source": "benchmark",
+            "title": f"{rng.choice(SUJETOS)} {rng.choice(VERBOS)} {rng.choice(COMPLEMENTOS)} sobre {tema} ({i})",
+            "description": parrafos[0][:300],
+            "url": f"https://ejemplo.com/noticias/{cat_id}/{i}",
+            "image_url": f"https://ejemplo.com/img/{i}.jpg",
+            "published_at": publicado.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": parrafos[0],
+            "full_text": full_text,
+            "author": f"Redacción {rng.choice(FUENTES)}",
+            "source_name": rng.choice(FUENTES),
+            "category_id": cat_id,
+            "category_name": cat_nombre,
+            "category_confidence": 0.9,
+        })
+
+    return corpus
+
+
+def _metadata_sitio() -> Dict:
+    """Metadata mínima con las claves que usan los generadores"""
+    return {
+        "nombre": "Diario Benchmark",
+        "site_name": "Diario Benchmark",
+        "tagline": "Noticias sintéticas para medir rendimiento",
+        "description": "Sitio generado por el benchmark",
+        "dominio": "diariobenchmark.com",
+        "domain": "https://diariobenchmark.com",
+        "site_url": "https://diariobenchmark.com",
+        "color_primario": "#1a365d",
+        "color_secundario": "#c53030",
+    }
+
+
+def _importar(nombre_modulo: str):
+    """Importa un módulo de scripts/ o marca el benchmark como omitido"""
+    import importlib
+
+    try:
+        return importlib.import_module(nombre_modulo)
+    except ImportError as e:
+        raise BenchmarkOmitido(f"{nombre_modulo}: {e}")
+    except SystemExit:
+        # master_orchestrator termina el proceso si falta alguna dependencia
+        raise BenchmarkOmitido(f"{nombre_modulo}: dependencias no disponibles")
+
+
+def _orquestador_sin_red():
+    """Instancia de MasterOrchestrator sin inicializar clientes de API"""
+    modulo = _importar("master_orchestrator")
+    seo = _importar("seo_metadata_generator")
+    preloader = _importar("preloader_generator")
+    client_search = _importar("client_search")
+    storage_backend = _importar("storage_backend")
+    render_executor = _importar("render_executor")
+
+    orquestador = object.__new__(modulo.MasterOrchestrator)
+    orquestador.storage = storage_backend.DiskStorage()
+    orquestador.render_executor = render_executor.RenderExecutor(storage=orquestador.storage)
+    orquestador.seo_generator = seo.SEOMetadataGenerator()
+    orquestador.preloader_generator = preloader.PreloaderGenerator()
+    orquestador.client_search = client_search.ClientSearchGenerator()
+    orquestador.log = lambda *args, **kwargs: None
+    return orquestador
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks: reciben (corpus, directorio temporal) y retornan items procesados
+# ---------------------------------------------------------------------------
+
+def bench_categorizacion_keywords(corpus: List[Dict], tmp_dir: Path) -> int:
+    categorizer = _importar("categorizer")
+    categorizador = categorizer.NewsCategorizador(api_key="offline")
+    for article in corpus:
+        categorizador.categorizar_por_keywords(article)
+    return len(corpus)
+
+
+def bench_parafraseo_linguistico(corpus: List[Dict], tmp_dir: Path) -> int:
+    spacy = _importar("spacy")
+    if not spacy.util.is_package("es_core_news_md"):
+        # Sin el modelo, LinguisticParaphraser intentaría descargarlo (red)
+        raise BenchmarkOmitido("modelo es_core_news_md no instalado")
+    linguistic = _importar("linguistic_paraphraser")
+    paraphraser = linguistic.LinguisticParaphraser()
+    for article in corpus:
+        paraphraser.paraphrase_article(article)
+    return len(corpus)
+
+
+def bench_formatear_contenido(corpus: List[Dict], tmp_dir: Path) -> int:
+    article_page_generator = _importar("article_page_generator")
+    generador = article_page_generator.ArticlePageGenerator()
+    for article in corpus:
+        generador.formatear_contenido_html(article["full_text"])
+    return len(corpus)
+
+
+def bench_paginas_articulos(corpus: List[Dict], tmp_dir: Path) -> int:
+    orquestador = _orquestador_sin_red()
+    site_dir = tmp_dir / "site"
+    site_dir.mkdir(parents=True, exist_ok=True)
+    orquestador._generar_paginas_articulos(site_dir, corpus, _metadata_sitio(), {}, 1)
+    orquestador.render_executor.cerrar()
+    return len(corpus)
+
+
+def bench_rss(corpus: List[Dict], tmp_dir: Path) -> int:
+    rss_generator = _importar("rss_generator")
+    # Sin tope de items para medir el escritor con feeds de todo el corpus
+    generator = rss_generator.RSSGenerator(max_items=len(corpus))
+    generator.generar_feeds_por_categoria(corpus, _metadata_sitio(), output_dir=str(tmp_dir), verbose=False)
+    return len(corpus)
+
+
+def bench_paginas_categorias(corpus: List[Dict], tmp_dir: Path) -> int:
+    section_generator = _importar("section_generator")
+    generator = section_generator.SectionGenerator()
+    metadata = _metadata_sitio()
+    paleta = {"primary": metadata["color_primario"], "secondary": metadata["color_secundario"]}
+    categoria_dir = tmp_dir / "categoria"
+    categoria_dir.mkdir(exist_ok=True)
+    for cat_id, cat_nombre, _ in TEMAS:
+        articulos = [a for a in corpus if a["category_id"] == cat_id]
+        generator.generar_paginas_categoria(cat_id, cat_nombre, articulos, metadata, paleta, categoria_dir)
+    return len(corpus)
+
+
+def bench_sitemap(corpus: List[Dict], tmp_dir: Path) -> int:
+    sitemap_generator = _importar("sitemap_generator")
+    generator = sitemap_generator.SitemapGenerator()
+    site_url = "https://ejemplo.com"
+    generator.generar(tmp_dir, site_url, generator.entradas_sitio(tmp_dir, site_url, corpus))
+    return len(corpus)
+
+
+def bench_precompresion(corpus: List[Dict], tmp_dir: Path) -> int:
+    precompression = _importar("precompression")
+    # Incluye la generación de las páginas de entrada: restar paginas_articulos
+    # para aislar la compresión
+    bench_paginas_articulos(corpus, tmp_dir)
+    precompression.Precompressor().comprimir_sitio(tmp_dir / "site")
+    return len(corpus)
+
+
+def bench_og_images(corpus: List[Dict], tmp_dir: Path) -> int:
+    og_image_generator = _importar("og_image_generator")
+    generator = og_image_generator.OGImageGenerator()
+    generator.output_dir = tmp_dir / "og-images"
+    generator.output_dir.mkdir(exist_ok=True)
+    metadata = _metadata_sitio()
+    for idx, article in enumerate(corpus, 1):
+        generator.generar_og_image(article, metadata, f"og_article_{idx}.png")
+    return len(corpus)
+
+
+def bench_css(corpus: List[Dict], tmp_dir: Path) -> int:
+    template_combiner = _importar("template_combiner")
+    combiner = template_combiner.TemplateCombiner()
+    random.seed(42)
+    # Un template por cada 10 artículos (un sitio típico usa uno)
+    num_templates = max(1, len(corpus) // 10)
+    for _ in range(num_templates):
+        combiner.generar_css_combinado(combiner.generar_combinacion_unica())
+    return num_templates
+
+
+def bench_almacen_ingesta(corpus: List[Dict], tmp_dir: Path) -> int:
+    article_store = _importar("article_store")
+    with article_store.ArticleStore(tmp_dir / "articles.sqlite3") as store:
+        store.agregar(corpus, lote="benchmark")
+    return len(corpus)
+
+
+# nombre -> (función, máximo de items por corrida; None = corpus completo)
+# Los topes evitan que las etapas lentas (spaCy, PIL, O(n²) del sidebar)
+# conviertan la corrida de 10k en horas; el throughput sigue siendo comparable.
+BENCHMARKS: Dict[str, tuple] = {
+    "categorizacion_keywords": (bench_categorizacion_keywords, None),
+    "parafraseo_linguistico": (bench_parafraseo_linguistico, 50),
+    "formatear_contenido_html": (bench_formatear_contenido, None),
+    "paginas_articulos": (bench_paginas_articulos, 1000),
+    "rss": (bench_rss, None),
+    "paginas_categorias": (bench_paginas_categorias, None),
+    "sitemap": (bench_sitemap, None),
+    "precompresion": (bench_precompresion, 1000),
+    "og_images": (bench_og_images, 100),
+    "css": (bench_css, None),
+    "almacen_ingesta": (bench_almacen_ingesta, None),
+}
+
+
+def medir(funcion: Callable, corpus: List[Dict]) -> Dict:
+    """
+    Ejecuta un benchmark dos veces (tras un calentamiento): una cronometrada y otra con tracemalloc
+    (tracemalloc ralentiza la ejecución, así que no se mezcla con el tiempo)
+
+    Args:
+        funcion: Benchmark a ejecutar
+        corpus: Artículos de entrada
+
+    Returns:
+        Dict con items, segundos, items_por_segundo y pico_memoria_mb
+    """
+    # Calentamiento: imports, caches de fuentes/regex, etc. fuera del tiempo
+    with tempfile.TemporaryDirectory() as tmp:
+        funcion(corpus[:5], Path(tmp))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inicio = time.perf_counter()
+        items = funcion(corpus, Path(tmp))
+        segundos = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        try:
+            funcion(corpus, Path(tmp))
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "items": items,
+        "segundos": round(segundos, 4),
+        "items_por_segundo": round(items / segundos, 2) if segundos > 0 else 0.0,
+        "pico_memoria_mb": round(pico / (1024 * 1024), 2),
+    }
+
+
+def ejecutar_benchmarks(tamanos: List[int], seleccion: List[str] = None) -> Dict[str, Dict]:
+    """
+    Ejecuta los benchmarks seleccionados sobre cada tamaño de corpus
+
+    Args:
+        tamanos: Tamaños de corpus (ej: [100, 1000, 10000])
+        seleccion: Nombres de benchmarks (None = todos)
+
+    Returns:
+        Dict "<benchmark>@<tamaño>" -> resultado (o {"omitido": motivo})
+    """
+    resultados = {}
+    nombres = seleccion or list(BENCHMARKS)
+
+    for tamano in tamanos:
+        corpus = generar_corpus(tamano)
+        print(f"\n📚 Corpus sintético: {tamano} artículos")
+
+        for nombre in nombres:
+            funcion, maximo = BENCHMARKS[nombre]
+            entrada = corpus[:maximo] if maximo else corpus
+            clave = f"{nombre}@{tamano}"
+
+            try:
+                resultado = medir(funcion, entrada)
+            except BenchmarkOmitido as e:
+                resultados[clave] = {"omitido": str(e)}
+                print(f"  ⏭️  {nombre}: omitido ({e})")
+                continue
+
+            resultados[clave] = resultado
+            print(
+                f"  ⏱️  {nombre}: {resultado['items_por_segundo']:.1f} items/s "
+                f"({resultado['items']} items en {resultado['segundos']:.3f}s, "
+                f"pico {resultado['pico_memoria_mb']:.1f}MB)"
+            )
+
+    return resultados
+
+
+def comparar_con_baseline(resultados: Dict, baseline: Dict, tolerancia: float) -> List[str]:
+    """
+    Compara throughput y memoria contra el baseline
+
+    Args:
+        resultados: Resultados de la corrida actual
+        baseline: Resultados guardados
+        tolerancia: Fracción de empeoramiento permitida (0.2 = 20%)
+
+    Returns:
+        Lista de regresiones detectadas (vacía si todo está dentro de tolerancia).
+        Un benchmark medido en el baseline y omitido ahora es una regresión:
+        la etapa dejó de estar cubierta
+    """
+    regresiones = []
+    for clave, actual in resultados.items():
+        anterior = baseline.get(clave)
+        if not anterior or "omitido" in anterior:
+            continue
+        if "omitido" in actual:
+            regresiones.append(f"{clave}: medido en el baseline, omitido ahora ({actual['omitido']})")
+            continue
+
+        if actual["items_por_segundo"] < anterior["items_por_segundo"] * (1 - tolerancia):
+            regresiones.append(
+                f"{clave}: throughput {anterior['items_por_segundo']:.1f} → "
+                f"{actual['items_por_segundo']:.1f} items/s"
+            )
+        if actual["pico_memoria_mb"] > anterior["pico_memoria_mb"] * (1 + tolerancia) + 1:
+            regresiones.append(
+                f"{clave}: memoria {anterior['pico_memoria_mb']:.1f} → "
+                f"{actual['pico_memoria_mb']:.1f} MB"
+            )
+    return regresiones
+
+
+def sin_baseline(resultados: Dict, baseline: Dict) -> List[str]:
+    """
+    Benchmarks medidos ahora que el baseline no cubre (ausentes u omitidos
+    en él): no se comparan, así que conviene regenerar el baseline
+
+    Returns:
+        Lista de avisos
+    """
+    avisos = []
+    for clave, actual in resultados.items():
+        anterior = baseline.get(clave)
+        if "omitido" in actual:
+            continue
+        if not anterior:
+            avisos.append(f"{clave}: no está en el baseline")
+        elif "omitido" in anterior:
+            avisos.append(f"{clave}: omitido en el baseline ({anterior['omitido']})")
+    return avisos
+
+
+def main():
+    """Ejecuta el benchmark y lo compara con el baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline offline")
+    parser.add_argument(
+        "--tamanos", type=int, nargs="+", default=TAMANOS_DEFAULT, help="Tamaños de corpus"
+    )
+    parser.add_argument(
+        "--solo", type=str, nargs="+", choices=list(BENCHMARKS), default=None,
+        help="Ejecutar solo estos benchmarks",
+    )
+    parser.add_argument(
+        "--baseline", type=str, default=str(BASELINE_PATH), help="Archivo de baseline"
+    )
+    parser.add_argument(
+        "--guardar-baseline", action="store_true", help="Guardar esta corrida como baseline"
+    )
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.2,
+        help="Empeoramiento permitido antes de marcar regresión (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🏁 BENCHMARK DEL PIPELINE OFFLINE")
+    print("=" * 70)
+
+    resultados = ejecutar_benchmarks(args.tamanos, args.solo)
+    baseline_path = Path(args.baseline)
+
+    if args.guardar_baseline:
+        baseline = {}
+        if baseline_path.exists():
+            with open(baseline_path, "r", encoding="utf-8") as f:
+                baseline = json.load(f).get("resultados", {})
+        baseline.update(resultados)
+
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fecha": datetime.now().isoformat(),
+                    "python": sys.version.split()[0],
+                    "resultados": baseline,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"\n💾 Baseline guardado: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print("\n💡 No hay baseline. Ejecuta con --guardar-baseline para crearlo.")
+        return
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f).get("resultados", {})
+
+    regresiones = comparar_con_baseline(resultados, baseline, args.tolerancia)
+    print(f"\n{'=' * 70}")
+    avisos = sin_baseline(resultados, baseline)
+    if avisos:
+        print(f"⚠️  {len(avisos)} benchmarks sin comparar (regenera el baseline con --guardar-baseline):")
+        for aviso in avisos:
+            print(f"  - {aviso}")
+    if regresiones:
+        print(f"❌ {len(regresiones)} regresiones (tolerancia {args.tolerancia:.0%}):")
+        for regresion in regresiones:
+            print(f"  - {regresion}")
+        sys.exit(1)
+
+    print(f"✅ Sin regresiones respecto al baseline (tolerancia {args.tolerancia:.0%})")
+
+
+if __name__ == "__main__":
+    main()
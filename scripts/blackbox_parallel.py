@@ -7,12 +7,16 @@ Usa rotación de keys para acelerar generación de artículos principales
 import os
 import requests
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import Callable, List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import itertools
 from threading import Lock
 
+from llm_streaming import StreamingArticleParser, consumir_stream
+from pipeline_tracer import trazar
+from utils.blackbox import api_url
+
 load_dotenv()
 
 # Cargar múltiples keys para rotación
@@ -23,13 +27,14 @@ BLACKBOX_MODEL_1 = os.getenv('BLACKBOX_MODEL_1', DEFAULT_MODEL)
 BLACKBOX_API_KEY_2 = os.getenv('BLACKBOX_API_KEY_2')
 BLACKBOX_MODEL_2 = os.getenv('BLACKBOX_MODEL_2', DEFAULT_MODEL)
 
-BLACKBOX_API_URL = 'https://api.blackbox.ai/chat/completions'
-
 
 class BlackboxParallelParaphraser:
     """Parafraseo de artículos principales con Blackbox en paralelo"""
     
-    def __init__(self, api_keys: List[str] = None):
+    def __init__(self, api_keys: List[str] = None, base_url: str = None):
+        # URL del endpoint de chat (override para pruebas de carga locales)
+        self.api_url = api_url(base_url)
+
         # Cargar todas las keys y modelos disponibles
         # Usar siempre el modelo blackboxai/x-ai/grok-code-fast-1:free por defecto
         if api_keys:
@@ -90,7 +95,15 @@ class BlackboxParallelParaphraser:
         with self.config_lock:
             return next(self.config_iterator)
     
-    def parafrasear_articulo(self, article: Dict, style: str = "formal y objetivo") -> Dict:
+    def parafrasear_articulo(
+        self,
+        article: Dict,
+        style: str = "formal y objetivo",
+        stream: bool = False,
+        on_titulo: Callable[[Dict], None] = None,
+        on_parrafo: Callable[[Dict, str], None] = None,
+        max_tokens_stream: int = None
+    ) -> Dict:
         """
         Parafrasea un artículo completo usando Blackbox
         Similar a NewsParaphraser pero con rotación de keys
@@ -98,6 +111,10 @@ class BlackboxParallelParaphraser:
         Args:
             article: Artículo a parafrasear
             style: Estilo de parafraseo
+            stream: Si True, pide la respuesta en streaming y arma el artículo progresivamente
+            on_titulo: Callback(article_copy) en cuanto llega el título (solo stream)
+            on_parrafo: Callback(article_copy, parrafo) por cada párrafo completo (solo stream)
+            max_tokens_stream: Corta la generación al superar este presupuesto aproximado
             
         Returns:
             Artículo parafraseado
@@ -187,8 +204,16 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
             
             self.request_count += 1
             
-            response = requests.post(BLACKBOX_API_URL, headers=headers, json=payload, timeout=90)
-            response.raise_for_status()
+            if stream:
+                return self._parafrasear_stream(
+                    article, style, headers, payload, current_key_id,
+                    on_titulo, on_parrafo, max_tokens_stream
+                )
+            
+            with trazar("llm.blackbox", "llm", modelo=model, key_id=current_key_id) as span:
+                response = requests.post(self.api_url, headers=headers, json=payload, timeout=90)
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             self.success_count += 1
             
@@ -241,11 +266,82 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
             article['key_used'] = current_key_id
             return article
     
+    def _parafrasear_stream(
+        self,
+        article: Dict,
+        style: str,
+        headers: Dict,
+        payload: Dict,
+        key_id: str,
+        on_titulo: Callable[[Dict], None] = None,
+        on_parrafo: Callable[[Dict, str], None] = None,
+        max_tokens_stream: int = None
+    ) -> Dict:
+        """
+        Versión streaming de parafrasear_articulo: el título y cada párrafo
+        se escriben en la copia del artículo conforme llegan, para que las
+        etapas siguientes (categoría, OG, esqueleto de página) arranquen antes
+        
+        Returns:
+            Artículo parafraseado (con 'truncated' si se cortó por presupuesto)
+        """
+        article_copy = article.copy()
+        article_copy['full_text'] = ''
+        
+        def publicar_titulo(titulo: str):
+            article_copy['title'] = titulo
+            if on_titulo:
+                on_titulo(article_copy)
+        
+        def publicar_parrafo(parrafo: str):
+            if article_copy['full_text']:
+                article_copy['full_text'] += '\n\n' + parrafo
+            else:
+                article_copy['full_text'] = parrafo
+            if on_parrafo:
+                on_parrafo(article_copy, parrafo)
+        
+        parser = StreamingArticleParser(publicar_titulo, publicar_parrafo, max_tokens_stream)
+        
+        with trazar("llm.blackbox", "llm", modelo=payload['model'], key_id=key_id, stream=True) as span:
+            response = requests.post(
+                self.api_url, headers=headers, json={**payload, "stream": True},
+                timeout=90, stream=True
+            )
+            response.raise_for_status()
+            resultado = consumir_stream(response, parser)
+            span.registrar_bytes(entrada=len(parser.texto_completo.encode('utf-8')))
+        
+        if not resultado['full_text']:
+            raise ValueError("Respuesta en streaming vacía de Blackbox API")
+        
+        self.success_count += 1
+        
+        if not resultado['title']:
+            article_copy['title'] = article.get('title', '')[:150]
+        article_copy['description'] = (
+            resultado['full_text'][:300] + '...' if len(resultado['full_text']) > 300 else resultado['full_text']
+        )
+        if 'content' in article_copy:
+            article_copy['content'] = article_copy['full_text']
+        
+        article_copy['paraphrased'] = True
+        article_copy['paraphrase_method'] = 'blackbox-parallel-stream'
+        article_copy['style'] = style
+        article_copy['key_used'] = key_id
+        article_copy['truncated'] = resultado['truncated']
+        
+        return article_copy
+    
     def parafrasear_lote_paralelo(
         self,
         articles: List[Dict],
         max_workers: int = 2,
-        styles: List[str] = None
+        styles: List[str] = None,
+        stream: bool = False,
+        on_titulo: Callable[[Dict], None] = None,
+        on_parrafo: Callable[[Dict, str], None] = None,
+        max_tokens_stream: int = None
     ) -> List[Dict]:
         """
         Parafrasea múltiples artículos en paralelo
@@ -254,6 +350,10 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
             articles: Lista de artículos
             max_workers: Número de workers paralelos
             styles: Lista de estilos (rotará entre ellos)
+            stream: Usar respuestas en streaming (ver parafrasear_articulo)
+            on_titulo: Callback(article_copy) al llegar cada título (solo stream)
+            on_parrafo: Callback(article_copy, parrafo) por cada párrafo completo (solo stream)
+            max_tokens_stream: Presupuesto aproximado de tokens por artículo
             
         Returns:
             Lista de artículos parafraseados
@@ -278,7 +378,11 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
             future_to_article = {}
             for idx, article in enumerate(articles):
                 style = styles[idx % len(styles)]
-                future = executor.submit(self.parafrasear_articulo, article, style)
+                future = executor.submit(
+                    self.parafrasear_articulo, article, style,
+                    stream=stream, on_titulo=on_titulo, on_parrafo=on_parrafo,
+                    max_tokens_stream=max_tokens_stream
+                )
                 future_to_article[future] = (idx + 1, article)
             
             # Procesar resultados conforme se completen
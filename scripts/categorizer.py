@@ -11,10 +11,12 @@ from dotenv import load_dotenv
 from typing import List, Dict, Tuple
 import re
 
+from pipeline_tracer import trazar
+from utils.blackbox import api_url
+
 load_dotenv()
 
 API_KEY = os.getenv('BLACKBOX_API_KEY')
-API_URL = 'https://api.blackbox.ai/chat/completions'
 
 
 class NewsCategorizador:
@@ -74,8 +76,9 @@ class NewsCategorizador:
         }
     }
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None):
         self.api_key = api_key or API_KEY
+        self.api_url = api_url(base_url)
         if not self.api_key:
             raise ValueError("BLACKBOX_API_KEY no encontrada en .env")
         
@@ -139,8 +142,10 @@ Categoría:"""
         }
         
         try:
-            response = requests.post(API_URL, headers=self.headers, json=payload, timeout=30)
-            response.raise_for_status()
+            with trazar("llm.categorizer", "llm", modelo=payload["model"]) as span:
+                response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=30)
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             result = response.json()
             categoria = result['choices'][0]['message']['content'].strip().lower()
@@ -197,13 +202,14 @@ Categoría:"""
         # Default: análisis-opinión
         return "análisis-opinión", 0.3
     
-    def categorizar_articulo(self, article: Dict, use_ai: bool = True) -> Dict:
+    def categorizar_articulo(self, article: Dict, use_ai: bool = True, copiar: bool = True) -> Dict:
         """
         Categoriza un artículo y retorna datos enriquecidos
         
         Args:
             article: Artículo a categorizar
             use_ai: Si True, usa IA; si False, usa keywords
+            copiar: Si False, agrega la categoría al mismo dict en vez de a una copia
             
         Returns:
             Artículo con categoría agregada
@@ -214,14 +220,16 @@ Categoría:"""
             categoria, confianza = self.categorizar_por_keywords(article)
         
         # Agregar datos de categoría
-        article_copy = article.copy()
+        article_copy = article.copy() if copiar else article
         article_copy['category_id'] = categoria
         article_copy['category_name'] = self.CATEGORIAS[categoria]['nombre']
         article_copy['category_confidence'] = confianza
         
         return article_copy
     
-    def categorizar_lote(self, articles: List[Dict], use_ai: bool = True, batch_delay: float = 0.5) -> List[Dict]:
+    def categorizar_lote(
+        self, articles: List[Dict], use_ai: bool = True, batch_delay: float = 0.5, copiar: bool = True
+    ) -> List[Dict]:
         """
         Categoriza múltiples artículos
         
@@ -229,6 +237,7 @@ Categoría:"""
             articles: Lista de artículos
             use_ai: Si True, usa IA
             batch_delay: Delay entre requests (rate limiting)
+            copiar: Si False, categoriza los mismos dicts (el llamador ya es su dueño)
             
         Returns:
             Lista de artículos categorizados
@@ -249,7 +258,7 @@ Categoría:"""
             print(f"[{idx}/{len(articles)}] {title}...", end=" ")
             
             try:
-                result = self.categorizar_articulo(article, use_ai=use_ai)
+                result = self.categorizar_articulo(article, use_ai=use_ai, copiar=copiar)
                 categorized.append(result)
                 
                 # Contar por categoría
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Búsqueda del Lado del Cliente
+Exporta el índice BM25 del sitio (SearchIndex) como archivos estáticos
+fragmentados para que la página buscar.html solo descargue lo que necesita:
+
+    search/t_<prefijo>.json   términos que empiezan con <prefijo> y sus postings
+    search/d_<bloque>.json    url, título, categoría y fecha de cada documento
+    search.js                 cargador que pide un fragmento por palabra buscada
+
+Los postings se guardan como [delta_id, peso, delta_id, peso, ...] con pesos
+enteros de 1 a 255 y términos ordenados, así cada fragmento pesa unos pocos KB y
+comprime bien con gzip.
+"""
+
+import json
+from collections import defaultdict
+from html import escape
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from search_index import SearchIndex
+from storage_backend import DiskStorage, StorageBackend
+
+SEARCH_JS = r"""(function () {
+  var script = document.currentScript;
+  var BASE = script.getAttribute('data-base') || 'search/';
+  var PREFIJO = parseInt(script.getAttribute('data-prefijo'), 10);
+  var BLOQUE = parseInt(script.getAttribute('data-bloque'), 10);
+  var ACENTOS = {'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ü': 'u', 'à': 'a', 'è': 'e', 'ì': 'i', 'ò': 'o', 'ù': 'u'};
+  var cache = {};
+
+  // Un 404 es definitivo (no hay fragmento para ese prefijo); cualquier otro
+  // fallo se descarta de la cache para reintentarlo en la próxima búsqueda
+  function obtener(nombre) {
+    if (!cache[nombre]) {
+      cache[nombre] = fetch(BASE + nombre + '.json')
+        .then(function (r) {
+          if (r.status === 404) return {};
+          if (!r.ok) throw new Error(r.status);
+          return r.json();
+        })
+        .catch(function () {
+          delete cache[nombre];
+          return {};
+        });
+    }
+    return cache[nombre];
+  }
+
+  function tokenizar(texto) {
+    var limpio = texto.toLowerCase().replace(/[áéíóúüàèìòù]/g, function (c) { return ACENTOS[c]; });
+    return limpio.match(/[a-z0-9ñ]{3,}/g) || [];
+  }
+
+  function fragmento(termino) {
+    return 't_' + termino.slice(0, PREFIJO).replace(/ñ/g, '_');
+  }
+
+  function sumar(puntajes, postings) {
+    var id = 0;
+    for (var i = 0; i < postings.length; i += 2) {
+      id += postings[i];
+      puntajes[id] = (puntajes[id] || 0) + postings[i + 1];
+    }
+  }
+
+  // La última palabra cuenta como prefijo (búsqueda mientras se escribe)
+  function buscar(consulta, k) {
+    var terminos = tokenizar(consulta);
+    var ultimo = terminos.length - 1;
+    return Promise.all(terminos.map(function (t) { return obtener(fragmento(t)); }))
+      .then(function (fragmentos) {
+        var puntajes = {};
+        fragmentos.forEach(function (frag, i) {
+          var t = terminos[i];
+          if (i === ultimo) {
+            Object.keys(frag).forEach(function (clave) {
+              if (clave.lastIndexOf(t, 0) === 0) sumar(puntajes, frag[clave]);
+            });
+          } else if (frag[t]) {
+            sumar(puntajes, frag[t]);
+          }
+        });
+        var ids = Object.keys(puntajes).map(Number).sort(function (a, b) {
+          return puntajes[b] - puntajes[a] || a - b;
+        }).slice(0, k || 20);
+        var bloques = {};
+        ids.forEach(function (id) { bloques[Math.floor(id / BLOQUE)] = true; });
+        return Promise.all(Object.keys(bloques).map(function (b) {
+          return obtener('d_' + b).then(function (docs) { return [b, docs]; });
+        })).then(function (pares) {
+          var docs = {};
+          pares.forEach(function (p) { docs[p[0]] = p[1]; });
+          // Se omiten los resultados cuyo bloque no se pudo descargar
+          return ids.map(function (id) {
+            var d = docs[Math.floor(id / BLOQUE)][id % BLOQUE];
+            return d && {id: id, url: d[0], titulo: d[1], categoria: d[2], fecha: d[3]};
+          }).filter(Boolean);
+        });
+      });
+  }
+
+  window.buscarSitio = buscar;
+
+  var form = document.getElementById('search-form');
+  if (!form) return;
+  var input = document.getElementById('search-input');
+  var lista = document.getElementById('search-results');
+  var turno = 0;
+
+  function pintar(resultados) {
+    lista.innerHTML = '';
+    resultados.forEach(function (r) {
+      var li = document.createElement('li');
+      var a = document.createElement('a');
+      a.href = r.url;
+      a.textContent = r.titulo;
+      var meta = document.createElement('span');
+      meta.className = 'search-meta';
+      meta.textContent = [r.categoria, r.fecha].filter(Boolean).join(' · ');
+      li.appendChild(a);
+      li.appendChild(meta);
+      lista.appendChild(li);
+    });
+    if (!resultados.length && input.value.trim()) lista.innerHTML = '<li>Sin resultados</li>';
+  }
+
+  function ejecutar() {
+    var mio = ++turno;
+    buscar(input.value, 20).then(function (r) { if (mio === turno) pintar(r); });
+  }
+
+  form.addEventListener('submit', function (e) { e.preventDefault(); ejecutar(); });
+  input.addEventListener('input', ejecutar);
+  var q = new URLSearchParams(location.search).get('q');
+  if (q) { input.value = q; ejecutar(); }
+})();
+"""
+
+
+class ClientSearchGenerator:
+    """Genera el índice de búsqueda fragmentado, su cargador JS y buscar.html"""
+
+    def __init__(
+        self, largo_prefijo: int = 2, docs_por_bloque: int = 200, max_postings: int = 200, storage: StorageBackend = None
+    ):
+        """
+        Args:
+            largo_prefijo: Caracteres del término que definen su fragmento
+                (con 1 un sitio de miles de artículos deja fragmentos de cientos de KB)
+            docs_por_bloque: Documentos por archivo de la tabla de documentos
+            max_postings: Postings por término (se conservan los de mayor peso)
+            storage: Destino de los archivos (default: disco local)
+        """
+        self.largo_prefijo = largo_prefijo
+        self.docs_por_bloque = docs_por_bloque
+        self.max_postings = max_postings
+        self.storage = storage or DiskStorage()
+
+    def nombre_fragmento(self, termino: str) -> str:
+        """Archivo (sin extensión) del fragmento de un término; 'ñ' -> '_' para URLs ASCII"""
+        return "t_" + termino[: self.largo_prefijo].replace("ñ", "_")
+
+    def _postings_compactos(self, postings: List, escala: float) -> List[int]:
+        """Mejores postings por peso, ordenados por doc_id y codificados en deltas"""
+        if len(postings) > self.max_postings:
+            postings = sorted(postings, key=lambda p: -p[1])[: self.max_postings]
+        compactos, anterior = [], 0
+        for doc_id, peso in sorted(postings):
+            compactos.extend((doc_id - anterior, max(1, round(peso * escala))))
+            anterior = doc_id
+        return compactos
+
+    def exportar_indice(
+        self, indice: SearchIndex, site_dir: Path, url_documento: Callable[[int], str]
+    ) -> Dict:
+        """
+        Escribe los fragmentos de términos y los bloques de documentos en
+        site_dir/search y elimina los que quedaron de una generación anterior
+
+        Args:
+            indice: Índice BM25 del sitio
+            site_dir: Directorio del sitio
+            url_documento: doc_id -> URL relativa del artículo
+
+        Returns:
+            Estadísticas: fragmentos, bloques, bytes y tamaño del mayor fragmento
+        """
+        indice.finalizar()
+        destino = Path(site_dir) / "search"
+        previos = set(destino.glob("*.json")) if destino.is_dir() else set()
+
+        peso_maximo = max((peso for lista in indice.postings.values() for _, peso in lista), default=1.0)
+        escala = 255 / peso_maximo
+
+        fragmentos: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+        for termino in sorted(indice.postings):
+            fragmentos[self.nombre_fragmento(termino)][termino] = self._postings_compactos(indice.postings[termino], escala)
+
+        stats = {"fragmentos": len(fragmentos), "bloques": 0, "bytes": 0, "mayor_fragmento": 0}
+        for nombre, terminos in fragmentos.items():
+            ruta = destino / f"{nombre}.json"
+            previos.discard(ruta)
+            tamano = self._escribir(ruta, terminos)
+            stats["bytes"] += tamano
+            stats["mayor_fragmento"] = max(stats["mayor_fragmento"], tamano)
+
+        for inicio in range(0, len(indice.documentos), self.docs_por_bloque):
+            bloque = [
+                [url_documento(doc_id), doc["titulo"], doc.get("categoria", ""), doc.get("fecha", "")]
+                for doc_id, doc in enumerate(indice.documentos[inicio : inicio + self.docs_por_bloque], inicio)
+            ]
+            ruta = destino / f"d_{inicio // self.docs_por_bloque}.json"
+            previos.discard(ruta)
+            stats["bytes"] += self._escribir(ruta, bloque)
+            stats["bloques"] += 1
+
+        for viejo in previos:
+            self.storage.eliminar(viejo)
+        return stats
+
+    def _escribir(self, ruta: Path, datos) -> int:
+        contenido = json.dumps(datos, ensure_ascii=False, separators=(",", ":"))
+        with self.storage.abrir(ruta) as f:
+            f.write(contenido)
+        return f.bytes
+
+    def generar_pagina_busqueda(self, site_metadata: Dict, logo_path: str = None) -> str:
+        """HTML de buscar.html (formulario + resultados pintados por search.js)"""
+        nombre = escape(site_metadata.get("nombre", "Noticias"))
+        logo = f'<img src="logo.jpg" alt="{nombre}" class="logo-img">' if logo_path else ""
+        return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="robots" content="noindex">
+    <title>Buscar - {nombre}</title>
+    <link rel="stylesheet" href="style.css">
+    <style>
+        .search-form {{ display: flex; gap: 0.5rem; margin: 2rem 0 1rem; }}
+        .search-form input {{ flex: 1; padding: 0.75rem 1rem; font-size: 1rem; border: 1px solid #ccc; border-radius: 6px; }}
+        .search-form button {{ padding: 0.75rem 1.25rem; border: 0; border-radius: 6px; cursor: pointer; }}
+        .search-results {{ list-style: none; padding: 0; }}
+        .search-results li {{ padding: 0.75rem 0; border-bottom: 1px solid #eee; }}
+        .search-results a {{ display: block; font-weight: 600; }}
+        .search-meta {{ font-size: 0.85rem; opacity: 0.7; }}
+    </style>
+</head>
+<body>
+    <header class="header">
+        <div class="container">
+            <div class="header-branding">
+                {logo}
+                <h1 class="logo"><a href="index.html">{nombre}</a></h1>
+            </div>
+            <nav class="nav">
+                <a href="index.html" class="nav-link">Inicio</a>
+            </nav>
+        </div>
+    </header>
+
+    <main class="main">
+        <div class="container">
+            <form class="search-form" id="search-form" role="search" action="buscar.html">
+                <input type="search" id="search-input" name="q" placeholder="Buscar noticias..." autocomplete="off" aria-label="Buscar">
+                <button type="submit">Buscar</button>
+            </form>
+            <ul class="search-results" id="search-results"></ul>
+        </div>
+    </main>
+
+    <script src="search.js" data-base="search/" data-prefijo="{self.largo_prefijo}" data-bloque="{self.docs_por_bloque}"></script>
+</body>
+</html>"""
+
+    def generar(
+        self,
+        indice: SearchIndex,
+        site_dir: Path,
+        site_metadata: Dict,
+        url_documento: Callable[[int], str],
+        logo_path: str = None,
+    ) -> Dict:
+        """
+        Genera índice fragmentado, search.js y buscar.html del sitio
+
+        Args:
+            indice: Índice BM25 del sitio
+            site_dir: Directorio del sitio
+            site_metadata: Metadata del sitio (nombre)
+            url_documento: doc_id -> URL relativa del artículo
+            logo_path: Logo del sitio (si existe)
+
+        Returns:
+            Estadísticas de exportar_indice
+        """
+        site_dir = Path(site_dir)
+        stats = self.exportar_indice(indice, site_dir, url_documento)
+        self.storage.escribir(site_dir / "search.js", SEARCH_JS)
+        self.storage.escribir(site_dir / "buscar.html", self.generar_pagina_busqueda(site_metadata, logo_path))
+        return stats
+
+
+def main():
+    """Genera la búsqueda de un sitio a partir de un JSON de artículos"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generar búsqueda estática fragmentada para un sitio")
+    parser.add_argument("articulos", help="JSON con la lista de artículos del sitio")
+    parser.add_argument("site_dir", help="Directorio del sitio")
+    parser.add_argument("--nombre", default="Noticias", help="Nombre del sitio")
+    args = parser.parse_args()
+
+    with open(args.articulos, encoding="utf-8") as f:
+        articles = json.load(f)
+
+    indice = SearchIndex.desde_articulos(articles)
+    stats = ClientSearchGenerator().generar(
+        indice, Path(args.site_dir), {"nombre": args.nombre}, lambda doc_id: f"article_{doc_id + 1}.html"
+    )
+    print(f"✅ {stats['fragmentos']} fragmentos, {stats['bloques']} bloques de documentos")
+    print(f"📦 {stats['bytes'] / 1024:.1f} KB en total, mayor fragmento {stats['mayor_fragmento'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,42 +2,139 @@
 """
 Script para deployar sitios generados a Vercel automáticamente
 Usa la API de Vercel para crear proyectos y subir archivos
+
+Por defecto el deploy es incremental (delta): se calcula el SHA1 de cada
+archivo leyéndolo por bloques, se crea el deployment con el manifiesto de
+digests y solo se suben (en paralelo y en streaming desde disco) los blobs
+que Vercel reporta como faltantes. Redeployar un sitio tras refrescar unas
+pocas noticias sube kilobytes en lugar del directorio de imágenes completo.
+
+deployar_flota() deploya muchos sitios a la vez con un tope global de
+conexiones y de ancho de banda de subida, y espera a todos los deployments
+con una sola ronda de consultas con backoff.
 """
 
 import os
 import json
+import hashlib
+import threading
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import base64
 
 load_dotenv()
 
 VERCEL_TOKEN = os.getenv('VERCEL_TOKEN')
-VERCEL_API_URL = 'https://api.vercel.com'
+# Override para probar contra un servidor local
+VERCEL_API_URL = os.getenv('VERCEL_API_URL', 'https://api.vercel.com')
 VERCEL_TEAM_ID = os.getenv('VERCEL_TEAM_ID')  # Opcional, para teams
 
+# Bloque de lectura para hashear y subir sin cargar archivos completos
+BLOQUE_LECTURA = 1024 * 1024
+
+# Variantes de precompression.py: Vercel comprime por su cuenta
+SUFIJOS_PRECOMPRIMIDOS = ('.gz', '.br', '.zst')
+
+
+class LimitadorAncho:
+    """Token bucket compartido entre hilos para limitar bytes por segundo"""
+    
+    def __init__(self, bytes_por_segundo: float):
+        """
+        Args:
+            bytes_por_segundo: Tasa sostenida (ráfaga máxima: un segundo)
+        """
+        self.tasa = float(bytes_por_segundo)
+        self.tokens = self.tasa
+        self.ultimo = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consumir(self, n: int):
+        """Reserva n bytes y espera lo necesario fuera del lock"""
+        with self.lock:
+            ahora = time.monotonic()
+            self.tokens = min(self.tasa, self.tokens + (ahora - self.ultimo) * self.tasa)
+            self.ultimo = ahora
+            self.tokens -= n
+            espera = -self.tokens / self.tasa if self.tokens < 0 else 0
+        if espera:
+            time.sleep(espera)
+
+
+class _LecturaLimitada:
+    """Archivo de solo lectura que pasa por el limitador en cada read()"""
+    
+    def __init__(self, archivo, size: int, limitador: LimitadorAncho):
+        self.archivo = archivo
+        self.size = size
+        self.limitador = limitador
+    
+    def __len__(self):
+        # requests usa len() para el Content-Length (sin chunked encoding)
+        return self.size
+    
+    def read(self, n: int = -1) -> bytes:
+        bloque = self.archivo.read(n if n and n > 0 else BLOQUE_LECTURA)
+        if bloque:
+            self.limitador.consumir(len(bloque))
+        return bloque
+
 
 class VercelDeployer:
     """Deployer para sitios generados en Vercel"""
     
-    def __init__(self, token: str = None, team_id: str = None):
+    def __init__(
+        self,
+        token: str = None,
+        team_id: str = None,
+        api_url: str = None,
+        delta: bool = True,
+        max_workers: int = 8,
+        max_bytes_por_segundo: Optional[float] = None
+    ):
+        """
+        Args:
+            token: Token de Vercel (default: VERCEL_TOKEN)
+            team_id: ID del team (default: VERCEL_TEAM_ID)
+            api_url: URL de la API (default: VERCEL_API_URL)
+            delta: Subir solo los archivos que Vercel no tiene (False = todo inline)
+            max_workers: Subidas simultáneas en modo delta (tope global,
+                compartido por todos los sitios de una flota)
+            max_bytes_por_segundo: Ancho de banda de subida total (None = sin límite)
+        """
         self.token = token or VERCEL_TOKEN
         if not self.token:
             raise ValueError("VERCEL_TOKEN no encontrado")
         
         self.team_id = team_id or VERCEL_TEAM_ID
+        self.api_url = (api_url or VERCEL_API_URL).rstrip('/')
+        self.delta = delta
+        self.max_workers = max_workers
+        self._conexiones = threading.BoundedSemaphore(max_workers)
+        self.limitador = LimitadorAncho(max_bytes_por_segundo) if max_bytes_por_segundo else None
+        # Segundos entre consultas del estado del deployment
+        self.intervalo_estado = 5
         self.headers = {
             'Authorization': f'Bearer {self.token}',
             'Content-Type': 'application/json'
         }
+        self._sesiones = threading.local()
         
         if self.team_id:
-            self.base_url = f"{VERCEL_API_URL}/v9/projects?teamId={self.team_id}"
+            self.base_url = f"{self.api_url}/v9/projects?teamId={self.team_id}"
         else:
-            self.base_url = f"{VERCEL_API_URL}/v9/projects"
+            self.base_url = f"{self.api_url}/v9/projects"
+    
+    def _url(self, ruta: str) -> str:
+        """URL de la API con el teamId si aplica"""
+        url = f"{self.api_url}{ruta}"
+        if self.team_id:
+            url += f"?teamId={self.team_id}"
+        return url
     
     def crear_proyecto(self, nombre: str, framework: str = 'other') -> Dict:
         """
@@ -82,22 +179,47 @@ class VercelDeployer:
     
     def crear_deployment(self, project_name: str, site_dir: Path) -> Dict:
         """
-        Crea un deployment de un sitio en Vercel
+        Crea un deployment de un sitio en Vercel y espera a que esté listo
         
         Args:
             project_name: Nombre del proyecto en Vercel
             site_dir: Directorio del sitio a deployar
             
         Returns:
-            Información del deployment
+            Información del deployment (en modo delta incluye archivos,
+            subidos y bytes_subidos)
         """
+        deployment = self._iniciar_deployment(project_name, site_dir)
+        
+        # Esperar a que el deployment esté listo
+        deployment['url'] = self._esperar_deployment(deployment['id'])
+        deployment['status'] = 'ready'
+        return deployment
+    
+    def _iniciar_deployment(self, project_name: str, site_dir: Path) -> Dict:
+        """Crea el deployment (subiendo lo necesario) sin esperar a que esté listo"""
+        if self.delta:
+            return self._iniciar_deployment_delta(project_name, site_dir)
+        
         # Leer archivos del sitio
         files = self._preparar_archivos(site_dir)
         
         if not files:
             raise Exception(f"No hay archivos para deployar en {site_dir}")
         
-        # Crear deployment
+        deployment, _ = self._post_deployment(project_name, files)
+        if deployment is None:
+            raise Exception("Error en deployment: archivos faltantes en modo inline")
+        return {'id': deployment['id']}
+    
+    def _post_deployment(self, project_name: str, files: List[Dict]) -> Tuple[Optional[Dict], set]:
+        """
+        POST /v13/deployments
+        
+        Returns:
+            (Deployment creado o None, digests faltantes si Vercel respondió
+            missing_files)
+        """
         deployment_data = {
             'name': project_name,
             'files': files,
@@ -107,29 +229,121 @@ class VercelDeployer:
             'target': 'production'
         }
         
-        url = f"{VERCEL_API_URL}/v13/deployments"
-        if self.team_id:
-            url += f"?teamId={self.team_id}"
-        
         response = requests.post(
-            url,
+            self._url('/v13/deployments'),
             headers=self.headers,
             json=deployment_data
         )
         
-        if response.status_code not in [200, 201]:
-            raise Exception(f"Error en deployment: {response.text}")
+        if response.status_code in [200, 201]:
+            return response.json(), set()
         
-        deployment = response.json()
+        error = {}
+        try:
+            error = response.json().get('error', {})
+        except ValueError:
+            pass
+        if error.get('code') == 'missing_files':
+            return None, set(error.get('missing', []))
+        raise Exception(f"Error en deployment: {response.text}")
+    
+    def _iniciar_deployment_delta(self, project_name: str, site_dir: Path) -> Dict:
+        """
+        Deployment por digests: primero se envía el manifiesto; si Vercel
+        responde missing_files se suben solo esos blobs y se reintenta
+        """
+        manifiesto = self._manifiesto_archivos(site_dir)
+        if not manifiesto:
+            raise Exception(f"No hay archivos para deployar en {site_dir}")
         
-        # Esperar a que el deployment esté listo
-        deployment_url = self._esperar_deployment(deployment['id'])
+        files = [{'file': rel, 'sha': sha, 'size': size} for rel, sha, size, _ in manifiesto]
+        subidos, bytes_subidos = 0, 0
+        
+        deployment, faltantes = self._post_deployment(project_name, files)
+        if deployment is None:
+            # Un digest puede aparecer en varios archivos: se sube una vez
+            por_sha = {sha: (ruta, size) for _, sha, size, ruta in manifiesto if sha in faltantes}
+            print(f"📤 {project_name}: subiendo {len(por_sha)} de {len(manifiesto)} archivos "
+                  f"({sum(size for _, size in por_sha.values()) / 1024:.0f} KB)")
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for size in executor.map(lambda item: self._subir_archivo(item[1][0], item[0], item[1][1]), por_sha.items()):
+                    subidos += 1
+                    bytes_subidos += size
+            
+            deployment, faltantes = self._post_deployment(project_name, files)
+            if deployment is None:
+                raise Exception(f"Error en deployment: siguen faltando {len(faltantes)} archivos")
+        else:
+            print(f"📤 {project_name}: Vercel ya tenía los {len(manifiesto)} archivos")
         
         return {
             'id': deployment['id'],
-            'url': deployment_url,
-            'status': 'ready'
+            'archivos': len(manifiesto),
+            'subidos': subidos,
+            'bytes_subidos': bytes_subidos
+        }
+    
+    def _sha1_archivo(self, ruta: Path) -> Tuple[str, int]:
+        """SHA1 y tamaño de un archivo leído por bloques"""
+        sha = hashlib.sha1()
+        size = 0
+        with open(ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(BLOQUE_LECTURA), b''):
+                sha.update(bloque)
+                size += len(bloque)
+        return sha.hexdigest(), size
+    
+    def _manifiesto_archivos(self, site_dir: Path) -> List[Tuple[str, str, int, Path]]:
+        """
+        (ruta relativa, sha1, tamaño, ruta) de cada archivo a deployar,
+        sin las variantes precomprimidas (.gz/.br/.zst) de archivos existentes
+        """
+        manifiesto = []
+        for file_path in sorted(site_dir.rglob('*')):
+            if not file_path.is_file():
+                continue
+            if file_path.suffix in SUFIJOS_PRECOMPRIMIDOS and file_path.with_suffix('').is_file():
+                continue
+            sha, size = self._sha1_archivo(file_path)
+            manifiesto.append((file_path.relative_to(site_dir).as_posix(), sha, size, file_path))
+        return manifiesto
+    
+    def _sesion(self) -> requests.Session:
+        """Sesión por hilo: reutiliza conexiones entre subidas"""
+        sesion = getattr(self._sesiones, 'sesion', None)
+        if sesion is None:
+            sesion = self._sesiones.sesion = requests.Session()
+        return sesion
+    
+    def _subir_archivo(self, ruta: Path, sha: str, size: int, reintentos: int = 3) -> int:
+        """
+        Sube un blob por digest (POST /v2/files) en streaming desde disco
+        
+        Returns:
+            Bytes subidos
+        """
+        headers = {
+            'Authorization': f'Bearer {self.token}',
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(size),
+            'x-vercel-digest': sha
         }
+        for intento in range(reintentos):
+            try:
+                # El semáforo es del deployer: limita las conexiones de toda la flota
+                with self._conexiones, open(ruta, 'rb') as f:
+                    cuerpo = _LecturaLimitada(f, size, self.limitador) if self.limitador else f
+                    response = self._sesion().post(self._url('/v2/files'), headers=headers, data=cuerpo, timeout=120)
+                if response.status_code == 200:
+                    return size
+                if response.status_code < 500 and response.status_code != 429:
+                    raise Exception(f"Error subiendo {ruta.name}: {response.text}")
+            except requests.RequestException as e:
+                if intento == reintentos - 1:
+                    raise Exception(f"Error subiendo {ruta.name}: {e}")
+            time.sleep(2 ** intento)
+        raise Exception(f"Error subiendo {ruta.name}: {response.status_code}")
     
     def _preparar_archivos(self, site_dir: Path) -> List[Dict]:
         """Prepara archivos para el deployment"""
@@ -161,21 +375,21 @@ class VercelDeployer:
         
         return files
     
+    def _consultar_estado(self, deployment_id: str) -> Dict:
+        """Estado actual de un deployment (GET /v13/deployments/<id>)"""
+        response = requests.get(self._url(f"/v13/deployments/{deployment_id}"), headers=self.headers)
+        
+        if response.status_code != 200:
+            raise Exception(f"Error obteniendo estado: {response.text}")
+        
+        return response.json()
+    
     def _esperar_deployment(self, deployment_id: str, timeout: int = 300) -> str:
         """Espera a que el deployment esté listo"""
-        url = f"{VERCEL_API_URL}/v13/deployments/{deployment_id}"
-        if self.team_id:
-            url += f"?teamId={self.team_id}"
-        
         start_time = time.time()
         
         while time.time() - start_time < timeout:
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code != 200:
-                raise Exception(f"Error obteniendo estado: {response.text}")
-            
-            deployment = response.json()
+            deployment = self._consultar_estado(deployment_id)
             state = deployment.get('readyState')
             
             if state == 'READY':
@@ -183,10 +397,15 @@ class VercelDeployer:
             elif state == 'ERROR':
                 raise Exception(f"Deployment falló: {deployment.get('error')}")
             
-            time.sleep(5)
+            time.sleep(self.intervalo_estado)
         
         raise Exception(f"Timeout esperando deployment {deployment_id}")
     
+    def _nombre_proyecto(self, site_name: str) -> str:
+        """Sanitiza el nombre (Vercel solo permite lowercase, números, guiones)"""
+        project_name = site_name.lower().replace('_', '-').replace(' ', '-')
+        return ''.join(c for c in project_name if c.isalnum() or c == '-')
+    
     def deployar_sitio_completo(self, site_dir: Path, site_name: str = None) -> Dict:
         """
         Deploya un sitio completo a Vercel
@@ -205,9 +424,7 @@ class VercelDeployer:
         if not site_name:
             site_name = site_dir.name
         
-        # Sanitizar nombre (Vercel solo permite lowercase, números, guiones)
-        project_name = site_name.lower().replace('_', '-').replace(' ', '-')
-        project_name = ''.join(c for c in project_name if c.isalnum() or c == '-')
+        project_name = self._nombre_proyecto(site_name)
         
         print(f"📦 Deployando sitio: {site_name}")
         print(f"   Proyecto Vercel: {project_name}")
@@ -229,6 +446,89 @@ class VercelDeployer:
         except Exception as e:
             print(f"❌ Error en deployment: {e}")
             raise
+    
+    def deployar_flota(self, site_dirs: List[Path], max_sitios: int = 8, timeout: int = 600) -> Dict:
+        """
+        Deploya muchos sitios en paralelo. Las subidas de todos comparten el
+        tope de conexiones (max_workers) y de ancho de banda del deployer;
+        después se espera a todos los deployments juntos, consultando solo
+        los pendientes en cada ronda con backoff exponencial
+        
+        Args:
+            site_dirs: Directorios de los sitios
+            max_sitios: Sitios preparándose (hash, proyecto, subidas) a la vez
+            timeout: Segundos máximos de espera de la flota completa
+            
+        Returns:
+            Reporte con un registro por sitio (proyecto, id, url, estado,
+            subidos, bytes_subidos, segundos, error) y totales
+        """
+        inicio = time.time()
+        registros = [{'sitio': str(site_dir), 'proyecto': self._nombre_proyecto(Path(site_dir).name)} for site_dir in site_dirs]
+        
+        def iniciar(registro: Dict) -> Dict:
+            inicio_sitio = time.time()
+            try:
+                if not Path(registro['sitio']).exists():
+                    raise Exception(f"Directorio no existe: {registro['sitio']}")
+                self.crear_proyecto(registro['proyecto'])
+                registro.update(self._iniciar_deployment(registro['proyecto'], Path(registro['sitio'])))
+                registro['estado'] = 'BUILDING'
+            except Exception as e:
+                registro['estado'] = 'ERROR'
+                registro['error'] = str(e)
+            registro['segundos_subida'] = round(time.time() - inicio_sitio, 2)
+            return registro
+        
+        print(f"🚀 Deployando {len(registros)} sitios ({max_sitios} a la vez, {self.max_workers} conexiones)")
+        with ThreadPoolExecutor(max_workers=max_sitios) as executor:
+            list(executor.map(iniciar, registros))
+            
+            # Espera conjunta: una consulta por deployment pendiente y ronda
+            pendientes = [r for r in registros if r['estado'] == 'BUILDING']
+            espera = min(1.0, self.intervalo_estado)
+            while pendientes and time.time() - inicio < timeout:
+                time.sleep(espera)
+                for registro, estado in zip(pendientes, executor.map(self._estado_seguro, [r['id'] for r in pendientes])):
+                    state = estado.get('readyState')
+                    if state == 'READY':
+                        registro['estado'] = 'READY'
+                        registro['url'] = f"https://{estado['url']}"
+                    elif state in ('ERROR', 'CANCELED') or 'error_consulta' in estado:
+                        registro['estado'] = 'ERROR'
+                        registro['error'] = str(estado.get('error') or estado.get('error_consulta') or state)
+                    if registro['estado'] != 'BUILDING':
+                        registro['segundos'] = round(time.time() - inicio, 2)
+                pendientes = [r for r in pendientes if r['estado'] == 'BUILDING']
+                espera = min(espera * 2, self.intervalo_estado)
+        
+        for registro in pendientes:
+            registro['estado'] = 'TIMEOUT'
+            registro['error'] = f"Timeout esperando deployment {registro['id']}"
+        for registro in registros:
+            registro.setdefault('segundos', round(time.time() - inicio, 2))
+        
+        reporte = {
+            'sitios': registros,
+            'listos': sum(1 for r in registros if r['estado'] == 'READY'),
+            'fallidos': sum(1 for r in registros if r['estado'] != 'READY'),
+            'subidos': sum(r.get('subidos', 0) for r in registros),
+            'bytes_subidos': sum(r.get('bytes_subidos', 0) for r in registros),
+            'segundos': round(time.time() - inicio, 2)
+        }
+        print(f"✅ {reporte['listos']}/{len(registros)} sitios listos en {reporte['segundos']}s "
+              f"({reporte['subidos']} archivos, {reporte['bytes_subidos'] / 1024:.0f} KB subidos)")
+        for registro in registros:
+            if registro['estado'] != 'READY':
+                print(f"❌ {registro['proyecto']}: {registro['estado']} - {registro.get('error')}")
+        return reporte
+    
+    def _estado_seguro(self, deployment_id: str) -> Dict:
+        """_consultar_estado sin excepciones (un sitio no detiene la espera de la flota)"""
+        try:
+            return self._consultar_estado(deployment_id)
+        except Exception as e:
+            return {'error_consulta': str(e)}
 
 
 def main():
@@ -236,13 +536,29 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Deploy sitio a Vercel")
-    parser.add_argument('site_dir', type=str, help='Directorio del sitio')
+    parser.add_argument('site_dirs', type=str, nargs='+', help='Directorio(s) del sitio; con varios se deploya como flota')
     parser.add_argument('--name', type=str, help='Nombre del proyecto')
+    parser.add_argument('--inline', action='store_true', help='Enviar todos los archivos en el body (sin delta)')
+    parser.add_argument('--workers', type=int, default=8, help='Subidas simultáneas (total)')
+    parser.add_argument('--max-sitios', type=int, default=8, help='Sitios en paralelo en modo flota')
+    parser.add_argument('--max-mbps', type=float, default=None, help='Ancho de banda de subida total (MB/s)')
     
     args = parser.parse_args()
     
-    deployer = VercelDeployer()
-    site_dir = Path(args.site_dir)
+    deployer = VercelDeployer(
+        delta=not args.inline,
+        max_workers=args.workers,
+        max_bytes_por_segundo=args.max_mbps * 1024 * 1024 if args.max_mbps else None
+    )
+    
+    if len(args.site_dirs) > 1:
+        reporte = deployer.deployar_flota([Path(d) for d in args.site_dirs], max_sitios=args.max_sitios)
+        for registro in reporte['sitios']:
+            if registro['estado'] == 'READY':
+                print(f"🌐 {registro['proyecto']}: {registro['url']}")
+        return 0 if reporte['fallidos'] == 0 else 1
+    
+    site_dir = Path(args.site_dirs[0])
     
     try:
         resultado = deployer.deployar_sitio_completo(site_dir, args.name)
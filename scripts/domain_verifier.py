@@ -14,6 +14,8 @@ import requests
 from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+from pipeline_tracer import trazar
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -111,7 +113,9 @@ Arch Linux:
         headers = {'apikey': self.api_key}
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            with trazar("whois.api", "whois", dominio=dominio) as span:
+                response = requests.get(url, headers=headers, timeout=30)
+                span.registrar_respuesta(response)
             
             if response.status_code == 200:
                 data = response.json()
@@ -156,13 +160,15 @@ Arch Linux:
         cmd.append(dominio)
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False  # No lanzar excepción por códigos de salida no cero
-            )
+            with trazar("whois.local", "whois", dominio=dominio) as span:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False  # No lanzar excepción por códigos de salida no cero
+                )
+                span.registrar_bytes(entrada=len(result.stdout or "") + len(result.stderr or ""))
             
             # Considerar éxito si hay alguna salida, incluso con código de error
             if result.stdout or result.stderr:
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Extracción y Deduplicación de Hechos
+Extractor de hechos con las expresiones regulares compiladas una sola vez
+y deduplicación de hechos casi idénticos con el criterio de la comparación
+por pares (SequenceMatcher), pero solo contra los candidatos de un índice
+invertido de n-gramas (los que comparten una fracción mínima de n-gramas),
+descartados además con cotas baratas antes de calcular ratio().
+"""
+
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Set
+
+from near_duplicate_clusterer import normalizar
+
+
+class FactExtractor:
+    """Detecta oraciones con indicadores de hecho (números, fechas, %, montos, citas)"""
+
+    SEPARADOR_ORACIONES = re.compile(r'[.!?]+')
+    NUMERO = re.compile(r'\d')
+    FECHA = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-](?:19|20)\d{2}\b|\b(?:19|20)\d{2}\b')
+    PORCENTAJE = re.compile(r'\d+%|\d+\s*por\s*ciento', re.I)
+    MONTO = re.compile(r'\$[\d,]+|\d+\s*(pesos|dólares|euros|millones|miles)', re.I)
+    CITA = re.compile(r'".*?"')
+
+    def __init__(self, max_hechos: int = 5, min_score: int = 2):
+        """
+        Args:
+            max_hechos: Hechos a retornar por texto
+            min_score: Indicadores mínimos para considerar una oración como hecho
+        """
+        self.max_hechos = max_hechos
+        self.min_score = min_score
+
+    def puntuar(self, oracion: str) -> int:
+        """Cuenta los indicadores de hecho de una oración"""
+        has_quote = bool(self.CITA.search(oracion))
+        if not self.NUMERO.search(oracion):
+            # Fecha, porcentaje y monto requieren dígitos: solo puede sumar la cita
+            return int(has_quote)
+        return (
+            1
+            + bool(self.FECHA.search(oracion))
+            + bool(self.PORCENTAJE.search(oracion))
+            + bool(self.MONTO.search(oracion))
+            + has_quote
+        )
+
+    def extraer(self, text: str) -> List[str]:
+        """
+        Extrae los hechos con más indicadores de un texto
+
+        Args:
+            text: Texto a analizar
+
+        Returns:
+            Lista de hechos (máximo max_hechos), del más al menos puntuado
+        """
+        facts = []
+        for sentence in self.SEPARADOR_ORACIONES.split(text):
+            sentence = sentence.strip()
+            if len(sentence) < 20:
+                continue
+            score = self.puntuar(sentence)
+            if score >= self.min_score:
+                facts.append((score, sentence))
+
+        # sort estable: a igual score conserva el orden de aparición
+        facts.sort(key=lambda x: x[0], reverse=True)
+        return [sentence for _, sentence in facts[:self.max_hechos]]
+
+
+class FactDedupIndex:
+    """
+    Conjunto de hechos únicos: un hecho es duplicado si su similitud
+    (SequenceMatcher) con alguno ya aceptado supera el umbral.
+
+    Solo se comparan los hechos que comparten al menos min_compartidos de
+    los n-gramas de caracteres del más corto de los dos (índice invertido);
+    los candidatos se descartan además con las cotas de longitud y de
+    caracteres, que nunca subestiman ratio(). Así cada hecho se compara con
+    unos pocos y no con todos.
+
+    Aproximación aceptada: dos hechos con similitud > umbral pero con ruido
+    a nivel de carácter (un cambio cada pocas letras) casi no comparten
+    n-gramas y no se detectan como duplicados. Los duplicados de la síntesis
+    (notas de agencia replicadas, cifras o palabras cambiadas) conservan
+    tramos intactos y sí se detectan.
+    """
+
+    def __init__(self, umbral: float = 0.7, n: int = 5, min_compartidos: float = 0.3):
+        """
+        Args:
+            umbral: Similitud por encima de la cual un hecho es duplicado
+            n: Tamaño de los n-gramas de caracteres
+            min_compartidos: Fracción de los n-gramas del hecho más corto que
+                dos hechos deben compartir para compararse
+        """
+        self.umbral = umbral
+        self.n = n
+        self.min_compartidos = min_compartidos
+        # Comparaciones con SequenceMatcher (para medir el filtro)
+        self.comparaciones = 0
+        self.hechos: List[str] = []
+        # Un matcher por hecho aceptado: el índice de caracteres del hecho
+        # existente (seq2) se arma una sola vez, no en cada comparación
+        self._matchers: List[SequenceMatcher] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._num_ngramas: List[int] = []
+        self._exactos: Set[str] = set()
+
+    def _ngramas(self, normalizado: str) -> Set[str]:
+        n = self.n
+        if len(normalizado) <= n:
+            return {normalizado}
+        return {normalizado[i:i + n] for i in range(len(normalizado) - n + 1)}
+
+    def agregar(self, hecho: str) -> bool:
+        """
+        Agrega un hecho si no es casi-duplicado de uno existente
+
+        Returns:
+            True si se agregó, False si era duplicado
+        """
+        hecho_lower = hecho.lower()
+        if hecho_lower in self._exactos:
+            # Copia textual (notas de agencia replicadas): similitud 1.0
+            return False
+
+        normalizado = normalizar(hecho)
+        ngramas = self._ngramas(normalizado)
+
+        compartidos = Counter()
+        for ngrama in ngramas:
+            compartidos.update(self._postings.get(ngrama, ()))
+
+        # Primero los que más n-gramas comparten: si hay duplicado, se encuentra antes
+        longitud = len(hecho_lower)
+        for idx, comunes in compartidos.most_common():
+            if comunes < self.min_compartidos * min(len(ngramas), self._num_ngramas[idx]):
+                # most_common() no ordena por fracción: se revisan todos
+                continue
+            matcher = self._matchers[idx]
+            # Cota de real_quick_ratio() sin tocar el matcher
+            otra = len(matcher.b)
+            if 2.0 * min(longitud, otra) / (longitud + otra) <= self.umbral:
+                continue
+            matcher.set_seq1(hecho_lower)
+            self.comparaciones += 1
+            if matcher.quick_ratio() > self.umbral and matcher.ratio() > self.umbral:
+                return False
+
+        idx = len(self.hechos)
+        for ngrama in ngramas:
+            self._postings[ngrama].append(idx)
+        self.hechos.append(hecho)
+        self._num_ngramas.append(len(ngramas))
+        self._matchers.append(SequenceMatcher(None, '', hecho_lower))
+        self._exactos.add(hecho_lower)
+        return True
+
+    def agregar_lote(self, hechos: List[str]) -> List[str]:
+        """Agrega hechos en orden y retorna la lista de únicos"""
+        for hecho in hechos:
+            self.agregar(hecho)
+        return self.hechos
+
+
+def deduplicar_hechos(hechos: List[str], umbral: float = 0.7) -> List[str]:
+    """
+    Elimina hechos casi-duplicados conservando el primero de cada grupo
+
+    Args:
+        hechos: Hechos en orden de extracción
+        umbral: Similitud por encima de la cual se considera duplicado
+
+    Returns:
+        Hechos únicos
+    """
+    return FactDedupIndex(umbral).agregar_lote(hechos)
+
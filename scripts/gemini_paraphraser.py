@@ -14,6 +14,8 @@ import time
 import itertools
 from threading import Lock
 
+from pipeline_tracer import trazar
+
 load_dotenv()
 
 # Cargar múltiples keys para rotación
@@ -22,13 +24,22 @@ GEMINI_API_KEY_2 = os.getenv('GEMINI_API_KEY_2')
 GEMINI_API_KEY_3 = os.getenv('GEMINI_API_KEY_3')
 GEMINI_API_KEY_4 = os.getenv('GEMINI_API_KEY_4')
 
-GEMINI_API_URL_BASE = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent'
+# GEMINI_BASE_URL permite apuntar a un servidor compatible (ej: mock_llm_server.py)
+GEMINI_BASE_URL = os.getenv('GEMINI_BASE_URL', 'https://generativelanguage.googleapis.com').rstrip('/')
+GEMINI_MODEL = 'gemini-2.5-flash-lite'
+GEMINI_API_URL_BASE = f'{GEMINI_BASE_URL}/v1beta/models/{GEMINI_MODEL}:generateContent'
 
 
 class GeminiParaphraser:
     """Parafraseo rápido con Gemini API para placeholders con rotación de keys"""
     
-    def __init__(self, api_keys: List[str] = None):
+    def __init__(self, api_keys: List[str] = None, base_url: str = None):
+        # URL del endpoint (override para pruebas de carga locales)
+        self.api_url_base = (
+            f"{base_url.rstrip('/')}/v1beta/models/{GEMINI_MODEL}:generateContent"
+            if base_url else GEMINI_API_URL_BASE
+        )
+
         # Cargar todas las keys disponibles
         if api_keys:
             self.api_keys = [k for k in api_keys if k]
@@ -154,17 +165,19 @@ Tu reescritura (SIN firmas, SIN metadata):"""
         try:
             # Obtener key para este request (rotación automática)
             api_key = self._get_next_key()
-            api_url = f"{GEMINI_API_URL_BASE}?key={api_key}"
+            api_url = f"{self.api_url_base}?key={api_key}"
             
             self.request_count += 1
             
-            response = requests.post(
-                api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
+            with trazar("llm.gemini", "llm") as span:
+                response = requests.post(
+                    api_url,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=30
+                )
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             self.success_count += 1
             
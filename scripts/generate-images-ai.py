@@ -5,35 +5,45 @@ Crea imágenes basadas en el contenido de artículos de noticias
 Modelo: blackboxai/black-forest-labs/flux-schnell ($0.003/imagen)
 """
 
-import os
 import json
-import requests
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import List, Dict
-import time
-import base64
 
-load_dotenv()
+from ai_image_client import AIImageClient
 
-API_KEY = os.getenv('BLACKBOX_API_KEY')
-API_URL = 'https://api.blackbox.ai/chat/completions'
 
 class AIImageGenerator:
     """Genera imágenes usando IA (Flux Schnell de Blackbox)"""
     
-    def __init__(self, output_dir='images/news', api_key: str = None):
+    def __init__(
+        self,
+        output_dir='images/news',
+        api_key: str = None,
+        base_url: str = None,
+        max_concurrencia: int = 4,
+        cache_dir: str = None
+    ):
+        """
+        Args:
+            output_dir: Directorio de salida
+            api_key: Key de Blackbox (default: BLACKBOX_API_KEY)
+            base_url: Servidor compatible (default: BLACKBOX_BASE_URL)
+            max_concurrencia: Imágenes generándose a la vez en process_articles
+            cache_dir: Cache por hash de prompt (default: data/ai_image_cache)
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.api_key = api_key or API_KEY
-        if not self.api_key:
-            raise ValueError("BLACKBOX_API_KEY no encontrada en .env")
-        
-        self.headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}'
-        }
+        # El cliente valida la key y evita pagar dos veces el mismo prompt
+        self.client = AIImageClient(
+            api_key=api_key,
+            base_url=base_url,
+            max_concurrencia=max_concurrencia,
+            cache_dir=cache_dir
+        )
+        self.api_url = self.client.api_url
+        self.api_key = self.client.api_key
+        self.headers = self.client.headers
         
         self.width = 1200
         self.height = 600
@@ -82,85 +92,17 @@ Requirements:
         """
         # Usar Flux Schnell: rápido, económico ($0.003/imagen), hasta 4 imágenes
         # Alternativas: flux-dev ($0.025), flux-1.1-pro ($0.04), flux-pro ($0.055)
-        payload = {
-            "model": "blackboxai/black-forest-labs/flux-schnell",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1000
-        }
-        
-        try:
-            print(f"    🎨 Generando imagen con Flux Schnell...", end=" ")
-            
-            response = requests.post(API_URL, headers=self.headers, json=payload, timeout=60)
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # La respuesta puede contener la imagen en diferentes formatos
-            # Intentar extraer la URL o datos de la imagen
-            image_data = None
-            image_url = None
-            
-            # Verificar si hay una URL de imagen en la respuesta
-            if 'choices' in result and len(result['choices']) > 0:
-                content = result['choices'][0].get('message', {}).get('content', '')
-                
-                # Buscar URL de imagen en el contenido
-                if 'http' in content:
-                    # Extraer URL
-                    import re
-                    urls = re.findall(r'https?://[^\s<>"]+', content)
-                    if urls:
-                        image_url = urls[0]
-                
-                # O puede venir como base64
-                elif 'base64' in content or len(content) > 1000:
-                    image_data = content
-            
-            # Descargar o guardar la imagen
-            filename = f"article_{article_id}_{index}.jpg"
-            filepath = self.output_dir / filename
-            
-            if image_url:
-                # Descargar desde URL
-                img_response = requests.get(image_url, timeout=30)
-                img_response.raise_for_status()
-                
-                with open(filepath, 'wb') as f:
-                    f.write(img_response.content)
-                
-                print("✅")
-                return str(filepath)
-                
-            elif image_data:
-                # Guardar desde base64
-                if 'base64,' in image_data:
-                    image_data = image_data.split('base64,')[1]
-                
-                img_bytes = base64.b64decode(image_data)
-                
-                with open(filepath, 'wb') as f:
-                    f.write(img_bytes)
-                
-                print("✅")
-                return str(filepath)
-            
-            else:
-                print("⚠️  No se pudo extraer imagen de la respuesta")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error en API: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        print(f"    🎨 Generando imagen con Flux Schnell...", end=" ")
+        
+        filepath = self.output_dir / f"article_{article_id}_{index}.jpg"
+        resultado = self.client.generar(prompt, filepath)
+        
+        if resultado['error']:
+            print(f"❌ Error: {resultado['error']}")
             return None
+        
+        print("✅ (cached)" if resultado['desde_cache'] else "✅")
+        return resultado['ruta']
     
     def process_articles(self, articles: List[Dict]) -> List[Dict]:
         """
@@ -179,34 +121,35 @@ Requirements:
         print(f"   Modelo: Flux Schnell (Black Forest Labs)")
         print(f"{'='*70}")
         
+        prompts, destinos = [], []
         for idx, article in enumerate(articles, 1):
-            title = article.get('title', 'Sin título')[:60]
             article_id = article.get('variation_id', idx)
-            
-            print(f"\n[{idx}/{len(articles)}] {title}...")
-            
-            # Crear prompt
-            prompt = self.create_image_prompt(article)
-            print(f"    📝 Prompt: {prompt[:100]}...")
-            
-            # Generar imagen
-            image_path = self.generate_image(prompt, article_id, idx)
+            prompts.append(self.create_image_prompt(article))
+            destinos.append(self.output_dir / f"article_{article_id}_{idx}.jpg")
+        
+        # Todas las imágenes en un lote: max_concurrencia requests en vuelo
+        # y los prompts repetidos o ya generados salen de la cache
+        def progreso(hechas: int, total: int):
+            print(f"    🎨 [{hechas}/{total}] {articles[hechas - 1].get('title', 'Sin título')[:60]}...")
+        
+        resultados_lote = self.client.generar_lote(prompts, destinos, progreso)
+        
+        for article, prompt, resultado in zip(articles, prompts, resultados_lote):
+            if resultado['error']:
+                print(f"    ❌ {article.get('title', 'Sin título')[:60]}: {resultado['error']}")
             
             # Agregar ruta de imagen al artículo
             article_with_image = article.copy()
-            article_with_image['ai_image_path'] = image_path
+            article_with_image['ai_image_path'] = resultado['ruta']
             article_with_image['image_prompt'] = prompt
             
             results.append(article_with_image)
-            
-            # Pausa para no saturar la API
-            if idx % 3 == 0:
-                time.sleep(2)
         
         print(f"\n{'='*70}")
         print(f"✨ Proceso completado")
         successful = sum(1 for r in results if r.get('ai_image_path'))
         print(f"📊 Imágenes generadas: {successful}/{len(articles)}")
+        print(f"💾 Desde cache: {self.client.stats['desde_cache'] + self.client.stats['duplicadas']} (sin costo)")
         print(f"📂 Directorio: {self.output_dir.absolute()}")
         print(f"{'='*70}")
         
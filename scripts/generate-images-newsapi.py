@@ -13,6 +13,8 @@ from typing import List, Dict
 import time
 import hashlib
 
+from pipeline_tracer import trazar
+
 class NewsAPIImageGenerator:
     """Descarga imágenes reales de las noticias desde NewsAPI"""
     
@@ -45,6 +47,8 @@ class NewsAPIImageGenerator:
             
             # Verificar si ya existe (solo si use_cache está habilitado)
             if self.use_cache and filepath.exists():
+                with trazar("http.imagen_newsapi", "http") as span:
+                    span.marcar_cache_hit()
                 print(f"    ✅ (cached)")
                 return str(filepath)
             
@@ -54,8 +58,10 @@ class NewsAPIImageGenerator:
             }
             
             # Descargar imagen
-            response = requests.get(image_url, headers=headers, timeout=30, allow_redirects=True)
-            response.raise_for_status()
+            with trazar("http.imagen_newsapi", "http") as span:
+                response = requests.get(image_url, headers=headers, timeout=30, allow_redirects=True)
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             # Verificar que es una imagen válida
             content_type = response.headers.get('Content-Type', '')
@@ -95,8 +101,10 @@ class NewsAPIImageGenerator:
             filename = f"article_{article_id}_{index}.jpg"
             filepath = self.output_dir / filename
             
-            response = requests.get(fallback_url, timeout=30)
-            response.raise_for_status()
+            with trazar("http.imagen_fallback", "http") as span:
+                response = requests.get(fallback_url, timeout=30)
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             with open(filepath, 'wb') as f:
                 f.write(response.content)
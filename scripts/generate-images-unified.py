@@ -84,13 +84,9 @@ class UnifiedImageGenerator:
         """
         try:
             import requests
-            from dotenv import load_dotenv
             
-            load_dotenv()
-            api_key = os.getenv('BLACKBOX_API_KEY')
-            
-            if not api_key:
-                return False
+            # Misma key y URL (BLACKBOX_BASE_URL) que el generador de IA
+            api_key = self.ai_generator.api_key
             
             # Test simple
             headers = {
@@ -104,7 +100,7 @@ class UnifiedImageGenerator:
             }
             
             response = requests.post(
-                'https://api.blackbox.ai/chat/completions',
+                self.ai_generator.api_url,
                 headers=headers,
                 json=payload,
                 timeout=10
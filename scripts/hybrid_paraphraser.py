@@ -14,18 +14,24 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import requests
 
+from utils.blackbox import api_url
+
 load_dotenv()
 
 BLACKBOX_API_KEY_PRO = os.getenv('BLACKBOX_API_KEY_PRO')
 BLACKBOX_MODEL_PRO = os.getenv('BLACKBOX_MODEL_PRO', os.getenv('BLACKBOX_CURRENT_MODEL', 'blackboxai/x-ai/grok-code-fast-1:free'))
-BLACKBOX_API_URL = 'https://api.blackbox.ai/chat/completions'
 
 
 class HybridParaphraser:
     """Sistema híbrido que usa Blackbox Pro + Gemini paralelo + Blackbox Free"""
     
-    def __init__(self):
-        self.gemini = GeminiParaphraser()  # 4 keys Gemini
+    def __init__(self, base_url: str = None):
+        """
+        Args:
+            base_url: Servidor compatible para Blackbox y Gemini (ej: mock_llm_server.py)
+        """
+        self.gemini = GeminiParaphraser(base_url=base_url)  # 4 keys Gemini
+        self.api_url = api_url(base_url)
         
         # Verificar Blackbox
         if not BLACKBOX_API_KEY_PRO:
@@ -112,7 +118,7 @@ Artículo expandido:"""
                 'Authorization': f'Bearer {self.blackbox_key}'
             }
             
-            response = requests.post(BLACKBOX_API_URL, headers=headers, json=payload, timeout=90)
+            response = requests.post(self.api_url, headers=headers, json=payload, timeout=90)
             response.raise_for_status()
             
             result = response.json()
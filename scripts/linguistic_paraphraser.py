@@ -221,11 +221,15 @@ class LinguisticParaphraser:
             "changes_count": changes_made
         }
 
-    def paraphrase_article(self, article: Dict) -> Dict:
+    def paraphrase_article(self, article: Dict, copiar: bool = True) -> Dict:
         """
         Procesa un artículo completo (título y descripción/contenido)
+
+        Args:
+            article: Artículo a parafrasear
+            copiar: Si False, reemplaza los campos parafraseados en el mismo dict
         """
-        new_article = article.copy()
+        new_article = article.copy() if copiar else article
         
         # Parafrasear título (con cuidado, menos agresivo)
         if 'title' in article:
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Streaming de Respuestas LLM
+Lee completions en streaming (SSE estilo OpenAI/Blackbox) y arma el artículo
+de forma progresiva: el título se publica en cuanto llega [TÍTULO] y cada
+párrafo en cuanto se cierra, con corte opcional por presupuesto de tokens.
+"""
+
+import json
+from typing import Callable, Dict, Iterator, List, Optional
+
+MARCADOR_TITULO = "[TÍTULO]"
+MARCADOR_CUERPO = "[ARTÍCULO]"
+
+# Aproximación estándar para texto en español/inglés
+CARACTERES_POR_TOKEN = 4
+
+
+def iterar_deltas_sse(response) -> Iterator[str]:
+    """
+    Itera los fragmentos de texto de una respuesta chat/completions con stream=True
+
+    Args:
+        response: Respuesta de requests abierta con stream=True
+
+    Yields:
+        Fragmentos de texto (choices[0].delta.content)
+    """
+    for linea in response.iter_lines():
+        if not linea:
+            continue
+        # Decodificar aquí: requests asume latin-1 para text/event-stream sin charset
+        linea = linea.decode("utf-8") if isinstance(linea, bytes) else linea
+        if not linea.startswith("data:"):
+            continue
+
+        datos = linea[5:].strip()
+        if datos == "[DONE]":
+            return
+
+        try:
+            evento = json.loads(datos)
+        except json.JSONDecodeError:
+            continue
+
+        choices = evento.get("choices") or []
+        if not choices:
+            continue
+        delta = choices[0].get("delta") or {}
+        texto = delta.get("content")
+        if texto:
+            yield texto
+
+
+class StreamingArticleParser:
+    """Parser incremental del formato [TÍTULO] ... [ARTÍCULO] ..."""
+
+    def __init__(
+        self,
+        on_titulo: Optional[Callable[[str], None]] = None,
+        on_parrafo: Optional[Callable[[str], None]] = None,
+        max_tokens: Optional[int] = None,
+    ):
+        """
+        Args:
+            on_titulo: Callback al detectar el título completo
+            on_parrafo: Callback por cada párrafo completo del cuerpo
+            max_tokens: Presupuesto aproximado de tokens (None = sin límite)
+        """
+        self.on_titulo = on_titulo
+        self.on_parrafo = on_parrafo
+        self.max_tokens = max_tokens
+
+        self.titulo: Optional[str] = None
+        self.parrafos: List[str] = []
+        self.truncado = False
+
+        # Fragmentos acumulados en listas: concatenar con += copia todo el
+        # texto en cada delta (cuadrático con miles de fragmentos)
+        self._fragmentos: List[str] = []
+        self._buffer = ""
+        self._pendientes: List[str] = []
+        self._en_cuerpo = False
+        self._caracteres = 0
+
+    @property
+    def texto_completo(self) -> str:
+        """Texto recibido hasta el momento"""
+        return "".join(self._fragmentos)
+
+    @property
+    def tokens_aproximados(self) -> int:
+        return self._caracteres // CARACTERES_POR_TOKEN
+
+    def alimentar(self, fragmento: str) -> bool:
+        """
+        Procesa un fragmento del stream
+
+        Args:
+            fragmento: Texto recibido
+
+        Returns:
+            False si se agotó el presupuesto de tokens (el llamador debe cortar)
+        """
+        self._fragmentos.append(fragmento)
+        self._caracteres += len(fragmento)
+        self._pendientes.append(fragmento)
+
+        # Solo un salto de línea o el cierre de un marcador puede completar
+        # el título o un párrafo: el resto de los fragmentos esperan en la lista
+        if "\n" in fragmento or "]" in fragmento:
+            self._consolidar_buffer()
+            if not self._en_cuerpo:
+                self._procesar_cabecera()
+            if self._en_cuerpo:
+                self._emitir_parrafos_completos()
+
+        if self.max_tokens and self.tokens_aproximados >= self.max_tokens:
+            self.truncado = True
+            return False
+        return True
+
+    def _consolidar_buffer(self):
+        """Une los fragmentos pendientes al buffer en una sola operación"""
+        if self._pendientes:
+            self._pendientes.insert(0, self._buffer)
+            self._buffer = "".join(self._pendientes)
+            self._pendientes = []
+
+    def _procesar_cabecera(self):
+        """Publica el título en cuanto su línea se cierra y detecta [ARTÍCULO]"""
+        if self.titulo is None and MARCADOR_TITULO in self._buffer:
+            resto = self._buffer.split(MARCADOR_TITULO, 1)[1].lstrip()
+            if "\n" in resto:
+                linea = resto.split("\n", 1)[0]
+                if not linea.startswith(MARCADOR_CUERPO):
+                    self._publicar_titulo(linea)
+
+        if MARCADOR_CUERPO in self._buffer:
+            cabecera, self._buffer = self._buffer.split(MARCADOR_CUERPO, 1)
+            if self.titulo is None:
+                self._publicar_titulo(cabecera)
+            self._en_cuerpo = True
+            return
+
+        # Sin marcadores: el primer bloque es el título (mismo fallback que sin streaming)
+        if MARCADOR_TITULO not in self._buffer and "\n\n" in self._buffer.strip():
+            cabecera, self._buffer = self._buffer.strip().split("\n\n", 1)
+            self._publicar_titulo(cabecera)
+            self._en_cuerpo = True
+
+    def _publicar_titulo(self, cabecera: str):
+        titulo = cabecera.replace(MARCADOR_TITULO, "").strip().strip("[]").strip()
+        if titulo:
+            self.titulo = titulo[:150]
+            if self.on_titulo:
+                self.on_titulo(self.titulo)
+
+    def _emitir_parrafos_completos(self):
+        """Publica los párrafos cerrados por doble salto de línea"""
+        while "\n\n" in self._buffer:
+            parrafo, self._buffer = self._buffer.split("\n\n", 1)
+            self._publicar_parrafo(parrafo)
+
+    def _publicar_parrafo(self, parrafo: str):
+        parrafo = parrafo.strip()
+        if parrafo:
+            self.parrafos.append(parrafo)
+            if self.on_parrafo:
+                self.on_parrafo(parrafo)
+
+    def finalizar(self) -> Dict:
+        """
+        Cierra el stream publicando lo que quede en el buffer
+
+        Returns:
+            Dict con title, paragraphs, full_text, truncated y tokens
+        """
+        self._consolidar_buffer()
+        if not self._en_cuerpo:
+            # El stream terminó sin separar cabecera y cuerpo
+            self._procesar_cabecera()
+            if not self._en_cuerpo and self.titulo is None:
+                self._publicar_titulo(self._buffer.split("\n", 1)[0])
+                self._buffer = self._buffer.split("\n", 1)[1] if "\n" in self._buffer else ""
+            self._en_cuerpo = True
+
+        self._emitir_parrafos_completos()
+        self._publicar_parrafo(self._buffer)
+        self._buffer = ""
+
+        return {
+            "title": self.titulo,
+            "paragraphs": list(self.parrafos),
+            "full_text": "\n\n".join(self.parrafos),
+            "truncated": self.truncado,
+            "tokens": self.tokens_aproximados,
+        }
+
+
+def consumir_stream(response, parser: StreamingArticleParser) -> Dict:
+    """
+    Alimenta el parser con una respuesta en streaming y corta si se excede
+    el presupuesto de tokens (cerrar la conexión detiene la generación)
+
+    Args:
+        response: Respuesta de requests abierta con stream=True
+        parser: Parser configurado con callbacks/presupuesto
+
+    Returns:
+        Resultado de parser.finalizar()
+    """
+    try:
+        for fragmento in iterar_deltas_sse(response):
+            if not parser.alimentar(fragmento):
+                break
+    finally:
+        response.close()
+    return parser.finalizar()
@@ -8,8 +8,11 @@ import os
 import random
 from pathlib import Path
 
+from storage_backend import DiskStorage, StorageBackend
+
 class LogoGeneratorSVG:
-    def __init__(self, assets_dir: str = None):
+    def __init__(self, assets_dir: str = None, storage: StorageBackend = None):
+        self.storage = storage or DiskStorage()
         self.assets_dir = Path(assets_dir) if assets_dir else Path(__file__).parent.parent / "assets"
         self.svg_icons_dir = self.assets_dir / "svg-icons"
         
@@ -233,10 +236,7 @@ class LogoGeneratorSVG:
     def save_logo(self, svg_content: str, output_path: str) -> str:
         """Guarda logo SVG a archivo"""
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        self.storage.escribir(output_file, svg_content)
         
         return str(output_file)
     
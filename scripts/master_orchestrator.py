@@ -6,7 +6,6 @@ Orquesta todo el proceso desde descarga de noticias hasta sitios completos
 
 import json
 import os
-import shutil
 import sys
 import time
 from datetime import datetime
@@ -45,8 +44,11 @@ try:
 
     # Importar módulos con guiones bajos normalmente
     from advanced_layout_generator import AdvancedLayoutGenerator
+    from article_registry import ArticleRegistry
+    from article_store import ArticleStore
     from blackbox_parallel import BlackboxParallelParaphraser
     from categorizer import NewsCategorizador
+    from client_search import ClientSearchGenerator
     from domain_verifier import DomainVerifier
     from enhanced_components import EnhancedComponents
     from featured_manager import FeaturedManager
@@ -56,15 +58,35 @@ try:
     from linguistic_paraphraser import LinguisticParaphraser
     from logo_generator_svg import LogoGeneratorSVG, generar_logo_svg
     from multi_layout_generator import MultiLayoutGenerator
-    from og_image_generator import OGImageGenerator
     from paraphrase import NewsParaphraser
+    from pipeline_tracer import PipelineTracer, activar_tracer, exportar_chrome_trace
+    from precompression import Precompressor
     from placeholder_generator import PlaceholderGenerator
     from preloader_generator import PreloaderGenerator
+    from render_executor import (
+        CAMPOS_ARTICULO,
+        CAMPOS_OG,
+        CAMPOS_SIDEBAR,
+        CAMPOS_TARJETA,
+        PAGINAS_LEGALES,
+        ContextoSitio,
+        RenderExecutor,
+        compactar,
+        renderizar_articulo,
+        renderizar_etiqueta,
+        renderizar_legal,
+        renderizar_og,
+        renderizar_pagina_categoria,
+    )
     from rss_generator import RSSGenerator
+    from run_metrics import RunMetricsStore
+    from search_index import SearchIndex
+    from storage_backend import crear_storage
     from section_generator import SectionGenerator
     from seo_metadata_generator import SEOMetadataGenerator
     from site_name_generator import SiteNameGenerator
     from site_pre_creation import SitePreCreation
+    from sitemap_generator import SitemapGenerator
     from template_combiner import TemplateCombiner
 
 except ImportError as e:
@@ -81,13 +103,20 @@ load_dotenv()
 class MasterOrchestrator:
     """Orquestador principal del flujo completo de generación"""
 
-    def __init__(self, output_base_dir: str = None, usar_api_whois: bool = False):
+    def __init__(
+        self,
+        output_base_dir: str = None,
+        usar_api_whois: bool = False,
+        usar_registro: bool = True,
+    ):
         """
         Inicializa el orquestador
 
         Args:
             output_base_dir: Directorio base para sitios generados
             usar_api_whois: Si True, usa APILayer WHOIS API. Si False, usa whois local
+            usar_registro: Si True, omite noticias ya procesadas en ejecuciones
+                anteriores y reutiliza su salida
         """
         # Usar rutas absolutas basadas en la ubicación del script
         script_dir = Path(__file__).parent
@@ -120,11 +149,21 @@ class MasterOrchestrator:
 
         # Componentes SEO y categorización
         self.categorizador = NewsCategorizador()
-        self.rss_generator = RSSGenerator()
+        # Destino de los archivos: disco o bucket S3/R2 según STORAGE_TYPE
+        self.storage = crear_storage(self.output_base_dir)
+        self.rss_generator = RSSGenerator(storage=self.storage)
         self.seo_generator = SEOMetadataGenerator()
-        self.section_generator = SectionGenerator()
-        self.og_image_generator = OGImageGenerator()
+        self.section_generator = SectionGenerator(storage=self.storage)
+        self.client_search = ClientSearchGenerator(storage=self.storage)
+        # Índice BM25 del sitio en construcción (paso 7): lo reusan las
+        # páginas de categoría y de etiqueta del paso 9
+        self.indice_busqueda = None
+        self.sitemap_generator = SitemapGenerator(storage=self.storage)
         self.preloader_generator = PreloaderGenerator()
+        self.precompressor = Precompressor()
+        # Render de páginas en un pool de procesos (uno por núcleo); los
+        # workers crean el mismo tipo de storage y publican directo
+        self.render_executor = RenderExecutor(storage=self.storage, raiz=self.output_base_dir)
 
         # Componentes de sistema paralelo
         self.gemini_paraphraser = GeminiParaphraser()
@@ -135,15 +174,24 @@ class MasterOrchestrator:
         self.layout_generator_multi = MultiLayoutGenerator()
         self.advanced_layout = AdvancedLayoutGenerator()
         self.legal_generator = LegalPagesGenerator()
-        self.logo_generator = LogoGeneratorSVG()
+        self.logo_generator = LogoGeneratorSVG(storage=self.storage)
         self.linguistic_paraphraser = None  # Lazy init
 
+        # Registro entre ejecuciones de noticias ya procesadas
+        self.registro = (
+            ArticleRegistry(self.data_dir / "article_registry.sqlite3")
+            if usar_registro
+            else None
+        )
+        self.articulos_reutilizados: List[Dict] = []
+
         # Timestamp para esta ejecución
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Estadísticas
         self.stats = {
             "noticias_descargadas": 0,
+            "noticias_reutilizadas": 0,
             "articulos_principales": 0,
             "placeholders_generados": 0,
             "noticias_parafraseadas": 0,
@@ -152,6 +200,14 @@ class MasterOrchestrator:
             "tiempo_inicio": time.time(),
         }
 
+        # Duración real de cada paso (se guarda en el run_summary)
+        self.tiempos_pasos = {}
+
+        # Trace JSON-lines de pasos y llamadas externas (LLM, HTTP, WHOIS, imágenes)
+        self.trace_path = self.output_base_dir / f"trace_{self.run_id}.jsonl"
+        self.tracer = PipelineTracer(self.trace_path, run_id=self.run_id)
+        activar_tracer(self.tracer)
+
     def _get_next_site_number(self) -> int:
         """
         Detecta sitios existentes y retorna el siguiente número disponible
@@ -177,6 +233,16 @@ class MasterOrchestrator:
 
         return max(site_numbers) + 1
 
+    def _cronometrar(self, nombre_paso: str, funcion, *args, **kwargs):
+        """Ejecuta un paso dentro de un span del tracer y guarda su duración"""
+        span = None
+        try:
+            with self.tracer.span(nombre_paso, "paso") as span:
+                return funcion(*args, **kwargs)
+        finally:
+            if span is not None:
+                self.tiempos_pasos[nombre_paso] = round(span.duracion, 3)
+
     def log(self, message: str, level: str = "INFO"):
         """Log con timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -207,8 +273,17 @@ class MasterOrchestrator:
         self.log("PASO 1: Descargando Noticias", "PROGRESS")
         self.log("=" * 70)
 
-        # Si no se fuerza descarga, intentar usar archivo existente
+        # Si no se fuerza descarga, usar la última descarga del almacén
         if not force_download:
+            with ArticleStore() as store:
+                noticias = store.cargar(limite=num_noticias)
+            if noticias:
+                self.log(f"Usando las noticias más recientes del almacén ({store.db_path.name})")
+                self.stats["noticias_descargadas"] = len(noticias)
+                self.log(f"Cargadas {len(noticias)} noticias originales", "SUCCESS")
+                return self._filtrar_conocidas(noticias)
+
+            # Compatibilidad: archivos JSON de descargas anteriores al almacén
             noticias_files = list(self.data_dir.glob("noticias_newsapi_*.json"))
             if noticias_files:
                 latest_file = max(noticias_files, key=lambda p: p.stat().st_mtime)
@@ -219,13 +294,12 @@ class MasterOrchestrator:
 
                 self.stats["noticias_descargadas"] = len(noticias)
                 self.log(f"Cargadas {len(noticias)} noticias originales", "SUCCESS")
-                return noticias[:num_noticias]
+                return self._filtrar_conocidas(noticias)[:num_noticias]
 
-        # Descargar noticias en vivo desde NewsAPI
-        self.log("Descargando noticias en vivo desde NewsAPI...", "PROGRESS")
+        # Descargar noticias en vivo de todos los proveedores configurados
+        self.log("Descargando noticias en vivo (multi-proveedor)...", "PROGRESS")
 
         try:
-            # Importar el módulo de NewsAPI
             import sys
             from pathlib import Path
 
@@ -233,25 +307,89 @@ class MasterOrchestrator:
             if str(api_dir) not in sys.path:
                 sys.path.insert(0, str(api_dir))
 
-            from newsapi import fetch_newsapi
+            from aggregator import NewsAggregator
 
-            # Descargar noticias
-            noticias = fetch_newsapi(
+            aggregator = NewsAggregator(page_size=min(num_noticias, 50))
+            if not aggregator.proveedores:
+                raise ValueError("No hay proveedores de noticias configurados en .env")
+
+            noticias = aggregator.descargar(
+                max_articulos=num_noticias,
+                enrich=True,
+                filtrar=self._filtrar_conocidas,
                 query="política México",
                 language="es",
-                page_size=num_noticias,
-                enrich=True,
-                silent=False,
             )
 
-            self.stats["noticias_descargadas"] = len(noticias)
-            self.log(f"Descargadas {len(noticias)} noticias desde NewsAPI", "SUCCESS")
+            self.stats["noticias_descargadas"] = sum(
+                stats["articulos"] for stats in aggregator.stats.values()
+            )
+            self.log(
+                f"Descargadas {self.stats['noticias_descargadas']} noticias de "
+                f"{', '.join(aggregator.proveedores)}",
+                "SUCCESS",
+            )
+
+            with ArticleStore() as store:
+                store.agregar(noticias, lote=f"multi_{self.run_id}")
             return noticias
 
         except Exception as e:
             self.log(f"Error descargando noticias: {e}", "ERROR")
             return []
 
+    def _filtrar_conocidas(self, noticias: List[Dict]) -> List[Dict]:
+        """
+        Descarta noticias ya procesadas en ejecuciones anteriores y guarda
+        su salida previa en self.articulos_reutilizados
+
+        Args:
+            noticias: Noticias descargadas (antes de enriquecer)
+
+        Returns:
+            Noticias nuevas a procesar
+        """
+        if self.registro is None:
+            return noticias
+
+        nuevas, reutilizables = self.registro.filtrar_nuevos(noticias, self.run_id)
+        self.articulos_reutilizados.extend(reutilizables)
+        self.stats["noticias_reutilizadas"] = len(self.articulos_reutilizados)
+
+        self.log(
+            f"Registro: {len(nuevas)} nuevas, {len(reutilizables)} reutilizadas, "
+            f"{len(noticias) - len(nuevas) - len(reutilizables)} repetidas descartadas"
+        )
+        return nuevas
+
+    def _combinar_con_reutilizadas(
+        self, noticias_procesadas: List[Dict], total: int
+    ) -> List[Dict]:
+        """
+        Guarda en el registro la salida de las noticias nuevas y completa
+        el sitio con las salidas reutilizadas hasta `total` artículos
+
+        Args:
+            noticias_procesadas: Noticias nuevas ya parafraseadas y categorizadas
+            total: Número de artículos del sitio
+
+        Returns:
+            Noticias nuevas seguidas de las reutilizadas
+        """
+        if self.registro is None:
+            return noticias_procesadas
+
+        guardadas = self.registro.guardar_salidas(noticias_procesadas, self.run_id)
+        faltantes = max(0, total - len(noticias_procesadas))
+        reutilizadas = self.articulos_reutilizados[:faltantes]
+
+        self.log(
+            f"Registro: {guardadas} salidas guardadas, {len(reutilizadas)} reutilizadas "
+            f"(total registrado: {self.registro.total()})",
+            "SUCCESS",
+        )
+        return noticias_procesadas + reutilizadas
+
     def paso_2_parafrasear_noticias(self, noticias: List[Dict]) -> List[Dict]:
         """
         Paso 2: Parafrasea artículos principales con Blackbox Pro
@@ -280,8 +418,20 @@ class MasterOrchestrator:
         # Verificar si hay 2 keys de Blackbox para usar paralelo
         if len(self.blackbox_parallel.api_configs) >= 2:
             self.log("Usando sistema paralelo (2 workers)", "SUCCESS")
+            # Streaming (LLM_STREAMING=0 lo desactiva): cada título se anuncia
+            # apenas llega y LLM_STREAM_MAX_TOKENS corta artículos desbocados
+            stream = os.getenv("LLM_STREAMING", "1").lower() not in ("0", "false", "no")
+            max_tokens = os.getenv("LLM_STREAM_MAX_TOKENS")
+
+            def anunciar_titulo(articulo: Dict):
+                self.log(f"  📝 Título recibido: {articulo.get('title', '')[:60]}")
+
             noticias_parafraseadas = self.blackbox_parallel.parafrasear_lote_paralelo(
-                noticias_principales, max_workers=2
+                noticias_principales,
+                max_workers=2,
+                stream=stream,
+                on_titulo=anunciar_titulo if stream else None,
+                max_tokens_stream=int(max_tokens) if max_tokens else None,
             )
         else:
             self.log("Usando parafraseo secuencial (1 key)")
@@ -296,8 +446,10 @@ class MasterOrchestrator:
                         f"  [{noticia_idx}/{len(noticias_principales)}] {noticia.get('title', '')[:50]}..."
                     )
 
+                    # Las noticias descargadas no se vuelven a usar: se
+                    # parafrasean en el mismo dict en vez de copiarlo
                     paraphrased = self.paraphraser.paraphrase_article(
-                        noticia, style=style
+                        noticia, style=style, copiar=False
                     )
 
                     # Generar metadata del sitio si no existe para obtener el nombre
@@ -349,7 +501,7 @@ class MasterOrchestrator:
             )
 
             # Parafrasear
-            resultado = self.linguistic_paraphraser.paraphrase_article(noticia)
+            resultado = self.linguistic_paraphraser.paraphrase_article(noticia, copiar=False)
             noticias_parafraseadas.append(resultado)
             self.stats["noticias_parafraseadas"] += 1
 
@@ -409,8 +561,10 @@ class MasterOrchestrator:
         method = "IA (Blackbox)" if use_ai else "Keywords"
         self.log(f"Método de categorización: {method}")
 
+        # Las noticias ya son copias propias del flujo (salida del paso 2):
+        # se les agrega la categoría sin copiar cada dict otra vez
         noticias_categorizadas = self.categorizador.categorizar_lote(
-            noticias, use_ai=use_ai, batch_delay=0.3
+            noticias, use_ai=use_ai, batch_delay=0.3, copiar=False
         )
 
         self.log(
@@ -469,7 +623,7 @@ No text, no watermarks."""
                 # Mover a directorio del sitio
                 if image_path and Path(image_path).exists():
                     dest_path = site_images_dir / f"news_{idx}.jpg"
-                    shutil.copy2(image_path, dest_path)
+                    self.storage.copiar(image_path, dest_path)
                     imagenes[article_id] = str(dest_path)
                     self.stats["imagenes_generadas"] += 1
 
@@ -675,8 +829,7 @@ No text, no watermarks."""
             self.log(f"Preloader seleccionado: {preloader_tipo}")
 
             index_path = site_dir / "index.html"
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(index_html)
+            self.storage.escribir(index_path, index_html)
 
             # Generar páginas de artículos individuales
             self._generar_paginas_articulos(
@@ -690,7 +843,12 @@ No text, no watermarks."""
             self._copiar_css(site_dir, idx)
 
             sitios_generados.append(
-                {"index_path": str(index_path), "site_dir": site_dir, "site_num": idx}
+                {
+                    "index_path": str(index_path),
+                    "site_dir": site_dir,
+                    "site_num": idx,
+                    "num_articulos": len(noticias),
+                }
             )
             self.stats["sitios_creados"] += 1
 
@@ -748,138 +906,6 @@ No text, no watermarks."""
 
         return html
 
-    def _generar_sidebar_articulos(
-        self, otras_noticias: List[Dict], metadata: Dict
-    ) -> str:
-        """
-        Genera sidebar con miniaturas de otros artículos
-
-        Args:
-            otras_noticias: Lista de otras noticias con índices
-            metadata: Metadata del sitio
-
-        Returns:
-            str: HTML del sidebar
-        """
-        items_html = []
-        for i, noticia in enumerate(otras_noticias):
-            # Usar el índice de la noticia original si existe
-            article_idx = noticia.get("_display_index", i + 1)
-            title = noticia.get("title", "")
-            title_truncated = title if len(title) <= 80 else title[:80] + "..."
-
-            items_html.append(f"""
-                    <article class="sidebar-article">
-                        <a href="article_{article_idx}.html" class="sidebar-article-link">
-                            <div class="sidebar-article-image">
-                                <img src="images/news_{article_idx}.jpg" alt="{title[:50]}">
-                                <span class="sidebar-category">{noticia.get("category", "General")}</span>
-                            </div>
-                            <div class="sidebar-article-content">
-                                <h3 class="sidebar-article-title">{title_truncated}</h3>
-                                <span class="sidebar-article-date">{noticia.get("published_at", "")[:10]}</span>
-                            </div>
-                        </a>
-                    </article>""")
-
-        sidebar_html = f"""
-                <aside class="article-sidebar">
-                    <div class="sidebar-section">
-                        <h2 class="sidebar-title">Más Noticias</h2>
-                        <div class="sidebar-articles">
-{"".join(items_html)}
-                        </div>
-                    </div>
-
-                    <div class="sidebar-section sidebar-newsletter">
-                        <h3>Suscríbete</h3>
-                        <p>Recibe las últimas noticias en tu correo</p>
-                        <form class="newsletter-form">
-                            <input type="email" placeholder="Tu email" required>
-                            <button type="submit">Suscribirse</button>
-                        </form>
-                    </div>
-                </aside>"""
-
-        return sidebar_html
-
-    def _formatear_contenido_html(self, texto: str) -> str:
-        """
-        Convierte texto plano en HTML con estructura semántica y marcado
-        """
-        if not texto:
-            return ""
-
-        # Limpiar el texto: normalizar espacios y saltos de línea
-        texto = texto.strip()
-
-        # Si no hay dobles saltos de línea, intentar dividir por saltos simples
-        # pero solo si hay múltiples líneas
-        if "\n\n" not in texto and "\n" in texto:
-            # Si hay saltos simples pero no dobles, asumir que cada línea es un párrafo
-            parrafos = [p.strip() for p in texto.split("\n") if p.strip()]
-        else:
-            # Dividir por líneas vacías (doble salto de línea)
-            parrafos = [p.strip() for p in texto.split("\n\n") if p.strip()]
-
-        # Si solo hay un párrafo y es muy largo, dividirlo en párrafos más pequeños
-        # pero asegurándonos de no cortar oraciones a la mitad
-        if len(parrafos) == 1 and len(parrafos[0].split()) > 150:
-            # Dividir párrafo largo en segmentos de ~100 palabras, pero respetando oraciones completas
-            palabras = parrafos[0].split()
-            parrafos = []
-            current_parrafo = []
-            current_length = 0
-
-            # Procesar palabra por palabra para encontrar puntos seguidos de espacio o fin de oración
-            for i, palabra in enumerate(palabras):
-                current_parrafo.append(palabra)
-                current_length += len(palabra) + 1  # +1 por el espacio
-
-                # Si hemos alcanzado ~100 palabras y encontramos un punto (posible fin de oración)
-                if len(current_parrafo) >= 100 and (
-                    palabra.endswith(".")
-                    or palabra.endswith("!")
-                    or palabra.endswith("?")
-                ):
-                    # Verificar que no sea una abreviatura común
-                    if not (
-                        palabra.lower().endswith("dr.")
-                        or palabra.lower().endswith("sr.")
-                        or palabra.lower().endswith("sra.")
-                        or palabra.lower().endswith("etc.")
-                        or palabra.lower().endswith("ej.")
-                        or palabra.lower().endswith("e.g.")
-                        or palabra.lower().endswith("i.e.")
-                        or palabra.lower().endswith("u.s.")
-                        or palabra.lower().endswith("u.k.")
-                        or palabra.lower().endswith("a.m.")
-                        or palabra.lower().endswith("p.m.")
-                    ):
-                        # Completar el párrafo y empezar uno nuevo
-                        parrafos.append(" ".join(current_parrafo))
-                        current_parrafo = []
-                        current_length = 0
-
-            # Agregar el último párrafo si hay contenido restante
-            if current_parrafo:
-                parrafos.append(" ".join(current_parrafo))
-
-        # Envolver cada párrafo en tags <p> con clases semánticas
-        html_parrafos = []
-        for i, parrafo in enumerate(parrafos):
-            if parrafo:
-                # Limpiar saltos de línea internos y espacios múltiples
-                parrafo = " ".join(parrafo.split())
-
-                # Primer párrafo como lead/intro
-                if i == 0:
-                    html_parrafos.append(f'<p class="lead">{parrafo}</p>')
-                else:
-                    html_parrafos.append(f"<p>{parrafo}</p>")
-
-        return "\n                    ".join(html_parrafos)
-
     def _seleccionar_preloader_aleatorio(self) -> str:
         """Selecciona un tipo de preloader aleatorio"""
         import random
@@ -910,114 +936,102 @@ No text, no watermarks."""
         logo_path: str = None,
     ):
         """Genera páginas HTML individuales para cada artículo con sidebar"""
-        for idx, noticia in enumerate(noticias, 1):
-            # Generar sidebar con otros artículos (excluyendo el actual)
-            otras_noticias = []
-            for i, n in enumerate(noticias, 1):
-                if i != idx:
-                    n_copy = n.copy()
-                    n_copy["_display_index"] = i
-                    otras_noticias.append(n_copy)
-
-            sidebar_html = self._generar_sidebar_articulos(otras_noticias[:6], metadata)
-
-            # Generar metadatos SEO
-            article_url = (
-                f"{metadata.get('domain', 'https://ejemplo.com')}/article_{idx}.html"
-            )
-            seo_meta_tags = self.seo_generator.generar_meta_tags_articulo(
-                noticia, metadata, article_url, idx
-            )
+        # Índice BM25 del sitio: relacionados, etiquetas y búsqueda del cliente
+        indice = SearchIndex.desde_articulos(noticias)
+        self.indice_busqueda = indice
+        busqueda = self.client_search.generar(
+            indice, site_dir, metadata, lambda doc_id: f"article_{doc_id + 1}.html", logo_path
+        )
+        self.log(
+            f"  Búsqueda: {busqueda['fragmentos']} fragmentos, "
+            f"mayor {busqueda['mayor_fragmento'] / 1024:.1f} KB"
+        )
 
-            article_html = f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-{seo_meta_tags}
-    <title>{noticia.get("title", "Artículo")} - {metadata["nombre"]}</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    <header class="header">
-        <div class="container">
-            <div class="header-branding">
-                {'<img src="logo.jpg" alt="' + metadata["nombre"] + '" class="logo-img">' if logo_path else ""}
-                <h1 class="logo"><a href="index.html">{metadata["nombre"]}</a></h1>
-            </div>
-            <nav class="nav">
-                <a href="index.html" class="nav-link">Inicio</a>
-            </nav>
-        </div>
-    </header>
-
-    <main class="main article-page">
-        <div class="container">
-            <div class="article-layout">
-                <article class="article-full">
-                    <header class="article-header">
-                        <div class="article-category-badge">{noticia.get("category", "General")}</div>
-                        <h1 class="article-title">{noticia.get("title", "")}</h1>
-                        <div class="article-meta">
-                            <span class="author">Por {noticia.get("author", "Redacción")}</span>
-                            <span class="separator">•</span>
-                            <time class="date">{noticia.get("published_at", "")}</time>
-                        </div>
-                    </header>
-
-                    <figure class="article-image-wrapper">
-                        <img src="images/news_{idx}.jpg" alt="{noticia.get("title", "")}" class="article-image">
-                    </figure>
-
-                    <div class="article-content">
-                    {f'<h2 class="article-subtitle">{noticia.get("description", "")[:200]}{"..." if len(noticia.get("description", "")) > 200 else ""}</h2>' if noticia.get("description") else ""}
-                    {self._formatear_contenido_html(noticia.get("full_article", noticia.get("full_text", noticia.get("content", noticia.get("description", "")))))}
-                    </div>
-
-                    <footer class="article-footer">
-                        <div class="article-tags">
-                            <span class="tag">{noticia.get("category", "General")}</span>
-                        </div>
-                        <div class="article-share">
-                            <span>Compartir:</span>
-                            <a href="#" class="share-link">Facebook</a>
-                            <a href="#" class="share-link">Twitter</a>
-                            <a href="#" class="share-link">WhatsApp</a>
-                        </div>
-                    </footer>
-                </article>
-
-                {sidebar_html}
-            </div>
-        </div>
-    </main>
-
-    <footer class="footer">
-        <div class="container">
-            <p><a href="index.html">← Volver al inicio</a></p>
-            <p>&copy; 2026 {metadata["nombre"]}</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-
-            # Inyectar preloader (solo en el primer artículo para testing, o todos si prefieres)
-            if idx == 1:
-                # Seleccionar preloader aleatorio
-                preloader_tipo = self._seleccionar_preloader_aleatorio()
-                colores_preloader = {
-                    "primary": metadata.get("color_primario", "#667eea"),
-                    "secondary": metadata.get("color_secundario", "#764ba2"),
-                }
-                preloader_code = self.preloader_generator.generar_preloader_completo(
-                    preloader_tipo, colores_preloader
-                )
-                article_html = self.preloader_generator.inyectar_en_html(
-                    article_html, preloader_code
-                )
-                self.log(f"  Preloader: {preloader_tipo} (artículo {idx})")
+        # Metadatos SEO de todas las páginas (el head del sitio se arma una sola vez)
+        dominio = metadata.get("domain", "https://ejemplo.com")
+        metas_seo = self.seo_generator.generar_meta_tags_lote(
+            noticias, metadata, lambda i: f"{dominio}/article_{i}.html"
+        )
+
+        # Preloader aleatorio solo en el primer artículo
+        preloader_tipo = self._seleccionar_preloader_aleatorio()
+        preloader_code = self.preloader_generator.generar_preloader_completo(
+            preloader_tipo,
+            {
+                "primary": metadata.get("color_primario", "#667eea"),
+                "secondary": metadata.get("color_secundario", "#764ba2"),
+            },
+        )
+        self.log(f"  Preloader: {preloader_tipo} (artículo 1)")
+
+        # Por página solo lo que se pinta: relacionados y etiquetas se resuelven
+        # aquí con el índice para no enviarlo a cada proceso
+        paginas = [
+            {
+                "idx": idx,
+                "noticia": compactar(noticia, CAMPOS_ARTICULO),
+                "relacionados": [
+                    {**compactar(noticias[i - 1], CAMPOS_SIDEBAR), "_display_index": i}
+                    for i in self._seleccionar_relacionados(indice, idx, len(noticias))
+                ],
+                "etiquetas": indice.etiquetas(idx - 1, 3),
+                "seo": metas_seo[idx - 1],
+                "preloader": preloader_code if idx == 1 else None,
+            }
+            for idx, noticia in enumerate(noticias, 1)
+        ]
+        resultado = self.render_executor.renderizar(
+            renderizar_articulo,
+            ContextoSitio(site_dir, metadata, logo_path=logo_path),
+            paginas,
+            self._progreso_render("Artículos"),
+        )
+        self._log_render("Artículos", resultado)
 
-            article_path = site_dir / f"article_{idx}.html"
-            with open(article_path, "w", encoding="utf-8") as f:
-                f.write(article_html)
+    def _progreso_render(self, etiqueta: str):
+        """Callback de progreso de RenderExecutor que registra cada 25%"""
+        siguiente = [25]
+
+        def progreso(hechas: int, total: int):
+            porcentaje = hechas * 100 // total
+            if porcentaje >= siguiente[0] and hechas < total:
+                self.log(f"  {etiqueta}: {hechas}/{total} páginas ({porcentaje}%)", "PROGRESS")
+                siguiente[0] = porcentaje // 25 * 25 + 25
+
+        return progreso
+
+    def _log_render(self, etiqueta: str, resultado: Dict):
+        """Resumen de un render por lotes"""
+        self.log(
+            f"  {etiqueta}: {resultado['paginas']} páginas en {resultado['segundos']:.2f}s "
+            f"({resultado['procesos']} proceso{'s' if resultado['procesos'] != 1 else ''})"
+        )
+        for error in resultado["errores"]:
+            self.log(f"  Error renderizando {error}", "WARNING")
+
+    def _seleccionar_relacionados(
+        self, indice: SearchIndex, idx: int, total: int, cantidad: int = 6
+    ) -> List[int]:
+        """
+        Índices (base 1) de los artículos para el sidebar: primero los más
+        relacionados según el índice y, si faltan, los siguientes del sitio
+
+        Args:
+            indice: Índice de búsqueda del sitio
+            idx: Índice (base 1) del artículo actual
+            total: Número de artículos del sitio
+            cantidad: Artículos a mostrar
+
+        Returns:
+            Lista de índices base 1
+        """
+        seleccion = [doc_id + 1 for doc_id in indice.relacionados(idx - 1, cantidad)]
+        for i in range(1, total + 1):
+            if len(seleccion) >= cantidad:
+                break
+            if i != idx and i not in seleccion:
+                seleccion.append(i)
+        return seleccion
 
     def _generar_paginas_legales(self, site_dir: Path, metadata: Dict):
         """
@@ -1027,37 +1041,11 @@ No text, no watermarks."""
             site_dir: Directorio del sitio
             metadata: Metadata del sitio
         """
-        site_name = metadata["nombre"]
-        domain = metadata["dominio"]
-        tagline = metadata["tagline"]
-
-        # Generar Términos y Condiciones
-        terms_html = self.legal_generator.generar_terminos_condiciones(
-            site_name, domain
-        )
-        terms_path = site_dir / "terminos.html"
-        with open(terms_path, "w", encoding="utf-8") as f:
-            f.write(terms_html)
-
-        # Generar Política de Privacidad
-        privacy_html = self.legal_generator.generar_politica_privacidad(
-            site_name, domain
+        resultado = self.render_executor.renderizar(
+            renderizar_legal, ContextoSitio(site_dir, metadata), list(PAGINAS_LEGALES)
         )
-        privacy_path = site_dir / "privacidad.html"
-        with open(privacy_path, "w", encoding="utf-8") as f:
-            f.write(privacy_html)
-
-        # Generar FAQs
-        faqs_html = self.legal_generator.generar_faqs(site_name)
-        faqs_path = site_dir / "faqs.html"
-        with open(faqs_path, "w", encoding="utf-8") as f:
-            f.write(faqs_html)
-
-        # Generar Acerca de
-        about_html = self.legal_generator.generar_acerca_de(site_name, tagline, domain)
-        about_path = site_dir / "acerca.html"
-        with open(about_path, "w", encoding="utf-8") as f:
-            f.write(about_html)
+        for error in resultado["errores"]:
+            self.log(f"Error generando página legal {error}", "WARNING")
 
     def _copiar_css(self, site_dir: Path, site_num: int):
         """Copia el CSS del template al directorio del sitio"""
@@ -1066,7 +1054,7 @@ No text, no watermarks."""
         css_dest = site_dir / "style.css"
 
         if css_source.exists():
-            shutil.copy2(css_source, css_dest)
+            self.storage.copiar(css_source, css_dest)
         else:
             self.log(f"⚠️  No se encontró {css_source}", "WARNING")
 
@@ -1097,6 +1085,9 @@ No text, no watermarks."""
         self.log(f"Modo Offline (Sin IA): {offline_mode}")
 
         try:
+            # Estadísticas del storage solo de este sitio
+            self.storage.reiniciar_stats()
+
             # Verificar si el sitio ya existe ANTES de generar contenido
             site_dir = self.output_base_dir / f"site_{self.next_site_number}"
             if site_dir.exists():
@@ -1107,10 +1098,13 @@ No text, no watermarks."""
                 raise Exception(f"Sitio site_{self.next_site_number} ya existe")
 
             # Paso 1: Descargar noticias (más para cubrir destacados + placeholders)
-            noticias = self.paso_1_descargar_noticias(
-                num_noticias=100, force_download=force_download
+            noticias = self._cronometrar(
+                "paso_1_descargar_noticias",
+                self.paso_1_descargar_noticias,
+                num_noticias=100,
+                force_download=force_download,
             )
-            if not noticias:
+            if not noticias and not self.articulos_reutilizados:
                 raise Exception("No hay noticias disponibles")
 
             if offline_mode:
@@ -1118,16 +1112,26 @@ No text, no watermarks."""
                 self.log(
                     "⚠️  MODO OFFLINE ACTIVADO: Usando Spacy+NLTK en lugar de Blackbox/Gemini"
                 )
-                articulos_principales = self.paso_2_parafraseo_linguistico(
-                    noticias[:100]
+                articulos_principales = self._cronometrar(
+                    "paso_2_parafraseo_linguistico",
+                    self.paso_2_parafraseo_linguistico,
+                    noticias[:100],
                 )  # Procesar todas
                 placeholders = []  # No hay placeholders separados en este modo
             else:
                 # Paso 2: Parafrasear artículos principales (Blackbox Pro - primeros 20)
-                articulos_principales = self.paso_2_parafrasear_noticias(noticias[:20])
+                articulos_principales = self._cronometrar(
+                    "paso_2_parafrasear_noticias",
+                    self.paso_2_parafrasear_noticias,
+                    noticias[:20],
+                )
 
                 # Paso 2.1: Generar placeholders (Gemini paralelo - resto)
-                placeholders = self.paso_2_1_generar_placeholders(noticias[20:])
+                placeholders = self._cronometrar(
+                    "paso_2_1_generar_placeholders",
+                    self.paso_2_1_generar_placeholders,
+                    noticias[20:],
+                )
 
             # Combinar todos los artículos
             todos_articulos = articulos_principales + placeholders
@@ -1138,8 +1142,16 @@ No text, no watermarks."""
 
             # Paso 2.5: Categorizar todos los artículos
             # En modo offline, usar keywords en lugar de IA
-            noticias_categorizadas = self.paso_2_5_categorizar_noticias(
-                todos_articulos, use_ai=not offline_mode
+            noticias_categorizadas = self._cronometrar(
+                "paso_2_5_categorizar_noticias",
+                self.paso_2_5_categorizar_noticias,
+                todos_articulos,
+                use_ai=not offline_mode,
+            )
+
+            # Noticias nuevas primero; el resto del sitio con salidas ya generadas
+            noticias_categorizadas = self._combinar_con_reutilizadas(
+                noticias_categorizadas, total=100
             )
 
             # Paso 2.6: Marcar y ordenar destacados
@@ -1158,21 +1170,35 @@ No text, no watermarks."""
             )
 
             # Paso 3: Generar imágenes
-            imagenes = self.paso_3_generar_imagenes(
-                noticias_categorizadas, self.next_site_number
+            imagenes = self._cronometrar(
+                "paso_3_generar_imagenes",
+                self.paso_3_generar_imagenes,
+                noticias_categorizadas,
+                self.next_site_number,
             )
 
             # Paso 4: Crear metadata del sitio
-            sites_metadata = self.paso_4_crear_metadata_sitios(1, verificar_dominios)
+            sites_metadata = self._cronometrar(
+                "paso_4_crear_metadata_sitios",
+                self.paso_4_crear_metadata_sitios,
+                1,
+                verificar_dominios,
+            )
 
             # Paso 5: Generar logo
-            logos = self.paso_5_generar_logos(sites_metadata)
+            logos = self._cronometrar(
+                "paso_5_generar_logos", self.paso_5_generar_logos, sites_metadata
+            )
 
             # Paso 6: Generar template CSS
-            templates_metadata = self.paso_6_generar_templates_css(1)
+            templates_metadata = self._cronometrar(
+                "paso_6_generar_templates_css", self.paso_6_generar_templates_css, 1
+            )
 
             # Paso 7: Generar sitio HTML
-            sitios_generados = self.paso_7_generar_sitios_html(
+            sitios_generados = self._cronometrar(
+                "paso_7_generar_sitios_html",
+                self.paso_7_generar_sitios_html,
                 sites_metadata,
                 noticias_categorizadas,
                 imagenes,
@@ -1188,18 +1214,53 @@ No text, no watermarks."""
             site_dir = sitios_generados[0]["site_dir"]
 
             # Paso 8: Generar RSS feeds
-            self.paso_8_generar_rss_feeds(
-                noticias_categorizadas, sites_metadata[0], site_dir
+            self._cronometrar(
+                "paso_8_generar_rss_feeds",
+                self.paso_8_generar_rss_feeds,
+                noticias_categorizadas,
+                sites_metadata[0],
+                site_dir,
             )
 
             # Paso 9: Generar páginas de categorías
-            self.paso_9_generar_paginas_categorias(
-                noticias_categorizadas, sites_metadata[0], site_dir
+            self._cronometrar(
+                "paso_9_generar_paginas_categorias",
+                self.paso_9_generar_paginas_categorias,
+                noticias_categorizadas,
+                sites_metadata[0],
+                site_dir,
+            )
+
+            # Paso 9.5: Generar sitemap (después de categorías para incluirlas)
+            self._cronometrar(
+                "paso_9_5_generar_sitemap",
+                self.paso_9_5_generar_sitemap,
+                noticias_categorizadas,
+                sites_metadata[0],
+                site_dir,
             )
 
             # Paso 10: Generar imágenes Open Graph
-            self.paso_10_generar_og_images(
-                noticias_categorizadas, sites_metadata[0], site_dir
+            self._cronometrar(
+                "paso_10_generar_og_images",
+                self.paso_10_generar_og_images,
+                noticias_categorizadas,
+                sites_metadata[0],
+                site_dir,
+            )
+
+            # Paso 11: Precomprimir (al final, con todos los archivos escritos)
+            self._cronometrar(
+                "paso_11_precomprimir_sitio",
+                self.paso_11_precomprimir_sitio,
+                site_dir,
+            )
+
+            # Paso 12: Publicar en el storage lo que quede pendiente
+            self._cronometrar(
+                "paso_12_publicar_storage",
+                self.paso_12_publicar_storage,
+                site_dir,
             )
 
             # Calcular estadísticas finales
@@ -1211,14 +1272,19 @@ No text, no watermarks."""
                 "sitios_generados": sitios_generados,
                 "stats": {
                     **self.stats,
+                    "total_articulos": len(noticias_categorizadas),
                     "tiempo_total_segundos": tiempo_total,
                     "tiempo_total_minutos": tiempo_total / 60,
                 },
+                "tiempos_pasos": dict(self.tiempos_pasos),
+                "instrumentacion": self.tracer.resumen(),
+                "trace_path": str(self.trace_path),
                 "output_dir": str(self.output_base_dir),
             }
 
-            # Guardar resumen
+            # Guardar resumen e incorporarlo a las métricas agregadas
             self._guardar_resumen(resultado)
+            self._actualizar_metricas()
 
             self.log("=" * 70)
             self.log("🎉 FLUJO COMPLETADO EXITOSAMENTE", "SUCCESS")
@@ -1234,10 +1300,7 @@ No text, no watermarks."""
             self.log(f"Imágenes generadas: {self.stats['imagenes_generadas']}")
             self.log(f"Tiempo total: {tiempo_total / 60:.2f} minutos")
             self.log(f"Directorio de salida: {self.output_base_dir}")
-            self.log(f"")
-            self.log(
-                f"✨ MEJORA: Sistema paralelo {int((7 * 60) / tiempo_total if tiempo_total > 0 else 1)}x más rápido que el original"
-            )
+            self._log_resumen_instrumentacion(tiempo_total)
 
             return resultado
 
@@ -1249,6 +1312,37 @@ No text, no watermarks."""
 
             return {"success": False, "error": str(e), "stats": self.stats}
 
+        finally:
+            self.render_executor.cerrar()
+            self.tracer.cerrar()
+            if self.registro is not None:
+                self.registro.cerrar()
+
+    def _log_resumen_instrumentacion(self, tiempo_total: float):
+        """Muestra dónde se fue el tiempo: pasos y llamadas externas agregadas"""
+        resumen = self.tracer.resumen()
+        if not resumen:
+            return
+
+        self.log("")
+        self.log("⏱️  Instrumentación (tiempo real / CPU / RSS máx / bytes / reintentos / cache):")
+        for nombre, datos in sorted(
+            resumen.items(), key=lambda item: item[1]["duracion_s"], reverse=True
+        ):
+            porcentaje = (
+                datos["duracion_s"] / tiempo_total * 100 if tiempo_total > 0 else 0
+            )
+            # Las llamadas externas se solapan entre hilos: su % puede superar 100
+            rss = f"{datos['rss_max_mb']:.0f}MB" if datos["rss_max_mb"] else "-"
+            self.log(
+                f"  [{datos['categoria']}] {nombre}: {datos['duracion_s']:.2f}s"
+                f" ({porcentaje:.0f}%) cpu={datos['cpu_s']:.2f}s rss={rss}"
+                f" n={datos['llamadas']} in={datos['bytes_in']}B out={datos['bytes_out']}B"
+                f" retries={datos['retries']} cache={datos['cache_hits']}"
+                + (f" errores={datos['errores']}" if datos["errores"] else "")
+            )
+        self.log(f"Trace: {self.trace_path}")
+
     def _guardar_resumen(self, resultado: Dict):
         """Guarda un resumen de la ejecución"""
         # Convertir Paths a strings para serialización JSON
@@ -1258,6 +1352,13 @@ No text, no watermarks."""
         with open(resumen_path, "w", encoding="utf-8") as f:
             json.dump(resultado_copy, f, indent=2, ensure_ascii=False)
 
+    def _actualizar_metricas(self):
+        """Ingiere los run_summary nuevos en el almacén de métricas"""
+        try:
+            RunMetricsStore(self.output_base_dir).ingestar()
+        except Exception as e:
+            self.log(f"No se pudieron actualizar las métricas: {e}", "WARNING")
+
     def _convert_paths_to_strings(self, obj):
         """Convierte objetos Path a strings recursivamente"""
         if isinstance(obj, Path):
@@ -1298,7 +1399,7 @@ No text, no watermarks."""
         self, noticias: List[Dict], site_metadata: Dict, site_dir: Path
     ):
         """
-        Paso 9: Genera páginas HTML por categoría
+        Paso 9: Genera páginas HTML por categoría (con sus temas) y por etiqueta
 
         Args:
             noticias: Lista de noticias categorizadas
@@ -1310,8 +1411,11 @@ No text, no watermarks."""
         self.log("=" * 70)
 
         try:
-            # Agrupar por categoría
+            # Agrupar por categoría, recordando la posición de cada noticia en
+            # el sitio para enlazar a su article_N.html (la posición se agrega
+            # a la tarjeta compacta, no a una copia completa de cada noticia)
             grouped = self.categorizador.agrupar_por_categoria(noticias)
+            posiciones = {id(n): i for i, n in enumerate(noticias, 1)}
 
             # Crear directorio de categorías
             cat_dir = site_dir / "categoria"
@@ -1323,23 +1427,66 @@ No text, no watermarks."""
                 "secondary": site_metadata.get("color_secundario", "#764ba2"),
             }
 
-            # Generar página por cada categoría
-            for cat_id, cat_articles in grouped.items():
-                cat_data = self.categorizador.CATEGORIAS.get(cat_id, {})
-                cat_nombre = cat_data.get("nombre", cat_id)
+            # Índice del paso 7 (o uno nuevo si el paso corre solo)
+            indice = self.indice_busqueda
+            if indice is None or len(indice.documentos) != len(noticias):
+                indice = SearchIndex.desde_articulos(noticias)
 
-                output_path = cat_dir / f"{cat_id}.html"
-
-                self.section_generator.generar_pagina_categoria(
+            # Planificar cada categoría (portada y archivo, sin las páginas
+            # que no cambiaron), con las etiquetas más repetidas en ella como
+            # temas, y renderizar las páginas de todas juntas (una por tarea)
+            planes = [
+                self.section_generator.planificar_categoria(
                     cat_id,
-                    cat_nombre,
-                    cat_articles,
+                    self.categorizador.CATEGORIAS.get(cat_id, {}).get("nombre", cat_id),
+                    [{**compactar(a, CAMPOS_TARJETA), "_display_index": posiciones[id(a)]} for a in cat_articles],
                     site_metadata,
                     color_palette,
-                    str(output_path),
+                    cat_dir,
+                    temas=indice.etiquetas_de([posiciones[id(a)] - 1 for a in cat_articles]),
                 )
-
-                self.log(f"  Generada: {cat_nombre} ({len(cat_articles)} artículos)")
+                for cat_id, cat_articles in grouped.items()
+            ]
+            paginas = [pagina for plan in planes for pagina in plan["paginas"]]
+            resultado = self.render_executor.renderizar(
+                renderizar_pagina_categoria,
+                ContextoSitio(site_dir, site_metadata, color_palette=color_palette),
+                paginas,
+            )
+            for plan in planes:
+                fallidas = [
+                    pagina["numero"]
+                    for pagina, ruta in zip(paginas, resultado["valores"])
+                    if ruta is None and pagina["categoria_id"] == plan["categoria_id"]
+                ]
+                self.section_generator.cerrar_categoria(plan, cat_dir, fallidas)
+                self.log(
+                    f"  Generada: {plan['paginas'][0]['categoria_nombre']} "
+                    f"({plan['paginas'][0]['total']} artículos, {plan['archivadas']} páginas "
+                    f"de archivo, {plan['omitidas']} sin cambios)"
+                )
+            self._log_render("Páginas de categoría", resultado)
+
+            # Páginas de etiqueta: los artículos de cada etiqueta por relevancia
+            campos_etiqueta = CAMPOS_TARJETA + ("category_name",)
+            etiquetas = [
+                (
+                    etiqueta,
+                    [{**compactar(noticias[doc_id], campos_etiqueta), "_display_index": doc_id + 1} for doc_id in doc_ids],
+                )
+                for etiqueta, doc_ids in indice.documentos_por_etiqueta().items()
+            ]
+            resultado = self.render_executor.renderizar(
+                renderizar_etiqueta,
+                ContextoSitio(site_dir, site_metadata, color_palette=color_palette),
+                etiquetas,
+            )
+            self._log_render("Etiquetas", resultado)
+            # Etiquetas de una generación anterior que ya no aparecen
+            vigentes = {f"{etiqueta}.html" for etiqueta, _ in etiquetas}
+            for vieja in (site_dir / "etiqueta").glob("*.html"):
+                if vieja.name not in vigentes:
+                    self.storage.eliminar(vieja)
 
             # Generar índice de categorías
             index_path = site_dir / "categorias.html"
@@ -1348,12 +1495,48 @@ No text, no watermarks."""
             )
 
             self.log(
-                f"Generadas {len(grouped)} páginas de categorías + índice", "SUCCESS"
+                f"Generadas {len(grouped)} páginas de categorías + índice y "
+                f"{len(etiquetas)} de etiquetas",
+                "SUCCESS",
             )
 
         except Exception as e:
             self.log(f"Error generando páginas de categorías: {e}", "ERROR")
 
+    def paso_9_5_generar_sitemap(
+        self, noticias: List[Dict], site_metadata: Dict, site_dir: Path
+    ):
+        """
+        Paso 9.5: Genera sitemap.xml (índice) y sus partes sitemap-N.xml
+
+        Args:
+            noticias: Lista de noticias en el orden del sitio
+            site_metadata: Metadata del sitio
+            site_dir: Directorio del sitio
+        """
+        self.log("=" * 70)
+        self.log("PASO 9.5: Generando Sitemap", "PROGRESS")
+        self.log("=" * 70)
+
+        try:
+            dominio = site_metadata.get("dominio")
+            site_url = f"https://{dominio}" if dominio else "https://ejemplo.com"
+
+            resultado = self.sitemap_generator.generar(
+                site_dir,
+                site_url,
+                self.sitemap_generator.entradas_sitio(site_dir, site_url, noticias),
+            )
+
+            self.log(
+                f"Sitemap: {resultado['urls']} URLs en {resultado['partes']} partes "
+                f"({resultado['reescritas']} reescritas, {resultado['omitidas']} sin cambios)",
+                "SUCCESS",
+            )
+
+        except Exception as e:
+            self.log(f"Error generando sitemap: {e}", "ERROR")
+
     def paso_10_generar_og_images(
         self, noticias: List[Dict], site_metadata: Dict, site_dir: Path
     ):
@@ -1373,20 +1556,82 @@ No text, no watermarks."""
             # Configurar output dir para OG images
             og_dir = site_dir / "og-images"
             og_dir.mkdir(parents=True, exist_ok=True)  # Crear directorio
-            self.og_image_generator.output_dir = og_dir
 
             # Generar imágenes
-            og_images = self.og_image_generator.generar_og_images_lote(
-                noticias, site_metadata
+            resultado = self.render_executor.renderizar(
+                renderizar_og,
+                ContextoSitio(site_dir, site_metadata),
+                [(idx, compactar(noticia, CAMPOS_OG)) for idx, noticia in enumerate(noticias, 1)],
+                self._progreso_render("Imágenes OG"),
             )
+            for noticia, image_path in zip(noticias, resultado["valores"]):
+                if image_path:
+                    noticia["og_image_path"] = image_path
+            self._log_render("Imágenes OG", resultado)
 
             self.log(
-                f"Generadas {len(og_images)} imágenes Open Graph (1200x630)", "SUCCESS"
+                f"Generadas {resultado['paginas']} imágenes Open Graph (1200x630)", "SUCCESS"
             )
 
         except Exception as e:
             self.log(f"Error generando imágenes OG: {e}", "WARNING")
 
+    def paso_11_precomprimir_sitio(self, site_dir: Path):
+        """
+        Paso 11: Escribe variantes .gz/.br/.zst de los archivos comprimibles
+
+        Args:
+            site_dir: Directorio del sitio
+        """
+        self.log("=" * 70)
+        self.log("PASO 11: Precomprimiendo archivos del sitio", "PROGRESS")
+        self.log("=" * 70)
+
+        try:
+            resumen = self.precompressor.comprimir_sitio(site_dir)
+            self.stats["precompresion"] = resumen
+
+            tasas = ", ".join(
+                f"{formato} {datos['tasa']:.1%}"
+                for formato, datos in resumen["formatos"].items()
+                if datos["tasa"] is not None
+            )
+            self.log(
+                f"Precomprimidos {resumen['comprimidos']} archivos "
+                f"({resumen['omitidos']} sin cambios); tamaño comprimido: {tasas or 'n/a'}",
+                "SUCCESS",
+            )
+
+        except Exception as e:
+            self.log(f"Error precomprimiendo el sitio: {e}", "WARNING")
+
+    def paso_12_publicar_storage(self, site_dir: Path):
+        """
+        Paso 12: Publica los archivos que quedaron fuera del storage y espera
+        las subidas pendientes. En disco no hace nada
+
+        Args:
+            site_dir: Directorio del sitio
+        """
+        try:
+            sincronizados = self.storage.sincronizar(site_dir)
+            resumen = self.storage.esperar()
+            self.stats["storage"] = resumen
+
+            if "subidos" in resumen:
+                self.log(
+                    f"Storage: {resumen['subidos']} archivos subidos "
+                    f"({resumen['bytes_subidos'] / 1024:.0f} KB), "
+                    f"{resumen['ya_publicados']} ya publicados, "
+                    f"{sincronizados['publicados']} de {sincronizados['archivos']} desde disco",
+                    "SUCCESS",
+                )
+                for error in resumen["errores"]:
+                    self.log(f"Error subiendo {error}", "WARNING")
+
+        except Exception as e:
+            self.log(f"Error publicando el sitio en el storage: {e}", "WARNING")
+
 
 def main():
     """Función principal"""
@@ -1418,12 +1663,24 @@ def main():
         action="store_true",
         help="Usar modo offline (parafraseo lingüístico sin IA)",
     )
+    parser.add_argument(
+        "--sin-registro",
+        action="store_true",
+        help="Procesar todas las noticias aunque ya se hayan publicado antes",
+    )
+    parser.add_argument(
+        "--chrome-trace",
+        action="store_true",
+        help="Exportar el trace a formato Chrome/Perfetto al terminar",
+    )
 
     args = parser.parse_args()
 
     # Crear orquestador
     orchestrator = MasterOrchestrator(
-        output_base_dir=args.output_dir, usar_api_whois=args.api_whois
+        output_base_dir=args.output_dir,
+        usar_api_whois=args.api_whois,
+        usar_registro=not args.sin_registro,
     )
 
     # Ejecutar flujo
@@ -1433,6 +1690,12 @@ def main():
         offline_mode=args.offline,
     )
 
+    if args.chrome_trace and orchestrator.trace_path.exists():
+        chrome_path = exportar_chrome_trace(
+            orchestrator.trace_path, orchestrator.trace_path.with_suffix(".chrome.json")
+        )
+        print(f"🧭 Trace Chrome/Perfetto: {chrome_path}")
+
     # Retornar código de salida
     sys.exit(0 if resultado["success"] else 1)
 
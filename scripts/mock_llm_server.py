@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Servidor LLM Local de Pruebas
+Imita la API de chat de Blackbox/OpenAI (/chat/completions) y la de Gemini
+(/v1beta/models/<modelo>:generateContent, y SSE con stream=true) con latencia configurable,
+inyección de errores 429/5xx y respuestas con forma de artículo.
+Los modelos de imagen (flux) responden con un PNG determinista por prompt, en
+base64 dentro del mensaje o como URL servida por el propio servidor.
+Permite hacer pruebas de carga de workers y rate limiting sin gastar cuota.
+
+Uso con los clientes:
+    BLACKBOX_BASE_URL=http://127.0.0.1:8765 GEMINI_BASE_URL=http://127.0.0.1:8765 \\
+        python master_orchestrator.py
+"""
+
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+FRASES = [
+    "El gobierno federal presentó una nueva estrategia que busca reordenar las prioridades del gasto público.",
+    "Legisladores de distintas bancadas cuestionaron el alcance de la propuesta durante la sesión.",
+    "Especialistas consultados advirtieron que los efectos dependerán de la implementación en los estados.",
+    "La oposición pidió mayor transparencia en la asignación de recursos y en los criterios de evaluación.",
+    "Fuentes oficiales señalaron que el calendario contempla una primera etapa antes de fin de año.",
+    "Organizaciones civiles insistieron en la necesidad de mecanismos de rendición de cuentas.",
+    "El debate se da en un contexto de presión presupuestaria y de expectativas ciudadanas elevadas.",
+    "Analistas coinciden en que el tema marcará la agenda política de las próximas semanas.",
+]
+
+# Modelos que responden con una imagen en lugar de texto
+MODELOS_IMAGEN = ("flux",)
+
+
+class MockLLMConfig:
+    """Configuración de latencia, errores y tamaño de respuestas"""
+
+    def __init__(
+        self,
+        latencia: str = "lognormal",
+        latencia_media: float = 0.8,
+        latencia_sigma: float = 0.5,
+        tasa_429: float = 0.0,
+        tasa_5xx: float = 0.0,
+        retry_after: int = 1,
+        parrafos: int = 12,
+        latencia_token: float = 0.0,
+        imagenes: str = "base64",
+        imagen_ancho: int = 64,
+        imagen_alto: int = 32,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            latencia: 'cero', 'fija', 'uniforme' (0..2·media) o 'lognormal'
+            latencia_media: Latencia media en segundos
+            latencia_sigma: Dispersión para la distribución lognormal
+            tasa_429: Probabilidad de responder 429 Too Many Requests
+            tasa_5xx: Probabilidad de responder 500/502/503
+            retry_after: Valor del header Retry-After en los 429
+            parrafos: Párrafos de las respuestas con forma de artículo
+            latencia_token: Pausa entre fragmentos en respuestas con stream=True
+            imagenes: Respuesta de los modelos de imagen: 'base64' (data URL) o 'url'
+            imagen_ancho: Ancho en píxeles de las imágenes generadas
+            imagen_alto: Alto en píxeles de las imágenes generadas
+            seed: Semilla para respuestas y errores reproducibles
+        """
+        self.latencia = latencia
+        self.latencia_media = latencia_media
+        self.latencia_sigma = latencia_sigma
+        self.tasa_429 = tasa_429
+        self.tasa_5xx = tasa_5xx
+        self.retry_after = retry_after
+        self.parrafos = parrafos
+        self.latencia_token = latencia_token
+        self.imagenes = imagenes
+        self.imagen_ancho = imagen_ancho
+        self.imagen_alto = imagen_alto
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def muestrear_latencia(self) -> float:
+        """Obtiene una latencia según la distribución configurada"""
+        with self.rng_lock:
+            if self.latencia == "cero":
+                return 0.0
+            if self.latencia == "fija":
+                return self.latencia_media
+            if self.latencia == "uniforme":
+                return self.rng.uniform(0, 2 * self.latencia_media)
+            # lognormal con la media pedida: mu = ln(media) - sigma²/2
+            mu = math.log(max(self.latencia_media, 1e-6)) - self.latencia_sigma ** 2 / 2
+            return self.rng.lognormvariate(mu, self.latencia_sigma)
+
+    def muestrear_error(self) -> Optional[int]:
+        """Retorna un código de error a inyectar o None"""
+        with self.rng_lock:
+            valor = self.rng.random()
+            if valor < self.tasa_429:
+                return 429
+            if valor < self.tasa_429 + self.tasa_5xx:
+                return self.rng.choice([500, 502, 503])
+        return None
+
+
+def _texto_articulo(prompt: str, parrafos: int, marcador_cuerpo: str) -> str:
+    """Genera una respuesta determinista con el formato [TÍTULO]/<cuerpo>"""
+    semilla = int(hashlib.md5(prompt.encode("utf-8")).hexdigest()[:8], 16)
+    rng = random.Random(semilla)
+    titulo = rng.choice(FRASES).rstrip(".")[:90]
+    cuerpo = "\n\n".join(
+        " ".join(rng.sample(FRASES, 3)) for _ in range(parrafos)
+    )
+    return f"[TÍTULO]\n{titulo}\n\n{marcador_cuerpo}\n\n{cuerpo}"
+
+
+def generar_respuesta(prompt: str, config: MockLLMConfig) -> str:
+    """
+    Elige una respuesta con la forma que espera cada cliente
+
+    Args:
+        prompt: Último mensaje del usuario
+        config: Configuración del servidor
+
+    Returns:
+        Texto de la respuesta
+    """
+    # NewsCategorizador: lista "- <id>: ..." y espera solo el ID
+    categorias = re.findall(r"^- ([\w\-áéíóúñ]+):", prompt, re.MULTILINE)
+    if categorias and "Categoría:" in prompt:
+        semilla = int(hashlib.md5(prompt.encode("utf-8")).hexdigest()[:8], 16)
+        return categorias[semilla % len(categorias)]
+
+    # BlackboxParallelParaphraser / NewsParaphraser
+    if "[ARTÍCULO]" in prompt:
+        return _texto_articulo(prompt, config.parrafos, "[ARTÍCULO]")
+
+    # GeminiParaphraser
+    if "[CONTENIDO]" in prompt:
+        return _texto_articulo(prompt, max(3, config.parrafos // 4), "[CONTENIDO]")
+
+    # ArticleExpander y resto: texto plano en párrafos
+    return _texto_articulo(prompt, config.parrafos, "").split("\n\n", 2)[-1]
+
+
+def generar_imagen(prompt: str, ancho: int, alto: int) -> bytes:
+    """
+    PNG de ruido determinista por prompt (no comprime: su tamaño es ~ancho·alto·3)
+
+    Args:
+        prompt: Prompt de la imagen
+        ancho: Ancho en píxeles
+        alto: Alto en píxeles
+
+    Returns:
+        Bytes del PNG
+    """
+    rng = random.Random(int(hashlib.md5(prompt.encode("utf-8")).hexdigest()[:8], 16))
+    filas = b"".join(b"\x00" + rng.randbytes(ancho * 3) for _ in range(alto))
+
+    def chunk(tipo: bytes, datos: bytes) -> bytes:
+        return struct.pack(">I", len(datos)) + tipo + datos + struct.pack(">I", zlib.crc32(tipo + datos))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", ancho, alto, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(filas, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+class MockLLMServer:
+    """Servidor HTTP multihilo con estadísticas de concurrencia"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: MockLLMConfig = None):
+        """
+        Args:
+            host: Interfaz de escucha
+            port: Puerto (0 = puerto libre asignado por el sistema)
+            config: Configuración de latencia/errores
+        """
+        self.config = config or MockLLMConfig()
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "ok": 0,
+            "errores": {},
+            "en_vuelo": 0,
+            "max_en_vuelo": 0,
+            "streams_cortados": 0,
+            "por_endpoint": {},
+            "por_key": {},
+        }
+        # Imágenes servidas en /imagenes/<id>.png (modo 'url')
+        self.imagenes: Dict[str, bytes] = {}
+        self.httpd = ThreadingHTTPServer((host, port), self._crear_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _registrar(self, campo: str, valor=None, delta: int = 1):
+        with self.stats_lock:
+            if valor is None:
+                self.stats[campo] += delta
+                if campo == "en_vuelo":
+                    self.stats["max_en_vuelo"] = max(
+                        self.stats["max_en_vuelo"], self.stats["en_vuelo"]
+                    )
+            else:
+                self.stats[campo][valor] = self.stats[campo].get(valor, 0) + delta
+
+    def obtener_stats(self) -> Dict:
+        """Copia de las estadísticas actuales"""
+        with self.stats_lock:
+            return json.loads(json.dumps(self.stats))
+
+    def _crear_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _responder(self, codigo: int, cuerpo: Dict, headers: Dict = None):
+                datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(datos)))
+                for nombre, valor in (headers or {}).items():
+                    self.send_header(nombre, valor)
+                self.end_headers()
+                self.wfile.write(datos)
+
+            def _responder_stream(self, texto: str, modelo: str):
+                """Envía el texto como eventos SSE estilo OpenAI (un fragmento por palabra)"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                fragmentos = re.findall(r"\S+\s*|\s+", texto)
+                try:
+                    for fragmento in fragmentos:
+                        evento = {
+                            "object": "chat.completion.chunk",
+                            "model": modelo,
+                            "choices": [{"index": 0, "delta": {"content": fragmento}, "finish_reason": None}],
+                        }
+                        self.wfile.write(f"data: {json.dumps(evento, ensure_ascii=False)}\n\n".encode("utf-8"))
+                        self.wfile.flush()
+                        if servidor.config.latencia_token:
+                            time.sleep(servidor.config.latencia_token)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # El cliente cortó el stream (presupuesto de tokens)
+                    servidor._registrar("streams_cortados")
+
+            def do_GET(self):
+                ruta = self.path.split("?", 1)[0]
+                if ruta.rstrip("/") == "/stats":
+                    self._responder(200, servidor.obtener_stats())
+                elif ruta.startswith("/imagenes/") and ruta[len("/imagenes/"):-4] in servidor.imagenes:
+                    datos = servidor.imagenes[ruta[len("/imagenes/"):-4]]
+                    servidor._registrar("por_endpoint", "descarga")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "image/png")
+                    self.send_header("Content-Length", str(len(datos)))
+                    self.end_headers()
+                    self.wfile.write(datos)
+                else:
+                    self._responder(404, {"error": "not found"})
+
+            def do_POST(self):
+                longitud = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(longitud) or b"{}")
+                except json.JSONDecodeError:
+                    self._responder(400, {"error": "JSON inválido"})
+                    return
+
+                ruta = self.path.split("?", 1)[0]
+                if ruta.endswith("/chat/completions"):
+                    modelo = str(payload.get("model", ""))
+                    endpoint = "imagen" if any(m in modelo for m in MODELOS_IMAGEN) else "chat"
+                    key = self.headers.get("Authorization", "").replace("Bearer ", "")
+                elif ":generateContent" in ruta:
+                    endpoint = "gemini"
+                    key = dict(
+                        p.split("=", 1) for p in self.path.partition("?")[2].split("&") if "=" in p
+                    ).get("key", "")
+                else:
+                    self._responder(404, {"error": f"ruta desconocida: {ruta}"})
+                    return
+
+                servidor._registrar("requests")
+                servidor._registrar("por_endpoint", endpoint)
+                servidor._registrar("por_key", key[-6:] or "sin-key")
+                servidor._registrar("en_vuelo")
+                try:
+                    time.sleep(servidor.config.muestrear_latencia())
+
+                    error = servidor.config.muestrear_error()
+                    if error == 429:
+                        servidor._registrar("errores", "429")
+                        self._responder(
+                            429,
+                            {"error": {"message": "Rate limit exceeded", "code": 429}},
+                            {"Retry-After": str(servidor.config.retry_after)},
+                        )
+                        return
+                    if error:
+                        servidor._registrar("errores", str(error))
+                        self._responder(error, {"error": {"message": "Upstream error", "code": error}})
+                        return
+
+                    if endpoint != "gemini":
+                        mensajes = payload.get("messages", [])
+                        prompt = mensajes[-1].get("content", "") if mensajes else ""
+                        if endpoint == "imagen":
+                            texto = servidor._respuesta_imagen(prompt)
+                        else:
+                            texto = generar_respuesta(prompt, servidor.config)
+                        if payload.get("stream") and endpoint == "chat":
+                            servidor._registrar("ok")
+                            self._responder_stream(texto, payload.get("model", "mock"))
+                            return
+                        cuerpo = {
+                            "id": f"mock-{hashlib.md5(prompt.encode('utf-8')).hexdigest()[:12]}",
+                            "object": "chat.completion",
+                            "created": int(time.time()),
+                            "model": payload.get("model", "mock"),
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {"role": "assistant", "content": texto},
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                            "usage": {
+                                "prompt_tokens": len(prompt.split()),
+                                "completion_tokens": len(texto.split()),
+                            },
+                        }
+                    else:
+                        partes = payload.get("contents", [{}])[-1].get("parts", [{}])
+                        prompt = partes[0].get("text", "") if partes else ""
+                        texto = generar_respuesta(prompt, servidor.config)
+                        cuerpo = {
+                            "candidates": [
+                                {
+                                    "content": {"role": "model", "parts": [{"text": texto}]},
+                                    "finishReason": "STOP",
+                                }
+                            ]
+                        }
+
+                    servidor._registrar("ok")
+                    self._responder(200, cuerpo)
+                finally:
+                    servidor._registrar("en_vuelo", delta=-1)
+
+        return Handler
+
+    def _respuesta_imagen(self, prompt: str) -> str:
+        """Contenido del mensaje de un modelo de imagen: data URL o URL de descarga"""
+        config = self.config
+        imagen = generar_imagen(prompt, config.imagen_ancho, config.imagen_alto)
+        if config.imagenes == "url":
+            imagen_id = hashlib.md5(prompt.encode("utf-8")).hexdigest()[:16]
+            with self.stats_lock:
+                self.imagenes[imagen_id] = imagen
+            return f"Imagen generada: {self.base_url}/imagenes/{imagen_id}.png"
+        return "data:image/png;base64," + base64.b64encode(imagen).decode("ascii")
+
+    def iniciar(self) -> "MockLLMServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def detener(self):
+        """Detiene el servidor"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+
+def main():
+    """Levanta el servidor de pruebas en primer plano"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor LLM local para pruebas de carga")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latencia", choices=["cero", "fija", "uniforme", "lognormal"], default="lognormal"
+    )
+    parser.add_argument("--latencia-media", type=float, default=0.8, help="Segundos")
+    parser.add_argument("--latencia-sigma", type=float, default=0.5)
+    parser.add_argument("--tasa-429", type=float, default=0.0, help="Probabilidad de 429")
+    parser.add_argument("--tasa-5xx", type=float, default=0.0, help="Probabilidad de 5xx")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--parrafos", type=int, default=12)
+    parser.add_argument(
+        "--latencia-token", type=float, default=0.0, help="Segundos entre fragmentos con stream=True"
+    )
+    parser.add_argument(
+        "--imagenes", choices=["base64", "url"], default="base64", help="Respuesta de los modelos de imagen"
+    )
+    parser.add_argument("--imagen-ancho", type=int, default=64)
+    parser.add_argument("--imagen-alto", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockLLMConfig(
+        latencia=args.latencia,
+        latencia_media=args.latencia_media,
+        latencia_sigma=args.latencia_sigma,
+        tasa_429=args.tasa_429,
+        tasa_5xx=args.tasa_5xx,
+        retry_after=args.retry_after,
+        parrafos=args.parrafos,
+        latencia_token=args.latencia_token,
+        imagenes=args.imagenes,
+        imagen_ancho=args.imagen_ancho,
+        imagen_alto=args.imagen_alto,
+        seed=args.seed,
+    )
+    servidor = MockLLMServer(args.host, args.port, config)
+
+    print(f"🤖 Servidor LLM local en {servidor.base_url}")
+    print(f"   Latencia: {args.latencia} (media {args.latencia_media}s)")
+    print(f"   Errores: 429={args.tasa_429:.0%} 5xx={args.tasa_5xx:.0%}")
+    print(f"   Estadísticas: {servidor.base_url}/stats")
+    print(f"\n💡 export BLACKBOX_BASE_URL={servidor.base_url}")
+    print(f"💡 export GEMINI_BASE_URL={servidor.base_url}")
+
+    try:
+        servidor.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
+        servidor.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
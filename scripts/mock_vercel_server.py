@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Servidor Vercel Local de Pruebas
+Imita los endpoints que usa deploy_to_vercel.py: proyectos (/v9/projects),
+subida de blobs por digest (/v2/files), creación de deployments por
+manifiesto de digests con el error missing_files (/v13/deployments) y el
+estado del deployment, que pasa a READY tras unas consultas.
+Permite probar deploys incrementales y de flota sin token ni red.
+
+Uso con el deployer:
+    VERCEL_API_URL=http://127.0.0.1:8766 VERCEL_TOKEN=local python deploy_to_vercel.py generated_sites/site_1
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class MockVercelServer:
+    """Servidor HTTP multihilo que guarda blobs por SHA1 en memoria"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, consultas_hasta_ready: int = 1, latencia_subida: float = 0.0):
+        """
+        Args:
+            host: Interfaz de escucha
+            port: Puerto (0 = puerto libre asignado por el sistema)
+            consultas_hasta_ready: Consultas de estado antes de responder READY
+            latencia_subida: Segundos de espera por cada subida de blob
+        """
+        self.consultas_hasta_ready = consultas_hasta_ready
+        self.latencia_subida = latencia_subida
+        self.lock = threading.Lock()
+        self.blobs: Dict[str, int] = {}
+        self.proyectos: Dict[str, Dict] = {}
+        self.deployments: Dict[str, Dict] = {}
+        self.stats = {
+            "subidas": 0,
+            "bytes_subidos": 0,
+            "deployments": 0,
+            "missing_files": 0,
+            "consultas_estado": 0,
+            "subidas_en_vuelo": 0,
+            "max_subidas_en_vuelo": 0,
+        }
+        self.httpd = ThreadingHTTPServer((host, port), self._crear_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def obtener_stats(self) -> Dict:
+        """Copia de las estadísticas actuales"""
+        with self.lock:
+            return dict(self.stats)
+
+    def _crear_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _responder(self, codigo: int, cuerpo: Dict):
+                datos = json.dumps(cuerpo).encode("utf-8")
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(datos)))
+                self.end_headers()
+                self.wfile.write(datos)
+
+            def _leer_cuerpo(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_GET(self):
+                ruta = urlsplit(self.path).path
+                if ruta.startswith("/v13/deployments/"):
+                    deployment_id = ruta.rsplit("/", 1)[1]
+                    with servidor.lock:
+                        servidor.stats["consultas_estado"] += 1
+                        deployment = servidor.deployments.get(deployment_id)
+                        if deployment is None:
+                            self._responder(404, {"error": {"code": "not_found"}})
+                            return
+                        deployment["consultas"] += 1
+                        listo = deployment["consultas"] >= servidor.consultas_hasta_ready
+                    self._responder(200, {
+                        "id": deployment_id,
+                        "url": deployment["url"],
+                        "readyState": "READY" if listo else "BUILDING",
+                    })
+                elif ruta.startswith("/v9/projects/"):
+                    nombre = ruta.rsplit("/", 1)[1]
+                    with servidor.lock:
+                        proyecto = servidor.proyectos.get(nombre)
+                    if proyecto:
+                        self._responder(200, proyecto)
+                    else:
+                        self._responder(404, {"error": {"code": "not_found"}})
+                else:
+                    self._responder(404, {"error": {"code": "not_found"}})
+
+            def do_POST(self):
+                ruta = urlsplit(self.path).path
+                if ruta == "/v2/files":
+                    self._subir_blob()
+                elif ruta == "/v9/projects":
+                    datos = json.loads(self._leer_cuerpo())
+                    with servidor.lock:
+                        existe = datos["name"] in servidor.proyectos
+                        proyecto = servidor.proyectos.setdefault(datos["name"], {"id": f"prj_{datos['name']}", "name": datos["name"]})
+                    self._responder(409 if existe else 201, proyecto)
+                elif ruta == "/v13/deployments":
+                    self._crear_deployment(json.loads(self._leer_cuerpo()))
+                else:
+                    self._responder(404, {"error": {"code": "not_found"}})
+
+            def _subir_blob(self):
+                with servidor.lock:
+                    servidor.stats["subidas_en_vuelo"] += 1
+                    servidor.stats["max_subidas_en_vuelo"] = max(
+                        servidor.stats["max_subidas_en_vuelo"], servidor.stats["subidas_en_vuelo"]
+                    )
+                try:
+                    datos = self._leer_cuerpo()
+                    if servidor.latencia_subida:
+                        time.sleep(servidor.latencia_subida)
+                    digest = self.headers.get("x-vercel-digest", "")
+                    if hashlib.sha1(datos).hexdigest() != digest:
+                        self._responder(400, {"error": {"code": "invalid_digest"}})
+                        return
+                    with servidor.lock:
+                        servidor.blobs[digest] = len(datos)
+                        servidor.stats["subidas"] += 1
+                        servidor.stats["bytes_subidos"] += len(datos)
+                    self._responder(200, {})
+                finally:
+                    with servidor.lock:
+                        servidor.stats["subidas_en_vuelo"] -= 1
+
+            def _crear_deployment(self, datos: Dict):
+                faltantes = []
+                for archivo in datos.get("files", []):
+                    if "sha" in archivo:
+                        with servidor.lock:
+                            if archivo["sha"] not in servidor.blobs:
+                                faltantes.append(archivo["sha"])
+                    elif "data" in archivo:
+                        # Modo inline: el contenido viene en el body
+                        contenido = archivo["data"].encode("utf-8")
+                        if archivo.get("encoding") == "base64":
+                            contenido = base64.b64decode(contenido)
+                        with servidor.lock:
+                            servidor.blobs[hashlib.sha1(contenido).hexdigest()] = len(contenido)
+                if faltantes:
+                    with servidor.lock:
+                        servidor.stats["missing_files"] += 1
+                    self._responder(400, {"error": {
+                        "code": "missing_files",
+                        "message": "Missing files",
+                        "missing": sorted(set(faltantes)),
+                    }})
+                    return
+                with servidor.lock:
+                    servidor.stats["deployments"] += 1
+                    deployment_id = f"dpl_{servidor.stats['deployments']}"
+                    servidor.deployments[deployment_id] = {
+                        "url": f"{datos['name']}-{servidor.stats['deployments']}.vercel.app",
+                        "consultas": 0,
+                    }
+                self._responder(200, {"id": deployment_id, "readyState": "QUEUED"})
+
+        return Handler
+
+    def iniciar(self) -> "MockVercelServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def detener(self):
+        """Detiene el servidor"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+
+def main():
+    """Levanta el servidor de pruebas en primer plano"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor Vercel local para pruebas de deploy")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--consultas-hasta-ready", type=int, default=2)
+    args = parser.parse_args()
+
+    servidor = MockVercelServer(args.host, args.port, consultas_hasta_ready=args.consultas_hasta_ready)
+    print(f"▲ Servidor Vercel local en {servidor.base_url}")
+    print(f"\n💡 export VERCEL_API_URL={servidor.base_url} VERCEL_TOKEN=local")
+
+    try:
+        servidor.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
+        servidor.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,18 @@ Combina información de varias fuentes sobre el mismo tema
 sin usar IA generativa, mediante técnicas de extracción y fusión.
 """
 
+import os
 import re
 import json
 from typing import List, Dict, Tuple, Set
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 import hashlib
 
+from fact_dedup import FactExtractor, deduplicar_hechos
+from near_duplicate_clusterer import NearDuplicateClusterer
+
 
 class MultiSourceSynthesizer:
     """
@@ -35,6 +40,9 @@ class MultiSourceSynthesizer:
             'está', 'están', 'estaba', 'estaban', 'estará', 'estarán',
             'tiene', 'tienen', 'tenía', 'tenían', 'tendrá', 'tendrán'
         }
+        
+        # Regex de hechos compiladas una sola vez
+        self.fact_extractor = FactExtractor()
     
     def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
         """
@@ -70,54 +78,41 @@ class MultiSourceSynthesizer:
         """
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
     
-    def find_similar_articles(self, articles: List[Dict], threshold: float = 0.6) -> List[List[Dict]]:
+    def find_similar_articles(
+        self,
+        articles: List[Dict],
+        threshold: float = 0.6,
+        clusterer: NearDuplicateClusterer = None
+    ) -> List[List[Dict]]:
         """
         Agrupa artículos similares sobre el mismo tema.
+        Usa MinHash + LSH para comparar solo pares candidatos (casi lineal)
+        con el mismo score combinado: 0.6·Jaccard de keywords + 0.4·similitud de título.
         
         Args:
             articles: Lista de artículos
             threshold: Umbral de similitud para agrupar
+            clusterer: Agrupador existente para sumar artículos a grupos previos
             
         Returns:
             Lista de grupos de artículos similares
         """
-        groups = []
-        used = set()
+        if clusterer is None:
+            clusterer = self.crear_clusterer(threshold)
+        clusterer.agregar_lote(articles)
+        return clusterer.obtener_grupos()
+    
+    def crear_clusterer(self, threshold: float = 0.6) -> NearDuplicateClusterer:
+        """
+        Crea un agrupador incremental que comparte las keywords de este sintetizador
         
-        for i, article1 in enumerate(articles):
-            if i in used:
-                continue
-                
-            group = [article1]
-            used.add(i)
-            
-            title1 = article1.get('title', '')
-            keywords1 = set(self.extract_keywords(title1))
-            
-            for j, article2 in enumerate(articles[i+1:], start=i+1):
-                if j in used:
-                    continue
-                    
-                title2 = article2.get('title', '')
-                keywords2 = set(self.extract_keywords(title2))
-                
-                # Calcular similitud por keywords y título (índice Jaccard simétrico)
-                intersection = keywords1 & keywords2
-                union = keywords1 | keywords2
-                keyword_sim = len(intersection) / max(len(union), 1)
-                title_sim = self.calculate_similarity(title1, title2)
-                
-                # Score combinado
-                combined_score = (keyword_sim * 0.6) + (title_sim * 0.4)
-                
-                if combined_score >= threshold:
-                    group.append(article2)
-                    used.add(j)
+        Args:
+            threshold: Umbral de similitud para agrupar
             
-            if len(group) >= 2:  # Solo grupos con 2+ artículos
-                groups.append(group)
-        
-        return groups
+        Returns:
+            NearDuplicateClusterer listo para agregar artículos
+        """
+        return NearDuplicateClusterer(self.extract_keywords, threshold)
     
     def extract_facts(self, text: str) -> List[str]:
         """
@@ -130,37 +125,7 @@ class MultiSourceSynthesizer:
         Returns:
             Lista de hechos extraídos
         """
-        facts = []
-        
-        # Dividir en oraciones
-        sentences = re.split(r'[.!?]+', text)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 20:
-                continue
-            
-            # Detectar hechos por patrones
-            has_number = bool(re.search(r'\d+', sentence))
-            has_date = bool(re.search(r'\b\d{1,2}[/-]\d{1,2}[/-](?:19|20)\d{2}\b|\b(?:19|20)\d{2}\b', sentence))
-            has_percentage = bool(re.search(r'\d+%|\d+\s*por\s*ciento', sentence, re.I))
-            has_money = bool(re.search(r'\$[\d,]+|\d+\s*(pesos|dólares|euros|millones|miles)', sentence, re.I))
-            has_quote = bool(re.search(r'[""''"].*?[""''"]', sentence))
-            
-            # Puntuar la oración
-            score = sum([has_number, has_date, has_percentage, has_money, has_quote])
-            
-            if score >= 2:  # Al menos 2 indicadores de hecho
-                facts.append({
-                    'text': sentence,
-                    'score': score,
-                    'has_number': has_number,
-                    'has_date': has_date
-                })
-        
-        # Ordenar por score y retornar textos
-        facts.sort(key=lambda x: x['score'], reverse=True)
-        return [f['text'] for f in facts[:5]]  # Top 5 hechos
+        return self.fact_extractor.extraer(text)
     
     def synthesize_group(self, articles: List[Dict]) -> Dict:
         """
@@ -185,16 +150,8 @@ class MultiSourceSynthesizer:
             facts = self.extract_facts(text)
             all_facts.extend(facts)
         
-        # Eliminar hechos duplicados (similares)
-        unique_facts = []
-        for fact in all_facts:
-            is_duplicate = False
-            for existing in unique_facts:
-                if self.calculate_similarity(fact, existing) > 0.7:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                unique_facts.append(fact)
+        # Eliminar hechos duplicados (similares) con índice de n-gramas
+        unique_facts = deduplicar_hechos(all_facts, umbral=0.7)
         
         # Construir descripción sintetizada
         base_desc = base_article.get('description', '')
@@ -233,6 +190,32 @@ class MultiSourceSynthesizer:
         
         return synthesized
     
+    def synthesize_groups_batch(
+        self,
+        groups: List[List[Dict]],
+        max_workers: int = None,
+        min_grupos_paralelo: int = 50
+    ) -> List[Dict]:
+        """
+        Sintetiza muchos grupos repartiéndolos entre procesos.
+        
+        Args:
+            groups: Grupos de artículos similares
+            max_workers: Procesos a usar (None = núcleos disponibles)
+            min_grupos_paralelo: Debajo de este número se sintetiza en serie
+                                 (arrancar procesos cuesta más que el trabajo)
+            
+        Returns:
+            Artículos sintetizados, en el mismo orden que los grupos
+        """
+        if len(groups) < min_grupos_paralelo or max_workers == 1:
+            return [self.synthesize_group(group) for group in groups]
+        
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(groups) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_sintetizar_grupo, groups, chunksize=chunksize))
+    
     def synthesize_articles(self, articles: List[Dict]) -> Tuple[List[Dict], Dict]:
         """
         Proceso completo de síntesis de artículos.
@@ -252,11 +235,12 @@ class MultiSourceSynthesizer:
         synthesized = []
         used_articles = set()
         
-        # Sintetizar cada grupo
-        for i, group in enumerate(groups, 1):
-            print(f"  🔄 Sintetizando grupo {i}: {len(group)} artículos")
+        # Sintetizar todos los grupos (en paralelo si son muchos)
+        synthesized_groups = self.synthesize_groups_batch(groups)
+        
+        for i, (group, synthesized_article) in enumerate(zip(groups, synthesized_groups), 1):
+            print(f"  🔄 Grupo {i} sintetizado: {len(group)} artículos")
             
-            synthesized_article = self.synthesize_group(group)
             if synthesized_article:
                 synthesized.append(synthesized_article)
                 
@@ -294,6 +278,17 @@ class MultiSourceSynthesizer:
         return synthesized, stats
 
 
+_synthesizer_proceso = None
+
+
+def _sintetizar_grupo(group: List[Dict]) -> Dict:
+    """Worker de synthesize_groups_batch (un sintetizador por proceso)"""
+    global _synthesizer_proceso
+    if _synthesizer_proceso is None:
+        _synthesizer_proceso = MultiSourceSynthesizer()
+    return _synthesizer_proceso.synthesize_group(group)
+
+
 # Demo
 if __name__ == "__main__":
     # Artículos de ejemplo sobre el mismo tema
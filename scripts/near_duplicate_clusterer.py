@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Agrupador de Casi-Duplicados (MinHash + LSH)
+Agrupa artículos sobre la misma noticia en tiempo casi lineal: calcula
+shingles y keywords una sola vez por artículo, usa firmas MinHash con
+LSH por bandas para obtener candidatos y solo verifica esos candidatos
+con el score combinado de MultiSourceSynthesizer (keywords + título).
+Tiene modo incremental para sumar artículos nuevos a grupos existentes.
+"""
+
+import random
+import zlib
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Set
+
+# Primo de Mersenne 2^61 - 1 para las permutaciones universales
+_PRIMO = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalizar(texto: str) -> str:
+    return " ".join(texto.lower().split())
+
+
+def shingles_caracteres(texto_normalizado: str, k: int = 3) -> Set[str]:
+    """k-gramas de caracteres de un texto ya normalizado"""
+    if len(texto_normalizado) < k:
+        return {f"c:{texto_normalizado}"} if texto_normalizado else set()
+    return {f"c:{texto_normalizado[i:i + k]}" for i in range(len(texto_normalizado) - k + 1)}
+
+
+def shingles_titulo(titulo_normalizado: str, keywords: Set[str], k: int = 3) -> Set[str]:
+    """
+    Shingles de un título: keywords + k-gramas de caracteres
+    (las dos señales que usa el score combinado)
+
+    Args:
+        titulo_normalizado: Título en minúsculas y con espacios colapsados
+        keywords: Keywords ya extraídas del título
+        k: Tamaño de los k-gramas de caracteres
+
+    Returns:
+        Conjunto de shingles
+    """
+    return {f"w:{kw}" for kw in keywords} | shingles_caracteres(titulo_normalizado, k)
+
+
+class MinHasher:
+    """Firmas MinHash con permutaciones universales deterministas"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._permutaciones = [
+            (rng.randrange(1, _PRIMO), rng.randrange(0, _PRIMO)) for _ in range(num_perm)
+        ]
+
+    def firma(self, shingles: Set[str]) -> List[int]:
+        """Calcula la firma MinHash de un conjunto de shingles"""
+        if not shingles:
+            return [_MAX_HASH] * self.num_perm
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+        return [
+            min((a * h + b) % _PRIMO for h in hashes) & _MAX_HASH
+            for a, b in self._permutaciones
+        ]
+
+
+class LSHIndex:
+    """Índice LSH por bandas sobre firmas MinHash"""
+
+    def __init__(self, num_perm: int = 64, bandas: int = 32):
+        """
+        Args:
+            num_perm: Tamaño de las firmas
+            bandas: Número de bandas (filas por banda = num_perm / bandas)
+        """
+        if num_perm % bandas != 0:
+            raise ValueError("num_perm debe ser múltiplo de bandas")
+        self.bandas = bandas
+        self.filas = num_perm // bandas
+        self._buckets: List[Dict[tuple, List[int]]] = [{} for _ in range(bandas)]
+
+    def _claves(self, firma: List[int]):
+        for banda in range(self.bandas):
+            inicio = banda * self.filas
+            yield banda, tuple(firma[inicio:inicio + self.filas])
+
+    def agregar(self, item_id: int, firma: List[int]):
+        """Indexa un elemento por su firma"""
+        for banda, clave in self._claves(firma):
+            self._buckets[banda].setdefault(clave, []).append(item_id)
+
+    def candidatos(self, firma: List[int]) -> Set[int]:
+        """Elementos que comparten al menos una banda con la firma"""
+        encontrados = set()
+        for banda, clave in self._claves(firma):
+            encontrados.update(self._buckets[banda].get(clave, ()))
+        return encontrados
+
+
+class NearDuplicateClusterer:
+    """
+    Agrupa artículos con el mismo criterio greedy que find_similar_articles:
+    cada artículo se une al primer grupo cuyo artículo semilla supera el umbral,
+    o se convierte en semilla de un grupo nuevo. Solo las semillas se indexan.
+    """
+
+    def __init__(
+        self,
+        extraer_keywords: Callable[[str], List[str]],
+        threshold: float = 0.6,
+        num_perm: int = 64,
+        bandas: int = 32,
+    ):
+        """
+        Args:
+            extraer_keywords: Función de keywords (MultiSourceSynthesizer.extract_keywords)
+            threshold: Umbral del score combinado (0.6·Jaccard keywords + 0.4·similitud título)
+            num_perm: Tamaño de la firma MinHash
+            bandas: Bandas LSH (filas por banda = num_perm / bandas)
+        """
+        self.extraer_keywords = extraer_keywords
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.indice = LSHIndex(num_perm, bandas)
+
+        self.grupos: List[List[Dict]] = []
+        self._semillas: List[Dict] = []
+        self.stats = {"articulos": 0, "candidatos": 0, "verificados": 0}
+
+    def _preparar(self, article: Dict) -> Dict:
+        """Calcula una sola vez todo lo que necesita la comparación"""
+        titulo = article.get("title", "") or ""
+        keywords = set(self.extraer_keywords(titulo))
+        titulo_normalizado = normalizar(titulo)
+        return {
+            "titulo_lower": titulo.lower(),
+            "keywords": keywords,
+            "firma": self.hasher.firma(shingles_titulo(titulo_normalizado, keywords)),
+        }
+
+    def _score(self, a: Dict, b: Dict) -> float:
+        """Score combinado, con poda por cota superior antes de SequenceMatcher"""
+        union = a["keywords"] | b["keywords"]
+        keyword_sim = len(a["keywords"] & b["keywords"]) / max(len(union), 1)
+
+        matcher = SequenceMatcher(None, a["titulo_lower"], b["titulo_lower"])
+        if keyword_sim * 0.6 + matcher.real_quick_ratio() * 0.4 < self.threshold:
+            return 0.0
+        if keyword_sim * 0.6 + matcher.quick_ratio() * 0.4 < self.threshold:
+            return 0.0
+        return keyword_sim * 0.6 + matcher.ratio() * 0.4
+
+    def agregar(self, article: Dict) -> int:
+        """
+        Agrega un artículo (modo incremental)
+
+        Args:
+            article: Artículo a agrupar
+
+        Returns:
+            Índice del grupo al que quedó asignado
+        """
+        datos = self._preparar(article)
+        self.stats["articulos"] += 1
+
+        candidatos = self.indice.candidatos(datos["firma"])
+        self.stats["candidatos"] += len(candidatos)
+
+        # Semillas en orden de creación, como el recorrido original
+        for idx in sorted(candidatos):
+            self.stats["verificados"] += 1
+            if self._score(self._semillas[idx], datos) >= self.threshold:
+                self.grupos[idx].append(article)
+                return idx
+
+        idx = len(self.grupos)
+        self.grupos.append([article])
+        self._semillas.append(datos)
+        self.indice.agregar(idx, datos["firma"])
+        return idx
+
+    def agregar_lote(self, articles: List[Dict]) -> List[int]:
+        """Agrega varios artículos en orden y retorna sus índices de grupo"""
+        return [self.agregar(article) for article in articles]
+
+    def obtener_grupos(self, minimo: int = 2) -> List[List[Dict]]:
+        """Grupos con al menos `minimo` artículos, en orden de creación"""
+        return [grupo for grupo in self.grupos if len(grupo) >= minimo]
+
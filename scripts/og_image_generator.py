@@ -11,6 +11,9 @@ from typing import Dict, List
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 
+from pipeline_tracer import trazar
+from storage_backend import DiskStorage, StorageBackend
+
 
 class OGImageGenerator:
     """Genera imágenes Open Graph para artículos"""
@@ -19,7 +22,12 @@ class OGImageGenerator:
     OG_WIDTH = 1200
     OG_HEIGHT = 630
     
-    def __init__(self):
+    def __init__(self, storage: StorageBackend = None):
+        """
+        Args:
+            storage: Destino de las imágenes (default: disco local)
+        """
+        self.storage = storage or DiskStorage()
         self.output_dir = Path('public/og-images')
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -129,7 +137,10 @@ class OGImageGenerator:
             output_name = f"og_{safe_title}.png"
         
         output_path = self.output_dir / output_name
-        img.save(output_path, 'PNG', optimize=True)
+        with trazar("imagen.og_encode", "imagen") as span:
+            with self.storage.abrir(output_path, 'wb', content_type='image/png') as f:
+                img.save(f, 'PNG', optimize=True)
+            span.registrar_bytes(salida=f.bytes)
         
         return str(output_path)
     
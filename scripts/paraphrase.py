@@ -11,16 +11,19 @@ from dotenv import load_dotenv
 from typing import List, Dict
 import time
 
+from pipeline_tracer import trazar
+from utils.blackbox import api_url
+
 load_dotenv()
 
 API_KEY = os.getenv('BLACKBOX_API_KEY')
-API_URL = 'https://api.blackbox.ai/chat/completions'
 
 class NewsParaphraser:
     """Genera variaciones de artículos usando IA"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None):
         self.api_key = api_key or API_KEY
+        self.api_url = api_url(base_url)
         if not self.api_key:
             raise ValueError("BLACKBOX_API_KEY no encontrada en .env")
         
@@ -128,8 +131,10 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
         }
         
         try:
-            response = requests.post(API_URL, headers=self.headers, json=payload, timeout=90)
-            response.raise_for_status()
+            with trazar("llm.paraphrase", "llm", modelo=payload["model"]) as span:
+                response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=90)
+                span.registrar_respuesta(response)
+                response.raise_for_status()
             
             result = response.json()
             
@@ -152,13 +157,14 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
             print(f"❌ Error procesando respuesta: {e}")
             return text
     
-    def paraphrase_article(self, article: Dict, style: str = "neutral") -> Dict:
+    def paraphrase_article(self, article: Dict, style: str = "neutral", copiar: bool = True) -> Dict:
         """
         Parafrasea un artículo completo
         
         Args:
             article: Diccionario con datos del artículo
             style: Estilo de escritura deseado
+            copiar: Si False, reemplaza los campos parafraseados en el mismo dict
             
         Returns:
             Diccionario con artículo parafraseado
@@ -191,7 +197,7 @@ Artículo expandido con PÁRRAFOS BIEN SEPARADOS:"""
         paraphrased = self.paraphrase_text(base_text, style)
         
         # Crear copia del artículo con texto parafraseado
-        result = article.copy()
+        result = article.copy() if copiar else article
         
         # Extraer título y artículo del formato estructurado
         if '[TÍTULO]' in paraphrased and '[ARTÍCULO]' in paraphrased:
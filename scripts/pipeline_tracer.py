@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Instrumentación del Pipeline
+Mide cada paso_* y cada llamada externa (LLM, HTTP, WHOIS, imágenes):
+tiempo real, CPU, RSS máximo, bytes de entrada/salida, reintentos y cache hits.
+Escribe un trace JSON-lines y puede exportarlo a formato Chrome/Perfetto.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows no tiene el módulo resource
+    resource = None
+
+
+def _rss_maximo_mb() -> Optional[float]:
+    """RSS máximo del proceso en MB (None si no está disponible)"""
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB, macOS reporta bytes
+    if sys.platform == "darwin":
+        return round(maxrss / (1024 * 1024), 2)
+    return round(maxrss / 1024, 2)
+
+
+class Span:
+    """Medición de un paso o de una llamada externa"""
+
+    def __init__(self, nombre: str, categoria: str, atributos: Dict):
+        self.nombre = nombre
+        self.categoria = categoria
+        self.atributos = atributos
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.error = None
+        self.duracion = 0.0
+
+    def registrar_bytes(self, entrada: int = 0, salida: int = 0):
+        """Acumula bytes recibidos (entrada) y enviados (salida)"""
+        self.bytes_in += entrada or 0
+        self.bytes_out += salida or 0
+
+    def registrar_respuesta(self, response):
+        """Acumula los bytes de una respuesta HTTP (requests/httpx) y su request"""
+        cuerpo = getattr(getattr(response, "request", None), "body", None)
+        if isinstance(cuerpo, str):
+            cuerpo = cuerpo.encode("utf-8")
+        self.registrar_bytes(
+            entrada=len(response.content or b""),
+            salida=len(cuerpo) if isinstance(cuerpo, (bytes, bytearray)) else 0,
+        )
+
+    def marcar_reintento(self):
+        """Cuenta un reintento dentro de la llamada"""
+        self.retries += 1
+
+    def marcar_cache_hit(self):
+        """Cuenta un acierto de cache (la llamada externa no se hizo)"""
+        self.cache_hits += 1
+
+
+class PipelineTracer:
+    """Registra spans en un archivo JSON-lines (thread-safe)"""
+
+    def __init__(self, trace_path: str = None, run_id: str = None, en_memoria: bool = False):
+        """
+        Inicializa el tracer
+
+        Args:
+            trace_path: Archivo .jsonl de salida (None para solo memoria agregada)
+            run_id: Identificador de la ejecución
+            en_memoria: Si True, guarda también los eventos para tomar_resumen
+                (tracer de un proceso worker)
+        """
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.run_id = run_id
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._archivo = None
+        self._origen = time.perf_counter()
+        self._eventos: Optional[List[Dict]] = [] if en_memoria else None
+
+        # Agregados por nombre de span (para el resumen final)
+        self.agregados = {}
+
+    @contextmanager
+    def span(self, nombre: str, categoria: str = "paso", **atributos):
+        """
+        Mide el bloque de código contenido
+
+        Args:
+            nombre: Nombre del span (ej: paso_3_generar_imagenes, llm.blackbox)
+            categoria: paso, llm, http, whois, imagen...
+            **atributos: Datos adicionales que se guardan con el span
+
+        Yields:
+            Span para registrar bytes, reintentos y cache hits
+        """
+        span = Span(nombre, categoria, atributos)
+        inicio_wall = time.perf_counter()
+        inicio_cpu = time.process_time()
+        inicio_cpu_hilo = time.thread_time()
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duracion = time.perf_counter() - inicio_wall
+            self._registrar(
+                span,
+                inicio_wall,
+                time.process_time() - inicio_cpu,
+                time.thread_time() - inicio_cpu_hilo,
+            )
+
+    def _registrar(self, span: Span, inicio_wall: float, cpu: float, cpu_hilo: float):
+        """Escribe el span en el trace y actualiza los agregados"""
+        evento = {
+            "run_id": self.run_id,
+            "nombre": span.nombre,
+            "categoria": span.categoria,
+            "inicio_us": int((inicio_wall - self._origen) * 1_000_000),
+            "duracion_s": round(span.duracion, 6),
+            "cpu_s": round(cpu, 6),
+            "cpu_hilo_s": round(cpu_hilo, 6),
+            "rss_max_mb": _rss_maximo_mb(),
+            "bytes_in": span.bytes_in,
+            "bytes_out": span.bytes_out,
+            "retries": span.retries,
+            "cache_hits": span.cache_hits,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if span.error:
+            evento["error"] = span.error
+        if span.atributos:
+            evento["atributos"] = span.atributos
+
+        with self._lock:
+            agregado = self._agregado(span.nombre, span.categoria)
+            agregado["llamadas"] += 1
+            agregado["duracion_s"] += span.duracion
+            agregado["cpu_s"] += cpu
+            agregado["bytes_in"] += span.bytes_in
+            agregado["bytes_out"] += span.bytes_out
+            agregado["retries"] += span.retries
+            agregado["cache_hits"] += span.cache_hits
+            agregado["errores"] += 1 if span.error else 0
+            agregado["rss_max_mb"] = evento["rss_max_mb"]
+            self._escribir(evento)
+
+    def _agregado(self, nombre: str, categoria: str) -> Dict:
+        """Agregado de un nombre de span (se crea vacío la primera vez)"""
+        return self.agregados.setdefault(
+            nombre,
+            {
+                "categoria": categoria,
+                "llamadas": 0,
+                "duracion_s": 0.0,
+                "cpu_s": 0.0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "retries": 0,
+                "cache_hits": 0,
+                "errores": 0,
+                "rss_max_mb": None,
+            },
+        )
+
+    def _escribir(self, evento: Dict):
+        """Guarda un evento en memoria y/o en el trace (con el lock tomado)"""
+        if self._eventos is not None:
+            self._eventos.append(evento)
+        if self.trace_path:
+            if self._archivo is None:
+                self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+                self._archivo = open(self.trace_path, "a", encoding="utf-8")
+            self._archivo.write(json.dumps(evento, ensure_ascii=False) + "\n")
+            self._archivo.flush()
+
+    def tomar_resumen(self) -> Dict:
+        """
+        Entrega los eventos y agregados registrados desde la última llamada
+        y los reinicia (un worker los envía al proceso principal con cada lote)
+
+        Returns:
+            Dict con origen (perf_counter del tracer), eventos y agregados
+        """
+        with self._lock:
+            resumen = {"origen": self._origen, "eventos": self._eventos or [], "agregados": self.agregados}
+            if self._eventos is not None:
+                self._eventos = []
+            self.agregados = {}
+        return resumen
+
+    def sumar_resumen(self, resumen: Optional[Dict]):
+        """
+        Incorpora el resumen de otro tracer (tomar_resumen de un worker):
+        escribe sus eventos en este trace y suma sus agregados
+
+        Args:
+            resumen: Resultado de tomar_resumen (None se ignora)
+        """
+        if not resumen:
+            return
+        # perf_counter usa un reloj monótono del sistema, común a los
+        # procesos: basta correr los inicios al origen de este tracer
+        desfase_us = int((resumen["origen"] - self._origen) * 1_000_000)
+        with self._lock:
+            for evento in resumen["eventos"]:
+                self._escribir({**evento, "run_id": self.run_id, "inicio_us": evento["inicio_us"] + desfase_us})
+            for nombre, datos in resumen["agregados"].items():
+                agregado = self._agregado(nombre, datos["categoria"])
+                for campo in ("llamadas", "duracion_s", "cpu_s", "bytes_in", "bytes_out", "retries", "cache_hits", "errores"):
+                    agregado[campo] += datos[campo]
+                rss = [v for v in (agregado["rss_max_mb"], datos["rss_max_mb"]) if v is not None]
+                agregado["rss_max_mb"] = max(rss) if rss else None
+
+    def resumen(self) -> Dict[str, Dict]:
+        """Retorna los agregados por span con tiempos redondeados"""
+        with self._lock:
+            return {
+                nombre: {
+                    **datos,
+                    "duracion_s": round(datos["duracion_s"], 3),
+                    "cpu_s": round(datos["cpu_s"], 3),
+                }
+                for nombre, datos in self.agregados.items()
+            }
+
+    def cerrar(self):
+        """Cierra el archivo de trace"""
+        with self._lock:
+            if self._archivo:
+                self._archivo.close()
+                self._archivo = None
+
+
+class _NullTracer:
+    """Tracer inactivo: los clientes pueden instrumentar sin coste"""
+
+    @contextmanager
+    def span(self, nombre: str, categoria: str = "paso", **atributos):
+        yield Span(nombre, categoria, atributos)
+
+    def resumen(self) -> Dict[str, Dict]:
+        return {}
+
+    def tomar_resumen(self) -> Optional[Dict]:
+        return None
+
+    def sumar_resumen(self, resumen: Optional[Dict]):
+        pass
+
+    def cerrar(self):
+        pass
+
+
+_tracer_activo = _NullTracer()
+
+
+def activar_tracer(tracer) -> None:
+    """Registra el tracer global que usan los clientes externos"""
+    global _tracer_activo
+    _tracer_activo = tracer if tracer is not None else _NullTracer()
+
+
+def obtener_tracer():
+    """Retorna el tracer global (inactivo si nadie lo activó)"""
+    return _tracer_activo
+
+
+def trazar(nombre: str, categoria: str, **atributos):
+    """
+    Atajo para instrumentar una llamada externa con el tracer global
+
+    Uso:
+        with trazar("llm.blackbox", "llm", modelo=model) as span:
+            response = requests.post(...)
+            span.registrar_bytes(entrada=len(response.content))
+    """
+    return _tracer_activo.span(nombre, categoria, **atributos)
+
+
+def exportar_chrome_trace(trace_path: str, output_path: str) -> str:
+    """
+    Convierte un trace JSON-lines al formato Chrome Trace Event
+    (abrible en chrome://tracing o https://ui.perfetto.dev)
+
+    Args:
+        trace_path: Archivo .jsonl generado por PipelineTracer
+        output_path: Archivo .json de salida
+
+    Returns:
+        Path del archivo generado
+    """
+    with open(trace_path, "r", encoding="utf-8") as entrada, open(
+        output_path, "w", encoding="utf-8"
+    ) as salida:
+        salida.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        primero = True
+        for linea in entrada:
+            if not linea.strip():
+                continue
+            evento = json.loads(linea)
+            args = {
+                k: evento[k]
+                for k in (
+                    "cpu_s",
+                    "rss_max_mb",
+                    "bytes_in",
+                    "bytes_out",
+                    "retries",
+                    "cache_hits",
+                    "error",
+                )
+                if evento.get(k) not in (None, 0)
+            }
+            args.update(evento.get("atributos", {}))
+            chrome_evento = {
+                "name": evento["nombre"],
+                "cat": evento["categoria"],
+                "ph": "X",
+                "ts": evento["inicio_us"],
+                "dur": int(evento["duracion_s"] * 1_000_000),
+                "pid": evento["pid"],
+                "tid": evento["tid"],
+                "args": args,
+            }
+            if not primero:
+                salida.write(",\n")
+            salida.write(json.dumps(chrome_evento, ensure_ascii=False))
+            primero = False
+        salida.write("\n]}\n")
+
+    return output_path
+
+
+def main():
+    """Exporta un trace JSON-lines a formato Chrome/Perfetto"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exportar trace del pipeline")
+    parser.add_argument("trace", type=str, help="Archivo trace_*.jsonl")
+    parser.add_argument(
+        "--chrome", type=str, default=None, help="Archivo de salida (default: <trace>.chrome.json)"
+    )
+    args = parser.parse_args()
+
+    output = args.chrome or str(Path(args.trace).with_suffix(".chrome.json"))
+    exportar_chrome_trace(args.trace, output)
+    print(f"✅ Trace exportado: {output}")
+    print("💡 Ábrelo en https://ui.perfetto.dev o chrome://tracing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Precompresión de Sitios
+Etapa posterior al build que escribe variantes .gz (y .br/.zst si están
+instalados brotli/zstandard) junto a cada archivo comprimible del sitio,
+para que el servidor o la CDN envíen bytes ya comprimidos sin gastar CPU por
+petición. Los archivos se comprimen en paralelo; los que no cambiaron de
+contenido desde el build anterior se omiten. precompression-manifest.json
+guarda el hash y los tamaños (y con ellos la tasa de compresión) por archivo.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    import brotli
+except ImportError:  # Dependencia opcional: sin ella solo se genera .gz
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Dependencia opcional
+    zstandard = None
+
+MANIFIESTO = "precompression-manifest.json"
+
+EXTENSIONES = {".html", ".css", ".js", ".mjs", ".json", ".xml", ".atom", ".svg", ".txt", ".webmanifest"}
+
+# Por debajo de este tamaño la cabecera del formato se come la ganancia
+MIN_BYTES = 256
+
+# formato -> sufijo del archivo
+SUFIJOS = {"gzip": ".gz", "br": ".br", "zstd": ".zst"}
+
+
+def formatos_disponibles() -> Tuple[str, ...]:
+    """Formatos que se pueden generar con las librerías instaladas"""
+    formatos = ["gzip"]
+    if brotli is not None:
+        formatos.append("br")
+    if zstandard is not None:
+        formatos.append("zstd")
+    return tuple(formatos)
+
+
+class Precompressor:
+    """Genera variantes precomprimidas de los archivos de un sitio"""
+
+    def __init__(
+        self,
+        formatos: Optional[Sequence[str]] = None,
+        nivel_gzip: int = 9,
+        nivel_brotli: int = 11,
+        nivel_zstd: int = 19,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            formatos: Formatos a generar (None = todos los disponibles)
+            nivel_gzip: Nivel de gzip (1-9)
+            nivel_brotli: Calidad de brotli (0-11)
+            nivel_zstd: Nivel de zstd (1-22)
+            max_workers: Hilos de compresión (None = núcleos disponibles);
+                zlib, brotli y zstandard liberan el GIL mientras comprimen
+        """
+        disponibles = formatos_disponibles()
+        self.formatos = tuple(formatos) if formatos else disponibles
+        faltantes = [f for f in self.formatos if f not in disponibles]
+        if faltantes:
+            raise ValueError(f"Formatos no disponibles: {', '.join(faltantes)} (instala brotli/zstandard)")
+        self.nivel_gzip = nivel_gzip
+        self.nivel_brotli = nivel_brotli
+        self.nivel_zstd = nivel_zstd
+        self.max_workers = max_workers or os.cpu_count() or 4
+
+    def comprimir(self, datos: bytes, formato: str) -> bytes:
+        """Comprime datos en un formato (salida determinista)"""
+        if formato == "gzip":
+            # mtime=0: el mismo contenido produce el mismo .gz en cada build
+            return gzip.compress(datos, compresslevel=self.nivel_gzip, mtime=0)
+        if formato == "br":
+            return brotli.compress(datos, quality=self.nivel_brotli)
+        if formato == "zstd":
+            return zstandard.ZstdCompressor(level=self.nivel_zstd).compress(datos)
+        raise ValueError(f"Formato desconocido: {formato}")
+
+    def _archivos(self, site_dir: Path):
+        for ruta in site_dir.rglob("*"):
+            if ruta.suffix.lower() in EXTENSIONES and ruta.name != MANIFIESTO and ruta.is_file():
+                yield ruta
+
+    def _procesar(self, ruta: Path, relativa: str, previo: Optional[Dict]) -> Dict:
+        """
+        Comprime un archivo si su contenido cambió
+
+        Args:
+            ruta: Archivo original
+            relativa: Ruta relativa al sitio (clave del manifiesto)
+            previo: Entrada del manifiesto anterior o None
+
+        Returns:
+            Entrada del manifiesto con sha256, bytes, tamaño por formato y
+            'reescrito'
+        """
+        datos = ruta.read_bytes()
+        sha = hashlib.sha256(datos).hexdigest()
+        stat = ruta.stat()
+        entrada = {"sha256": sha, "bytes": len(datos)}
+
+        if len(datos) < MIN_BYTES:
+            for sufijo in SUFIJOS.values():
+                ruta.with_name(ruta.name + sufijo).unlink(missing_ok=True)
+            entrada["reescrito"] = False
+            return entrada
+
+        vigente = previo is not None and previo.get("sha256") == sha
+        reescrito = False
+        for formato in self.formatos:
+            variante = ruta.with_name(ruta.name + SUFIJOS[formato])
+            if vigente and formato in previo and variante.exists():
+                entrada[formato] = previo[formato]
+            elif vigente and formato not in previo and previo.get(f"{formato}_descartado"):
+                # Ya se sabe que no reduce el tamaño
+                entrada[f"{formato}_descartado"] = True
+                continue
+            else:
+                comprimido = self.comprimir(datos, formato)
+                reescrito = True
+                if len(comprimido) >= len(datos):
+                    variante.unlink(missing_ok=True)
+                    entrada[f"{formato}_descartado"] = True
+                    continue
+                temporal = variante.with_name(variante.name + ".tmp")
+                temporal.write_bytes(comprimido)
+                os.replace(temporal, variante)
+                entrada[formato] = len(comprimido)
+            # La variante lleva el mtime del original: los servidores descartan
+            # variantes más viejas que el archivo (que el build reescribe aunque
+            # su contenido no cambie)
+            os.utime(variante, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        for formato, sufijo in SUFIJOS.items():
+            if formato not in self.formatos:
+                ruta.with_name(ruta.name + sufijo).unlink(missing_ok=True)
+
+        entrada["reescrito"] = reescrito
+        return entrada
+
+    def comprimir_sitio(self, site_dir: Path) -> Dict:
+        """
+        Precomprime todos los archivos comprimibles de un sitio
+
+        Args:
+            site_dir: Directorio del sitio
+
+        Returns:
+            Dict con archivos, comprimidos, omitidos, bytes_originales y,
+            por formato, bytes comprimidos y tasa (comprimido/original)
+        """
+        site_dir = Path(site_dir)
+        manifiesto_path = site_dir / MANIFIESTO
+        previos = {}
+        if manifiesto_path.exists():
+            with open(manifiesto_path, "r", encoding="utf-8") as f:
+                previos = json.load(f).get("archivos", {})
+
+        rutas = {ruta.relative_to(site_dir).as_posix(): ruta for ruta in self._archivos(site_dir)}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            entradas = dict(zip(
+                rutas,
+                executor.map(lambda item: self._procesar(item[1], item[0], previos.get(item[0])), rutas.items()),
+            ))
+
+        # Variantes de archivos que ya no existen
+        for relativa in previos:
+            if relativa not in entradas:
+                for sufijo in SUFIJOS.values():
+                    (site_dir / (relativa + sufijo)).unlink(missing_ok=True)
+
+        resumen = {
+            "archivos": len(entradas),
+            "comprimidos": sum(1 for e in entradas.values() if e.pop("reescrito")),
+            "bytes_originales": 0,
+            "formatos": {},
+        }
+        resumen["omitidos"] = resumen["archivos"] - resumen["comprimidos"]
+        # La tasa se calcula sobre los archivos con variante (los pequeños se sirven tal cual)
+        for formato in self.formatos:
+            con_variante = [e for e in entradas.values() if formato in e]
+            originales = sum(e["bytes"] for e in con_variante)
+            comprimidos = sum(e[formato] for e in con_variante)
+            resumen["formatos"][formato] = {
+                "archivos": len(con_variante),
+                "bytes_originales": originales,
+                "bytes": comprimidos,
+                "tasa": round(comprimidos / originales, 4) if originales else None,
+            }
+        resumen["bytes_originales"] = sum(e["bytes"] for e in entradas.values())
+
+        with open(manifiesto_path, "w", encoding="utf-8") as f:
+            json.dump({"archivos": entradas, "resumen": resumen}, f, ensure_ascii=False)
+
+        return resumen
+
+
+def main():
+    """Precomprime uno o más sitios ya construidos"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generar variantes .gz/.br/.zst de los sitios")
+    parser.add_argument("sitios", nargs="+", help="Directorios de sitios")
+    parser.add_argument("--formatos", type=str, default=None, help="Ej: gzip,br (default: todos los disponibles)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    precompressor = Precompressor(args.formatos.split(",") if args.formatos else None, max_workers=args.workers)
+    for sitio in args.sitios:
+        resumen = precompressor.comprimir_sitio(Path(sitio))
+        print(f"🗜️  {sitio}: {resumen['comprimidos']} comprimidos, {resumen['omitidos']} sin cambios")
+        for formato, datos in resumen["formatos"].items():
+            if datos["tasa"] is not None:
+                print(f"   {formato}: {datos['bytes_originales'] / 1024:.0f} KB → {datos['bytes'] / 1024:.0f} KB ({datos['tasa']:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Ejecutor de Render en Paralelo
+Reparte las páginas de un sitio (artículos, páginas de categoría,
+etiquetas, imágenes OG, páginas legales) en lotes y las renderiza en un pool de procesos, un
+proceso por núcleo. Cada worker escribe sus páginas y devuelve al proceso
+principal solo el resumen del lote, que se reporta como progreso.
+
+Los workers reciben un ContextoSitio (lo común a todas las páginas del
+sitio) y por cada página solo los campos que se pintan, para que lo que
+viaja entre procesos sea pequeño. Los generadores se crean una vez por
+proceso.
+
+Cada worker crea su storage con crear_storage (STORAGE_TYPE), así que con
+S3/R2 publica sus páginas al escribirlas. Al terminar cada lote espera sus
+subidas y devuelve lo publicado y sus estadísticas, que el executor suma al
+storage del orquestador, el único que guarda el manifiesto del bucket (al
+final de cada render en el pool; los workers lo releen en el siguiente). Del
+mismo modo devuelve los spans de su tracer, que se suman al tracer activo del
+proceso principal (mismo trace, con el pid del worker). Con
+un solo núcleo o pocas páginas se renderiza en el proceso principal con el
+storage del orquestador.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pipeline_tracer import PipelineTracer, activar_tracer, obtener_tracer, trazar
+from storage_backend import DiskStorage, StorageBackend, crear_storage
+
+# Debajo de este número de páginas el pool no compensa (arranque y pickling)
+MIN_PAGINAS_POOL = 64
+
+# Lotes por proceso: suficientes para repartir bien páginas de costo desigual
+LOTES_POR_PROCESO = 4
+
+# Campos de un artículo que pinta cada tipo de página
+CAMPOS_ARTICULO = ('title', 'category', 'author', 'published_at', 'description',
+                   'full_article', 'full_text', 'content')
+CAMPOS_TARJETA = ('_display_index', 'title', 'description', 'image_url', 'ai_image_path',
+                  'author', 'published_at')
+CAMPOS_SIDEBAR = ('_display_index', 'title', 'category', 'published_at')
+CAMPOS_OG = ('title', 'category_name')
+
+
+def compactar(article: Dict, campos: Sequence[str]) -> Dict:
+    """Copia de un artículo con solo los campos dados (los ausentes siguen ausentes)"""
+    return {campo: article[campo] for campo in campos if campo in article}
+
+
+class ContextoSitio:
+    """Datos comunes a todas las páginas de un sitio que necesita un worker"""
+
+    def __init__(self, site_dir, metadata: Dict, **datos):
+        """
+        Args:
+            site_dir: Directorio del sitio
+            metadata: Metadata del sitio
+            **datos: Datos propios del tipo de página (paleta, logo, directorios)
+        """
+        self.site_dir = str(site_dir)
+        self.metadata = metadata
+        self.datos = datos
+
+
+# ---------------------------------------------------------------------------
+# Estado por proceso
+# ---------------------------------------------------------------------------
+
+_generadores: Dict[str, Any] = {}
+_storage_worker: Optional[StorageBackend] = None
+# Render del executor al que pertenece el último lote del proceso
+_render_worker: Optional[int] = None
+
+
+def _iniciar_worker(raiz: Optional[str], tipo_storage: Optional[str]):
+    """Inicializa un proceso del pool"""
+    global _storage_worker
+    _storage_worker = crear_storage(raiz, tipo_storage) if raiz else DiskStorage()
+    # El tracer heredado del proceso principal escribiría en su mismo archivo:
+    # el worker junta sus spans en memoria y los envía con cada lote
+    activar_tracer(PipelineTracer(en_memoria=True))
+
+
+def _generador(nombre: str):
+    """Generador del proceso (se crea en el primer uso)"""
+    if nombre not in _generadores:
+        if nombre == 'articulo':
+            from article_page_generator import ArticlePageGenerator
+            _generadores[nombre] = ArticlePageGenerator()
+        elif nombre == 'preloader':
+            from preloader_generator import PreloaderGenerator
+            _generadores[nombre] = PreloaderGenerator()
+        elif nombre == 'seccion':
+            from section_generator import SectionGenerator
+            _generadores[nombre] = SectionGenerator()
+        elif nombre == 'og':
+            from og_image_generator import OGImageGenerator
+            _generadores[nombre] = OGImageGenerator()
+        elif nombre == 'legal':
+            from legal_pages_generator import LegalPagesGenerator
+            _generadores[nombre] = LegalPagesGenerator()
+    return _generadores[nombre]
+
+
+def _renderizar_lote(
+    funcion: Callable, contexto: ContextoSitio, lote: List, storage: StorageBackend = None, render: int = None
+) -> Dict:
+    """
+    Renderiza un lote de páginas. En un worker, el primer lote de cada
+    render relee el manifiesto del bucket
+
+    Returns:
+        Dict con valores (uno por página, None si falló), errores, tiempo y,
+        en un worker, los resúmenes de su storage y de su tracer
+    """
+    global _render_worker
+    en_worker = storage is None
+    if en_worker and render != _render_worker:
+        _storage_worker.recargar_indice()
+        _render_worker = render
+    storage = storage or _storage_worker
+    inicio = time.perf_counter()
+    valores, errores = [], []
+    with trazar('render.lote', 'render', funcion=funcion.__name__, paginas=len(lote)):
+        for item in lote:
+            try:
+                valores.append(funcion(contexto, item, storage))
+            except Exception as e:
+                valores.append(None)
+                errores.append(f"{str(item)[:80]}: {e}")
+    resultado = {'valores': valores, 'errores': errores, 'segundos': time.perf_counter() - inicio, 'pid': os.getpid()}
+    if en_worker:
+        resultado['storage'] = storage.tomar_resumen()
+        resultado['traza'] = obtener_tracer().tomar_resumen()
+    return resultado
+
+
+# ---------------------------------------------------------------------------
+# Páginas: funciones de módulo (picklables) con firma (contexto, item, storage)
+# ---------------------------------------------------------------------------
+
+def renderizar_articulo(contexto: ContextoSitio, pagina: Dict, storage: StorageBackend) -> int:
+    """
+    Escribe article_N.html
+
+    Args:
+        pagina: idx, noticia, relacionados, etiquetas, seo y preloader (o None)
+
+    Returns:
+        Bytes escritos
+    """
+    generador = _generador('articulo')
+    etiquetas_html = ''.join(
+        f'\n                            <a href="etiqueta/{etiqueta}.html" class="tag">{etiqueta}</a>'
+        for etiqueta in pagina['etiquetas']
+    )
+    html = generador.generar_html(
+        pagina['noticia'],
+        pagina['idx'],
+        contexto.metadata,
+        pagina['seo'],
+        generador.generar_sidebar(pagina['relacionados'], contexto.metadata),
+        etiquetas_html,
+        contexto.datos.get('logo_path'),
+    )
+    if pagina.get('preloader'):
+        html = _generador('preloader').inyectar_en_html(html, pagina['preloader'])
+    with storage.abrir(Path(contexto.site_dir) / f"article_{pagina['idx']}.html") as f:
+        f.write(html)
+    return f.bytes
+
+
+def renderizar_pagina_categoria(contexto: ContextoSitio, pagina: Dict, storage: StorageBackend) -> str:
+    """
+    Escribe la portada o una página del archivo de una categoría
+
+    Args:
+        pagina: Página de SectionGenerator.planificar_categoria (artículos
+            compactados con CAMPOS_TARJETA)
+
+    Returns:
+        Path de la página
+    """
+    generador = _generador('seccion')
+    generador.storage = storage
+    return generador.escribir_pagina_categoria(
+        pagina, contexto.metadata, contexto.datos['color_palette'], Path(contexto.site_dir) / 'categoria'
+    )
+
+
+def renderizar_etiqueta(contexto: ContextoSitio, item: tuple, storage: StorageBackend) -> str:
+    """
+    Escribe etiqueta/<etiqueta>.html
+
+    Args:
+        item: (etiqueta, artículos compactados con CAMPOS_TARJETA y category_name)
+
+    Returns:
+        Path de la página
+    """
+    etiqueta, articulos = item
+    generador = _generador('seccion')
+    generador.storage = storage
+    return generador.generar_pagina_etiqueta(
+        etiqueta, articulos, contexto.metadata, contexto.datos['color_palette'],
+        Path(contexto.site_dir) / 'etiqueta' / f'{etiqueta}.html'
+    )
+
+
+def renderizar_og(contexto: ContextoSitio, item: tuple, storage: StorageBackend) -> str:
+    """
+    Escribe og-images/og_article_N.png
+
+    Args:
+        item: (idx, artículo compactado con CAMPOS_OG)
+
+    Returns:
+        Path de la imagen
+    """
+    idx, article = item
+    generador = _generador('og')
+    generador.storage = storage
+    generador.output_dir = Path(contexto.site_dir) / 'og-images'
+    return generador.generar_og_image(article, contexto.metadata, f"og_article_{idx}.png")
+
+
+# Página legal -> (archivo, método de LegalPagesGenerator, campos de metadata)
+PAGINAS_LEGALES = {
+    'terminos': ('terminos.html', 'generar_terminos_condiciones', ('nombre', 'dominio')),
+    'privacidad': ('privacidad.html', 'generar_politica_privacidad', ('nombre', 'dominio')),
+    'faqs': ('faqs.html', 'generar_faqs', ('nombre',)),
+    'acerca': ('acerca.html', 'generar_acerca_de', ('nombre', 'tagline', 'dominio')),
+}
+
+
+def renderizar_legal(contexto: ContextoSitio, pagina: str, storage: StorageBackend) -> int:
+    """
+    Escribe una página legal (PAGINAS_LEGALES)
+
+    Returns:
+        Bytes escritos
+    """
+    archivo, metodo, campos = PAGINAS_LEGALES[pagina]
+    html = getattr(_generador('legal'), metodo)(*(contexto.metadata[campo] for campo in campos))
+    with storage.abrir(Path(contexto.site_dir) / archivo) as f:
+        f.write(html)
+    return f.bytes
+
+
+class RenderExecutor:
+    """Pool de procesos para renderizar páginas por lotes"""
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        tamano_lote: int = None,
+        min_paginas_pool: int = MIN_PAGINAS_POOL,
+        storage: StorageBackend = None,
+        raiz: str = None,
+        tipo_storage: str = None
+    ):
+        """
+        Args:
+            max_workers: Procesos (default: núcleos disponibles)
+            tamano_lote: Páginas por lote (default: LOTES_POR_PROCESO lotes por proceso)
+            min_paginas_pool: Con menos páginas se renderiza en el proceso principal
+            storage: Storage del proceso principal (suma lo que publican los workers)
+            raiz: Raíz de los sitios para crear_storage en los workers
+                (sin ella los workers escriben en disco)
+            tipo_storage: Tipo para crear_storage (default: STORAGE_TYPE)
+        """
+        if max_workers is None:
+            try:
+                max_workers = len(os.sched_getaffinity(0))
+            except AttributeError:
+                max_workers = os.cpu_count() or 1
+        self.max_workers = max(1, max_workers)
+        self.tamano_lote = tamano_lote
+        self.min_paginas_pool = min_paginas_pool
+        self.storage = storage or DiskStorage()
+        self.raiz = str(raiz) if raiz else None
+        self.tipo_storage = tipo_storage
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._renders = 0
+
+    def _lotes(self, items: List) -> List[List]:
+        tamano = self.tamano_lote or max(1, -(-len(items) // (self.max_workers * LOTES_POR_PROCESO)))
+        return [items[i:i + tamano] for i in range(0, len(items), tamano)]
+
+    def renderizar(
+        self,
+        funcion: Callable,
+        contexto: ContextoSitio,
+        items: List,
+        progreso: Callable[[int, int], None] = None
+    ) -> Dict:
+        """
+        Renderiza una página por item
+
+        Args:
+            funcion: Función de módulo (contexto, item, storage) que escribe la página
+            contexto: Contexto del sitio
+            items: Datos de cada página
+            progreso: Callback (páginas hechas, total) al terminar cada lote
+
+        Returns:
+            Dict con valores (en el orden de items), paginas, errores,
+            procesos y segundos
+        """
+        inicio = time.perf_counter()
+        total = len(items)
+        lotes = self._lotes(items)
+        resultados: List[Optional[Dict]] = [None] * len(lotes)
+        hechas = 0
+
+        en_pool = self.max_workers > 1 and total >= self.min_paginas_pool and len(lotes) > 1
+        if en_pool:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_iniciar_worker,
+                    initargs=(self.raiz, self.tipo_storage),
+                )
+            self._renders += 1
+            futuros = {
+                self._pool.submit(_renderizar_lote, funcion, contexto, lote, None, self._renders): n
+                for n, lote in enumerate(lotes)
+            }
+            for futuro in as_completed(futuros):
+                n = futuros[futuro]
+                resultados[n] = futuro.result()
+                self.storage.sumar_resumen(resultados[n]['storage'])
+                obtener_tracer().sumar_resumen(resultados[n]['traza'])
+                hechas += len(lotes[n])
+                if progreso:
+                    progreso(hechas, total)
+            # Manifiesto con lo que publicaron los workers
+            self.storage.esperar()
+        else:
+            for n, lote in enumerate(lotes):
+                resultados[n] = _renderizar_lote(funcion, contexto, lote, self.storage)
+                hechas += len(lote)
+                if progreso:
+                    progreso(hechas, total)
+
+        valores = [valor for resultado in resultados for valor in resultado['valores']]
+        errores = [error for resultado in resultados for error in resultado['errores']]
+        return {
+            'valores': valores,
+            'paginas': total - len(errores),
+            'errores': errores,
+            'procesos': len({resultado['pid'] for resultado in resultados}),
+            'segundos': time.perf_counter() - inicio,
+        }
+
+    def cerrar(self):
+        """Termina los procesos del pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
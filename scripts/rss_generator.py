@@ -1,41 +1,276 @@
 #!/usr/bin/env python3
 """
 Generador de RSS Feeds
-Crea feeds RSS 2.0 completos para el sitio y por categoría
+Crea feeds RSS 2.0, Atom y JSON Feed para el sitio y por categoría.
+
+Los feeds se escriben en streaming: cada artículo se prepara una sola vez
+(fecha parseada, texto limpio) y se escribe en los tres formatos del feed
+general y del de su categoría. Las fechas del feed salen de sus artículos,
+no de la hora de construcción, así que un feed sin cambios produce los mismos
+bytes. feeds_manifest.json guarda por archivo el hash del contenido (ETag),
+su Last-Modified y la huella de las entradas: si las entradas de un feed no
+cambiaron, no se vuelve a escribir.
 """
 
+import hashlib
+import json
 import os
-from datetime import datetime
-from typing import List, Dict
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from html import unescape
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from storage_backend import DiskStorage, StorageBackend
+from utils.fechas import parsear_fecha
+
+TAGS_HTML = re.compile(r'<[^>]+>')
+
+CATEGORIA_DEFAULT = 'análisis-opinión'
+
+CIERRE_RSS = '  </channel>\n</rss>\n'
+
+MANIFIESTO = 'feeds_manifest.json'
+
+# formato -> (extensión, content-type)
+FORMATOS = {
+    'rss': ('xml', 'application/rss+xml; charset=utf-8'),
+    'atom': ('atom', 'application/atom+xml; charset=utf-8'),
+    'json': ('json', 'application/feed+json; charset=utf-8'),
+}
+
+# Fecha fija para entradas sin fecha: mantiene el feed estable entre builds
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 class RSSGenerator:
     """Genera RSS feeds para noticias"""
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        max_items: int = 50,
+        formatos: Tuple[str, ...] = ('rss', 'atom', 'json'),
+        storage: StorageBackend = None
+    ):
+        """
+        Args:
+            max_items: Artículos máximos por feed
+            formatos: Formatos a generar en generar_feeds_por_categoria
+                ('rss', 'atom', 'json')
+            storage: Destino de los archivos (default: disco local)
+        """
+        desconocidos = set(formatos) - set(FORMATOS)
+        if desconocidos:
+            raise ValueError(f"Formatos de feed desconocidos: {', '.join(sorted(desconocidos))}")
         self.encoding = 'utf-8'
-    
-    def _prettify_xml(self, elem: Element) -> str:
-        """Convierte Element a string XML formateado"""
-        rough_string = tostring(elem, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ", encoding=self.encoding).decode(self.encoding)
-    
+        self.max_items = max_items
+        self.formatos = tuple(formatos)
+        self.storage = storage or DiskStorage()
+
     def _limpiar_html(self, texto: str) -> str:
-        """Limpia HTML del texto para RSS"""
-        import re
-        # Remover tags HTML
-        texto = re.sub(r'<[^>]+>', '', texto)
-        # Escapar caracteres especiales
-        texto = texto.replace('&', '&amp;')
-        texto = texto.replace('<', '&lt;')
-        texto = texto.replace('>', '&gt;')
-        texto = texto.replace('"', '&quot;')
-        texto = texto.replace("'", '&#39;')
-        return texto
-    
+        """Texto plano: sin tags ni entidades HTML (el escape XML se hace al escribir)"""
+        return unescape(TAGS_HTML.sub('', texto or ''))
+
+    def _cdata(self, texto: str) -> str:
+        """Bloque CDATA válido aunque el texto contenga ']]>'"""
+        return '<![CDATA[' + texto.replace(']]>', ']]]]><![CDATA[>') + ']]>'
+
+    def _fecha_utc(self, valor: str) -> Optional[datetime]:
+        """Fecha del artículo en UTC (sin zona se asume UTC)"""
+        dt = parsear_fecha(valor or '')
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+
+    def _rfc3339(self, dt: Optional[datetime]) -> str:
+        return (dt or EPOCH).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+    def _preparar_articulo(self, article: Dict, posicion: int, site_url: str) -> Dict:
+        """
+        Campos del artículo listos para cualquier feed (se calcula una vez por artículo)
+
+        Args:
+            article: Datos del artículo
+            posicion: Posición (base 1) del artículo en el sitio
+            site_url: URL del sitio
+        """
+        article_url = article.get('url', '')
+        if not article_url or not article_url.startswith('http'):
+            article_url = f"{site_url}/article_{article.get('_display_index', posicion)}.html"
+
+        image_url = article.get('image_url', article.get('ai_image_path', ''))
+        fecha = self._fecha_utc(article.get('published_at', article.get('publishedAt', '')))
+        return {
+            'title': article.get('title', 'Sin título'),
+            'link': article_url,
+            'description': self._limpiar_html(article.get('description', '')[:500]),
+            'content': article.get('full_text', article.get('content', ''))[:2000],
+            'fecha': fecha,
+            'pub_date': format_datetime(fecha) if fecha else None,
+            'author': article.get('author', article.get('source_name', '')),
+            'category': article.get('category_name', ''),
+            'image_url': image_url if image_url and image_url.startswith('http') else '',
+        }
+
+    def _huella_articulo(self, article: Dict, posicion: int) -> bytes:
+        """Entradas del artículo que afectan a los feeds (para saltar feeds sin cambios)"""
+        return json.dumps([
+            posicion, article.get('_display_index'), article.get('url'), article.get('title'),
+            article.get('description'), article.get('full_text', article.get('content')),
+            article.get('published_at', article.get('publishedAt')), article.get('author'),
+            article.get('source_name'), article.get('category_name'),
+            article.get('image_url', article.get('ai_image_path')),
+        ], ensure_ascii=False, default=str).encode('utf-8')
+
+    def _datos_canal(self, site_metadata: Dict, categoria: Optional[str]) -> Dict:
+        """Título, enlace y descripción del feed general o de una categoría"""
+        site_name = site_metadata.get('site_name', 'Sitio de Noticias')
+        site_url = site_metadata.get('site_url', 'https://ejemplo.com')
+
+        if categoria:
+            return {
+                'site_url': site_url,
+                'title': f"{site_name} - {categoria.replace('-', ' ').title()}",
+                'description': f"Noticias de {categoria.replace('-', ' ')} en {site_name}",
+                'link': f"{site_url}/categoria/{categoria}",
+            }
+        return {
+            'site_url': site_url,
+            'title': site_name,
+            'description': site_metadata.get('tagline', 'Noticias políticas de México'),
+            'link': site_url,
+        }
+
+    # ------------------------------------------------------------------
+    # RSS 2.0
+    # ------------------------------------------------------------------
+
+    def _item_rss(self, datos: Dict) -> str:
+        """<item> de RSS 2.0 a partir de los campos preparados"""
+        partes = [
+            '    <item>\n',
+            f'      <title>{escape(datos["title"])}</title>\n',
+            f'      <link>{escape(datos["link"])}</link>\n',
+            f'      <guid>{escape(datos["link"])}</guid>\n',
+            f'      <description>{escape(datos["description"])}</description>\n',
+        ]
+        if datos['content']:
+            partes.append(f'      <content:encoded>{self._cdata(datos["content"])}</content:encoded>\n')
+        if datos['pub_date']:
+            partes.append(f'      <pubDate>{datos["pub_date"]}</pubDate>\n')
+        if datos['author']:
+            partes.append(f'      <dc:creator>{escape(datos["author"])}</dc:creator>\n')
+        if datos['category']:
+            partes.append(f'      <category>{escape(datos["category"])}</category>\n')
+        if datos['image_url']:
+            partes.append(f'      <enclosure url={quoteattr(datos["image_url"])} type="image/jpeg"/>\n')
+        partes.append('    </item>\n')
+        return ''.join(partes)
+
+    def _cabecera_rss(self, canal: Dict, nombre_archivo: str) -> str:
+        """Declaración XML, <rss> y metadata del <channel>"""
+        return (
+            f'<?xml version="1.0" encoding="{self.encoding}"?>\n'
+            '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+            'xmlns:content="http://purl.org/rss/1.0/modules/content/">\n'
+            '  <channel>\n'
+            f'    <title>{escape(canal["title"])}</title>\n'
+            f'    <link>{escape(canal["link"])}</link>\n'
+            f'    <description>{escape(canal["description"])}</description>\n'
+            '    <language>es-MX</language>\n'
+            '    <generator>News Prototype Generator</generator>\n'
+            f'    <atom:link href={quoteattr(canal["site_url"] + "/" + nombre_archivo)} rel="self" type="application/rss+xml"/>\n'
+        )
+
+    def _cierre_rss(self, ultima: Optional[datetime]) -> str:
+        # El orden de los elementos del <channel> no importa: la fecha del
+        # artículo más reciente se conoce al final del streaming
+        fecha = f'    <lastBuildDate>{format_datetime(ultima)}</lastBuildDate>\n' if ultima else ''
+        return fecha + CIERRE_RSS
+
+    # ------------------------------------------------------------------
+    # Atom
+    # ------------------------------------------------------------------
+
+    def _cabecera_atom(self, canal: Dict, nombre_archivo: str) -> str:
+        return (
+            f'<?xml version="1.0" encoding="{self.encoding}"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="es-MX">\n'
+            f'  <title>{escape(canal["title"])}</title>\n'
+            f'  <subtitle>{escape(canal["description"])}</subtitle>\n'
+            f'  <id>{escape(canal["link"])}</id>\n'
+            f'  <link href={quoteattr(canal["link"])}/>\n'
+            f'  <link rel="self" href={quoteattr(canal["site_url"] + "/" + nombre_archivo)}/>\n'
+            '  <generator>News Prototype Generator</generator>\n'
+        )
+
+    def _entry_atom(self, datos: Dict) -> str:
+        partes = [
+            '  <entry>\n',
+            f'    <title>{escape(datos["title"])}</title>\n',
+            f'    <link href={quoteattr(datos["link"])}/>\n',
+            f'    <id>{escape(datos["link"])}</id>\n',
+            f'    <updated>{self._rfc3339(datos["fecha"])}</updated>\n',
+        ]
+        if datos['fecha']:
+            partes.append(f'    <published>{self._rfc3339(datos["fecha"])}</published>\n')
+        if datos['author']:
+            partes.append(f'    <author><name>{escape(datos["author"])}</name></author>\n')
+        if datos['category']:
+            partes.append(f'    <category term={quoteattr(datos["category"])}/>\n')
+        partes.append(f'    <summary>{escape(datos["description"])}</summary>\n')
+        if datos['content']:
+            partes.append(f'    <content type="html">{escape(datos["content"])}</content>\n')
+        if datos['image_url']:
+            partes.append(f'    <link rel="enclosure" type="image/jpeg" href={quoteattr(datos["image_url"])}/>\n')
+        partes.append('  </entry>\n')
+        return ''.join(partes)
+
+    def _cierre_atom(self, ultima: Optional[datetime]) -> str:
+        # Atom no da significado al orden de los hijos de <feed>
+        return f'  <updated>{self._rfc3339(ultima)}</updated>\n</feed>\n'
+
+    # ------------------------------------------------------------------
+    # JSON Feed 1.1
+    # ------------------------------------------------------------------
+
+    def _cabecera_json(self, canal: Dict, nombre_archivo: str) -> str:
+        cabecera = json.dumps({
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': canal['title'],
+            'home_page_url': canal['link'],
+            'feed_url': f"{canal['site_url']}/{nombre_archivo}",
+            'description': canal['description'],
+            'language': 'es-MX',
+        }, ensure_ascii=False)
+        return cabecera[:-1] + ', "items": ['
+
+    def _item_json(self, datos: Dict) -> str:
+        item = {'id': datos['link'], 'url': datos['link'], 'title': datos['title']}
+        if datos['content']:
+            item['content_text'] = datos['content']
+        else:
+            item['content_text'] = datos['description']
+        if datos['description']:
+            item['summary'] = datos['description']
+        if datos['fecha']:
+            item['date_published'] = self._rfc3339(datos['fecha'])
+        if datos['author']:
+            item['authors'] = [{'name': datos['author']}]
+        if datos['category']:
+            item['tags'] = [datos['category']]
+        if datos['image_url']:
+            item['image'] = datos['image_url']
+        return json.dumps(item, ensure_ascii=False)
+
+    # ------------------------------------------------------------------
+    # Generación
+    # ------------------------------------------------------------------
+
     def generar_rss(
         self,
         articles: List[Dict],
@@ -45,159 +280,202 @@ class RSSGenerator:
     ) -> str:
         """
         Genera un RSS feed
-        
+
         Args:
             articles: Lista de artículos
             site_metadata: Metadata del sitio
             categoria: Categoría específica (None para feed general)
             output_file: Nombre del archivo de salida
-            
+
         Returns:
             Path del archivo generado
         """
-        # Crear elemento raíz
-        rss = Element('rss')
-        rss.set('version', '2.0')
-        rss.set('xmlns:atom', 'http://www.w3.org/2005/Atom')
-        rss.set('xmlns:dc', 'http://purl.org/dc/elements/1.1/')
-        rss.set('xmlns:content', 'http://purl.org/rss/1.0/modules/content/')
-        
-        channel = SubElement(rss, 'channel')
-        
-        # Metadata del canal
-        site_name = site_metadata.get('site_name', 'Sitio de Noticias')
-        site_url = site_metadata.get('site_url', 'https://ejemplo.com')
-        site_description = site_metadata.get('tagline', 'Noticias políticas de México')
-        
-        if categoria:
-            title_text = f"{site_name} - {categoria.replace('-', ' ').title()}"
-            description_text = f"Noticias de {categoria.replace('-', ' ')} en {site_name}"
-            link_text = f"{site_url}/categoria/{categoria}"
-        else:
-            title_text = site_name
-            description_text = site_description
-            link_text = site_url
-        
-        SubElement(channel, 'title').text = title_text
-        SubElement(channel, 'link').text = link_text
-        SubElement(channel, 'description').text = description_text
-        SubElement(channel, 'language').text = 'es-MX'
-        SubElement(channel, 'lastBuildDate').text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0000')
-        SubElement(channel, 'generator').text = 'News Prototype Generator'
-        
-        # Atom self link
-        atom_link = SubElement(channel, 'atom:link')
-        atom_link.set('href', f"{site_url}/{output_file}")
-        atom_link.set('rel', 'self')
-        atom_link.set('type', 'application/rss+xml')
-        
-        # Agregar items (artículos)
-        for idx, article in enumerate(articles[:50], 1):  # Máximo 50 artículos en RSS
-            item = SubElement(channel, 'item')
-            
-            # Datos básicos
-            title = article.get('title', 'Sin título')
-            SubElement(item, 'title').text = title
-            
-            # Link al artículo
-            article_url = article.get('url', f"{site_url}/article_{idx}.html")
-            if not article_url.startswith('http'):
-                article_url = f"{site_url}/article_{idx}.html"
-            SubElement(item, 'link').text = article_url
-            SubElement(item, 'guid').text = article_url
-            
-            # Descripción
-            description = article.get('description', '')[:500]
-            description_clean = self._limpiar_html(description)
-            SubElement(item, 'description').text = description_clean
-            
-            # Contenido completo (opcional)
-            content = article.get('full_text', article.get('content', ''))[:2000]
-            if content:
-                content_clean = self._limpiar_html(content)
-                SubElement(item, 'content:encoded').text = f"<![CDATA[{content}]]>"
-            
-            # Fecha de publicación
-            pub_date = article.get('published_at', article.get('publishedAt', ''))
-            if pub_date:
-                try:
-                    if 'T' in pub_date:
-                        dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                    else:
-                        dt = datetime.strptime(pub_date, '%Y-%m-%d')
-                    pub_date_formatted = dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-                    SubElement(item, 'pubDate').text = pub_date_formatted
-                except:
-                    pass
-            
-            # Autor
-            author = article.get('author', article.get('source_name', ''))
-            if author:
-                SubElement(item, 'dc:creator').text = author
-            
-            # Categoría
-            if article.get('category_name'):
-                SubElement(item, 'category').text = article['category_name']
-            
-            # Imagen (enclosure)
-            image_url = article.get('image_url', article.get('ai_image_path', ''))
-            if image_url and image_url.startswith('http'):
-                enclosure = SubElement(item, 'enclosure')
-                enclosure.set('url', image_url)
-                enclosure.set('type', 'image/jpeg')
-        
-        # Convertir a string XML formateado
-        xml_string = self._prettify_xml(rss)
-        
-        # Guardar archivo
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(xml_string)
-        
+        canal = self._datos_canal(site_metadata, categoria)
+        ultima = None
+        with self.storage.abrir(output_file, encoding=self.encoding, content_type=FORMATOS['rss'][1]) as f:
+            f.write(self._cabecera_rss(canal, os.path.basename(output_file)))
+            for idx, article in enumerate(articles[:self.max_items], 1):
+                datos = self._preparar_articulo(article, idx, canal['site_url'])
+                if datos['fecha'] and (ultima is None or datos['fecha'] > ultima):
+                    ultima = datos['fecha']
+                f.write(self._item_rss(datos))
+            f.write(self._cierre_rss(ultima))
+
         return output_file
-    
+
+    def _escribir_grupo(
+        self,
+        output_dir: str,
+        base: str,
+        canal: Dict,
+        indices: List[int],
+        articles: List[Dict],
+        preparados: Dict[int, Dict]
+    ) -> Dict[str, Dict]:
+        """
+        Escribe los formatos de un feed (general o de una categoría) en una pasada
+
+        Returns:
+            nombre de archivo -> {etag, bytes, items}
+        """
+        escritores = {}
+        for formato in self.formatos:
+            nombre = f"{base}.{FORMATOS[formato][0]}"
+            escritores[formato] = self.storage.abrir(
+                os.path.join(output_dir, nombre), encoding=self.encoding, content_type=FORMATOS[formato][1]
+            )
+
+        ultima = None
+        try:
+            for formato, escritor in escritores.items():
+                nombre = os.path.basename(escritor.ruta)
+                cabecera = {'rss': self._cabecera_rss, 'atom': self._cabecera_atom, 'json': self._cabecera_json}[formato]
+                escritor.write(cabecera(canal, nombre))
+
+            # Los items no dependen del feed: cada artículo se renderiza una vez
+            # por formato aunque aparezca en el feed general y en el de su categoría
+            renderizar = {'rss': self._item_rss, 'atom': self._entry_atom, 'json': self._item_json}
+            for n, idx in enumerate(indices):
+                datos = preparados.get(idx)
+                if datos is None:
+                    datos = preparados[idx] = self._preparar_articulo(articles[idx], idx + 1, canal['site_url'])
+                    datos['items'] = {}
+                if datos['fecha'] and (ultima is None or datos['fecha'] > ultima):
+                    ultima = datos['fecha']
+                for formato, escritor in escritores.items():
+                    item = datos['items'].get(formato)
+                    if item is None:
+                        item = datos['items'][formato] = renderizar[formato](datos)
+                    escritor.write((', ' if n else '') + item if formato == 'json' else item)
+
+            if 'rss' in escritores:
+                escritores['rss'].write(self._cierre_rss(ultima))
+            if 'atom' in escritores:
+                escritores['atom'].write(self._cierre_atom(ultima))
+            if 'json' in escritores:
+                escritores['json'].write(']}\n')
+        except BaseException:
+            for escritor in escritores.values():
+                escritor.descartar()
+            raise
+        for escritor in escritores.values():
+            escritor.close()
+
+        return {
+            os.path.basename(e.ruta): {'etag': f'"{e.sha.hexdigest()[:32]}"', 'bytes': e.bytes, 'items': len(indices)}
+            for e in escritores.values()
+        }
+
     def generar_feeds_por_categoria(
         self,
         articles: List[Dict],
         site_metadata: Dict,
-        output_dir: str = '.'
+        output_dir: str = '.',
+        verbose: bool = True
     ) -> Dict[str, str]:
         """
-        Genera múltiples RSS feeds: uno general y uno por cada categoría
-        
+        Genera los feeds general y por categoría en todos los formatos.
+
+        Una pasada sobre los artículos reparte los de cada feed (hasta
+        max_items) y calcula la huella de sus entradas; solo se escriben los
+        feeds cuya huella cambió. Cada artículo se prepara una vez aunque
+        aparezca en el feed general y en el de su categoría. Al final se
+        actualiza feeds_manifest.json con ETag y Last-Modified por archivo.
+
         Args:
             articles: Lista de artículos categorizados
             site_metadata: Metadata del sitio
             output_dir: Directorio de salida
-            
+            verbose: Imprimir los feeds generados
+
         Returns:
-            Dict con categoría -> path del feed
+            Dict con categoría -> path del feed RSS
         """
-        import os
         os.makedirs(output_dir, exist_ok=True)
-        
-        feeds = {}
-        
-        # Feed general
-        print(f"\n📡 Generando feed general...")
-        general_feed = os.path.join(output_dir, 'feed.xml')
-        self.generar_rss(articles, site_metadata, categoria=None, output_file=general_feed)
-        feeds['general'] = general_feed
-        print(f"  ✅ {general_feed}")
-        
-        # Agrupar por categoría
-        from categorizer import NewsCategorizador
-        categorizador = NewsCategorizador()
-        grouped = categorizador.agrupar_por_categoria(articles)
-        
-        # Feed por categoría
-        print(f"\n📡 Generando feeds por categoría...")
-        for cat_id, cat_articles in grouped.items():
-            if len(cat_articles) > 0:
-                cat_feed = os.path.join(output_dir, f'feed_{cat_id}.xml')
-                self.generar_rss(cat_articles, site_metadata, categoria=cat_id, output_file=cat_feed)
-                feeds[cat_id] = cat_feed
-                print(f"  ✅ {cat_id}: {cat_feed} ({len(cat_articles)} artículos)")
-        
+        manifiesto_path = os.path.join(output_dir, MANIFIESTO)
+        previo = {}
+        contenido = self.storage.leer(manifiesto_path)
+        if contenido:
+            previo = json.loads(contenido).get('feeds', {})
+
+        # Pasada única: artículos de cada feed y huella de sus entradas
+        contexto = json.dumps(
+            [site_metadata.get('site_name'), site_metadata.get('site_url'), site_metadata.get('tagline'),
+             self.max_items, self.formatos],
+            ensure_ascii=False
+        ).encode('utf-8')
+
+        def nuevo_grupo(categoria: Optional[str]) -> Dict:
+            return {
+                'categoria': categoria,
+                'base': 'feed' if categoria is None else f'feed_{categoria}',
+                'indices': [],
+                'sha': hashlib.sha256(contexto + (categoria or '').encode('utf-8')),
+            }
+
+        grupos: Dict[str, Dict] = {'general': nuevo_grupo(None)}
+        totales: Dict[str, int] = {}
+        for idx, article in enumerate(articles):
+            cat_id = article.get('category_id', CATEGORIA_DEFAULT)
+            totales[cat_id] = totales.get(cat_id, 0) + 1
+            if cat_id not in grupos:
+                grupos[cat_id] = nuevo_grupo(cat_id)
+            huella = None
+            for grupo in (grupos['general'], grupos[cat_id]):
+                if len(grupo['indices']) < self.max_items:
+                    grupo['indices'].append(idx)
+                    huella = huella or self._huella_articulo(article, idx + 1)
+                    grupo['sha'].update(huella)
+
+        ahora = format_datetime(datetime.now(timezone.utc), usegmt=True)
+        manifiesto: Dict[str, Dict] = {}
+        preparados: Dict[int, Dict] = {}
+        feeds: Dict[str, str] = {}
+        escritos, omitidos = 0, 0
+
+        for clave, grupo in grupos.items():
+            entrada = grupo['sha'].hexdigest()
+            nombres = [f"{grupo['base']}.{FORMATOS[formato][0]}" for formato in self.formatos]
+            feeds[clave] = os.path.join(output_dir, f"{grupo['base']}.xml")
+
+            sin_cambios = all(
+                previo.get(nombre, {}).get('entrada') == entrada and self.storage.existe(os.path.join(output_dir, nombre))
+                for nombre in nombres
+            )
+            if sin_cambios:
+                for nombre in nombres:
+                    manifiesto[nombre] = previo[nombre]
+                omitidos += 1
+                continue
+
+            canal = self._datos_canal(site_metadata, grupo['categoria'])
+            escritos_grupo = self._escribir_grupo(output_dir, grupo['base'], canal, grupo['indices'], articles, preparados)
+            for formato, nombre in zip(self.formatos, nombres):
+                info = escritos_grupo[nombre]
+                anterior = previo.get(nombre, {})
+                # Mismo contenido con otras entradas (p. ej. un campo que no se publica): misma fecha
+                last_modified = anterior.get('last_modified') if anterior.get('etag') == info['etag'] else ahora
+                manifiesto[nombre] = {
+                    **info,
+                    'last_modified': last_modified or ahora,
+                    'content_type': FORMATOS[formato][1],
+                    'entrada': entrada,
+                }
+            escritos += 1
+
+        # Feeds de categorías que ya no existen
+        for nombre in previo:
+            if nombre not in manifiesto:
+                self.storage.eliminar(os.path.join(output_dir, nombre))
+
+        self.storage.escribir(manifiesto_path, json.dumps({'feeds': manifiesto}, ensure_ascii=False, indent=2))
+
+        if verbose:
+            print(f"\n📡 Feeds ({', '.join(self.formatos)}): {escritos} generados, {omitidos} sin cambios")
+            print(f"  ✅ {feeds['general']}")
+            for cat_id, total in totales.items():
+                print(f"  ✅ {cat_id}: {feeds[cat_id]} ({total} artículos)")
+
         return feeds
 
 
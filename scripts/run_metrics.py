@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Almacén de Métricas de Ejecución
+Ingiere los run_summary_*.json que escribe el orquestador y mantiene
+agregados precalculados (totales reales, p50/p95 por paso, por sitio)
+"""
+
+import bisect
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Lock entre procesos (orquestador, CLI); no disponible en Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+STORE_VERSION = 1
+
+
+def _percentil(valores_ordenados: List[float], p: float) -> float:
+    """
+    Calcula un percentil con interpolación lineal
+
+    Args:
+        valores_ordenados: Muestras ya ordenadas de menor a mayor
+        p: Percentil entre 0 y 100
+
+    Returns:
+        Valor del percentil (0.0 si no hay muestras)
+    """
+    if not valores_ordenados:
+        return 0.0
+    if len(valores_ordenados) == 1:
+        return float(valores_ordenados[0])
+
+    posicion = (len(valores_ordenados) - 1) * (p / 100)
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(valores_ordenados) - 1)
+    fraccion = posicion - inferior
+    return float(
+        valores_ordenados[inferior]
+        + (valores_ordenados[superior] - valores_ordenados[inferior]) * fraccion
+    )
+
+
+def _resumir_muestras(muestras: List[float]) -> Dict:
+    """Genera count/p50/p95/media a partir de muestras ordenadas"""
+    return {
+        "count": len(muestras),
+        "p50": round(_percentil(muestras, 50), 3),
+        "p95": round(_percentil(muestras, 95), 3),
+        "media": round(sum(muestras) / len(muestras), 3) if muestras else 0.0,
+    }
+
+
+class RunMetricsStore:
+    """Agrega métricas reales de las ejecuciones del orquestador"""
+
+    def __init__(self, summaries_dir: str, store_path: str = None):
+        """
+        Inicializa el almacén
+
+        Args:
+            summaries_dir: Directorio donde están los run_summary_*.json
+            store_path: Archivo JSON del almacén (default: <summaries_dir>/run_metrics.json)
+        """
+        self.summaries_dir = Path(summaries_dir)
+        self.store_path = (
+            Path(store_path) if store_path else self.summaries_dir / "run_metrics.json"
+        )
+        self.data = self._cargar()
+
+    def _store_vacio(self) -> Dict:
+        """Estructura inicial del almacén"""
+        return {
+            "version": STORE_VERSION,
+            "ingestados": {},
+            "runs": [],
+            "sitios": {},
+            "muestras": {"duracion_total": [], "pasos": {}},
+            "agregados": {},
+        }
+
+    def _cargar(self) -> Dict:
+        """Carga el almacén desde disco (o crea uno vacío)"""
+        if self.store_path.exists():
+            try:
+                with open(self.store_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == STORE_VERSION:
+                    return data
+            except (OSError, json.JSONDecodeError):
+                pass
+        return self._store_vacio()
+
+    @contextmanager
+    def _bloqueo(self):
+        """Lock exclusivo sobre <store>.lock mientras se lee y reescribe el almacén"""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_path.with_name(self.store_path.name + ".lock"), "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _guardar(self):
+        """Escribe el almacén de forma atómica (temporal único en el mismo directorio)"""
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.store_path.name}.", suffix=".tmp", dir=self.store_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.store_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _extraer_run(self, resumen: Dict, nombre_archivo: str) -> Dict:
+        """
+        Convierte un run_summary en un registro compacto
+
+        Args:
+            resumen: Contenido del run_summary_*.json
+            nombre_archivo: Nombre del archivo (fallback para el run_id)
+
+        Returns:
+            Registro del run
+        """
+        stats = resumen.get("stats", {})
+        sitios = resumen.get("sitios_generados", [])
+
+        # Resúmenes antiguos no traen total_articulos
+        articulos = stats.get("total_articulos")
+        if articulos is None:
+            articulos = sum(s.get("num_articulos", 0) for s in sitios) or stats.get(
+                "noticias_parafraseadas", 0
+            )
+
+        tiempo_inicio = stats.get("tiempo_inicio")
+        fecha = (
+            datetime.fromtimestamp(tiempo_inicio).isoformat() if tiempo_inicio else None
+        )
+
+        return {
+            "run_id": resumen.get("run_id")
+            or nombre_archivo.replace("run_summary_", "").replace(".json", ""),
+            "fecha": fecha,
+            "exito": bool(resumen.get("success", False)),
+            "articulos": int(articulos or 0),
+            "imagenes": int(stats.get("imagenes_generadas", 0)),
+            "sitios": int(stats.get("sitios_creados", len(sitios))),
+            "duracion_total": float(stats.get("tiempo_total_segundos", 0.0)),
+            "pasos": {
+                nombre: float(segundos)
+                for nombre, segundos in resumen.get("tiempos_pasos", {}).items()
+            },
+            "sitios_generados": [
+                {
+                    "site_num": s.get("site_num"),
+                    "num_articulos": s.get("num_articulos", articulos),
+                }
+                for s in sitios
+            ],
+        }
+
+    def _agregar_run(self, run: Dict):
+        """Incorpora un run a las muestras y a las estadísticas por sitio"""
+        self.data["runs"].append(
+            {k: v for k, v in run.items() if k != "sitios_generados"}
+        )
+
+        muestras = self.data["muestras"]
+        if run["duracion_total"] > 0:
+            bisect.insort(muestras["duracion_total"], run["duracion_total"])
+        for nombre, segundos in run["pasos"].items():
+            bisect.insort(muestras["pasos"].setdefault(nombre, []), segundos)
+
+        for sitio in run["sitios_generados"]:
+            if sitio.get("site_num") is None:
+                continue
+            self.data["sitios"][str(sitio["site_num"])] = {
+                "run_id": run["run_id"],
+                "fecha": run["fecha"],
+                "articulos": sitio["num_articulos"],
+                "imagenes": run["imagenes"],
+                "duracion_total": run["duracion_total"],
+            }
+
+    def _recalcular_agregados(self):
+        """Recalcula totales y percentiles a partir de las muestras ordenadas"""
+        runs = self.data["runs"]
+        muestras = self.data["muestras"]
+
+        total_articulos = sum(r["articulos"] for r in runs)
+        total_segundos = sum(r["duracion_total"] for r in runs)
+
+        self.data["agregados"] = {
+            "total_runs": len(runs),
+            "runs_exitosos": sum(1 for r in runs if r["exito"]),
+            "total_articulos": total_articulos,
+            "total_imagenes": sum(r["imagenes"] for r in runs),
+            "total_sitios": len(self.data["sitios"]),
+            "ultimo_run": max((r["fecha"] for r in runs if r["fecha"]), default=None),
+            "articulos_por_minuto": round(total_articulos / (total_segundos / 60), 2)
+            if total_segundos > 0
+            else 0.0,
+            "duracion_total": _resumir_muestras(muestras["duracion_total"]),
+            "pasos": {
+                nombre: _resumir_muestras(valores)
+                for nombre, valores in sorted(muestras["pasos"].items())
+            },
+        }
+
+    def ingestar(self) -> int:
+        """
+        Ingiere los run_summary nuevos o modificados desde la última llamada
+
+        Returns:
+            Número de resúmenes ingeridos
+        """
+        if not self.summaries_dir.exists():
+            return 0
+
+        with self._bloqueo():
+            # Otro escritor pudo actualizar el almacén desde que se cargó
+            self.data = self._cargar()
+            return self._ingestar_nuevos()
+
+    def _ingestar_nuevos(self) -> int:
+        """Ingiere y guarda (con el lock tomado)"""
+        ingestados = self.data["ingestados"]
+        nuevos = 0
+
+        for resumen_path in sorted(self.summaries_dir.glob("run_summary_*.json")):
+            mtime = resumen_path.stat().st_mtime
+            if ingestados.get(resumen_path.name) == mtime:
+                continue
+
+            try:
+                with open(resumen_path, "r", encoding="utf-8") as f:
+                    resumen = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+
+            run = self._extraer_run(resumen, resumen_path.name)
+
+            # Un resumen reescrito reemplaza su registro anterior
+            if resumen_path.name in ingestados:
+                self._descartar_run(run["run_id"])
+
+            self._agregar_run(run)
+            ingestados[resumen_path.name] = mtime
+            nuevos += 1
+
+        if nuevos or not self.data["agregados"]:
+            self._recalcular_agregados()
+            self._guardar()
+
+        return nuevos
+
+    def _descartar_run(self, run_id: str):
+        """Elimina un run previamente ingerido y sus muestras"""
+        anterior = next((r for r in self.data["runs"] if r["run_id"] == run_id), None)
+        if not anterior:
+            return
+
+        self.data["runs"].remove(anterior)
+        muestras = self.data["muestras"]
+        if anterior["duracion_total"] in muestras["duracion_total"]:
+            muestras["duracion_total"].remove(anterior["duracion_total"])
+        for nombre, segundos in anterior["pasos"].items():
+            valores = muestras["pasos"].get(nombre, [])
+            if segundos in valores:
+                valores.remove(segundos)
+
+    def obtener_estadisticas(self) -> Dict:
+        """Retorna los agregados precalculados"""
+        if not self.data["agregados"]:
+            self._recalcular_agregados()
+        return self.data["agregados"]
+
+    def obtener_sitio(self, site_num: int) -> Optional[Dict]:
+        """Retorna las estadísticas de un sitio concreto"""
+        return self.data["sitios"].get(str(site_num))
+
+    def obtener_sitios(self) -> Dict[str, Dict]:
+        """Retorna las estadísticas de todos los sitios"""
+        return self.data["sitios"]
+
+
+def main():
+    """Ingiere los resúmenes y muestra las métricas agregadas"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Métricas de ejecución del orquestador")
+    parser.add_argument(
+        "--dir",
+        type=str,
+        default=str(Path(__file__).parent.parent / "generated_sites"),
+        help="Directorio con run_summary_*.json",
+    )
+    args = parser.parse_args()
+
+    store = RunMetricsStore(args.dir)
+    nuevos = store.ingestar()
+    stats = store.obtener_estadisticas()
+
+    print(f"\n{'=' * 70}")
+    print("📊 MÉTRICAS DE EJECUCIÓN")
+    print(f"{'=' * 70}")
+    print(f"Resúmenes nuevos ingeridos: {nuevos}")
+    print(f"Runs: {stats['total_runs']} ({stats['runs_exitosos']} exitosos)")
+    print(f"Artículos totales: {stats['total_articulos']}")
+    print(f"Throughput: {stats['articulos_por_minuto']} artículos/minuto")
+    duracion = stats["duracion_total"]
+    print(f"Duración por run: p50={duracion['p50']}s p95={duracion['p95']}s")
+
+    if stats["pasos"]:
+        print("\n⏱️  Duración por paso:")
+        for nombre, resumen in stats["pasos"].items():
+            print(f"  {nombre}: p50={resumen['p50']}s p95={resumen['p95']}s (n={resumen['count']})")
+    print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Índice de Búsqueda BM25
+Índice invertido en memoria sobre títulos y cuerpos parafraseados, construido
+una vez por sitio. Alimenta los artículos relacionados del sidebar, las
+etiquetas de cada artículo, las páginas de etiqueta, los temas de cada
+categoría y la búsqueda del cliente (client_search). Los pesos BM25 se
+precalculan por posting, así que una consulta es solo sumar y elegir los k mejores.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+PALABRA = re.compile(r"[a-z0-9ñ]{3,}")
+SIN_ACENTOS = str.maketrans("áéíóúüàèìòù", "aeiouuaeiou")
+
+STOPWORDS = {
+    "los", "las", "unos", "unas", "pero", "sin", "con", "por", "para", "del",
+    "ante", "bajo", "desde", "hasta", "hacia", "sobre", "entre", "durante",
+    "mediante", "segun", "tras", "que", "como", "cuando", "donde", "quien",
+    "cuyo", "cuya", "este", "esta", "estos", "estas", "ese", "esa", "esos",
+    "esas", "aquel", "aquella", "aquellos", "aquellas", "nuestro", "vuestro",
+    "suyo", "mio", "tuyo", "son", "fue", "fueron", "era", "eran", "sera",
+    "seran", "han", "habia", "habian", "habra", "habran", "estan",
+    "estaba", "estaban", "estara", "estaran", "tiene", "tienen", "tenia",
+    "tenian", "tendra", "tendran", "mas", "muy", "tambien", "sus", "les",
+    "una", "uno", "ser", "hay", "pues", "asi", "solo", "cada", "otro", "otra",
+    "otros", "otras", "todo", "toda", "todos", "todas", "dijo", "ademas",
+}
+
+
+def tokenizar(texto: str) -> List[str]:
+    """Minúsculas sin acentos, palabras de 3+ caracteres sin stopwords"""
+    return [t for t in PALABRA.findall((texto or "").lower().translate(SIN_ACENTOS)) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    """Índice invertido BM25 con consultas de relacionados y etiquetas"""
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        peso_titulo: int = 3,
+        terminos_firma: int = 10,
+        max_df_firma: float = 0.2,
+    ):
+        """
+        Args:
+            k1: Saturación de frecuencia de término (BM25)
+            b: Normalización por longitud (BM25)
+            peso_titulo: Veces que cuenta cada término del título
+            terminos_firma: Términos por documento usados para buscar relacionados
+            max_df_firma: Fracción máxima de documentos en que puede aparecer un
+                término de la firma (los muy comunes discriminan poco y sus
+                postings largos harían lenta cada consulta)
+        """
+        self.k1 = k1
+        self.b = b
+        self.peso_titulo = peso_titulo
+        self.terminos_firma = terminos_firma
+        self.max_df_firma = max_df_firma
+
+        self.documentos: List[Dict] = []
+        self._frecuencias: List[Counter] = []
+        # término -> [(doc_id, peso BM25)]
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._firmas: List[List[Tuple[str, float]]] = []
+        self._finalizado = False
+
+    def agregar(self, titulo: str, cuerpo: str, metadatos: Optional[Dict] = None) -> int:
+        """
+        Agrega un documento
+
+        Args:
+            titulo: Título (pesa peso_titulo veces)
+            cuerpo: Texto del artículo
+            metadatos: Datos a devolver/exportar (url, categoría, fecha...)
+
+        Returns:
+            doc_id del documento (posición de inserción)
+        """
+        frecuencias = Counter(tokenizar(cuerpo))
+        for termino in tokenizar(titulo):
+            frecuencias[termino] += self.peso_titulo
+
+        self.documentos.append({"titulo": titulo, **(metadatos or {})})
+        self._frecuencias.append(frecuencias)
+        self._finalizado = False
+        return len(self.documentos) - 1
+
+    @classmethod
+    def desde_articulos(cls, articles: List[Dict], **kwargs) -> "SearchIndex":
+        """Índice de los artículos de un sitio (doc_id = posición en la lista)"""
+        indice = cls(**kwargs)
+        for article in articles:
+            cuerpo = article.get("full_article") or article.get("full_text") or article.get("content") or article.get("description") or ""
+            indice.agregar(
+                article.get("title", ""),
+                cuerpo,
+                {
+                    "categoria": article.get("category_name") or article.get("category", ""),
+                    "fecha": (article.get("published_at") or "")[:10],
+                },
+            )
+        indice.finalizar()
+        return indice
+
+    def finalizar(self):
+        """Calcula idf y los pesos BM25 de cada posting (se llama una vez tras agregar)"""
+        if self._finalizado:
+            return
+
+        n = len(self._frecuencias)
+        longitudes = [sum(f.values()) for f in self._frecuencias]
+        promedio = (sum(longitudes) / n) if n else 1.0
+
+        df = Counter()
+        for frecuencias in self._frecuencias:
+            df.update(frecuencias.keys())
+        idf = {t: math.log(1 + (n - d + 0.5) / (d + 0.5)) for t, d in df.items()}
+
+        # Piso fijo: en sitios chicos el costo es despreciable y no conviene descartar
+        max_df = max(10, int(n * self.max_df_firma))
+        postings = defaultdict(list)
+        self._firmas = []
+        for doc_id, frecuencias in enumerate(self._frecuencias):
+            normalizacion = self.k1 * (1 - self.b + self.b * longitudes[doc_id] / promedio)
+            pesos = []
+            for termino, tf in frecuencias.items():
+                peso = idf[termino] * tf * (self.k1 + 1) / (tf + normalizacion)
+                postings[termino].append((doc_id, peso))
+                pesos.append((termino, peso))
+            # Términos más característicos del documento que lo conectan con pocos otros
+            pesos = [p for p in pesos if 1 < df[p[0]] <= max_df]
+            self._firmas.append(heapq.nlargest(self.terminos_firma, pesos, key=lambda p: p[1]))
+
+        self.postings = dict(postings)
+        self._finalizado = True
+
+    def _mejores(self, puntajes: Dict[int, float], k: int, excluir: int = -1) -> List[Tuple[int, float]]:
+        puntajes.pop(excluir, None)
+        # Empates: el documento anterior primero (orden del sitio)
+        return heapq.nsmallest(k, puntajes.items(), key=lambda p: (-p[1], p[0]))
+
+    def buscar(self, consulta: str, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Documentos más relevantes para una consulta libre
+
+        Returns:
+            Lista de (doc_id, puntaje) de mayor a menor
+        """
+        self.finalizar()
+        puntajes: Dict[int, float] = defaultdict(float)
+        for termino in set(tokenizar(consulta)):
+            for doc_id, peso in self.postings.get(termino, ()):
+                puntajes[doc_id] += peso
+        return self._mejores(puntajes, k)
+
+    def relacionados(self, doc_id: int, k: int = 6) -> List[int]:
+        """
+        Documentos relacionados: BM25 usando como consulta los términos más
+        característicos del documento, ponderados por su peso en él
+
+        Args:
+            doc_id: Documento de referencia
+            k: Máximo de resultados
+
+        Returns:
+            doc_ids de mayor a menor relación (sin el propio documento)
+        """
+        self.finalizar()
+        puntajes: Dict[int, float] = defaultdict(float)
+        for termino, peso_consulta in self._firmas[doc_id]:
+            for otro, peso in self.postings[termino]:
+                puntajes[otro] += peso_consulta * peso
+        return [otro for otro, _ in self._mejores(puntajes, k, excluir=doc_id)]
+
+    def etiquetas(self, doc_id: int, k: int = 5) -> List[str]:
+        """Términos más característicos del documento compartidos con otros"""
+        self.finalizar()
+        return [termino for termino, _ in self._firmas[doc_id][:k]]
+
+    def etiquetas_de(self, doc_ids: List[int], k: int = 8, por_documento: int = 3) -> List[str]:
+        """
+        Etiquetas más repetidas en un grupo de documentos (p. ej. una categoría)
+
+        Args:
+            doc_ids: Documentos del grupo
+            k: Máximo de etiquetas
+            por_documento: Etiquetas de cada documento que cuentan (las que se muestran)
+
+        Returns:
+            Etiquetas de la más a la menos frecuente (empates en orden alfabético)
+        """
+        self.finalizar()
+        conteo = Counter(t for doc_id in doc_ids for t in self.etiquetas(doc_id, por_documento))
+        return [t for t, _ in heapq.nsmallest(k, conteo.items(), key=lambda p: (-p[1], p[0]))]
+
+    def documentos_por_etiqueta(self, por_documento: int = 3) -> Dict[str, List[int]]:
+        """
+        Contenido de las páginas de etiqueta: cada etiqueta que muestra algún
+        documento, con los documentos que contienen el término ordenados por
+        su peso BM25 (los postings de las etiquetas son cortos por max_df_firma)
+
+        Args:
+            por_documento: Etiquetas mostradas por documento
+
+        Returns:
+            etiqueta -> doc_ids de mayor a menor relevancia
+        """
+        self.finalizar()
+        etiquetas = {t for doc_id in range(len(self.documentos)) for t in self.etiquetas(doc_id, por_documento)}
+        return {
+            t: [doc_id for doc_id, _ in sorted(self.postings[t], key=lambda p: (-p[1], p[0]))]
+            for t in sorted(etiquetas)
+        }
@@ -4,38 +4,63 @@ Generador de Páginas de Secciones por Categoría
 Crea páginas HTML para cada categoría de noticias
 """
 
-from typing import Dict, List
+import hashlib
+import json
+from datetime import timezone
 from pathlib import Path
+from typing import Dict, Iterable, List
+
+from storage_backend import DiskStorage, StorageBackend
+from utils.fechas import parsear_fecha
+
+
+def _clave_fecha(article: Dict) -> float:
+    """published_at como timestamp para ordenar (sin fecha válida: al final)"""
+    dt = parsear_fecha(article.get('published_at') or '')
+    if dt is None:
+        return float('-inf')
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 class SectionGenerator:
     """Genera páginas de sección por categoría"""
     
-    def __init__(self):
-        pass
+    def __init__(self, por_pagina: int = 24, storage: StorageBackend = None):
+        """
+        Args:
+            por_pagina: Artículos por página del archivo de cada categoría
+            storage: Destino de las páginas (default: disco local)
+        """
+        self.por_pagina = por_pagina
+        self.storage = storage or DiskStorage()
     
-    def generar_pagina_categoria(
+    def _cabecera_html(
         self,
         categoria_id: str,
         categoria_nombre: str,
-        articles: List[Dict],
         site_metadata: Dict,
         color_palette: Dict,
-        output_path: str
+        ruta: str,
+        raiz: str,
+        contador: str,
+        sufijo_titulo: str = '',
+        enlaces: str = '',
+        descripcion: str = None,
+        temas: List[str] = None
     ) -> str:
         """
-        Genera página HTML para una categoría
+        HTML desde el DOCTYPE hasta la apertura del grid de artículos
         
         Args:
-            categoria_id: ID de la categoría
-            categoria_nombre: Nombre de la categoría
-            articles: Artículos de esta categoría
-            site_metadata: Metadata del sitio
-            color_palette: Paleta de colores
-            output_path: Path del archivo de salida
-            
-        Returns:
-            Path del archivo generado
+            ruta: Ruta de la página relativa a la raíz del sitio (og:url, canonical)
+            raiz: Prefijo relativo hasta la raíz del sitio ('../', '../../../')
+            contador: Texto del contador de artículos
+            sufijo_titulo: Texto agregado al título (páginas del archivo)
+            enlaces: <link> extra del head (rel=prev/next)
+            descripcion: Texto bajo el título (default: el de una categoría)
+            temas: Etiquetas enlazadas a sus páginas (etiqueta/<tema>.html)
         """
         site_name = site_metadata.get('site_name', 'Noticias')
         site_url = site_metadata.get('site_url', 'https://ejemplo.com')
@@ -44,7 +69,14 @@ class SectionGenerator:
         primary_color = color_palette.get('primary', '#667eea')
         secondary_color = color_palette.get('secondary', '#764ba2')
         
-        html = f'''<!DOCTYPE html>
+        descripcion = descripcion or f'Noticias y análisis político de {categoria_nombre.lower()}'
+        temas_html = ''
+        if temas:
+            temas_html = '\n        <div class="category-tags">' + ''.join(
+                f'<a href="{raiz}etiqueta/{tema}.html" class="tag">#{tema}</a>' for tema in temas
+            ) + '</div>'
+        
+        return f'''<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
@@ -56,10 +88,11 @@ class SectionGenerator:
     <meta property="og:type" content="website">
     <meta property="og:title" content="{categoria_nombre} - {site_name}">
     <meta property="og:description" content="Noticias de {categoria_nombre} en {site_name}">
-    <meta property="og:url" content="{site_url}/categoria/{categoria_id}.html">
+    <meta property="og:url" content="{site_url}/{ruta}">
     
-    <title>{categoria_nombre} - {site_name}</title>
-    <link rel="stylesheet" href="../style.css">
+    <title>{categoria_nombre}{sufijo_titulo} - {site_name}</title>
+    <link rel="stylesheet" href="{raiz}style.css">
+    <link rel="canonical" href="{site_url}/{ruta}">{enlaces}
     
     <style>
         /* Estilos específicos de categoría que complementan style.css */
@@ -122,6 +155,22 @@ class SectionGenerator:
             margin-top: 1rem;
         }}
         
+        .category-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-top: 1rem;
+        }}
+        
+        .category-tags .tag {{
+            color: {primary_color};
+            border: 1px solid {primary_color};
+            padding: 0.2rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.85rem;
+            text-decoration: none;
+        }}
+        
         .articles-grid {{
             max-width: 1200px;
             margin: 0 auto 3rem;
@@ -196,6 +245,20 @@ class SectionGenerator:
             border-top: 1px solid #ecf0f1;
         }}
         
+        .pagination {{
+            max-width: 1200px;
+            margin: 0 auto 3rem;
+            padding: 0 1rem;
+            display: flex;
+            justify-content: space-between;
+        }}
+        
+        .pagination a {{
+            color: {primary_color};
+            font-weight: 600;
+            text-decoration: none;
+        }}
+        
         .footer {{
             background: #2c3e50;
             color: white;
@@ -220,36 +283,40 @@ class SectionGenerator:
         <div class="header-content">
             <div class="site-name">{site_name}</div>
             <div class="breadcrumb">
-                <a href="../index.html">Inicio</a> › <span>{categoria_nombre}</span>
+                <a href="{raiz}index.html">Inicio</a> › <span>{categoria_nombre}</span>
             </div>
         </div>
     </header>
     
     <div class="category-header">
         <h1 class="category-title">{categoria_nombre}</h1>
-        <p class="category-description">Noticias y análisis político de {categoria_nombre.lower()}</p>
-        <span class="article-count">{len(articles)} artículos</span>
+        <p class="category-description">{descripcion}</p>
+        <span class="article-count">{contador}</span>{temas_html}
     </div>
     
     <div class="articles-grid">
 '''
-        
-        # Agregar artículos
-        for idx, article in enumerate(articles, 1):
-            title = article.get('title', 'Sin título')
-            description = article.get('description', '')[:200]
-            image_url = article.get('image_url', article.get('ai_image_path', ''))
-            author = article.get('author', 'Redacción')
-            published = article.get('published_at', '')[:10]
-            
-            if not image_url or not image_url.startswith('http'):
-                image_url = 'https://via.placeholder.com/400x200/667eea/ffffff?text=Noticia'
-            
-            html += f'''
-        <a href="../article_{idx}.html" class="article-card">
+    
+    def _tarjeta_html(self, article: Dict, posicion: int, categoria_nombre: str, raiz: str) -> str:
+        """
+        Tarjeta de un artículo; enlaza a su página del sitio (_display_index) si
+        la conoce y muestra su category_name si lo trae (páginas de etiqueta)
+        """
+        title = article.get('title', 'Sin título')
+        description = article.get('description', '')[:200]
+        image_url = article.get('image_url', article.get('ai_image_path', ''))
+        author = article.get('author', 'Redacción')
+        published = article.get('published_at', '')[:10]
+        article_idx = article.get('_display_index', posicion)
+        
+        if not image_url or not image_url.startswith('http'):
+            image_url = 'https://via.placeholder.com/400x200/667eea/ffffff?text=Noticia'
+        
+        return f'''
+        <a href="{raiz}article_{article_idx}.html" class="article-card">
             <img src="{image_url}" alt="{title}" class="article-image" loading="lazy">
             <div class="article-content">
-                <span class="article-category">{categoria_nombre}</span>
+                <span class="article-category">{article.get('category_name') or categoria_nombre}</span>
                 <h2 class="article-title">{title[:120]}</h2>
                 <p class="article-description">{description}</p>
                 <div class="article-meta">
@@ -259,23 +326,318 @@ class SectionGenerator:
             </div>
         </a>
 '''
-        
-        html += '''
-    </div>
     
-    <footer class="footer">
-        <p>&copy; 2026 ''' + site_name + '''. Todos los derechos reservados.</p>
+    def _pie_html(self, categoria_id: str, site_name: str, raiz: str, paginacion: str = '') -> str:
+        """Cierre del grid, navegación entre páginas y footer (sin RSS si categoria_id es None)"""
+        rss = ''
+        if categoria_id:
+            rss = '''
         <p style="margin-top: 0.5rem; font-size: 0.9rem; opacity: 0.8;">
-            <a href="../feed_''' + categoria_id + '''.xml" style="color: white;">📡 RSS de esta categoría</a>
-        </p>
+            <a href="''' + raiz + '''feed_''' + categoria_id + '''.xml" style="color: white;">📡 RSS de esta categoría</a>
+        </p>'''
+        return '''
+    </div>
+    ''' + paginacion + '''
+    <footer class="footer">
+        <p>&copy; 2026 ''' + site_name + '''. Todos los derechos reservados.</p>''' + rss + '''
     </footer>
 </body>
 </html>'''
+    
+    def _escribir_pagina(
+        self,
+        output_path,
+        cabecera: str,
+        articles: Iterable[Dict],
+        categoria_nombre: str,
+        raiz: str,
+        pie: str
+    ):
+        """Escribe una página en streaming: cabecera, una tarjeta a la vez y pie"""
+        with self.storage.abrir(output_path) as f:
+            f.write(cabecera)
+            for posicion, article in enumerate(articles, 1):
+                f.write(self._tarjeta_html(article, posicion, categoria_nombre, raiz))
+            f.write(pie)
+    
+    def generar_pagina_categoria(
+        self,
+        categoria_id: str,
+        categoria_nombre: str,
+        articles: List[Dict],
+        site_metadata: Dict,
+        color_palette: Dict,
+        output_path: str
+    ) -> str:
+        """
+        Genera página HTML para una categoría (todos los artículos en una sola página)
         
-        # Guardar archivo
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        Args:
+            categoria_id: ID de la categoría
+            categoria_nombre: Nombre de la categoría
+            articles: Artículos de esta categoría
+            site_metadata: Metadata del sitio
+            color_palette: Paleta de colores
+            output_path: Path del archivo de salida
+            
+        Returns:
+            Path del archivo generado
+        """
+        cabecera = self._cabecera_html(
+            categoria_id, categoria_nombre, site_metadata, color_palette,
+            ruta=f'categoria/{categoria_id}.html', raiz='../', contador=f'{len(articles)} artículos'
+        )
+        pie = self._pie_html(categoria_id, site_metadata.get('site_name', 'Noticias'), '../')
+        self._escribir_pagina(output_path, cabecera, articles, categoria_nombre, '../', pie)
+        return output_path
+    
+    def _firma_pagina(self, articles: List[Dict], es_la_mas_reciente: bool, *contexto) -> str:
+        """Huella de todo lo que se pinta en una página del archivo"""
+        contenido = [es_la_mas_reciente, contexto] + [
+            [a.get('_display_index'), a.get('title'), a.get('description', '')[:200],
+             a.get('image_url', a.get('ai_image_path')), a.get('author'), a.get('published_at', '')[:10]]
+            for a in articles
+        ]
+        return hashlib.sha1(json.dumps(contenido, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+    
+    def generar_paginas_categoria(
+        self,
+        categoria_id: str,
+        categoria_nombre: str,
+        articles: List[Dict],
+        site_metadata: Dict,
+        color_palette: Dict,
+        cat_dir: str,
+        por_pagina: int = None,
+        temas: List[str] = None
+    ) -> Dict:
+        """
+        Genera una categoría paginada:
+        
+            categoria/<id>.html          portada con los artículos más recientes
+            categoria/<id>/page/N.html   archivo; N=1 tiene los más antiguos
+        
+        El archivo se numera desde los artículos más antiguos y cada página
+        tiene exactamente por_pagina artículos; la portada se queda con el resto
+        (entre por_pagina y 2*por_pagina-1). Así una página ya publicada no
+        cambia cuando llegan artículos nuevos: solo se reescriben la portada,
+        las páginas nuevas y la anterior a ellas (su enlace a las más recientes).
+        Un manifiesto con la firma de cada página permite omitir las que no
+        cambiaron.
+        
+        Es planificar_categoria + escribir_pagina_categoria por página +
+        cerrar_categoria; el orquestador usa esos pasos por separado para
+        repartir las páginas de todas las categorías en el pool de render.
+        
+        Args:
+            categoria_id: ID de la categoría
+            categoria_nombre: Nombre de la categoría
+            articles: Artículos de la categoría; se ordenan por published_at (más
+                recientes primero), ya que el orden del sitio lo decide el
+                gestor de destacados
+            site_metadata: Metadata del sitio
+            color_palette: Paleta de colores
+            cat_dir: Directorio categoria/ del sitio
+            por_pagina: Artículos por página (default: self.por_pagina)
+            temas: Etiquetas de la categoría para la portada (el archivo no
+                las lleva, así sus páginas no cambian cuando cambian los temas)
+            
+        Returns:
+            Dict con paginas (del archivo), escritas (rutas) y omitidas
+        """
+        plan = self.planificar_categoria(
+            categoria_id, categoria_nombre, articles, site_metadata, color_palette, cat_dir, por_pagina, temas
+        )
+        escritas = [
+            self.escribir_pagina_categoria(pagina, site_metadata, color_palette, cat_dir)
+            for pagina in plan['paginas']
+        ]
+        self.cerrar_categoria(plan, cat_dir)
+        return {'paginas': plan['archivadas'], 'escritas': escritas, 'omitidas': plan['omitidas']}
+    
+    def planificar_categoria(
+        self,
+        categoria_id: str,
+        categoria_nombre: str,
+        articles: List[Dict],
+        site_metadata: Dict,
+        color_palette: Dict,
+        cat_dir: str,
+        por_pagina: int = None,
+        temas: List[str] = None
+    ) -> Dict:
+        """
+        Reparte los artículos de una categoría en portada y archivo, y deja
+        fuera las páginas del archivo cuya firma no cambió (ver
+        generar_paginas_categoria)
+        
+        Returns:
+            Dict con categoria_id, por_pagina, archivadas, omitidas, firmas
+            (de todo el archivo) y paginas: una por página a escribir (dicts
+            con categoria_id, categoria_nombre, numero -0 para la portada-,
+            archivadas, total, articulos y temas)
+        """
+        por_pagina = por_pagina or self.por_pagina
+        page_dir = Path(cat_dir) / categoria_id / 'page'
+        # sort estable: a igual fecha se conserva el orden del sitio
+        articles = sorted(articles, key=_clave_fecha, reverse=True)
+        site_name = site_metadata.get('site_name', 'Noticias')
+        
+        total = len(articles)
+        archivadas = max(0, total // por_pagina - 1)
+        en_portada = total - archivadas * por_pagina
+        
+        def pagina(numero: int, articulos: List[Dict], temas_pagina: List[str] = None) -> Dict:
+            return {
+                'categoria_id': categoria_id, 'categoria_nombre': categoria_nombre, 'numero': numero,
+                'archivadas': archivadas, 'total': total, 'articulos': articulos, 'temas': temas_pagina,
+            }
+        
+        # Portada: siempre cambia (contador y artículos nuevos)
+        plan = {
+            'categoria_id': categoria_id, 'por_pagina': por_pagina, 'archivadas': archivadas,
+            'omitidas': 0, 'firmas': {}, 'paginas': [pagina(0, articles[:en_portada], temas)],
+        }
+        
+        firmas_previas = {}
+        contenido = self.storage.leer(page_dir / 'manifest.json')
+        if contenido:
+            firmas_previas = json.loads(contenido).get('firmas', {})
+        
+        contexto = (categoria_nombre, site_name, site_metadata.get('site_url'), sorted(color_palette.items()))
+        for n in range(1, archivadas + 1):
+            # Página n: artículos (n-1)*por_pagina .. n*por_pagina contando desde el más antiguo
+            fin = total - (n - 1) * por_pagina
+            articulos = articles[fin - por_pagina:fin]
+            firma = self._firma_pagina(articulos, n == archivadas, *contexto)
+            plan['firmas'][str(n)] = firma
+            
+            if firmas_previas.get(str(n)) == firma and self.storage.existe(page_dir / f'{n}.html'):
+                plan['omitidas'] += 1
+            else:
+                plan['paginas'].append(pagina(n, articulos))
+        
+        return plan
+    
+    def escribir_pagina_categoria(self, pagina: Dict, site_metadata: Dict, color_palette: Dict, cat_dir: str) -> str:
+        """
+        Escribe la portada o una página del archivo de una categoría
+        
+        Args:
+            pagina: Página de planificar_categoria
+            site_metadata: Metadata del sitio
+            color_palette: Paleta de colores
+            cat_dir: Directorio categoria/ del sitio
+            
+        Returns:
+            Path del archivo escrito
+        """
+        categoria_id = pagina['categoria_id']
+        categoria_nombre = pagina['categoria_nombre']
+        n, archivadas, articulos = pagina['numero'], pagina['archivadas'], pagina['articulos']
+        site_name = site_metadata.get('site_name', 'Noticias')
+        
+        if n == 0:
+            enlaces, paginacion = '', ''
+            if archivadas:
+                siguiente = f'{categoria_id}/page/{archivadas}.html'
+                enlaces = f'\n    <link rel="next" href="{siguiente}">'
+                paginacion = f'''<nav class="pagination"><span></span><a href="{siguiente}" rel="next">Anteriores →</a></nav>
+    '''
+            ruta = Path(cat_dir) / f'{categoria_id}.html'
+            self._escribir_pagina(
+                ruta,
+                self._cabecera_html(
+                    categoria_id, categoria_nombre, site_metadata, color_palette,
+                    ruta=f'categoria/{categoria_id}.html', raiz='../',
+                    contador=f"{pagina['total']} artículos", enlaces=enlaces, temas=pagina['temas']
+                ),
+                articulos,
+                categoria_nombre,
+                '../',
+                self._pie_html(categoria_id, site_name, '../', paginacion)
+            )
+            return str(ruta)
+        
+        raiz = '../../../'
+        recientes = f'../../{categoria_id}.html' if n == archivadas else f'{n + 1}.html'
+        anteriores = f'{n - 1}.html' if n > 1 else None
+        enlaces = f'\n    <link rel="prev" href="{recientes}">'
+        enlace_anteriores = '<span></span>'
+        if anteriores:
+            enlaces += f'\n    <link rel="next" href="{anteriores}">'
+            enlace_anteriores = f'<a href="{anteriores}" rel="next">Anteriores →</a>'
+        paginacion = f'''<nav class="pagination"><a href="{recientes}" rel="prev">← Más recientes</a>{enlace_anteriores}</nav>
+    '''
+        desde = articulos[-1].get('published_at', '')[:10]
+        hasta = articulos[0].get('published_at', '')[:10]
+        
+        ruta = Path(cat_dir) / categoria_id / 'page' / f'{n}.html'
+        self._escribir_pagina(
+            ruta,
+            self._cabecera_html(
+                categoria_id, categoria_nombre, site_metadata, color_palette,
+                ruta=f'categoria/{categoria_id}/page/{n}.html', raiz=raiz,
+                contador=f'Archivo: {desde} a {hasta}' if desde and hasta else f'{len(articulos)} artículos',
+                sufijo_titulo=f' (página {n} del archivo)', enlaces=enlaces
+            ),
+            articulos,
+            categoria_nombre,
+            raiz,
+            self._pie_html(categoria_id, site_name, raiz, paginacion)
+        )
+        return str(ruta)
+    
+    def cerrar_categoria(self, plan: Dict, cat_dir: str, fallidas: Iterable[int] = ()):
+        """
+        Elimina las páginas sobrantes de una generación anterior con más
+        artículos y guarda el manifiesto de firmas del archivo
+        
+        Args:
+            plan: Resultado de planificar_categoria
+            cat_dir: Directorio categoria/ del sitio
+            fallidas: Números de página que no se escribieron (quedan fuera
+                del manifiesto para reintentarse en la próxima generación)
+        """
+        page_dir = Path(cat_dir) / plan['categoria_id'] / 'page'
+        if not page_dir.exists():
+            return
+        for vieja in page_dir.glob('*.html'):
+            if vieja.stem.isdigit() and int(vieja.stem) > plan['archivadas']:
+                self.storage.eliminar(vieja)
+        fallidas = {str(n) for n in fallidas}
+        firmas = {n: firma for n, firma in plan['firmas'].items() if n not in fallidas}
+        self.storage.escribir(page_dir / 'manifest.json', json.dumps({'por_pagina': plan['por_pagina'], 'firmas': firmas}))
+    
+    def generar_pagina_etiqueta(
+        self,
+        etiqueta: str,
+        articles: List[Dict],
+        site_metadata: Dict,
+        color_palette: Dict,
+        output_path: str
+    ) -> str:
+        """
+        Genera la página de una etiqueta (etiqueta/<etiqueta>.html)
         
+        Args:
+            etiqueta: Término del índice de búsqueda (ya sin acentos ni espacios)
+            articles: Artículos con la etiqueta, del más al menos relevante
+            site_metadata: Metadata del sitio
+            color_palette: Paleta de colores
+            output_path: Path del archivo de salida
+            
+        Returns:
+            Path del archivo generado
+        """
+        nombre = f'#{etiqueta}'
+        cabecera = self._cabecera_html(
+            etiqueta, nombre, site_metadata, color_palette,
+            ruta=f'etiqueta/{etiqueta}.html', raiz='../', contador=f'{len(articles)} artículos',
+            descripcion=f'Noticias sobre {etiqueta}'
+        )
+        pie = self._pie_html(None, site_metadata.get('site_name', 'Noticias'), '../')
+        self._escribir_pagina(output_path, cabecera, articles, nombre, '../', pie)
         return output_path
     
     def generar_index_categorias(
@@ -392,8 +754,7 @@ class SectionGenerator:
 </html>'''
         
         # Guardar
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        self.storage.escribir(output_path, html)
         
         return output_path
 
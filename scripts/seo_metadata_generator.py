@@ -4,9 +4,12 @@ Generador de Metadatos SEO y Open Graph
 Genera metadatos completos para artículos y páginas
 """
 
-from typing import Dict, List
+import json
 from datetime import datetime
-import os
+from html import escape
+from typing import Callable, Dict, List
+
+from utils.fechas import fecha_iso
 
 
 class SEOMetadataGenerator:
@@ -14,139 +17,179 @@ class SEOMetadataGenerator:
     
     def __init__(self):
         self.default_og_image = 'https://via.placeholder.com/1200x630/667eea/ffffff?text=Política+México'
+        # (site_name, site_url, favicon) -> fragmento del head del sitio
+        self._fragmentos: Dict[tuple, Dict] = {}
     
-    def generar_meta_tags_articulo(
-        self,
-        article: Dict,
-        site_metadata: Dict,
-        article_url: str,
-        article_index: int = 1
-    ) -> str:
+    def _fragmento_sitio(self, site_metadata: Dict) -> Dict:
         """
-        Genera meta tags completos para un artículo
+        Partes del head que son iguales en todas las páginas de un sitio: se
+        calculan una vez por sitio y se reutilizan en cada artículo
         
         Args:
-            article: Datos del artículo
             site_metadata: Metadata del sitio
-            article_url: URL del artículo
-            article_index: Índice del artículo
             
         Returns:
-            HTML con meta tags
+            Dict con site_name, site_url, publisher (para JSON-LD) y head (HTML)
         """
-        # Extraer datos
+        site_name = site_metadata.get('site_name', 'Noticias Políticas')
+        site_url = site_metadata.get('site_url', 'https://ejemplo.com')
+        favicon = site_metadata.get('favicon', '')
+        clave = (site_name, site_url, favicon)
+        if clave in self._fragmentos:
+            return self._fragmentos[clave]
+        
+        nombre = escape(site_name)
+        handle = escape(site_name.replace(' ', ''))
+        icono = f'\n    <link rel="icon" href="{escape(favicon)}">' if favicon else ''
+        head = f'''
+    <!-- Sitio -->
+    <meta property="og:site_name" content="{nombre}">
+    <meta property="og:locale" content="es_MX">
+    <meta name="twitter:creator" content="@{handle}">
+    <meta name="twitter:site" content="@{handle}">
+    <link rel="alternate" type="application/rss+xml" title="{nombre} RSS Feed" href="{escape(site_url)}/feed.xml">
+    <meta name="theme-color" content="#667eea">{icono}
+'''
+        fragmento = {
+            'site_name': site_name,
+            'site_url': site_url,
+            'publisher': {
+                '@type': 'Organization',
+                'name': site_name,
+                'url': site_url,
+                'logo': {'@type': 'ImageObject', 'url': f'{site_url}/assets/logo.png'},
+            },
+            'head': head,
+        }
+        self._fragmentos[clave] = fragmento
+        return fragmento
+    
+    def _meta_tags_articulo(self, article: Dict, sitio: Dict, article_url: str, modified_iso: str) -> str:
+        """Meta tags de un artículo sobre el fragmento ya calculado de su sitio"""
         title = article.get('title', 'Sin título')
         description = article.get('description', '')[:300]
         author = article.get('author', 'Redacción')
-        published_at = article.get('published_at', article.get('publishedAt', ''))
         category = article.get('category_name', 'Noticias')
+        published_iso = fecha_iso(article.get('published_at', article.get('publishedAt', ''))) or modified_iso
         
         # URL de imagen
         image_url = article.get('image_url', article.get('ai_image_path', ''))
         if not image_url or not image_url.startswith('http'):
             image_url = self.default_og_image
         
-        # Site name
-        site_name = site_metadata.get('site_name', 'Noticias Políticas')
-        site_url = site_metadata.get('site_url', 'https://ejemplo.com')
-        
-        # Keywords desde categoría y contenido
         keywords = self._generar_keywords(article)
         
-        # Fecha formateada
-        if published_at:
-            try:
-                if 'T' in published_at:
-                    dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                else:
-                    dt = datetime.strptime(published_at, '%Y-%m-%d')
-                published_iso = dt.isoformat()
-                modified_iso = datetime.now().isoformat()
-            except:
-                published_iso = datetime.now().isoformat()
-                modified_iso = published_iso
-        else:
-            published_iso = datetime.now().isoformat()
-            modified_iso = published_iso
+        title_e = escape(title)
+        description_e = escape(description)
+        author_e = escape(author)
+        category_e = escape(category)
+        url_e = escape(article_url)
+        image_e = escape(image_url)
         
-        # Generar meta tags
-        meta_tags = f'''
+        json_ld = {
+            '@context': 'https://schema.org',
+            '@type': 'NewsArticle',
+            'headline': title,
+            'description': description,
+            'image': [image_url],
+            'datePublished': published_iso,
+            'dateModified': modified_iso,
+            'author': {'@type': 'Person', 'name': author},
+            'publisher': sitio['publisher'],
+            'mainEntityOfPage': {'@type': 'WebPage', '@id': article_url},
+            'articleSection': category,
+            'keywords': keywords,
+            'inLanguage': 'es-MX',
+        }
+        
+        return f'''
     <!-- SEO Meta Tags -->
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{self._escape_html(description)}">
-    <meta name="keywords" content="{keywords}">
-    <meta name="author" content="{self._escape_html(author)}">
+    <meta name="description" content="{description_e}">
+    <meta name="keywords" content="{escape(keywords)}">
+    <meta name="author" content="{author_e}">
     <meta name="robots" content="index, follow, max-image-preview:large, max-snippet:-1, max-video-preview:-1">
     <meta name="googlebot" content="index, follow">
     
     <!-- Canonical URL -->
-    <link rel="canonical" href="{article_url}">
+    <link rel="canonical" href="{url_e}">
     
     <!-- Open Graph / Facebook -->
     <meta property="og:type" content="article">
-    <meta property="og:url" content="{article_url}">
-    <meta property="og:title" content="{self._escape_html(title)}">
-    <meta property="og:description" content="{self._escape_html(description)}">
-    <meta property="og:image" content="{image_url}">
+    <meta property="og:url" content="{url_e}">
+    <meta property="og:title" content="{title_e}">
+    <meta property="og:description" content="{description_e}">
+    <meta property="og:image" content="{image_e}">
     <meta property="og:image:width" content="1200">
     <meta property="og:image:height" content="630">
-    <meta property="og:site_name" content="{self._escape_html(site_name)}">
-    <meta property="og:locale" content="es_MX">
     <meta property="article:published_time" content="{published_iso}">
     <meta property="article:modified_time" content="{modified_iso}">
-    <meta property="article:author" content="{self._escape_html(author)}">
-    <meta property="article:section" content="{category}">
-    <meta property="article:tag" content="{category}">
+    <meta property="article:author" content="{author_e}">
+    <meta property="article:section" content="{category_e}">
+    <meta property="article:tag" content="{category_e}">
     
     <!-- Twitter Card -->
     <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:url" content="{article_url}">
-    <meta name="twitter:title" content="{self._escape_html(title)}">
-    <meta name="twitter:description" content="{self._escape_html(description)}">
-    <meta name="twitter:image" content="{image_url}">
-    <meta name="twitter:creator" content="@{site_name.replace(' ', '')}">
-    <meta name="twitter:site" content="@{site_name.replace(' ', '')}">
-    
-    <!-- Additional SEO -->
-    <link rel="alternate" type="application/rss+xml" title="{site_name} RSS Feed" href="{site_url}/feed.xml">
-    <meta name="theme-color" content="#667eea">
-    
+    <meta name="twitter:url" content="{url_e}">
+    <meta name="twitter:title" content="{title_e}">
+    <meta name="twitter:description" content="{description_e}">
+    <meta name="twitter:image" content="{image_e}">
+{sitio['head']}
     <!-- JSON-LD Structured Data -->
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org",
-      "@type": "NewsArticle",
-      "headline": "{self._escape_json(title)}",
-      "description": "{self._escape_json(description)}",
-      "image": ["{image_url}"],
-      "datePublished": "{published_iso}",
-      "dateModified": "{modified_iso}",
-      "author": {{
-        "@type": "Person",
-        "name": "{self._escape_json(author)}"
-      }},
-      "publisher": {{
-        "@type": "Organization",
-        "name": "{self._escape_json(site_name)}",
-        "url": "{site_url}",
-        "logo": {{
-          "@type": "ImageObject",
-          "url": "{site_url}/assets/logo.png"
-        }}
-      }},
-      "mainEntityOfPage": {{
-        "@type": "WebPage",
-        "@id": "{article_url}"
-      }},
-      "articleSection": "{category}",
-      "keywords": "{keywords}",
-      "inLanguage": "es-MX"
-    }}
-    </script>
+    <script type="application/ld+json">{self._json_script(json_ld)}</script>
 '''
+    
+    def generar_meta_tags_articulo(
+        self,
+        article: Dict,
+        site_metadata: Dict,
+        article_url: str,
+        article_index: int = 1
+    ) -> str:
+        """
+        Genera meta tags completos para un artículo
         
-        return meta_tags
+        Args:
+            article: Datos del artículo
+            site_metadata: Metadata del sitio
+            article_url: URL del artículo
+            article_index: Índice del artículo
+            
+        Returns:
+            HTML con meta tags
+        """
+        return self._meta_tags_articulo(
+            article, self._fragmento_sitio(site_metadata), article_url, datetime.now().isoformat()
+        )
+    
+    def generar_meta_tags_lote(
+        self,
+        articles: List[Dict],
+        site_metadata: Dict,
+        url_articulo: Callable[[int], str] = None
+    ) -> List[str]:
+        """
+        Genera los meta tags de todos los artículos de un sitio de una vez
+        (fragmento del sitio y fecha de modificación se calculan una sola vez)
+        
+        Args:
+            articles: Artículos del sitio
+            site_metadata: Metadata del sitio
+            url_articulo: Índice base 1 -> URL del artículo
+                (default: {site_url}/article_N.html)
+            
+        Returns:
+            Lista de HTML con meta tags, en el orden de articles
+        """
+        sitio = self._fragmento_sitio(site_metadata)
+        if url_articulo is None:
+            url_articulo = lambda idx: f"{sitio['site_url']}/article_{idx}.html"
+        modified_iso = datetime.now().isoformat()
+        return [
+            self._meta_tags_articulo(article, sitio, url_articulo(idx), modified_iso)
+            for idx, article in enumerate(articles, 1)
+        ]
     
     def generar_meta_tags_home(self, site_metadata: Dict, total_articles: int = 0) -> str:
         """
@@ -256,30 +299,21 @@ class SEOMetadataGenerator:
     
     def _escape_html(self, text: str) -> str:
         """Escapa HTML"""
-        if not text:
-            return ''
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+        return escape(text) if text else ''
     
     def _escape_json(self, text: str) -> str:
-        """Escapa para JSON"""
+        """Escapa para un string JSON (sin las comillas)"""
         if not text:
             return ''
-        return (text
-                .replace('\\', '\\\\')
-                .replace('"', '\\"')
-                .replace('\n', '\\n')
-                .replace('\r', '\\r')
-                .replace('\t', '\\t'))
+        return json.dumps(text, ensure_ascii=False)[1:-1].replace('</', '<\\/')
+    
+    def _json_script(self, datos: Dict) -> str:
+        """JSON seguro dentro de <script> (un '</script>' en el texto no cierra el bloque)"""
+        return json.dumps(datos, ensure_ascii=False).replace('</', '<\\/')
 
 
 def main():
     """Demo del generador de metadatos"""
-    import json
     import glob
     
     print("""
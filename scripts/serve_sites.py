@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """
 Script auxiliar para servir sitios generados
-Puede usarse standalone o desde el menú principal
+Puede usarse standalone o desde el menú principal. Todos los sitios se
+sirven desde un solo proceso (static_site_server.py)
 """
 
 import sys
-import subprocess
 import argparse
 from pathlib import Path
 
+from static_site_server import StaticSiteServer
+
 def listar_sitios():
     """Lista todos los sitios disponibles"""
     site_dir = Path('generated_sites')
@@ -24,31 +26,30 @@ def servir_sitio(site_path: Path, port: int):
     print(f"🌐 Sirviendo {site_path.name} en http://localhost:{port}")
     print(f"Presiona Ctrl+C para detener\n")
     
+    servidor = StaticSiteServer(site_path.parent, '0.0.0.0', port, sitio=site_path.name)
     try:
-        subprocess.run(['python3', '-m', 'http.server', str(port)], cwd=site_path)
+        servidor.httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Servidor detenido")
+    finally:
+        servidor.httpd.server_close()
 
 def servir_todos(sites: list, port_base: int = 8000):
-    """Sirve todos los sitios en puertos secuenciales"""
-    print(f"🌍 Iniciando servidores para {len(sites)} sitios...\n")
+    """Sirve todos los sitios desde un solo servidor, por prefijo o por host"""
+    print(f"🌍 Sirviendo {len(sites)} sitios en http://localhost:{port_base}\n")
     
-    processes = []
-    for idx, site in enumerate(sites):
-        port = port_base + idx
-        print(f"  🌐 {site.name}: http://localhost:{port}")
-        
-        proc = subprocess.Popen(
-            ['python3', '-m', 'http.server', str(port)],
-            cwd=site,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        processes.append(proc)
+    for site in sites:
+        print(f"  🌐 {site.name}: http://localhost:{port_base}/{site.name}/ · http://{site.name}.localhost:{port_base}/")
+    
+    print(f"\nPresiona Ctrl+C para detener\n")
     
-    print(f"\n✅ {len(sites)} servidores iniciados en segundo plano")
-    print(f"\n⚠️  Para detener todos los servidores:")
-    print(f"   pkill -f 'http.server'")
+    servidor = StaticSiteServer(sites[0].parent, '0.0.0.0', port_base)
+    try:
+        servidor.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Servidor detenido")
+    finally:
+        servidor.httpd.server_close()
 
 def main():
     """Función principal"""
@@ -77,7 +78,7 @@ def main():
             print(f"  {idx}. {site.name}")
             print(f"     Páginas: {html_count} HTML, {images_count} imágenes")
             print(f"     Tamaño: {size:.2f} MB")
-            print(f"     Puerto sugerido: {8000 + idx - 1}")
+            print(f"     URL: http://localhost:8000/{site.name}/")
             print()
         return
     
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Generador de Sitemaps
+Escribe sitemap.xml como índice de sitemaps por partes (sitemap-N.xml) de
+hasta 50.000 URLs o 50 MB cada una, con lastmod y la extensión de imágenes de
+Google. Las URLs se consumen de un iterable y cada parte se escribe en
+streaming, así la memoria no depende del número de artículos. En
+reconstrucciones, las partes cuyo contenido no cambió se dejan intactas
+(mismo archivo y misma fecha de modificación). Todo se escribe por el
+storage del build, así que con S3/R2 se publica al cerrarse cada archivo.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from storage_backend import DiskStorage, StorageBackend
+from utils.fechas import parsear_fecha
+
+# (loc, lastmod ISO o None, URL de imagen o None)
+Entrada = Tuple[str, Optional[str], Optional[str]]
+
+CABECERA_URLSET = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">\n'
+)
+CIERRE_URLSET = "</urlset>\n"
+
+
+def lastmod_w3c(valor: str) -> Optional[str]:
+    """Fecha de un artículo en formato W3C para <lastmod> (None si no se puede parsear)"""
+    dt = parsear_fecha(valor or "")
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.date().isoformat()
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+class SitemapGenerator:
+    """Genera sitemaps por partes con índice y reescritura incremental"""
+
+    def __init__(self, max_urls: int = 50000, max_bytes: int = 50 * 1024 * 1024, storage: StorageBackend = None):
+        """
+        Args:
+            max_urls: URLs máximas por parte (límite del protocolo: 50.000)
+            max_bytes: Tamaño máximo por parte sin comprimir (límite: 50 MB)
+            storage: Destino de los sitemaps (default: disco local)
+        """
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.storage = storage or DiskStorage()
+
+    def _url_xml(self, loc: str, lastmod: Optional[str], imagen: Optional[str]) -> str:
+        partes = [f"  <url>\n    <loc>{escape(loc)}</loc>\n"]
+        if lastmod:
+            partes.append(f"    <lastmod>{lastmod}</lastmod>\n")
+        if imagen:
+            partes.append(f"    <image:image>\n      <image:loc>{escape(imagen)}</image:loc>\n    </image:image>\n")
+        partes.append("  </url>\n")
+        return "".join(partes)
+
+    def _escribir_parte(
+        self, ruta: Path, urls: Iterator[Tuple[str, Optional[str]]], primera: Tuple[str, Optional[str]]
+    ) -> Tuple[Dict, Optional[Tuple[str, Optional[str]]]]:
+        """
+        Escribe una parte por el storage, que deja intacto el archivo si el
+        contenido no cambió
+
+        Args:
+            ruta: Archivo de la parte
+            urls: Iterador de (xml de la URL, lastmod)
+            primera: Primera URL de la parte
+
+        Returns:
+            (Dict con firma, urls, lastmod máximo y reescrita, URL que ya no cupo o None)
+        """
+        sobrante = None
+        sha = hashlib.sha1()
+        total, tamano, lastmod_max = 0, len(CABECERA_URLSET) + len(CIERRE_URLSET), None
+
+        with self.storage.abrir(ruta) as f:
+            f.write(CABECERA_URLSET)
+            siguiente = primera
+            while siguiente is not None:
+                xml, lastmod = siguiente
+                datos = xml.encode("utf-8")
+                f.write(xml)
+                sha.update(datos)
+                total += 1
+                tamano += len(datos)
+                if lastmod and (lastmod_max is None or lastmod > lastmod_max):
+                    lastmod_max = lastmod
+                if total >= self.max_urls:
+                    break
+                siguiente = next(urls, None)
+                if siguiente is not None and tamano + len(siguiente[0].encode("utf-8")) > self.max_bytes:
+                    sobrante = siguiente
+                    break
+            f.write(CIERRE_URLSET)
+
+        return {"firma": sha.hexdigest(), "urls": total, "lastmod": lastmod_max, "reescrita": f.escrito}, sobrante
+
+    def generar(self, site_dir: Path, site_url: str, entradas: Iterable[Entrada]) -> Dict:
+        """
+        Genera sitemap-N.xml y el índice sitemap.xml en site_dir
+
+        Args:
+            site_dir: Directorio del sitio
+            site_url: URL pública del sitio (sin '/' final)
+            entradas: Iterable de (loc, lastmod, imagen); conviene que los
+                artículos vayan del más antiguo al más nuevo para que los
+                nuevos solo cambien la última parte
+
+        Returns:
+            Dict con partes, urls, reescritas y omitidas
+        """
+        site_dir = Path(site_dir)
+        site_url = site_url.rstrip("/")
+        manifiesto_path = site_dir / "sitemap-manifest.json"
+        previas = {}
+        contenido = self.storage.leer(manifiesto_path)
+        if contenido:
+            previas = json.loads(contenido).get("partes", {})
+
+        urls = ((self._url_xml(loc, lastmod, imagen), lastmod) for loc, lastmod, imagen in entradas)
+        partes, resultado = {}, {"partes": 0, "urls": 0, "reescritas": 0, "omitidas": 0}
+
+        primera = next(urls, None)
+        while primera is not None:
+            numero = len(partes) + 1
+            nombre = f"sitemap-{numero}.xml"
+            parte, sobrante = self._escribir_parte(site_dir / nombre, urls, primera)
+            partes[nombre] = parte
+            resultado["urls"] += parte["urls"]
+            resultado["reescritas" if parte["reescrita"] else "omitidas"] += 1
+            primera = sobrante if sobrante is not None else next(urls, None)
+
+        # Partes sobrantes de una generación anterior más grande
+        for nombre in previas:
+            if nombre not in partes:
+                self.storage.eliminar(site_dir / nombre)
+
+        with self.storage.abrir(site_dir / "sitemap.xml") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+            for nombre, parte in partes.items():
+                f.write(f"  <sitemap>\n    <loc>{escape(site_url)}/{nombre}</loc>\n")
+                if parte["lastmod"]:
+                    f.write(f"    <lastmod>{parte['lastmod']}</lastmod>\n")
+                f.write("  </sitemap>\n")
+            f.write("</sitemapindex>\n")
+
+        self.storage.escribir(
+            manifiesto_path,
+            json.dumps({"partes": {n: {"firma": p["firma"], "lastmod": p["lastmod"]} for n, p in partes.items()}}),
+        )
+
+        resultado["partes"] = len(partes)
+        return resultado
+
+    def entradas_sitio(self, site_dir: Path, site_url: str, articles: Sequence[Dict]) -> Iterator[Entrada]:
+        """
+        Entradas de un sitio generado: artículos del más antiguo al más nuevo
+        y después las páginas fijas, de categorías y de etiquetas (desde el
+        disco). Las páginas llevan la fecha del artículo más reciente, así que
+        van al final para no invalidar las primeras partes en cada reconstrucción
+
+        Args:
+            site_dir: Directorio del sitio
+            site_url: URL pública del sitio
+            articles: Artículos en el orden del sitio (article_N.html = posición N)
+        """
+        site_dir = Path(site_dir)
+        site_url = site_url.rstrip("/")
+        ultima = max((f for f in (lastmod_w3c(a.get("published_at", "")) for a in articles) if f), default=None)
+
+        for idx in range(len(articles), 0, -1):
+            imagen = f"{site_url}/images/news_{idx}.jpg" if (site_dir / "images" / f"news_{idx}.jpg").exists() else None
+            yield f"{site_url}/article_{idx}.html", lastmod_w3c(articles[idx - 1].get("published_at", "")), imagen
+
+        paginas = ["index.html", "categorias.html"]
+        paginas += sorted(p.relative_to(site_dir).as_posix() for p in site_dir.glob("categoria/*.html"))
+        paginas += sorted(p.relative_to(site_dir).as_posix() for p in site_dir.glob("categoria/*/page/*.html"))
+        paginas += sorted(p.relative_to(site_dir).as_posix() for p in site_dir.glob("etiqueta/*.html"))
+        for pagina in paginas:
+            if (site_dir / pagina).exists():
+                loc = f"{site_url}/" if pagina == "index.html" else f"{site_url}/{pagina}"
+                yield loc, ultima, None
+
+
+def main():
+    """Genera el sitemap de un sitio ya construido"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generar sitemap.xml por partes para un sitio")
+    parser.add_argument("site_dir", help="Directorio del sitio")
+    parser.add_argument("site_url", help="URL pública del sitio")
+    parser.add_argument("articulos", help="JSON con los artículos en el orden del sitio")
+    args = parser.parse_args()
+
+    with open(args.articulos, encoding="utf-8") as f:
+        articles = json.load(f)
+
+    generador = SitemapGenerator()
+    resultado = generador.generar(
+        Path(args.site_dir), args.site_url, generador.entradas_sitio(Path(args.site_dir), args.site_url, articles)
+    )
+    print(f"✅ {resultado['urls']} URLs en {resultado['partes']} partes")
+    print(f"📝 Reescritas: {resultado['reescritas']}, sin cambios: {resultado['omitidas']}")
+
+
+if __name__ == "__main__":
+    main()
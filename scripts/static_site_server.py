@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Servidor Estático Multi-sitio
+Sirve todos los sitios de generated_sites/site_* desde un solo proceso
+multihilo. El sitio se elige por el host (site_3.localhost:8000) o por el
+prefijo de la ruta (localhost:8000/site_3/). Sirve las variantes
+precomprimidas (.br/.zst/.gz) cuando el cliente las acepta, responde 304 a
+peticiones condicionales con ETag fuerte o Last-Modified, marca como
+inmutables los assets con hash en el nombre y envía los archivos con
+sendfile (sin copiar el contenido a Python).
+"""
+
+import json
+import mimetypes
+import posixpath
+import re
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+# Nombre del sitio en el host o en el primer segmento de la ruta
+NOMBRE_SITIO = re.compile(r"^site_[A-Za-z0-9_-]+$")
+
+# Assets con hash de contenido en el nombre: app.3f2a9c1b.js, logo-8c1e0d2f4a.svg
+ASSET_CON_HASH = re.compile(r"[.-][0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+# Variantes precomprimidas (precompression.py) en orden de preferencia
+CODIFICACIONES = (("br", ".br"), ("zstd", ".zst"), ("gzip", ".gz"))
+
+TIPOS = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".mjs": "text/javascript; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".xml": "application/xml; charset=utf-8",
+    ".atom": "application/atom+xml; charset=utf-8",
+    ".txt": "text/plain; charset=utf-8",
+    ".svg": "image/svg+xml",
+    ".webmanifest": "application/manifest+json",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+}
+COMPRIMIBLES = ("text/", "application/json", "application/xml", "application/atom+xml",
+                "application/rss+xml", "application/feed+json", "application/manifest+json", "image/svg+xml")
+
+CACHE_INMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDAR = "no-cache"
+CACHE_ESTATICO = "public, max-age=3600"
+
+
+def tipo_contenido(ruta: Path) -> str:
+    """Content-Type de un archivo por su extensión"""
+    tipo = TIPOS.get(ruta.suffix.lower())
+    if tipo is None:
+        tipo = mimetypes.guess_type(ruta.name)[0] or "application/octet-stream"
+    return tipo
+
+
+def cache_control(ruta: Path, tipo: str) -> str:
+    """
+    Política de caché: inmutable para assets con hash, revalidación para
+    HTML/feeds/JSON (cambian en cada build) y una hora para el resto
+    """
+    if ASSET_CON_HASH.search(ruta.name):
+        return CACHE_INMUTABLE
+    if tipo.startswith(("text/html", "application/")):
+        return CACHE_REVALIDAR
+    return CACHE_ESTATICO
+
+
+def codificaciones_aceptadas(accept_encoding: str) -> List[str]:
+    """Codificaciones de Accept-Encoding con q > 0"""
+    aceptadas = []
+    for parte in (accept_encoding or "").split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        q = 1.0
+        if parametros.strip().startswith("q="):
+            try:
+                q = float(parametros.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if nombre and q > 0:
+            aceptadas.append(nombre.strip().lower())
+    return aceptadas
+
+
+class _ServidorHTTP(ThreadingHTTPServer):
+    daemon_threads = True
+    # Cola de conexiones pendientes más larga que la de socketserver (5)
+    request_queue_size = 128
+
+
+class StaticSiteServer:
+    """Servidor HTTP multihilo para los sitios generados"""
+
+    def __init__(
+        self,
+        sites_dir: str = "generated_sites",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        sitio: Optional[str] = None,
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            sites_dir: Directorio con los sitios (site_1, site_2, ...)
+            host: Interfaz de escucha
+            port: Puerto (0 = puerto libre asignado por el sistema)
+            sitio: Servir solo este sitio en la raíz (sin enrutado)
+            verbose: Imprimir cada petición
+        """
+        self.sites_dir = Path(sites_dir)
+        self.sitio = sitio
+        self.verbose = verbose
+        self._manifiestos: Dict[Path, Tuple[int, Dict]] = {}
+        self._manifiestos_lock = threading.Lock()
+        self.httpd = _ServidorHTTP((host, port), self._crear_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listar_sitios(self) -> List[str]:
+        """Nombres de los sitios disponibles"""
+        if not self.sites_dir.is_dir():
+            return []
+        return sorted(d.name for d in self.sites_dir.iterdir() if d.is_dir() and NOMBRE_SITIO.match(d.name))
+
+    def resolver_sitio(self, host: str, ruta: str) -> Tuple[Optional[Path], str, str]:
+        """
+        Elige el sitio de una petición
+
+        Args:
+            host: Header Host (site_3.localhost:8000)
+            ruta: Ruta de la petición ya decodificada
+
+        Returns:
+            (Directorio del sitio o None, ruta dentro del sitio, prefijo de URL del sitio)
+        """
+        if self.sitio:
+            return self.sites_dir / self.sitio, ruta, ""
+
+        etiqueta = (host or "").split(":", 1)[0].split(".", 1)[0]
+        if NOMBRE_SITIO.match(etiqueta) and (self.sites_dir / etiqueta).is_dir():
+            return self.sites_dir / etiqueta, ruta, ""
+
+        primero, _, resto = ruta.lstrip("/").partition("/")
+        if NOMBRE_SITIO.match(primero) and (self.sites_dir / primero).is_dir():
+            return self.sites_dir / primero, "/" + resto, f"/{primero}"
+        return None, ruta, ""
+
+    def _manifiesto_feeds(self, raiz: Path) -> Dict:
+        """feeds_manifest.json del sitio (cacheado mientras no cambie en disco)"""
+        ruta = raiz / "feeds_manifest.json"
+        try:
+            mtime = ruta.stat().st_mtime_ns
+        except OSError:
+            return {}
+        with self._manifiestos_lock:
+            cacheado = self._manifiestos.get(raiz)
+            if cacheado and cacheado[0] == mtime:
+                return cacheado[1]
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                feeds = json.load(f).get("feeds", {})
+        except (OSError, ValueError):
+            feeds = {}
+        with self._manifiestos_lock:
+            self._manifiestos[raiz] = (mtime, feeds)
+        return feeds
+
+    def validadores(self, raiz: Path, relativa: str, stat, codificacion: Optional[str]) -> Tuple[str, str, float]:
+        """
+        ETag fuerte, Last-Modified y su timestamp para un archivo. Los feeds
+        usan el ETag (hash del contenido) y la fecha de feeds_manifest.json;
+        el resto, tamaño y mtime en nanosegundos
+
+        Args:
+            raiz: Directorio del sitio
+            relativa: Ruta del archivo (sin .br/.gz) relativa al sitio
+            stat: os.stat_result del archivo original
+            codificacion: Codificación de la variante servida o None
+        """
+        info = self._manifiesto_feeds(raiz).get(relativa) if relativa.startswith("feed") else None
+        if info and info.get("bytes") == stat.st_size and info.get("etag"):
+            etag = info["etag"]
+            last_modified = info.get("last_modified") or formatdate(stat.st_mtime, usegmt=True)
+            try:
+                timestamp = parsedate_to_datetime(last_modified).timestamp()
+            except (TypeError, ValueError):
+                timestamp = stat.st_mtime
+        else:
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            last_modified = formatdate(stat.st_mtime, usegmt=True)
+            timestamp = stat.st_mtime
+        if codificacion:
+            etag = f'{etag[:-1]}-{codificacion}"'
+        return etag, last_modified, timestamp
+
+    def _crear_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Conexiones keep-alive inactivas no retienen un hilo indefinidamente
+            timeout = 30
+
+            def log_message(self, format, *args):
+                if servidor.verbose:
+                    super().log_message(format, *args)
+
+            def _redirigir(self, destino: str):
+                self.send_response(301)
+                self.send_header("Location", destino)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def _responder_html(self, codigo: int, html: str):
+                datos = html.encode("utf-8")
+                self.send_response(codigo)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(datos)))
+                self.send_header("Cache-Control", CACHE_REVALIDAR)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(datos)
+
+            def _indice_sitios(self):
+                host = (self.headers.get("Host") or "localhost").split(":", 1)
+                puerto = f":{host[1]}" if len(host) > 1 else ""
+                filas = "".join(
+                    f'<li><a href="/{nombre}/">{nombre}</a> · '
+                    f'<a href="http://{nombre}.localhost{puerto}/">{nombre}.localhost</a></li>'
+                    for nombre in servidor.listar_sitios()
+                )
+                self._responder_html(200, f"<!DOCTYPE html><html lang=\"es\"><meta charset=\"utf-8\">"
+                                          f"<title>Sitios generados</title><h1>Sitios generados</h1><ul>{filas}</ul></html>")
+
+            def _no_encontrado(self):
+                self._responder_html(404, "<!DOCTYPE html><html lang=\"es\"><meta charset=\"utf-8\">"
+                                          "<title>404</title><h1>404 - No encontrado</h1></html>")
+
+            def _no_modificado(self, etag: str, timestamp: float) -> bool:
+                """If-None-Match tiene prioridad sobre If-Modified-Since (RFC 9110)"""
+                if_none_match = self.headers.get("If-None-Match")
+                if if_none_match is not None:
+                    if if_none_match.strip() == "*":
+                        return True
+                    etiquetas = [e.strip().removeprefix("W/") for e in if_none_match.split(",")]
+                    return etag in etiquetas
+                if_modified_since = self.headers.get("If-Modified-Since")
+                if if_modified_since:
+                    try:
+                        return int(timestamp) <= parsedate_to_datetime(if_modified_since).timestamp()
+                    except (TypeError, ValueError):
+                        return False
+                return False
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                ruta = unquote(url.path)
+                if "\x00" in ruta:
+                    self.send_error(400)
+                    return
+
+                raiz, ruta, prefijo = servidor.resolver_sitio(self.headers.get("Host", ""), ruta)
+                if raiz is None:
+                    if ruta in ("", "/"):
+                        self._indice_sitios()
+                    else:
+                        self._no_encontrado()
+                    return
+                if prefijo and ruta == "/" and not url.path.endswith("/"):
+                    # /site_3 -> /site_3/ para que los enlaces relativos resuelvan
+                    self._redirigir(quote(prefijo) + "/" + (f"?{url.query}" if url.query else ""))
+                    return
+
+                # Normalizar como ruta absoluta: los '..' no pueden salir de la raíz del sitio
+                relativa = posixpath.normpath("/" + ruta).lstrip("/")
+                archivo = raiz / relativa
+                if archivo.is_dir():
+                    if not ruta.endswith("/"):
+                        self._redirigir(quote(prefijo + ruta) + "/")
+                        return
+                    archivo = archivo / "index.html"
+                    relativa = posixpath.join(relativa, "index.html").lstrip("/")
+                elif not archivo.exists() and not archivo.suffix and archivo.with_suffix(".html").is_file():
+                    archivo = archivo.with_suffix(".html")
+                    relativa += ".html"
+
+                try:
+                    stat = archivo.stat()
+                except OSError:
+                    self._no_encontrado()
+                    return
+                if not archivo.is_file():
+                    self._no_encontrado()
+                    return
+
+                tipo = tipo_contenido(archivo)
+                comprimible = tipo.startswith(COMPRIMIBLES)
+                servido, codificacion, stat_servido = archivo, None, stat
+                if comprimible:
+                    aceptadas = codificaciones_aceptadas(self.headers.get("Accept-Encoding", ""))
+                    for nombre, sufijo in CODIFICACIONES:
+                        if nombre not in aceptadas:
+                            continue
+                        variante = archivo.with_name(archivo.name + sufijo)
+                        try:
+                            stat_variante = variante.stat()
+                        except OSError:
+                            continue
+                        # Una variante más vieja que el original quedó de un build anterior
+                        if stat_variante.st_mtime_ns >= stat.st_mtime_ns:
+                            servido, codificacion, stat_servido = variante, nombre, stat_variante
+                            break
+
+                etag, last_modified, timestamp = servidor.validadores(raiz, relativa, stat, codificacion)
+                no_modificado = self._no_modificado(etag, timestamp)
+
+                self.send_response(304 if no_modificado else 200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.send_header("Cache-Control", cache_control(archivo, tipo))
+                if comprimible:
+                    self.send_header("Vary", "Accept-Encoding")
+                if no_modificado:
+                    self.end_headers()
+                    return
+                self.send_header("Content-Type", tipo)
+                self.send_header("Content-Length", str(stat_servido.st_size))
+                if codificacion:
+                    self.send_header("Content-Encoding", codificacion)
+                self.end_headers()
+
+                if self.command == "HEAD":
+                    return
+                try:
+                    with open(servido, "rb") as f:
+                        # socket.sendfile usa os.sendfile (copia en el kernel) cuando puede
+                        self.connection.sendfile(f)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+        return Handler
+
+    def iniciar(self) -> "StaticSiteServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def detener(self):
+        """Detiene el servidor"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+
+def main():
+    """Sirve los sitios generados en primer plano"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor estático para los sitios generados")
+    parser.add_argument("--dir", type=str, default="generated_sites", help="Directorio de sitios")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--site", type=str, default=None, help="Servir solo este sitio en la raíz")
+    parser.add_argument("--verbose", action="store_true", help="Imprimir cada petición")
+    args = parser.parse_args()
+
+    servidor = StaticSiteServer(args.dir, args.host, args.port, sitio=args.site, verbose=args.verbose)
+    port = servidor.httpd.server_address[1]
+    if args.site:
+        print(f"🌐 Sirviendo {args.site} en http://localhost:{port}")
+    else:
+        sitios = servidor.listar_sitios()
+        print(f"🌍 Sirviendo {len(sitios)} sitios en http://localhost:{port}")
+        for nombre in sitios[:5]:
+            print(f"  🌐 {nombre}: http://localhost:{port}/{nombre}/ · http://{nombre}.localhost:{port}/")
+        if len(sitios) > 5:
+            print(f"  ... y {len(sitios) - 5} más (índice en http://localhost:{port}/)")
+    print("Presiona Ctrl+C para detener\n")
+
+    try:
+        servidor.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Servidor detenido")
+        servidor.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+Almacenamiento de Sitios Generados
+Capa por la que escriben los generadores (orquestador, RSS, secciones, OG).
+Cada archivo se escribe en streaming a un temporal mientras se calcula su
+SHA-256 y se confirma de forma atómica; si el contenido es idéntico al que
+ya existe, el archivo no se toca.
+
+- DiskStorage: disco local (generated_sites), el comportamiento de siempre.
+- S3Storage: además del directorio local de build, publica cada archivo en
+  un bucket S3-compatible (AWS S3, Cloudflare R2, MinIO) en cuanto se
+  cierra, en segundo plano y en paralelo, con multipart para archivos
+  grandes. Un manifiesto en el bucket (clave -> SHA-256) evita subir lo
+  que ya está publicado, incluso desde un disco efímero (Render).
+- ClienteS3Local: sustituto S3-compatible sobre un directorio para pruebas
+  y desarrollo sin MinIO ni credenciales.
+
+El tipo se elige con STORAGE_TYPE (disk, s3, r2, local) en crear_storage().
+"""
+
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+try:
+    import boto3
+except ImportError:  # Dependencia opcional: solo para STORAGE_TYPE=s3/r2
+    boto3 = None
+
+# Bloque de lectura para hashear y copiar sin cargar archivos completos
+BLOQUE_LECTURA = 1024 * 1024
+
+# Mínimo de S3 para cada parte de un multipart (salvo la última)
+TAMANO_PARTE_MINIMO = 5 * 1024 * 1024
+
+MANIFIESTO_BUCKET = '.storage-manifest.json'
+
+# Variantes de precompression.py: los buckets no negocian Accept-Encoding
+SUFIJOS_PRECOMPRIMIDOS = ('.gz', '.br', '.zst')
+
+
+def content_type(ruta: Union[str, Path]) -> str:
+    """Content-Type para publicar un archivo"""
+    nombre = str(ruta)
+    if nombre.endswith('.atom'):
+        return 'application/atom+xml; charset=utf-8'
+    tipo = mimetypes.guess_type(nombre)[0] or 'application/octet-stream'
+    if tipo.startswith('text/') or tipo in ('application/json', 'application/xml', 'application/javascript'):
+        tipo += '; charset=utf-8'
+    return tipo
+
+
+def sha256_archivo(ruta: Union[str, Path]) -> str:
+    """SHA-256 de un archivo leído por bloques"""
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(BLOQUE_LECTURA), b''):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+class EscrituraStorage:
+    """
+    Archivo abierto para escritura por StorageBackend.abrir(). Acepta str
+    (se codifica) o bytes, calcula el SHA-256 y el tamaño mientras se
+    escribe y confirma al cerrar; si hubo una excepción dentro del with,
+    se descarta y el archivo anterior queda intacto
+    """
+
+    def __init__(self, storage: 'StorageBackend', ruta: Path, encoding: str, tipo: Optional[str]):
+        self.storage = storage
+        self.ruta = ruta
+        self.encoding = encoding
+        self.content_type = tipo
+        self.sha = hashlib.sha256()
+        self.bytes = 0
+        self.escrito = None
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        self._temporal = ruta.with_name(f".{ruta.name}.{uuid.uuid4().hex[:8]}.tmp")
+        self._f = open(self._temporal, 'wb')
+
+    def write(self, datos: Union[str, bytes]) -> int:
+        if isinstance(datos, str):
+            datos = datos.encode(self.encoding)
+        self._f.write(datos)
+        self.sha.update(datos)
+        self.bytes += len(datos)
+        return len(datos)
+
+    def tell(self) -> int:
+        return self.bytes
+
+    def flush(self):
+        self._f.flush()
+
+    def close(self):
+        """Confirma el archivo (idempotente)"""
+        if self._f.closed:
+            return
+        self._f.close()
+        self.escrito = self.storage._confirmar(self.ruta, self._temporal, self.sha.hexdigest(), self.bytes, self.content_type)
+
+    def descartar(self):
+        """Cancela la escritura"""
+        if not self._f.closed:
+            self._f.close()
+        self._temporal.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_error, *exc):
+        if tipo_error is None:
+            self.close()
+        else:
+            self.descartar()
+
+
+class StorageBackend:
+    """Interfaz común; las rutas son rutas locales del build (str o Path)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {'escritos': 0, 'sin_cambios': 0}
+
+    def abrir(self, ruta: Union[str, Path], modo: str = 'w', encoding: str = 'utf-8', content_type: str = None) -> EscrituraStorage:
+        """
+        Abre un archivo para escritura en streaming
+
+        Args:
+            ruta: Ruta del archivo dentro del build
+            modo: 'w' o 'wb' (el escritor acepta str y bytes en ambos)
+            encoding: Codificación para los str
+            content_type: Content-Type al publicar (default: por extensión)
+        """
+        if modo not in ('w', 'wb'):
+            raise ValueError(f"Modo no soportado: {modo}")
+        return EscrituraStorage(self, Path(ruta), encoding, content_type)
+
+    def escribir(self, ruta: Union[str, Path], datos: Union[str, bytes], content_type: str = None) -> bool:
+        """Escribe un archivo completo; True si cambió"""
+        with self.abrir(ruta, content_type=content_type) as f:
+            f.write(datos)
+        return f.escrito
+
+    def copiar(self, origen: Union[str, Path], ruta: Union[str, Path]) -> bool:
+        """Copia un archivo local al storage en streaming; True si cambió"""
+        with open(origen, 'rb') as entrada, self.abrir(ruta, 'wb') as f:
+            for bloque in iter(lambda: entrada.read(BLOQUE_LECTURA), b''):
+                f.write(bloque)
+        return f.escrito
+
+    def leer(self, ruta: Union[str, Path]) -> Optional[bytes]:
+        """Contenido de un archivo o None si no existe"""
+        try:
+            return Path(ruta).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def existe(self, ruta: Union[str, Path]) -> bool:
+        return Path(ruta).exists()
+
+    def eliminar(self, ruta: Union[str, Path]):
+        Path(ruta).unlink(missing_ok=True)
+
+    def sincronizar(self, directorio: Union[str, Path]) -> Dict:
+        """Publica los archivos que se escribieron sin pasar por el storage"""
+        return {'archivos': 0, 'publicados': 0}
+
+    def esperar(self) -> Dict:
+        """Espera las operaciones pendientes y devuelve las estadísticas"""
+        with self._lock:
+            return dict(self.stats)
+
+    def recargar_indice(self):
+        """Descarta lo que se sabe del destino; se vuelve a leer en el próximo uso"""
+
+    def reiniciar_stats(self):
+        """Pone las estadísticas en cero (al empezar un sitio)"""
+        with self._lock:
+            self._reiniciar_stats()
+
+    def _reiniciar_stats(self):
+        self.stats = {campo: [] if isinstance(valor, list) else 0 for campo, valor in self.stats.items()}
+
+    def tomar_resumen(self) -> Dict:
+        """
+        Espera lo pendiente y entrega lo hecho desde el último resumen, sin
+        guardar el manifiesto del bucket. Lo usan los workers del render para
+        que el storage principal lo sume con sumar_resumen
+
+        Returns:
+            Dict con stats y publicados (clave -> SHA-256, None si se eliminó)
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            self._reiniciar_stats()
+        return {'stats': stats, 'publicados': {}}
+
+    def sumar_resumen(self, resumen: Dict):
+        """Suma a este storage el resumen de un worker (ver tomar_resumen)"""
+        with self._lock:
+            for campo, valor in resumen['stats'].items():
+                if isinstance(valor, list):
+                    self.stats[campo] = self.stats.get(campo, []) + valor
+                else:
+                    self.stats[campo] = self.stats.get(campo, 0) + valor
+
+    def _contar(self, campo: str, delta: int = 1):
+        with self._lock:
+            self.stats[campo] = self.stats.get(campo, 0) + delta
+
+    def _confirmar(self, ruta: Path, temporal: Path, sha: str, size: int, tipo: Optional[str]) -> bool:
+        """
+        Reemplaza el archivo por el temporal salvo que el contenido sea
+        idéntico (conserva el archivo y su fecha de modificación)
+
+        Returns:
+            True si el archivo cambió
+        """
+        try:
+            igual = ruta.stat().st_size == size and sha256_archivo(ruta) == sha
+        except FileNotFoundError:
+            igual = False
+        if igual:
+            temporal.unlink()
+            self._contar('sin_cambios')
+            return False
+        os.replace(temporal, ruta)
+        self._contar('escritos')
+        return True
+
+
+class DiskStorage(StorageBackend):
+    """Escritura en disco local"""
+
+
+class S3Storage(StorageBackend):
+    """Disco local de build + publicación en un bucket S3-compatible"""
+
+    def __init__(
+        self,
+        raiz: Union[str, Path],
+        bucket: str,
+        prefijo: str = '',
+        cliente=None,
+        endpoint_url: str = None,
+        region: str = None,
+        tamano_parte: int = 8 * 1024 * 1024,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            raiz: Directorio local que corresponde a la raíz del bucket
+                (generated_sites); las claves son rutas relativas a él
+            bucket: Nombre del bucket
+            prefijo: Prefijo de las claves dentro del bucket
+            cliente: Cliente con la interfaz de boto3 (default: boto3.client('s3'))
+            endpoint_url: Endpoint S3-compatible (R2, MinIO)
+            region: Región del bucket
+            tamano_parte: Archivos más grandes se suben en multipart
+            max_workers: Subidas simultáneas
+        """
+        super().__init__()
+        if cliente is None:
+            if boto3 is None:
+                raise ImportError("STORAGE_TYPE=s3/r2 requiere boto3: pip install boto3")
+            cliente = boto3.client('s3', endpoint_url=endpoint_url, region_name=region)
+        self.raiz = Path(raiz).resolve()
+        self.bucket = bucket
+        self.prefijo = prefijo.strip('/') + '/' if prefijo.strip('/') else ''
+        self.cliente = cliente
+        self.tamano_parte = max(tamano_parte, TAMANO_PARTE_MINIMO)
+        self.stats.update({'subidos': 0, 'bytes_subidos': 0, 'ya_publicados': 0, 'eliminados': 0, 'errores': []})
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pendientes: List[Future] = []
+        self._indice: Optional[Dict[str, str]] = None
+        self._indice_cambiado = False
+        # Clave -> SHA-256 en cola de subida (evita subir dos veces lo mismo)
+        self._programados: Dict[str, str] = {}
+        # Cambios al bucket desde el último resumen (clave -> SHA-256 o None)
+        self._publicados: Dict[str, Optional[str]] = {}
+
+    def _clave(self, ruta: Union[str, Path]) -> Optional[str]:
+        """Clave del bucket para una ruta local (None si está fuera de la raíz)"""
+        try:
+            relativa = Path(ruta).resolve().relative_to(self.raiz)
+        except ValueError:
+            return None
+        return self.prefijo + relativa.as_posix()
+
+    def _cargar_indice(self) -> Dict[str, str]:
+        with self._lock:
+            if self._indice is not None:
+                return self._indice
+        try:
+            respuesta = self.cliente.get_object(Bucket=self.bucket, Key=self.prefijo + MANIFIESTO_BUCKET)
+            indice = json.loads(respuesta['Body'].read())
+        except Exception as e:
+            if _codigo_error(e) not in ('NoSuchKey', '404', 'NotFound'):
+                raise
+            indice = {}
+        with self._lock:
+            if self._indice is None:
+                self._indice = indice
+            return self._indice
+
+    def _confirmar(self, ruta: Path, temporal: Path, sha: str, size: int, tipo: Optional[str]) -> bool:
+        cambiado = super()._confirmar(ruta, temporal, sha, size, tipo)
+        self._publicar(ruta, sha, tipo)
+        return cambiado
+
+    def _publicar(self, ruta: Path, sha: str, tipo: Optional[str] = None) -> bool:
+        """Programa la subida si el bucket no tiene ya ese contenido; True si se programó"""
+        clave = self._clave(ruta)
+        if clave is None:
+            return False
+        indice = self._cargar_indice()
+        with self._lock:
+            if indice.get(clave) == sha:
+                self.stats['ya_publicados'] += 1
+                return False
+            if self._programados.get(clave) == sha:
+                # Ya está en cola (p. ej. sincronizar tras escribir por el storage)
+                return False
+            self._programados[clave] = sha
+            self._pendientes.append(self._executor.submit(self._subir, ruta, clave, tipo or content_type(ruta)))
+        return True
+
+    def _subir(self, ruta: Path, clave: str, tipo: str):
+        """
+        Sube el archivo local; el hash se calcula sobre los bytes que se
+        suben (el archivo pudo reescribirse después de programar la subida)
+        """
+        try:
+            sha = hashlib.sha256()
+            size = ruta.stat().st_size
+            with open(ruta, 'rb') as f:
+                if size <= self.tamano_parte:
+                    datos = f.read()
+                    sha.update(datos)
+                    self.cliente.put_object(Bucket=self.bucket, Key=clave, Body=datos, ContentType=tipo)
+                    size = len(datos)
+                else:
+                    size = self._subir_multipart(f, clave, tipo, sha)
+        except FileNotFoundError:
+            # Se eliminó antes de subirse
+            return
+        except Exception as e:
+            self._contar_error(f"{clave}: {e}")
+            return
+        with self._lock:
+            self._indice[clave] = self._publicados[clave] = sha.hexdigest()
+            self._indice_cambiado = True
+            self.stats['subidos'] += 1
+            self.stats['bytes_subidos'] += size
+
+    def _subir_multipart(self, f, clave: str, tipo: str, sha) -> int:
+        """Multipart con una parte en memoria a la vez; aborta si algo falla"""
+        upload_id = self.cliente.create_multipart_upload(Bucket=self.bucket, Key=clave, ContentType=tipo)['UploadId']
+        partes, size = [], 0
+        try:
+            for numero, bloque in enumerate(iter(lambda: f.read(self.tamano_parte), b''), 1):
+                sha.update(bloque)
+                size += len(bloque)
+                respuesta = self.cliente.upload_part(
+                    Bucket=self.bucket, Key=clave, PartNumber=numero, UploadId=upload_id, Body=bloque
+                )
+                partes.append({'PartNumber': numero, 'ETag': respuesta['ETag']})
+            self.cliente.complete_multipart_upload(
+                Bucket=self.bucket, Key=clave, UploadId=upload_id, MultipartUpload={'Parts': partes}
+            )
+        except Exception:
+            self.cliente.abort_multipart_upload(Bucket=self.bucket, Key=clave, UploadId=upload_id)
+            raise
+        return size
+
+    def _contar_error(self, mensaje: str):
+        with self._lock:
+            self.stats['errores'].append(mensaje)
+
+    def eliminar(self, ruta: Union[str, Path]):
+        super().eliminar(ruta)
+        clave = self._clave(ruta)
+        if clave is None:
+            return
+
+        def borrar():
+            try:
+                self.cliente.delete_object(Bucket=self.bucket, Key=clave)
+            except Exception as e:
+                self._contar_error(f"{clave}: {e}")
+                return
+            with self._lock:
+                if self._indice is not None and self._indice.pop(clave, None) is not None:
+                    self._indice_cambiado = True
+                self._publicados[clave] = None
+                self.stats['eliminados'] += 1
+
+        futuro = self._executor.submit(borrar)
+        with self._lock:
+            self._pendientes.append(futuro)
+
+    def sincronizar(self, directorio: Union[str, Path]) -> Dict:
+        """
+        Publica los archivos del directorio que no pasaron por el storage
+        (generadores que escriben directo a disco). Lo ya publicado con el
+        mismo contenido se omite
+        """
+        archivos, publicados = 0, 0
+        for ruta in sorted(Path(directorio).rglob('*')):
+            if not ruta.is_file() or ruta.name.endswith('.tmp'):
+                continue
+            if ruta.suffix in SUFIJOS_PRECOMPRIMIDOS and ruta.with_suffix('').is_file():
+                continue
+            archivos += 1
+            publicados += self._publicar(ruta, sha256_archivo(ruta))
+        return {'archivos': archivos, 'publicados': publicados}
+
+    def recargar_indice(self):
+        with self._lock:
+            self._indice = None
+
+    def _esperar_pendientes(self):
+        while True:
+            with self._lock:
+                pendientes, self._pendientes = self._pendientes, []
+            if not pendientes:
+                self._programados.clear()
+                return
+            for futuro in pendientes:
+                futuro.result()
+
+    def esperar(self) -> Dict:
+        """Espera las subidas pendientes y guarda el manifiesto del bucket"""
+        self._esperar_pendientes()
+        with self._lock:
+            guardar = self._indice_cambiado
+            indice = json.dumps(self._indice or {}, sort_keys=True).encode('utf-8')
+            self._indice_cambiado = False
+            self._publicados = {}
+        if guardar:
+            self.cliente.put_object(
+                Bucket=self.bucket, Key=self.prefijo + MANIFIESTO_BUCKET, Body=indice, ContentType='application/json'
+            )
+        return super().esperar()
+
+    def tomar_resumen(self) -> Dict:
+        self._esperar_pendientes()
+        with self._lock:
+            publicados, self._publicados = self._publicados, {}
+        resumen = super().tomar_resumen()
+        resumen['publicados'] = publicados
+        return resumen
+
+    def sumar_resumen(self, resumen: Dict):
+        super().sumar_resumen(resumen)
+        if not resumen['publicados']:
+            return
+        indice = self._cargar_indice()
+        with self._lock:
+            for clave, sha in resumen['publicados'].items():
+                if sha is None:
+                    indice.pop(clave, None)
+                else:
+                    indice[clave] = sha
+            self._indice_cambiado = True
+
+
+def _codigo_error(error: Exception) -> str:
+    """Código de un error de boto3 (botocore ClientError) o de ClienteS3Local"""
+    return str(getattr(error, 'response', {}).get('Error', {}).get('Code', ''))
+
+
+class ErrorS3Local(Exception):
+    """Error con la forma de botocore.exceptions.ClientError"""
+
+    def __init__(self, codigo: str, mensaje: str):
+        super().__init__(mensaje)
+        self.response = {'Error': {'Code': codigo, 'Message': mensaje}}
+
+
+class ClienteS3Local:
+    """
+    Sustituto S3-compatible sobre un directorio (subconjunto de la interfaz
+    de boto3 que usa S3Storage). Útil para pruebas y desarrollo sin MinIO
+    """
+
+    def __init__(self, directorio: Union[str, Path]):
+        self.directorio = Path(directorio)
+        self._lock = threading.Lock()
+        self.llamadas: Dict[str, int] = {}
+
+    def _registrar(self, operacion: str):
+        with self._lock:
+            self.llamadas[operacion] = self.llamadas.get(operacion, 0) + 1
+
+    def _ruta(self, bucket: str, clave: str) -> Path:
+        ruta = (self.directorio / bucket / clave).resolve()
+        if not ruta.is_relative_to((self.directorio / bucket).resolve()):
+            raise ErrorS3Local('InvalidKey', clave)
+        return ruta
+
+    def _guardar(self, ruta: Path, datos: bytes):
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_name(f".{ruta.name}.{uuid.uuid4().hex[:8]}.tmp")
+        temporal.write_bytes(datos)
+        os.replace(temporal, ruta)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> Dict:
+        self._registrar('put_object')
+        datos = Body if isinstance(Body, bytes) else Body.read()
+        self._guardar(self._ruta(Bucket, Key), datos)
+        return {'ETag': f'"{hashlib.md5(datos).hexdigest()}"'}
+
+    def get_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._registrar('get_object')
+        try:
+            return {'Body': io.BytesIO(self._ruta(Bucket, Key).read_bytes())}
+        except FileNotFoundError:
+            raise ErrorS3Local('NoSuchKey', Key)
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._registrar('delete_object')
+        self._ruta(Bucket, Key).unlink(missing_ok=True)
+        return {}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._registrar('create_multipart_upload')
+        upload_id = uuid.uuid4().hex
+        (self.directorio / '.multipart' / upload_id).mkdir(parents=True)
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, PartNumber: int, UploadId: str, Body: bytes, **kwargs) -> Dict:
+        self._registrar('upload_part')
+        (self.directorio / '.multipart' / UploadId / f"{PartNumber:05d}").write_bytes(Body)
+        return {'ETag': f'"{hashlib.md5(Body).hexdigest()}"'}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict, **kwargs) -> Dict:
+        self._registrar('complete_multipart_upload')
+        partes_dir = self.directorio / '.multipart' / UploadId
+        ruta = self._ruta(Bucket, Key)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_name(f".{ruta.name}.{UploadId[:8]}.tmp")
+        with open(temporal, 'wb') as salida:
+            for parte in MultipartUpload['Parts']:
+                with open(partes_dir / f"{parte['PartNumber']:05d}", 'rb') as entrada:
+                    shutil.copyfileobj(entrada, salida)
+        os.replace(temporal, ruta)
+        shutil.rmtree(partes_dir)
+        return {}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> Dict:
+        self._registrar('abort_multipart_upload')
+        shutil.rmtree(self.directorio / '.multipart' / UploadId, ignore_errors=True)
+        return {}
+
+
+def crear_storage(raiz: Union[str, Path], tipo: str = None) -> StorageBackend:
+    """
+    Storage según STORAGE_TYPE
+
+    Args:
+        raiz: Directorio local de los sitios (OUTPUT_BASE_DIR / generated_sites)
+        tipo: 'disk', 's3', 'r2' o 'local' (default: STORAGE_TYPE o 'disk')
+
+    Variables de entorno:
+        AWS_S3_BUCKET, AWS_REGION, S3_PREFIX: bucket, región y prefijo
+        S3_ENDPOINT_URL: endpoint S3-compatible (p. ej. MinIO http://localhost:9000)
+        R2_ACCOUNT_ID: cuenta de Cloudflare R2 (endpoint por defecto para 'r2')
+        S3_LOCAL_DIR: directorio del bucket simulado para 'local'
+    """
+    tipo = (tipo or os.getenv('STORAGE_TYPE') or 'disk').lower()
+    if tipo == 'disk':
+        return DiskStorage()
+
+    bucket = os.getenv('AWS_S3_BUCKET', 'news-generator-sites')
+    prefijo = os.getenv('S3_PREFIX', '')
+    if tipo == 'local':
+        directorio = os.getenv('S3_LOCAL_DIR') or Path(raiz).parent / 'object_storage'
+        return S3Storage(raiz, bucket, prefijo, cliente=ClienteS3Local(directorio))
+    if tipo == 's3':
+        return S3Storage(raiz, bucket, prefijo, endpoint_url=os.getenv('S3_ENDPOINT_URL'), region=os.getenv('AWS_REGION'))
+    if tipo == 'r2':
+        endpoint = os.getenv('S3_ENDPOINT_URL')
+        if not endpoint and os.getenv('R2_ACCOUNT_ID'):
+            endpoint = f"https://{os.getenv('R2_ACCOUNT_ID')}.r2.cloudflarestorage.com"
+        return S3Storage(raiz, bucket, prefijo, endpoint_url=endpoint, region='auto')
+    raise ValueError(f"STORAGE_TYPE desconocido: {tipo} (disk, s3, r2, local)")
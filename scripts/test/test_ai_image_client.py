@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test del Cliente de Imágenes con IA
+Genera lotes de imágenes contra mock_llm_server.py (base64 inline y URL) y
+verifica la concurrencia acotada, que los prompts repetidos o ya generados
+no se vuelvan a pedir y que el base64 se decodifique por bloques
+"""
+
+import base64
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from ai_image_client import AIImageClient, DecodificadorBase64, clave_prompt
+from mock_llm_server import MockLLMConfig, MockLLMServer, generar_imagen
+
+PROMPTS = [f"Ilustración editorial sobre la reforma {i}" for i in range(8)]
+
+
+def _cliente(servidor: MockLLMServer, cache_dir: Path, **kwargs) -> AIImageClient:
+    return AIImageClient(api_key="mock", base_url=servidor.base_url, cache_dir=cache_dir, **kwargs)
+
+
+def test_lote_con_cache():
+    """Un request por prompt distinto, como mucho max_concurrencia a la vez"""
+    config = MockLLMConfig(latencia="fija", latencia_media=0.1, imagen_ancho=400, imagen_alto=300)
+    with tempfile.TemporaryDirectory() as tmp, MockLLMServer(config=config) as servidor:
+        tmp = Path(tmp)
+        prompts = PROMPTS + [PROMPTS[0], "  " + PROMPTS[1].replace(" ", "  ")]
+        destinos = [tmp / "sitio" / f"news_{i}.jpg" for i in range(len(prompts))]
+        progreso = []
+        with _cliente(servidor, tmp / "cache", max_concurrencia=3) as cliente:
+            resultados = cliente.generar_lote(prompts, destinos, lambda hechas, total: progreso.append(hechas))
+        stats = servidor.obtener_stats()
+
+        assert all(r["error"] is None for r in resultados)
+        assert stats["por_endpoint"]["imagen"] == len(PROMPTS)
+        assert 1 < stats["max_en_vuelo"] <= 3
+        assert cliente.stats["generadas"] == len(PROMPTS) and cliente.stats["duplicadas"] == 2
+        assert progreso == list(range(1, len(prompts) + 1))
+        for prompt, destino in zip(PROMPTS, destinos):
+            assert destino.read_bytes() == generar_imagen(prompt, 400, 300)
+        assert destinos[-2].read_bytes() == destinos[0].read_bytes()
+
+        # Otra ejecución con la misma cache: nada se vuelve a pagar
+        with MockLLMServer(config=config) as otro:
+            with _cliente(otro, tmp / "cache") as cliente:
+                resultados = cliente.generar_lote(PROMPTS)
+            assert otro.obtener_stats()["requests"] == 0
+        assert all(r["desde_cache"] for r in resultados)
+        assert Path(resultados[0]["ruta"]) == tmp / "cache" / clave_prompt(PROMPTS[0])[:2] / clave_prompt(PROMPTS[0])
+
+
+def test_imagen_por_url():
+    """Si el modelo responde con una URL, la imagen se descarga"""
+    config = MockLLMConfig(latencia="cero", imagenes="url")
+    with tempfile.TemporaryDirectory() as tmp, MockLLMServer(config=config) as servidor:
+        resultado = _cliente(servidor, Path(tmp) / "cache").generar(PROMPTS[0], Path(tmp) / "news_1.jpg")
+        stats = servidor.obtener_stats()
+
+        assert resultado["error"] is None and not resultado["desde_cache"]
+        assert Path(resultado["ruta"]).read_bytes() == generar_imagen(PROMPTS[0], 64, 32)
+        assert stats["por_endpoint"] == {"imagen": 1, "descarga": 1}
+
+
+def test_errores_no_se_cachean():
+    """Un 5xx persistente se reporta sin dejar nada en la cache"""
+    config = MockLLMConfig(latencia="cero", tasa_5xx=1.0)
+    with tempfile.TemporaryDirectory() as tmp, MockLLMServer(config=config) as servidor:
+        cliente = _cliente(servidor, Path(tmp) / "cache", reintentos=2)
+        resultado = cliente.generar(PROMPTS[0])
+        stats = servidor.obtener_stats()
+
+        assert resultado["error"] and "2 intentos" in resultado["error"]
+        assert stats["requests"] == 2 and cliente.stats["reintentos"] == 1
+        assert cliente.en_cache(PROMPTS[0]) is None
+
+
+def test_decodificador_por_fragmentos():
+    """Fragmentos arbitrarios de un string JSON con escapes dan los mismos bytes"""
+    imagen = generar_imagen("decodificador", 50, 40)
+    codificado = json.dumps(base64.b64encode(imagen).decode("ascii")).replace("/", "\\/")[1:-1]
+    codificado = codificado[:100] + "\\n" + codificado[100:]
+    for tamano in (1, 3, 7, 4096):
+        salida = io.BytesIO()
+        decodificador = DecodificadorBase64(salida)
+        for i in range(0, len(codificado), tamano):
+            decodificador.escribir(codificado[i:i + tamano].encode("ascii"))
+        assert decodificador.cerrar() == len(imagen)
+        assert salida.getvalue() == imagen
+
+
+def main():
+    print("🧪 Test del cliente de imágenes con IA...")
+    test_lote_con_cache()
+    print("✅ Lote con concurrencia acotada y cache por prompt")
+    test_imagen_por_url()
+    print("✅ Imagen por URL")
+    test_errores_no_se_cachean()
+    print("✅ Errores sin cachear")
+    test_decodificador_por_fragmentos()
+    print("✅ Base64 decodificado por fragmentos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test del Registro de Artículos
+Verifica la detección por URL canónica y SimHash, la reutilización de
+salidas entre ejecuciones y el reproceso de las que fallaron
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from article_registry import ArticleRegistry, canonicalizar_url, distancia_hamming, simhash
+
+NOTICIAS = [
+    {
+        "title": "El Senado aprueba la reforma judicial tras una sesión de doce horas",
+        "description": "La iniciativa fue aprobada con 86 votos a favor y 41 en contra en una sesión extraordinaria.",
+        "url": "https://www.ejemplo.mx/politica/reforma-judicial?utm_source=newsapi",
+    },
+    {
+        "title": "Banxico mantiene la tasa de interés en 10.5% por tercera vez consecutiva",
+        "description": "La Junta de Gobierno citó la inflación subyacente como motivo principal de la pausa.",
+        "url": "https://economia.ejemplo.mx/banxico-tasa",
+    },
+]
+
+
+def test_canonicalizar_url():
+    """Tracking, www, esquema, fragmento y barra final no cambian la nota"""
+    esperada = "ejemplo.mx/politica/reforma-judicial?id=7"
+    assert canonicalizar_url("https://www.ejemplo.mx/politica/reforma-judicial/?utm_source=x&id=7#top") == esperada
+    assert canonicalizar_url("http://ejemplo.mx/politica/reforma-judicial?fbclid=abc&id=7") == esperada
+    assert canonicalizar_url("") == ""
+
+
+def test_simhash_casi_duplicados():
+    """Un título levemente reescrito queda a pocos bits; otra noticia, lejos"""
+    a = simhash(NOTICIAS[0]["title"] + " " + NOTICIAS[0]["description"])
+    b = simhash(NOTICIAS[0]["title"] + ". " + NOTICIAS[0]["description"].upper())
+    c = simhash(NOTICIAS[1]["title"] + " " + NOTICIAS[1]["description"])
+    assert distancia_hamming(a, b) == 0
+    assert distancia_hamming(a, c) > 10
+
+
+def test_reutiliza_entre_ejecuciones():
+    """La segunda ejecución reutiliza la salida y solo procesa lo nuevo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "registro.sqlite3"
+
+        with ArticleRegistry(db) as registro:
+            nuevas, reutilizadas = registro.filtrar_nuevos(NOTICIAS + [dict(NOTICIAS[1])], "run1")
+            assert len(nuevas) == 2 and not reutilizadas
+            assert registro.stats["duplicados_lote"] == 1
+
+            salidas = [
+                {**NOTICIAS[0], "title": "Título parafraseado", "category_id": "politica"},
+                {**NOTICIAS[1], "paraphrase_method": "error"},
+            ]
+            assert registro.guardar_salidas(salidas, "run1") == 1
+
+        # Misma nota con otra URL de tracking + una noticia nueva
+        misma_nota = {**NOTICIAS[0], "url": "http://ejemplo.mx/politica/reforma-judicial/?utm_medium=rss"}
+        nueva = {"title": "Sismo de magnitud 5.8 sacude Oaxaca", "description": "Sin daños reportados.", "url": "https://ejemplo.mx/sismo"}
+
+        with ArticleRegistry(db) as registro:
+            nuevas, reutilizadas = registro.filtrar_nuevos([misma_nota, NOTICIAS[1], nueva], "run2")
+            assert [r["title"] for r in reutilizadas] == ["Título parafraseado"]
+            assert reutilizadas[0]["reused_from_registry"]
+            # La que falló en run1 se vuelve a procesar
+            assert nuevas == [NOTICIAS[1], nueva]
+            assert registro.buscar(misma_nota)["veces_visto"] == 2
+
+
+def test_mismo_contenido_otra_url():
+    """Una nota replicada en otro dominio se reconoce por SimHash"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with ArticleRegistry(Path(tmp) / "registro.sqlite3") as registro:
+            registro.filtrar_nuevos([NOTICIAS[0]], "run1")
+            replica = {**NOTICIAS[0], "url": "https://otro-diario.mx/nota/123"}
+            assert registro.buscar(replica) is not None
+            assert registro.buscar(NOTICIAS[1]) is None
+
+
+def main():
+    print("🧪 Test del registro de artículos...")
+    test_canonicalizar_url()
+    print("✅ URL canónica")
+    test_simhash_casi_duplicados()
+    print("✅ SimHash de casi-duplicados")
+    test_reutiliza_entre_ejecuciones()
+    print("✅ Reutilización entre ejecuciones")
+    test_mismo_contenido_otra_url()
+    print("✅ Mismo contenido en otra URL")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test del Almacén de Artículos
+Verifica la ingesta append-only, la proyección de columnas, los filtros por
+fecha/fuente/categoría y la búsqueda de texto completo
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from article_store import ArticleStore
+from benchmark_pipeline import generar_corpus
+
+
+def _corpus():
+    corpus = generar_corpus(300)
+    for idx, article in enumerate(corpus):
+        article["source"] = "newsapi" if idx % 2 else "apitube"
+        article["published_at"] = f"2025-01-{idx % 28 + 1:02d}T10:00:00Z"
+    return corpus
+
+
+def test_ingesta_append_only():
+    """Las URLs repetidas se ignoran y las claves extra sobreviven"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with ArticleStore(Path(tmp) / "articles.sqlite3") as store:
+            corpus = _corpus()
+            corpus[0]["paraphrase_method"] = "blackbox-parallel"
+
+            assert store.agregar(corpus[:200], lote="newsapi_1") == 200
+            assert store.agregar(corpus[100:], lote="newsapi_2") == 100
+            assert store.contar() == 300
+            assert store.ultimo_lote() == "newsapi_2"
+
+            primero = store.cargar(recientes_primero=False, limite=1)[0]
+            assert primero["title"] == corpus[0]["title"]
+            assert primero["paraphrase_method"] == "blackbox-parallel"
+
+            # Las fuentes repetidas comparten un solo objeto
+            newsapi = store.cargar(columnas=["source"], fuentes=["newsapi"], limite=2)
+            assert newsapi[0]["source"] is newsapi[1]["source"]
+
+
+def test_proyeccion_y_filtros():
+    """Solo se leen las columnas pedidas y los filtros coinciden con Python"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with ArticleStore(Path(tmp) / "articles.sqlite3") as store:
+            corpus = _corpus()
+            store.agregar(corpus)
+
+            ligeros = store.cargar(columnas=["title", "category_id"])
+            assert set(ligeros[0]) == {"title", "category_id"}
+
+            categoria = corpus[0]["category_id"]
+            esperados = [
+                a for a in corpus
+                if a["source"] == "newsapi"
+                and a["category_id"] == categoria
+                and "2025-01-05" <= a["published_at"][:10] <= "2025-01-20"
+            ]
+            obtenidos = store.cargar(
+                columnas=["url"],
+                desde="2025-01-05",
+                hasta="2025-01-20",
+                fuentes=["newsapi"],
+                categorias=[categoria],
+                recientes_primero=False,
+            )
+            assert [a["url"] for a in obtenidos] == [a["url"] for a in esperados]
+            assert store.contar(fuentes=["newsapi"], categorias=[categoria], desde="2025-01-05", hasta="2025-01-20") == len(esperados)
+
+            try:
+                store.cargar(columnas=["title; DROP TABLE articulos"])
+                assert False, "debe rechazar columnas desconocidas"
+            except ValueError:
+                pass
+
+
+def test_busqueda_texto():
+    """FTS encuentra por palabras sin importar acentos"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with ArticleStore(Path(tmp) / "articles.sqlite3") as store:
+            store.agregar([
+                {"url": "https://a.mx/1", "title": "Reforma energética en el Senado", "full_text": "Debate de la reforma"},
+                {"url": "https://a.mx/2", "title": "Resultados de la liga", "full_text": "Fútbol mexicano"},
+            ])
+            resultados = store.buscar_texto("energetica", columnas=["url", "title"])
+            assert [r["url"] for r in resultados] == ["https://a.mx/1"]
+            assert [r["url"] for r in store.buscar_texto("futbol")] == ["https://a.mx/2"]
+
+
+def main():
+    print("🧪 Test del almacén de artículos...")
+    test_ingesta_append_only()
+    print("✅ Ingesta append-only")
+    test_proyeccion_y_filtros()
+    print("✅ Proyección de columnas y filtros")
+    test_busqueda_texto()
+    print("✅ Búsqueda de texto completo")
+
+
+if __name__ == "__main__":
+    main()
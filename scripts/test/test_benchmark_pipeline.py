@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test del Benchmark del Pipeline
+Corre el benchmark offline con un corpus de 10 artículos (guardar baseline y
+comparar contra él) y verifica el baseline versionado en data/benchmarks/
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from benchmark_pipeline import BASELINE_PATH, BENCHMARKS, comparar_con_baseline, generar_corpus, sin_baseline
+
+
+def _correr(*args) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(scripts_dir / "benchmark_pipeline.py"), "--tamanos", "10", *args],
+        capture_output=True, text=True, timeout=600,
+    )
+
+
+def test_smoke_offline():
+    """--tamanos 10: todos los benchmarks miden u omiten, y la comparación pasa"""
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = Path(tmp) / "baseline.json"
+        proceso = _correr("--guardar-baseline", "--baseline", str(baseline))
+        assert proceso.returncode == 0, proceso.stderr
+
+        resultados = json.loads(baseline.read_text(encoding="utf-8"))["resultados"]
+        assert set(resultados) == {f"{nombre}@10" for nombre in BENCHMARKS}
+        medidos = [r for r in resultados.values() if "omitido" not in r]
+        assert medidos and all(r["items"] > 0 and r["items_por_segundo"] > 0 for r in medidos)
+
+        # Contra sí mismo, con tolerancia amplia para el ruido de 10 artículos
+        proceso = _correr("--baseline", str(baseline), "--tolerancia", "0.9")
+        assert proceso.returncode == 0, proceso.stdout + proceso.stderr
+        assert "Sin regresiones" in proceso.stdout
+
+
+def test_deteccion_de_regresiones():
+    """Una caída de throughput o un aumento de memoria se reportan"""
+    anterior = {"rss@100": {"items": 100, "items_por_segundo": 1000.0, "pico_memoria_mb": 10.0}}
+    peor = {"rss@100": {"items": 100, "items_por_segundo": 500.0, "pico_memoria_mb": 30.0}}
+    regresiones = comparar_con_baseline(peor, anterior, 0.2)
+    assert len(regresiones) == 2 and all(r.startswith("rss@100") for r in regresiones)
+    assert comparar_con_baseline(anterior, anterior, 0.2) == []
+
+
+def test_cobertura_del_baseline():
+    """Una etapa que deja de medirse falla; una que el baseline no cubre avisa"""
+    medido = {"items": 100, "items_por_segundo": 1000.0, "pico_memoria_mb": 10.0}
+    omitido = {"omitido": "No module named 'PIL'"}
+    regresiones = comparar_con_baseline({"og_images@100": omitido}, {"og_images@100": medido}, 0.2)
+    assert regresiones == ["og_images@100: medido en el baseline, omitido ahora (No module named 'PIL')"]
+
+    assert comparar_con_baseline({"og_images@100": medido}, {"og_images@100": omitido}, 0.2) == []
+    avisos = sin_baseline({"og_images@100": medido, "rss@100": medido, "css@100": omitido}, {"og_images@100": omitido})
+    assert avisos == ["og_images@100: omitido en el baseline (No module named 'PIL')", "rss@100: no está en el baseline"]
+
+
+def test_baseline_versionado():
+    """El baseline de data/benchmarks cubre los tamaños por defecto"""
+    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))["resultados"]
+    for tamano in (100, 1000, 10000):
+        assert all(f"{nombre}@{tamano}" in baseline for nombre in BENCHMARKS)
+    # Grabado con requirements.txt instalado: solo falta el modelo de spaCy
+    # (se descarga aparte con python -m spacy download)
+    omitidos = {clave.split("@")[0] for clave, resultado in baseline.items() if "omitido" in resultado}
+    assert omitidos <= {"parafraseo_linguistico"}, omitidos
+    assert len(generar_corpus(10)) == 10 and generar_corpus(10) == generar_corpus(10)
+
+
+def main():
+    print("🧪 Test del benchmark del pipeline...")
+    test_smoke_offline()
+    print("✅ Smoke test offline (--tamanos 10)")
+    test_deteccion_de_regresiones()
+    print("✅ Detección de regresiones")
+    test_cobertura_del_baseline()
+    print("✅ Cambios de cobertura respecto al baseline")
+    test_baseline_versionado()
+    print("✅ Baseline versionado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test del Categorizador
+Verifica la categorización por keywords y que el lote pueda categorizar
+los mismos dicts (sin copiar) cuando el llamador ya es su dueño
+"""
+
+import sys
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from categorizer import NewsCategorizador
+
+ARTICULOS = [
+    {"title": "El Senado aprueba la reforma electoral", "description": "Votación en el Congreso"},
+    {"title": "La inflación golpea el presupuesto", "description": "Economía y gasto público"},
+]
+
+
+def test_lote_con_copias():
+    """Por defecto el lote retorna copias y no modifica los originales"""
+    categorizador = NewsCategorizador(api_key="offline")
+    originales = [dict(a) for a in ARTICULOS]
+    resultado = categorizador.categorizar_lote(originales, use_ai=False)
+
+    assert all(r is not o for r, o in zip(resultado, originales))
+    assert all("category_id" not in o for o in originales)
+    assert all(r["category_name"] for r in resultado)
+
+
+def test_lote_sin_copias():
+    """Con copiar=False se agregan las claves de categoría a los mismos dicts"""
+    categorizador = NewsCategorizador(api_key="offline")
+    articulos = [dict(a) for a in ARTICULOS]
+    resultado = categorizador.categorizar_lote(articulos, use_ai=False, copiar=False)
+
+    assert all(r is a for r, a in zip(resultado, articulos))
+    assert [a["category_id"] for a in articulos] == [
+        categorizador.categorizar_por_keywords(a)[0] for a in ARTICULOS
+    ]
+    assert all(0 < a["category_confidence"] <= 1 for a in articulos)
+
+
+def main():
+    print("🧪 Test del categorizador...")
+    test_lote_con_copias()
+    print("✅ Lote con copias (originales intactos)")
+    test_lote_sin_copias()
+    print("✅ Lote sin copias (categoría en los mismos dicts)")
+
+
+if __name__ == "__main__":
+    main()
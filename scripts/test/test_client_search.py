@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test de la Búsqueda del Lado del Cliente
+Verifica los fragmentos por prefijo, la codificación de postings y que un sitio
+grande no obligue a descargar un JSON gigante
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from benchmark_pipeline import generar_corpus
+from client_search import ClientSearchGenerator
+from search_index import SearchIndex
+
+ARTICULOS = [
+    {"title": "Banxico recorta la tasa de interés", "full_text": "La inflación bajó y Banxico recortó la tasa."},
+    {"title": "Selección mexicana gana en el Azteca", "full_text": "La selección venció 2-0 en el partido."},
+    {"title": "Año récord para la niñez", "full_text": "Programas para niños y niñas en todo el país."},
+]
+
+
+def _decodificar(postings):
+    doc_id, docs = 0, []
+    for delta in postings[::2]:
+        doc_id += delta
+        docs.append(doc_id)
+    return docs
+
+
+def test_fragmentos_y_postings():
+    """Cada término vive en el fragmento de su prefijo con los mismos documentos"""
+    indice = SearchIndex.desde_articulos(ARTICULOS)
+    generador = ClientSearchGenerator()
+    with tempfile.TemporaryDirectory() as tmp:
+        generador.generar(indice, Path(tmp), {"nombre": "Diario"}, lambda d: f"article_{d + 1}.html")
+        search_dir = Path(tmp) / "search"
+
+        for termino, postings in indice.postings.items():
+            fragmento = json.loads((search_dir / f"{generador.nombre_fragmento(termino)}.json").read_text(encoding="utf-8"))
+            assert _decodificar(fragmento[termino]) == sorted(doc for doc, _ in postings)
+            assert all(1 <= peso <= 255 for peso in fragmento[termino][1::2])
+
+        # 'ñ' no aparece en nombres de archivo
+        assert generador.nombre_fragmento("niñez") == "t_ni"
+        assert generador.nombre_fragmento("ñandu") == "t__a"
+
+        documentos = json.loads((search_dir / "d_0.json").read_text(encoding="utf-8"))
+        assert documentos[1][:2] == ["article_2.html", ARTICULOS[1]["title"]]
+
+        pagina = (Path(tmp) / "buscar.html").read_text(encoding="utf-8")
+        assert 'data-prefijo="2"' in pagina and 'src="search.js"' in pagina
+        assert (Path(tmp) / "search.js").exists()
+
+
+def test_fragmentos_pequenos():
+    """En un sitio de miles de artículos ningún fragmento pasa de unos pocos KB"""
+    indice = SearchIndex.desde_articulos(generar_corpus(2000))
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = ClientSearchGenerator().exportar_indice(indice, Path(tmp), lambda d: f"article_{d + 1}.html")
+
+    assert stats["bloques"] == 10
+    assert stats["mayor_fragmento"] < 16 * 1024, f"{stats['mayor_fragmento']} bytes"
+
+
+def main():
+    print("🧪 Test de la búsqueda del lado del cliente...")
+    test_fragmentos_y_postings()
+    print("✅ Fragmentos por prefijo y postings")
+    test_fragmentos_pequenos()
+    print("✅ Fragmentos de pocos KB")
+
+
+if __name__ == "__main__":
+    main()
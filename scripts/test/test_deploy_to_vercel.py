@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test del Deploy a Vercel
+Ejecuta VercelDeployer contra mock_vercel_server.py: el deploy delta solo
+sube los blobs que faltan, un redeploy sin cambios no sube nada, el modo
+inline sigue funcionando y el deploy de flota respeta los topes globales
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from deploy_to_vercel import LimitadorAncho, VercelDeployer
+from mock_vercel_server import MockVercelServer
+
+
+def _sitio(tmp: Path):
+    (tmp / "images").mkdir()
+    (tmp / "index.html").write_text("<html>portada</html>", encoding="utf-8")
+    (tmp / "article_1.html").write_text("<html>nota 1</html>", encoding="utf-8")
+    (tmp / "article_1.html.gz").write_bytes(b"gz")
+    for n in range(1, 6):
+        (tmp / "images" / f"news_{n}.jpg").write_bytes(os.urandom(50_000))
+    # Mismo contenido en dos rutas: un solo blob
+    (tmp / "images" / "logo.svg").write_text("<svg/>", encoding="utf-8")
+    (tmp / "favicon.svg").write_text("<svg/>", encoding="utf-8")
+
+
+def test_deploy_delta():
+    """El primer deploy sube todo; los siguientes solo lo que cambió"""
+    with tempfile.TemporaryDirectory() as tmp, MockVercelServer() as servidor:
+        tmp = Path(tmp)
+        _sitio(tmp)
+        deployer = VercelDeployer(token="local", api_url=servidor.base_url, max_workers=4)
+
+        primero = deployer.crear_deployment("diario", tmp)
+        assert primero["status"] == "ready" and primero["url"].startswith("https://diario-")
+        assert primero["archivos"] == 9 and primero["subidos"] == 8
+        assert primero["bytes_subidos"] >= 250_000
+
+        segundo = deployer.crear_deployment("diario", tmp)
+        assert segundo["subidos"] == 0 and segundo["bytes_subidos"] == 0
+
+        (tmp / "article_1.html").write_text("<html>nota 1 corregida</html>", encoding="utf-8")
+        (tmp / "article_2.html").write_text("<html>nota 2</html>", encoding="utf-8")
+        tercero = deployer.crear_deployment("diario", tmp)
+        assert tercero["subidos"] == 2 and tercero["bytes_subidos"] < 100
+
+        stats = servidor.obtener_stats()
+    assert stats["deployments"] == 3 and stats["missing_files"] == 2
+    assert stats["subidas"] == 10
+
+
+def test_deploy_inline():
+    """El modo inline envía el contenido en el body"""
+    with tempfile.TemporaryDirectory() as tmp, MockVercelServer() as servidor:
+        tmp = Path(tmp)
+        _sitio(tmp)
+        deployer = VercelDeployer(token="local", api_url=servidor.base_url, delta=False)
+        resultado = deployer.crear_deployment("diario", tmp)
+        stats = servidor.obtener_stats()
+    assert resultado["status"] == "ready"
+    assert stats["subidas"] == 0 and stats["deployments"] == 1
+
+
+def test_sitio_completo():
+    """Crear proyecto + deploy + espera con varias consultas de estado"""
+    with tempfile.TemporaryDirectory() as tmp, MockVercelServer(consultas_hasta_ready=2) as servidor:
+        tmp = Path(tmp) / "site_7"
+        tmp.mkdir()
+        _sitio(tmp)
+        deployer = VercelDeployer(token="local", api_url=servidor.base_url)
+        deployer.intervalo_estado = 0.01
+        resultado = deployer.deployar_sitio_completo(tmp)
+        assert resultado["url"].startswith("https://site-7-")
+        assert servidor.obtener_stats()["consultas_estado"] == 2
+
+
+def test_flota():
+    """Varios sitios a la vez con tope global de conexiones y espera conjunta"""
+    with tempfile.TemporaryDirectory() as tmp, MockVercelServer(consultas_hasta_ready=3, latencia_subida=0.02) as servidor:
+        tmp = Path(tmp)
+        sitios = []
+        for n in range(1, 7):
+            sitio = tmp / f"site_{n}"
+            sitio.mkdir()
+            _sitio(sitio)
+            sitios.append(sitio)
+        deployer = VercelDeployer(token="local", api_url=servidor.base_url, max_workers=3)
+        deployer.intervalo_estado = 0.05
+
+        reporte = deployer.deployar_flota(sitios + [tmp / "site_99"], max_sitios=4)
+        stats = servidor.obtener_stats()
+
+    assert reporte["listos"] == 6 and reporte["fallidos"] == 1
+    # Las imágenes son distintas por sitio; el HTML y el SVG son los mismos
+    # blobs para todos (se suben una vez, o pocas si dos sitios coinciden)
+    assert 6 * 5 + 3 <= reporte["subidos"] < 6 * 8
+    assert reporte["subidos"] == stats["subidas"] and reporte["bytes_subidos"] == stats["bytes_subidos"]
+    assert [r["proyecto"] for r in reporte["sitios"]][:2] == ["site-1", "site-2"]
+    assert all(r["url"].startswith("https://site-") for r in reporte["sitios"][:6])
+    assert reporte["sitios"][6]["estado"] == "ERROR" and "no existe" in reporte["sitios"][6]["error"]
+    # Tope global: 3 subidas en vuelo aunque haya 4 sitios subiendo
+    assert 1 < stats["max_subidas_en_vuelo"] <= 3
+    # Cada deployment se consulta hasta estar listo, sin rondas de más
+    assert stats["consultas_estado"] == 6 * 3
+
+
+def test_limitador_ancho():
+    """El token bucket sostiene la tasa configurada entre hilos"""
+    limitador = LimitadorAncho(500_000)
+    inicio = time.monotonic()
+    for _ in range(10):
+        limitador.consumir(100_000)
+    segundos = time.monotonic() - inicio
+    # 500 KB de ráfaga inicial + 500 KB a 500 KB/s
+    assert 0.9 <= segundos < 1.5
+
+
+def main():
+    print("🧪 Test del deploy a Vercel...")
+    test_deploy_delta()
+    print("✅ Deploy delta por digests")
+    test_deploy_inline()
+    print("✅ Deploy inline")
+    test_sitio_completo()
+    print("✅ Proyecto, deploy y espera")
+    test_flota()
+    print("✅ Deploy de flota con topes globales")
+    test_limitador_ancho()
+    print("✅ Limitador de ancho de banda")
+
+
+if __name__ == "__main__":
+    main()
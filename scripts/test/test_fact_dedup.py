@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test de la Deduplicación de Hechos
+Compara el índice de n-gramas contra la comparación por pares original,
+mide que las comparaciones crezcan menos que cuadráticamente y verifica que
+la síntesis en lote coincide con la síntesis grupo a grupo
+"""
+
+import random
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from fact_dedup import FactDedupIndex, FactExtractor, deduplicar_hechos
+from multi_source_synthesizer import MultiSourceSynthesizer
+
+
+def _deduplicar_por_pares(hechos, umbral=0.7):
+    """Implementación O(n²) de referencia (algoritmo original)"""
+    unicos = []
+    for hecho in hechos:
+        if not any(
+            SequenceMatcher(None, hecho.lower(), existente.lower()).ratio() > umbral
+            for existente in unicos
+        ):
+            unicos.append(hecho)
+    return unicos
+
+
+def _frase(rng):
+    inicio = rng.choice([
+        "El PIB creció",
+        "La inversión pública alcanzó",
+        "Hacienda estimó que el gasto llegará a",
+        "Según el INE, la participación fue de",
+        "El presupuesto federal asigna",
+    ])
+    return f"{inicio} {rng.randint(1, 99)}% con $ {rng.randint(1, 900)},000 millones en {rng.choice([2024, 2025, 2026])}"
+
+
+def test_mismos_hechos_que_por_pares():
+    """El índice conserva exactamente los mismos hechos que la comparación exhaustiva"""
+    rng = random.Random(7)
+    for _ in range(20):
+        base = [_frase(rng) for _ in range(8)]
+        hechos = [rng.choice(base) if rng.random() < 0.5 else _frase(rng) for _ in range(60)]
+        assert deduplicar_hechos(hechos) == _deduplicar_por_pares(hechos)
+
+
+def _con_ruido(rng, frase, cada=4):
+    """Reemplaza un carácter de cada `cada`: ningún 5-grama queda intacto"""
+    return "".join(c if i % cada else rng.choice("xyzq") for i, c in enumerate(frase))
+
+
+def test_ruido_de_caracteres():
+    """Aproximación documentada: el ruido en cada palabra escapa al filtro"""
+    hecho = "El presupuesto federal asigna 45% con $ 300,000 millones en 2025"
+    ruidoso = _con_ruido(random.Random(1), hecho)
+    assert SequenceMatcher(None, ruidoso.lower(), hecho.lower()).ratio() > 0.7
+    assert deduplicar_hechos([hecho, ruidoso]) == [hecho, ruidoso]
+
+    # Con tramos intactos (cifras o una palabra cambiada) sí se detecta
+    editado = hecho.replace("federal", "fedral").replace("45%", "47%")
+    assert deduplicar_hechos([hecho, editado]) == [hecho]
+
+
+def test_comparaciones_subcuadraticas():
+    """Cuadruplicar los hechos no multiplica por 16 las comparaciones"""
+    rng = random.Random(5)
+    vocabulario = ["".join(rng.choice("abcdefghijlmnoprstu") for _ in range(rng.randint(4, 9))) for _ in range(3000)]
+
+    def comparaciones(total):
+        indice = FactDedupIndex()
+        hechos = [" ".join(rng.sample(vocabulario, 8)) + f" {rng.randint(10, 99)}%" for _ in range(total)]
+        # Un 10% de casi-duplicados: la misma frase con otra cifra
+        casi = [hecho[:-3] + "5%" for hecho in hechos[: total // 10]]
+        indice.agregar_lote(hechos + casi)
+        assert len(indice.hechos) == total
+        return indice.comparaciones
+
+    chico, grande = comparaciones(300), comparaciones(1200)
+    # Todos contra todos serían ~50.000 y ~790.000: aquí crece casi lineal
+    assert 30 <= chico and grande < 6 * chico, (chico, grande)
+
+
+def test_extractor():
+    """Puntuación por indicadores y orden estable del extractor"""
+    extractor = FactExtractor()
+    assert extractor.puntuar("Sin cifras ni citas en esta oración") == 0
+    assert extractor.puntuar('Dijo "vamos a ganar" ante la prensa') == 1
+    assert extractor.puntuar("El 15% de $ 300 millones en 2025") == 4
+
+    texto = (
+        "Oración de relleno sin indicadores. "
+        "La tasa bajó 3 por ciento en 2025. "
+        "El gobierno invirtió $1,000 en el 12% de escuelas durante 2024. "
+        "La tasa subió 4 por ciento en 2026."
+    )
+    assert extractor.extraer(texto) == [
+        "El gobierno invirtió $1,000 en el 12% de escuelas durante 2024",
+        "La tasa bajó 3 por ciento en 2025",
+        "La tasa subió 4 por ciento en 2026",
+    ]
+
+
+def test_lote_paralelo_igual_a_serial():
+    """synthesize_groups_batch en procesos da el mismo resultado que grupo a grupo"""
+    rng = random.Random(3)
+    synthesizer = MultiSourceSynthesizer()
+    groups = []
+    for g in range(6):
+        base = [_frase(rng) for _ in range(5)]
+        groups.append([
+            {
+                "title": f"Nota {g}",
+                "description": ". ".join(rng.sample(base, 3) + [_frase(rng)]),
+                "content": ". ".join(rng.sample(base, 2)),
+                "source_name": f"Fuente {a}",
+            }
+            for a in range(rng.randint(2, 6))
+        ])
+
+    seriales = [synthesizer.synthesize_group(group) for group in groups]
+    en_lote = synthesizer.synthesize_groups_batch(groups, max_workers=2, min_grupos_paralelo=1)
+
+    assert [r["description"] for r in en_lote] == [r["description"] for r in seriales]
+    assert [r["facts_extracted"] for r in en_lote] == [r["facts_extracted"] for r in seriales]
+
+
+def main():
+    print("🧪 Test de la deduplicación de hechos...")
+    test_mismos_hechos_que_por_pares()
+    print("✅ Mismos hechos que la comparación por pares")
+    test_ruido_de_caracteres()
+    print("✅ Aproximación con ruido de caracteres")
+    test_comparaciones_subcuadraticas()
+    print("✅ Comparaciones subcuadráticas")
+    test_extractor()
+    print("✅ Extractor de hechos")
+    test_lote_paralelo_igual_a_serial()
+    print("✅ Síntesis en lote igual a la serial")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test del Streaming de Respuestas LLM
+Verifica el parseo incremental de [TÍTULO]/[ARTÍCULO], los callbacks
+progresivos y el corte por presupuesto de tokens contra el servidor local
+"""
+
+import sys
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from llm_streaming import StreamingArticleParser
+from mock_llm_server import MockLLMConfig, MockLLMServer
+
+RESPUESTA = (
+    "[TÍTULO]\nReforma judicial avanza en el Senado\n\n[ARTÍCULO]\n\n"
+    "Primer párrafo del artículo.\n\nSegundo párrafo del artículo.\n\nTercer párrafo."
+)
+
+
+def test_parser_caracter_a_caracter():
+    """El título se publica antes del cuerpo aunque llegue de a un carácter"""
+    eventos = []
+    recibido_al_titulo = []
+    parser = StreamingArticleParser(
+        on_titulo=lambda t: (eventos.append(("titulo", t)), recibido_al_titulo.append(len(parser.texto_completo))),
+        on_parrafo=lambda p: eventos.append(("parrafo", p)),
+    )
+    for caracter in RESPUESTA:
+        assert parser.alimentar(caracter)
+    resultado = parser.finalizar()
+
+    assert eventos[0] == ("titulo", "Reforma judicial avanza en el Senado")
+    # El título se publicó antes de recibir el marcador [ARTÍCULO]
+    assert recibido_al_titulo[0] <= RESPUESTA.index("[ARTÍCULO]")
+    assert [e[1] for e in eventos[1:]] == [
+        "Primer párrafo del artículo.",
+        "Segundo párrafo del artículo.",
+        "Tercer párrafo.",
+    ]
+    assert resultado["full_text"].count("\n\n") == 2
+    assert not resultado["truncated"]
+
+
+def test_parser_sin_marcadores():
+    """Sin marcadores, el primer bloque es el título (como sin streaming)"""
+    parser = StreamingArticleParser()
+    parser.alimentar("Título directo\n\nCuerpo uno.\n\nCuerpo dos.")
+    resultado = parser.finalizar()
+    assert resultado["title"] == "Título directo"
+    assert resultado["paragraphs"] == ["Cuerpo uno.", "Cuerpo dos."]
+
+
+def test_stream_blackbox_contra_mock():
+    """El artículo se arma progresivamente y el presupuesto corta la generación"""
+    from blackbox_parallel import BlackboxParallelParaphraser
+
+    articulo = {"title": "Original", "description": "Descripción", "content": "Contenido"}
+    titulos = []
+
+    with MockLLMServer(config=MockLLMConfig(latencia="cero", parrafos=12)) as servidor:
+        paraphraser = BlackboxParallelParaphraser(api_keys=["key-a"], base_url=servidor.base_url)
+
+        resultado = paraphraser.parafrasear_articulo(
+            articulo,
+            stream=True,
+            on_titulo=lambda a: titulos.append((a["title"], a["full_text"])),
+        )
+        assert resultado["paraphrased"], resultado.get("error_message")
+        assert resultado["paraphrase_method"] == "blackbox-parallel-stream"
+        assert resultado["full_text"].count("\n\n") == 11
+        # Al publicarse el título todavía no había cuerpo
+        assert titulos == [(resultado["title"], "")]
+
+        truncado = paraphraser.parafrasear_articulo(articulo, stream=True, max_tokens_stream=60)
+        assert truncado["paraphrased"]
+        assert truncado["truncated"]
+        assert len(truncado["full_text"]) < len(resultado["full_text"])
+
+
+def test_lote_reenvia_callbacks():
+    """El lote paralelo reenvía on_titulo y on_parrafo a cada artículo"""
+    from blackbox_parallel import BlackboxParallelParaphraser
+
+    articulos = [{"title": f"Original {i}", "description": "D", "content": "C"} for i in range(3)]
+    titulos = []
+    parrafos = []
+
+    with MockLLMServer(config=MockLLMConfig(latencia="cero", parrafos=4)) as servidor:
+        paraphraser = BlackboxParallelParaphraser(api_keys=["key-a", "key-b"], base_url=servidor.base_url)
+        resultados = paraphraser.parafrasear_lote_paralelo(
+            articulos,
+            stream=True,
+            on_titulo=lambda a: titulos.append(a["title"]),
+            on_parrafo=lambda a, p: parrafos.append(p),
+        )
+
+    assert all(r["paraphrased"] for r in resultados)
+    assert sorted(titulos) == sorted(r["title"] for r in resultados)
+    assert len(parrafos) == sum(len(r["full_text"].split("\n\n")) for r in resultados)
+
+
+def test_texto_completo_por_fragmentos():
+    """texto_completo reconstruye el stream sin concatenar en cada delta"""
+    parser = StreamingArticleParser()
+    fragmentos = [RESPUESTA[i:i + 3] for i in range(0, len(RESPUESTA), 3)]
+    for fragmento in fragmentos:
+        parser.alimentar(fragmento)
+    assert parser.texto_completo == RESPUESTA
+    assert parser.finalizar()["paragraphs"][-1] == "Tercer párrafo."
+
+
+def main():
+    print("🧪 Test del streaming de respuestas LLM...")
+    test_parser_caracter_a_caracter()
+    print("✅ Parser incremental carácter a carácter")
+    test_parser_sin_marcadores()
+    print("✅ Fallback sin marcadores")
+    test_stream_blackbox_contra_mock()
+    print("✅ Streaming progresivo y corte por presupuesto")
+    test_lote_reenvia_callbacks()
+    print("✅ El lote paralelo reenvía título y párrafos")
+    test_texto_completo_por_fragmentos()
+    print("✅ Texto completo armado por fragmentos")
+
+
+if __name__ == "__main__":
+    main()
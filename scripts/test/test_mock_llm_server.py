@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test del Servidor LLM Local
+Ejecuta los clientes reales (Blackbox, Gemini, categorizador) contra
+mock_llm_server.py usando el override de base_url, sin red ni cuota
+"""
+
+import sys
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from mock_llm_server import MockLLMConfig, MockLLMServer
+
+ARTICULOS = [
+    {
+        "title": f"El Senado discute la reforma {i}",
+        "description": "Legisladores analizan cambios al presupuesto federal.",
+        "content": "El Senado de la República inició la discusión de la reforma.",
+    }
+    for i in range(8)
+]
+
+
+def test_blackbox_paralelo():
+    """Los workers paralelos reciben artículos con [TÍTULO]/[ARTÍCULO]"""
+    from blackbox_parallel import BlackboxParallelParaphraser
+
+    config = MockLLMConfig(latencia="fija", latencia_media=0.05, seed=1)
+    with MockLLMServer(config=config) as servidor:
+        paraphraser = BlackboxParallelParaphraser(api_keys=["key-a", "key-b"], base_url=servidor.base_url)
+        resultados = paraphraser.parafrasear_lote_paralelo(ARTICULOS, max_workers=4)
+        stats = servidor.obtener_stats()
+
+    assert len(resultados) == len(ARTICULOS)
+    assert all(r.get("paraphrased") for r in resultados)
+    assert all(r["full_text"].count("\n\n") >= 5 for r in resultados)
+    assert stats["por_endpoint"]["chat"] == len(ARTICULOS)
+    assert stats["max_en_vuelo"] > 1
+    assert len(stats["por_key"]) == 2
+
+
+def test_gemini_y_categorizador():
+    """Gemini y el categorizador entienden las respuestas del mock"""
+    from categorizer import NewsCategorizador
+    from gemini_paraphraser import GeminiParaphraser
+
+    with MockLLMServer(config=MockLLMConfig(latencia="cero")) as servidor:
+        gemini = GeminiParaphraser(api_keys=["gemini-key"], base_url=servidor.base_url)
+        resultado = gemini.parafrasear_simple(ARTICULOS[0], delay=0)
+        assert resultado.get("paraphrased")
+
+        categorizador = NewsCategorizador(api_key="mock", base_url=servidor.base_url)
+        categoria, confianza = categorizador.categorizar_con_ia(ARTICULOS[0])
+        assert categoria in NewsCategorizador.CATEGORIAS
+        assert confianza == 0.9
+
+
+def test_inyeccion_429():
+    """Con 100% de 429 el categorizador cae a keywords"""
+    from categorizer import NewsCategorizador
+
+    config = MockLLMConfig(latencia="cero", tasa_429=1.0)
+    with MockLLMServer(config=config) as servidor:
+        categorizador = NewsCategorizador(api_key="mock", base_url=servidor.base_url)
+        categoria, _ = categorizador.categorizar_con_ia(ARTICULOS[0])
+        stats = servidor.obtener_stats()
+
+    assert categoria in NewsCategorizador.CATEGORIAS
+    assert stats["errores"]["429"] == 1
+    assert stats["ok"] == 0
+
+
+def main():
+    print("🧪 Test del servidor LLM local...")
+    test_blackbox_paralelo()
+    print("✅ Blackbox paralelo contra el mock")
+    test_gemini_y_categorizador()
+    print("✅ Gemini y categorizador contra el mock")
+    test_inyeccion_429()
+    print("✅ Inyección de 429 y fallback")
+
+
+if __name__ == "__main__":
+    main()
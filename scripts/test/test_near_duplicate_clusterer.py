@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test del Agrupador de Casi-Duplicados
+Compara MinHash/LSH contra la comparación por pares original y
+verifica el modo incremental
+"""
+
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from benchmark_pipeline import generar_corpus
+from multi_source_synthesizer import MultiSourceSynthesizer
+
+
+def _agrupar_por_pares(synthesizer, articles, threshold=0.6):
+    """Implementación O(n²) de referencia (algoritmo greedy original)"""
+    groups, used = [], set()
+    for i, a1 in enumerate(articles):
+        if i in used:
+            continue
+        group = [a1]
+        used.add(i)
+        k1 = set(synthesizer.extract_keywords(a1["title"]))
+        for j in range(i + 1, len(articles)):
+            if j in used:
+                continue
+            k2 = set(synthesizer.extract_keywords(articles[j]["title"]))
+            keyword_sim = len(k1 & k2) / max(len(k1 | k2), 1)
+            title_sim = SequenceMatcher(None, a1["title"].lower(), articles[j]["title"].lower()).ratio()
+            if keyword_sim * 0.6 + title_sim * 0.4 >= threshold:
+                group.append(articles[j])
+                used.add(j)
+        if len(group) >= 2:
+            groups.append(group)
+    return groups
+
+
+def _firma_grupos(groups):
+    return sorted(tuple(sorted(id(a) for a in g)) for g in groups)
+
+
+def test_mismos_grupos_que_por_pares():
+    """LSH encuentra los mismos grupos que la comparación exhaustiva"""
+    synthesizer = MultiSourceSynthesizer()
+    articles = generar_corpus(400)
+
+    esperados = _agrupar_por_pares(synthesizer, articles)
+    obtenidos = synthesizer.find_similar_articles(articles)
+
+    assert esperados, "el corpus debe tener casi-duplicados"
+    assert _firma_grupos(obtenidos) == _firma_grupos(esperados)
+
+
+def test_modo_incremental():
+    """Agregar en dos tandas da el mismo resultado que en una sola"""
+    synthesizer = MultiSourceSynthesizer()
+    articles = generar_corpus(300)
+
+    clusterer = synthesizer.crear_clusterer()
+    synthesizer.find_similar_articles(articles[:150], clusterer=clusterer)
+    incrementales = synthesizer.find_similar_articles(articles[150:], clusterer=clusterer)
+
+    de_una_vez = synthesizer.find_similar_articles(articles)
+    assert _firma_grupos(incrementales) == _firma_grupos(de_una_vez)
+    # Solo se verificaron pares candidatos, no todos contra todos
+    assert clusterer.stats["verificados"] < len(articles) * (len(articles) - 1) / 2
+
+
+def main():
+    print("🧪 Test del agrupador de casi-duplicados...")
+    test_mismos_grupos_que_por_pares()
+    print("✅ Mismos grupos que la comparación por pares")
+    test_modo_incremental()
+    print("✅ Modo incremental consistente")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test del Agregador Multi-Proveedor
+Usa proveedores simulados para verificar la deduplicación entre proveedores,
+la paginación y que un proveedor lento o con error no bloquea al resto
+"""
+
+import contextlib
+import importlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Añadir directorios scripts y api al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+sys.path.insert(0, str(scripts_dir / "api"))
+
+import aggregator
+from aggregator import NewsAggregator
+
+
+def _articulo(proveedor, i, url=None, titulo=None):
+    return {
+        "source": proveedor,
+        "title": titulo or f"Noticia {i} de {proveedor}",
+        "description": "",
+        "url": url or f"https://{proveedor}.mx/nota-{i}",
+        "full_text": "texto",
+    }
+
+
+def _pagina_rapida(consulta, pagina, page_size, timeout):
+    # 2 páginas completas y una parcial
+    tamanos = {1: page_size, 2: page_size, 3: 1}
+    return [_articulo("rapido", pagina * 100 + i) for i in range(tamanos.get(pagina, 0))]
+
+
+def _pagina_duplicada(consulta, pagina, page_size, timeout):
+    time.sleep(0.05)
+    if pagina > 1:
+        return []
+    return [
+        # Misma nota que el proveedor rápido con tracking distinto
+        _articulo("dup", 0, url="http://www.rapido.mx/nota-100/?utm_source=rss"),
+        # Mismo título con otro espaciado/mayúsculas
+        _articulo("dup", 1, url="https://otro.mx/x", titulo="NOTICIA 101   de rapido"),
+        _articulo("dup", 2),
+    ]
+
+
+def _pagina_lenta(consulta, pagina, page_size, timeout):
+    time.sleep(5)
+    return [_articulo("lento", 0)]
+
+
+def _pagina_con_error(consulta, pagina, page_size, timeout):
+    raise ConnectionError("sin conexión")
+
+
+def _con_proveedores(simulados, funcion):
+    originales = dict(aggregator.PROVEEDORES)
+    try:
+        aggregator.PROVEEDORES.update({nombre: (None, fn) for nombre, fn in simulados.items()})
+        return funcion()
+    finally:
+        aggregator.PROVEEDORES.clear()
+        aggregator.PROVEEDORES.update(originales)
+
+
+def test_fan_out_y_deduplicacion():
+    """Artículos de todos los proveedores, sin duplicados entre ellos"""
+    def ejecutar():
+        agg = NewsAggregator(["rapido", "dup", "falla"], timeout_proveedor=2, max_paginas=5, page_size=3)
+        return agg, agg.descargar(enrich=False, silent=True)
+
+    agg, articles = _con_proveedores(
+        {"rapido": _pagina_rapida, "dup": _pagina_duplicada, "falla": _pagina_con_error}, ejecutar
+    )
+
+    assert agg.stats["rapido"]["paginas"] == 3
+    assert agg.stats["rapido"]["articulos"] == 7
+    assert agg.stats["dup"]["duplicados"] == 2
+    assert agg.stats["falla"]["error"] == "sin conexión"
+    assert len(articles) == 8
+    assert len({a["url"] for a in articles}) == 8
+
+
+def test_proveedor_lento_no_bloquea():
+    """El flujo termina al vencer el tiempo aunque un proveedor siga colgado"""
+    def ejecutar():
+        agg = NewsAggregator(["rapido", "lento"], timeout_proveedor=0.2, max_paginas=1, page_size=3)
+        agg_iter = agg.iterar()
+        # El primer artículo llega sin esperar al proveedor lento
+        inicio = time.monotonic()
+        primero = next(agg_iter)
+        al_primero = time.monotonic() - inicio
+        resto = list(agg_iter)
+        return agg, [primero] + resto, al_primero, time.monotonic() - inicio
+
+    agg, articles, al_primero, total = _con_proveedores(
+        {"rapido": _pagina_rapida, "lento": _pagina_lenta}, ejecutar
+    )
+
+    assert al_primero < 0.5
+    assert total < 5, "no debe esperar al proveedor colgado"
+    assert len(articles) == 3
+    assert agg.stats["lento"]["agotado_tiempo"]
+
+
+def test_max_articulos():
+    """descargar corta el flujo en max_articulos"""
+    def ejecutar():
+        agg = NewsAggregator(["rapido"], timeout_proveedor=2, max_paginas=5, page_size=3)
+        return agg.descargar(max_articulos=4, enrich=False, silent=True)
+
+    assert len(_con_proveedores({"rapido": _pagina_rapida}, ejecutar)) == 4
+
+
+def test_fetchers_silenciosos_ante_errores():
+    """Con silent=True los fetchers propagan el error sin imprimir: lo reporta el agregador"""
+    for nombre in ("newsapi", "newsdata", "apitube", "worldnews"):
+        modulo = importlib.import_module(nombre)
+        original = modulo.API_KEY, modulo.BASE_URL
+        # Puerto cerrado: error de conexión inmediato
+        modulo.API_KEY, modulo.BASE_URL = "test", "http://127.0.0.1:9/"
+        salida = io.StringIO()
+        error = None
+        try:
+            with contextlib.redirect_stdout(salida):
+                getattr(modulo, f"fetch_{nombre}")(silent=True, timeout=2)
+        except Exception as e:
+            error = e
+        finally:
+            modulo.API_KEY, modulo.BASE_URL = original
+        assert error is not None, f"{nombre} debe propagar el error"
+        assert salida.getvalue() == "", f"{nombre} imprimió: {salida.getvalue()!r}"
+
+
+def main():
+    print("🧪 Test del agregador multi-proveedor...")
+    test_fan_out_y_deduplicacion()
+    print("✅ Fan-out y deduplicación entre proveedores")
+    test_proveedor_lento_no_bloquea()
+    print("✅ Proveedor lento no bloquea")
+    test_max_articulos()
+    print("✅ Límite de artículos")
+    test_fetchers_silenciosos_ante_errores()
+    print("✅ Fetchers silenciosos ante errores")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test de la Instrumentación del Pipeline
+Verifica el trace JSON-lines, los agregados y la exportación Chrome/Perfetto
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from pipeline_tracer import PipelineTracer, activar_tracer, exportar_chrome_trace, trazar
+
+
+def test_trace_y_exportacion():
+    """Los spans anidados se escriben, se agregan y se exportan"""
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = Path(tmp) / "trace_test.jsonl"
+        tracer = PipelineTracer(trace_path, run_id="test")
+        activar_tracer(tracer)
+
+        try:
+            with tracer.span("paso_1_descargar_noticias", "paso"):
+                for _ in range(3):
+                    with trazar("llm.blackbox", "llm", modelo="test") as span:
+                        span.registrar_bytes(entrada=100, salida=40)
+                with trazar("http.imagen_newsapi", "http") as span:
+                    span.marcar_cache_hit()
+                try:
+                    with trazar("whois.local", "whois"):
+                        raise TimeoutError("sin respuesta")
+                except TimeoutError:
+                    pass
+        finally:
+            activar_tracer(None)
+            tracer.cerrar()
+
+        eventos = [json.loads(l) for l in trace_path.read_text(encoding="utf-8").splitlines()]
+        assert len(eventos) == 6
+        assert eventos[-1]["nombre"] == "paso_1_descargar_noticias"
+        assert eventos[0]["atributos"] == {"modelo": "test"}
+
+        resumen = tracer.resumen()
+        assert resumen["llm.blackbox"]["llamadas"] == 3
+        assert resumen["llm.blackbox"]["bytes_in"] == 300
+        assert resumen["http.imagen_newsapi"]["cache_hits"] == 1
+        assert resumen["whois.local"]["errores"] == 1
+
+        chrome_path = exportar_chrome_trace(trace_path, Path(tmp) / "trace.chrome.json")
+        with open(chrome_path, "r", encoding="utf-8") as f:
+            chrome = json.load(f)
+        assert len(chrome["traceEvents"]) == 6
+        assert all(e["ph"] == "X" for e in chrome["traceEvents"])
+
+
+def test_resumen_de_worker():
+    """Los spans de un tracer en memoria se suman a otro tracer y su trace"""
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = Path(tmp) / "trace_test.jsonl"
+        principal = PipelineTracer(trace_path, run_id="test")
+        worker = PipelineTracer(en_memoria=True)
+
+        with principal.span("imagen.og_encode", "imagen") as span:
+            span.registrar_bytes(salida=10)
+        for _ in range(2):
+            with worker.span("imagen.og_encode", "imagen") as span:
+                span.registrar_bytes(salida=5)
+
+        resumen = worker.tomar_resumen()
+        assert len(resumen["eventos"]) == 2 and worker.resumen() == {}
+        assert worker.tomar_resumen()["eventos"] == []
+        principal.sumar_resumen(resumen)
+        principal.sumar_resumen(None)
+        principal.cerrar()
+
+        agregado = principal.resumen()["imagen.og_encode"]
+        assert agregado["llamadas"] == 3 and agregado["bytes_out"] == 20
+        eventos = [json.loads(l) for l in trace_path.read_text(encoding="utf-8").splitlines()]
+        assert len(eventos) == 3 and all(e["run_id"] == "test" for e in eventos)
+        # Los inicios del worker quedan en la escala del tracer principal
+        assert eventos[1]["inicio_us"] >= eventos[0]["inicio_us"]
+
+
+def test_tracer_inactivo():
+    """Sin tracer activo, trazar no escribe nada ni falla"""
+    with trazar("llm.gemini", "llm") as span:
+        span.registrar_bytes(entrada=10)
+    assert span.bytes_in == 10
+
+
+def main():
+    print("🧪 Test de instrumentación del pipeline...")
+    test_trace_y_exportacion()
+    print("✅ Trace JSON-lines, agregados y exportación Chrome correctos")
+    test_resumen_de_worker()
+    print("✅ Spans de un worker sumados al tracer principal")
+    test_tracer_inactivo()
+    print("✅ Tracer inactivo sin efectos")
+
+
+if __name__ == "__main__":
+    main()
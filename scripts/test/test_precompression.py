@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test de la Precompresión
+Verifica las variantes .gz, que los archivos sin cambios no se recompriman,
+las tasas del manifiesto y la limpieza de variantes sobrantes
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from precompression import MANIFIESTO, Precompressor, formatos_disponibles
+
+HTML = "<!DOCTYPE html><html><body>" + "<p>Noticias del día en México.</p>" * 100 + "</body></html>"
+
+
+def _sitio(tmp: Path):
+    (tmp / "categoria").mkdir()
+    (tmp / "images").mkdir()
+    (tmp / "index.html").write_text(HTML, encoding="utf-8")
+    (tmp / "categoria" / "economia.html").write_text(HTML.replace("México", "Economía"), encoding="utf-8")
+    (tmp / "style.css").write_text("body { margin: 0; padding: 0; }\n" * 40, encoding="utf-8")
+    (tmp / "mini.js").write_text("x()", encoding="utf-8")
+    (tmp / "images" / "news_1.jpg").write_bytes(os.urandom(2048))
+
+
+def test_variantes_y_manifiesto():
+    """Variantes .gz válidas solo para archivos comprimibles y no diminutos"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        _sitio(tmp)
+        resumen = Precompressor(formatos=["gzip"]).comprimir_sitio(tmp)
+
+        assert resumen["archivos"] == 4 and resumen["comprimidos"] == 3
+        assert gzip.decompress((tmp / "index.html.gz").read_bytes()).decode("utf-8") == HTML
+        assert (tmp / "categoria" / "economia.html.gz").exists()
+        assert not (tmp / "mini.js.gz").exists() and not (tmp / "images" / "news_1.jpg.gz").exists()
+        assert (tmp / "index.html.gz").stat().st_mtime_ns == (tmp / "index.html").stat().st_mtime_ns
+
+        gz = resumen["formatos"]["gzip"]
+        assert gz["archivos"] == 3 and 0 < gz["tasa"] < 0.2
+        with open(tmp / MANIFIESTO, encoding="utf-8") as f:
+            manifiesto = json.load(f)
+        assert manifiesto["archivos"]["index.html"]["gzip"] == (tmp / "index.html.gz").stat().st_size
+        assert manifiesto["resumen"]["formatos"]["gzip"]["tasa"] == gz["tasa"]
+
+
+def test_incremental():
+    """Sin cambios de contenido no se recomprime; un archivo editado sí"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        _sitio(tmp)
+        precompressor = Precompressor(formatos=["gzip"])
+        precompressor.comprimir_sitio(tmp)
+        contenido_css = (tmp / "style.css.gz").read_bytes()
+
+        # El build reescribe index.html con el mismo contenido (mtime nuevo)
+        (tmp / "index.html").write_text(HTML, encoding="utf-8")
+        (tmp / "style.css").write_text("body { color: red; }\n" * 40, encoding="utf-8")
+        resumen = precompressor.comprimir_sitio(tmp)
+
+        assert resumen["comprimidos"] == 1 and resumen["omitidos"] == 3
+        assert (tmp / "style.css.gz").read_bytes() != contenido_css
+        # La variante sigue vigente para el servidor: mismo mtime que el original
+        assert (tmp / "index.html.gz").stat().st_mtime_ns == (tmp / "index.html").stat().st_mtime_ns
+
+        (tmp / "categoria" / "economia.html").unlink()
+        precompressor.comprimir_sitio(tmp)
+        assert not (tmp / "categoria" / "economia.html.gz").exists()
+
+
+def test_formatos():
+    assert formatos_disponibles()[0] == "gzip"
+    try:
+        Precompressor(formatos=["lzma"])
+        assert False, "Debe rechazar formatos no disponibles"
+    except ValueError:
+        pass
+
+
+def main():
+    print("🧪 Test de la precompresión...")
+    test_variantes_y_manifiesto()
+    print("✅ Variantes .gz y manifiesto con tasas")
+    test_incremental()
+    print("✅ Archivos sin cambios omitidos y variantes sobrantes borradas")
+    test_formatos()
+    print(f"✅ Formatos disponibles: {', '.join(formatos_disponibles())}")
+
+
+if __name__ == "__main__":
+    main()
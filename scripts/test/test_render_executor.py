@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Test del Ejecutor de Render
+Renderiza páginas de artículos, categorías y legales en el proceso
+principal y en un pool de procesos, y verifica que el resultado sea el
+mismo, que el progreso llegue al total, que los errores de una página no
+detengan el resto y que los workers publiquen en el bucket
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from render_executor import (
+    PAGINAS_LEGALES,
+    ContextoSitio,
+    RenderExecutor,
+    renderizar_articulo,
+    renderizar_etiqueta,
+    renderizar_legal,
+    renderizar_og,
+    renderizar_pagina_categoria,
+)
+from pipeline_tracer import PipelineTracer, activar_tracer
+from section_generator import SectionGenerator
+from storage_backend import MANIFIESTO_BUCKET, crear_storage
+
+METADATA = {"nombre": "Diario", "dominio": "diario.mx", "tagline": "Noticias", "site_name": "Diario"}
+
+
+def _paginas(total: int):
+    return [
+        {
+            "idx": idx,
+            "noticia": {
+                "title": f"Nota {idx}",
+                "category": "Economía",
+                "published_at": "2026-10-01T10:00:00",
+                "full_text": f"Primer párrafo de la nota {idx}.\n\nSegundo párrafo.",
+            },
+            "relacionados": [{"_display_index": i, "title": f"Nota {i}"} for i in range(1, 4) if i != idx],
+            "etiquetas": ["presupuesto"],
+            "seo": f'<meta name="description" content="Nota {idx}">',
+            "preloader": {"html": "<div id='preloader'></div>", "css": "#preloader{}", "js": ""} if idx == 1 else None,
+        }
+        for idx in range(1, total + 1)
+    ]
+
+
+def _renderizar(executor: RenderExecutor, site_dir: Path, paginas):
+    progreso = []
+    resultado = executor.renderizar(
+        renderizar_articulo,
+        ContextoSitio(site_dir, METADATA, logo_path=None),
+        paginas,
+        lambda hechas, total: progreso.append((hechas, total)),
+    )
+    return resultado, progreso
+
+
+def test_en_proceso():
+    """Con un solo proceso se renderiza en el principal, por lotes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = Path(tmp)
+        executor = RenderExecutor(max_workers=1, tamano_lote=4)
+        resultado, progreso = _renderizar(executor, site_dir, _paginas(10))
+
+        assert resultado["paginas"] == 10 and resultado["procesos"] == 1
+        assert progreso == [(4, 10), (8, 10), (10, 10)]
+        html = (site_dir / "article_1.html").read_text(encoding="utf-8")
+        assert "<title>Nota 1 - Diario</title>" in html and "id='preloader'" in html
+        assert '<p class="lead">Primer párrafo de la nota 1.</p>' in html
+        assert 'href="article_2.html"' in html and '<a href="etiqueta/presupuesto.html" class="tag">presupuesto</a>' in html
+        assert "preloader" not in (site_dir / "article_2.html").read_text(encoding="utf-8")
+        assert resultado["valores"][1] == (site_dir / "article_2.html").stat().st_size
+
+
+def test_pool_igual_que_en_proceso():
+    """El pool escribe exactamente las mismas páginas"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paginas = _paginas(40)
+        _renderizar(RenderExecutor(max_workers=1), tmp / "uno", paginas)
+        with RenderExecutor(max_workers=2, min_paginas_pool=1) as executor:
+            resultado, progreso = _renderizar(executor, tmp / "pool", paginas)
+            # El pool se reutiliza entre llamadas
+            segundo = executor.renderizar(
+                renderizar_legal, ContextoSitio(tmp / "pool", METADATA), list(PAGINAS_LEGALES)
+            )
+
+        assert resultado["paginas"] == 40 and 1 <= resultado["procesos"] <= 2
+        assert progreso[-1] == (40, 40) and len(progreso) == 8
+        for idx in range(1, 41):
+            nombre = f"article_{idx}.html"
+            assert (tmp / "pool" / nombre).read_bytes() == (tmp / "uno" / nombre).read_bytes()
+        assert segundo["paginas"] == 4 and (tmp / "pool" / "faqs.html").exists()
+
+
+def test_pool_publica_en_bucket():
+    """Los workers crean su storage con crear_storage y publican directo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        anterior = os.environ.get("S3_LOCAL_DIR")
+        os.environ["S3_LOCAL_DIR"] = str(tmp / "bucket")
+        try:
+            storage = crear_storage(tmp / "build", "local")
+            paginas = _paginas(20)
+            executor = RenderExecutor(
+                max_workers=2, min_paginas_pool=1, storage=storage, raiz=tmp / "build", tipo_storage="local"
+            )
+            with executor:
+                _renderizar(executor, tmp / "build" / "site_1", paginas)
+                stats = storage.esperar()
+                assert stats["subidos"] == 20 and stats["escritos"] == 20 and stats["errores"] == []
+
+                # Mismo contenido en otro sitio del mismo orquestador: nada que subir
+                storage.reiniciar_stats()
+                _renderizar(executor, tmp / "build" / "site_1", paginas)
+                stats = storage.esperar()
+                assert stats["subidos"] == 0 and stats["sin_cambios"] == 20 and stats["ya_publicados"] == 20
+        finally:
+            if anterior is None:
+                os.environ.pop("S3_LOCAL_DIR", None)
+            else:
+                os.environ["S3_LOCAL_DIR"] = anterior
+
+        bucket = tmp / "bucket" / "news-generator-sites"
+        indice = json.loads((bucket / MANIFIESTO_BUCKET).read_text(encoding="utf-8"))
+        assert sorted(indice) == sorted(f"site_1/article_{idx}.html" for idx in range(1, 21))
+        assert (bucket / "site_1" / "article_7.html").read_bytes() == (tmp / "build" / "site_1" / "article_7.html").read_bytes()
+
+
+def test_trazas_del_pool():
+    """Los spans de los workers llegan al trace del proceso principal"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        tracer = PipelineTracer(tmp / "trace.jsonl", run_id="test")
+        activar_tracer(tracer)
+        try:
+            with RenderExecutor(max_workers=2, min_paginas_pool=1, tamano_lote=2) as executor:
+                resultado = executor.renderizar(
+                    renderizar_og,
+                    ContextoSitio(tmp, METADATA),
+                    [(idx, {"title": f"Nota {idx}", "category_name": "Economía"}) for idx in range(1, 7)],
+                )
+        finally:
+            activar_tracer(None)
+            tracer.cerrar()
+
+        assert resultado["paginas"] == 6, resultado["errores"]
+        resumen = tracer.resumen()
+        assert resumen["imagen.og_encode"]["llamadas"] == 6
+        assert resumen["render.lote"]["llamadas"] == 3
+        eventos = [json.loads(l) for l in (tmp / "trace.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert {e["pid"] for e in eventos} - {os.getpid()}
+        assert all(e["run_id"] == "test" for e in eventos)
+
+
+def test_errores_por_pagina():
+    """Una página con datos inválidos se reporta sin detener el lote"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paginas = _paginas(5)
+        del paginas[2]["seo"]
+        with RenderExecutor(max_workers=2, min_paginas_pool=1, tamano_lote=2) as executor:
+            resultado, _ = _renderizar(executor, Path(tmp), paginas)
+
+        assert resultado["paginas"] == 4 and len(resultado["errores"]) == 1
+        assert resultado["valores"][2] is None and "'seo'" in resultado["errores"][0]
+        assert not (Path(tmp) / "article_3.html").exists() and (Path(tmp) / "article_4.html").exists()
+
+
+def test_categorias():
+    """Cada página de categoría (portada o archivo) es una tarea; igual que en serie"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        articulos = [
+            {"_display_index": i, "title": f"Nota {i}", "published_at": f"2026-10-{i % 28 + 1:02d}T10:00:00"}
+            for i in range(1, 61)
+        ]
+        categorias = [("economia", "Economía", articulos, ["banxico", "inflacion"]), ("seguridad", "Seguridad", articulos[:3], [])]
+        paleta = {"primary": "#000", "secondary": "#fff"}
+        generador = SectionGenerator(por_pagina=10)
+
+        def planificar(cat_dir):
+            return [
+                generador.planificar_categoria(cat_id, nombre, arts, METADATA, paleta, cat_dir, temas=temas)
+                for cat_id, nombre, arts, temas in categorias
+            ]
+
+        planes = planificar(tmp / "pool" / "categoria")
+        paginas = [pagina for plan in planes for pagina in plan["paginas"]]
+        contexto = ContextoSitio(tmp / "pool", METADATA, color_palette=paleta)
+        with RenderExecutor(max_workers=2, min_paginas_pool=1, tamano_lote=1) as executor:
+            resultado = executor.renderizar(renderizar_pagina_categoria, contexto, paginas)
+        for plan in planes:
+            generador.cerrar_categoria(plan, tmp / "pool" / "categoria")
+
+        # Portada y 5 páginas de archivo de economía, portada de seguridad
+        assert [plan["archivadas"] for plan in planes] == [5, 0]
+        assert resultado["paginas"] == 7 and len(paginas) == 7
+        for cat_id, nombre, arts, temas in categorias:
+            generador.generar_paginas_categoria(cat_id, nombre, arts, METADATA, paleta, tmp / "serie" / "categoria", temas=temas)
+        serie = sorted(p.relative_to(tmp / "serie") for p in (tmp / "serie").rglob("*") if p.is_file())
+        assert serie == sorted(p.relative_to(tmp / "pool") for p in (tmp / "pool").rglob("*") if p.is_file())
+        for ruta in serie:
+            assert (tmp / "pool" / ruta).read_bytes() == (tmp / "serie" / ruta).read_bytes()
+
+        portada = (tmp / "pool" / "categoria" / "economia.html").read_text(encoding="utf-8")
+        assert 'href="../etiqueta/banxico.html"' in portada
+        assert "etiqueta/" not in (tmp / "pool" / "categoria" / "economia" / "page" / "1.html").read_text(encoding="utf-8")
+
+        # Otra generación sin cambios: solo las portadas
+        planes = planificar(tmp / "pool" / "categoria")
+        assert [len(plan["paginas"]) for plan in planes] == [1, 1] and planes[0]["omitidas"] == 5
+
+
+def test_etiquetas():
+    """Páginas de etiqueta con la categoría de cada artículo y sin RSS"""
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = Path(tmp)
+        articulos = [
+            {"_display_index": i, "title": f"Nota {i}", "category_name": "Economía"} for i in (4, 1)
+        ]
+        contexto = ContextoSitio(site_dir, METADATA, color_palette={"primary": "#000", "secondary": "#fff"})
+        resultado = RenderExecutor(max_workers=1).renderizar(renderizar_etiqueta, contexto, [("banxico", articulos)])
+
+        html = (site_dir / "etiqueta" / "banxico.html").read_text(encoding="utf-8")
+        assert resultado["paginas"] == 1 and not resultado["errores"]
+        assert html.index("article_4.html") < html.index("article_1.html")
+        assert "#banxico" in html and ">Economía<" in html and "feed_" not in html
+
+
+def main():
+    print("🧪 Test del ejecutor de render...")
+    test_en_proceso()
+    print("✅ Render por lotes en el proceso principal")
+    test_pool_igual_que_en_proceso()
+    print("✅ Pool de procesos con el mismo resultado")
+    test_pool_publica_en_bucket()
+    print("✅ Workers que publican en el bucket")
+    test_trazas_del_pool()
+    print("✅ Spans de los workers en el trace principal")
+    test_errores_por_pagina()
+    print("✅ Errores por página")
+    test_categorias()
+    print("✅ Páginas de categoría repartidas en el pool")
+    test_etiquetas()
+    print("✅ Páginas de etiqueta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test del Generador RSS
+Verifica que los feeds en streaming sean XML válido con escapes correctos,
+que la pasada única reparta los items entre feed general y por categoría,
+que se respete el máximo de items por feed, las salidas Atom y JSON Feed y
+que el manifiesto permita omitir los feeds sin cambios
+"""
+
+import json
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from rss_generator import RSSGenerator
+
+SITIO = {"site_name": "Diario & Cía", "site_url": "https://diario.mx", "tagline": "Noticias"}
+NS = {"content": "http://purl.org/rss/1.0/modules/content/", "atom": "http://www.w3.org/2005/Atom"}
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _articulos(total: int):
+    return [
+        {
+            "title": f"Nota {i} <urgente>",
+            "description": "<p>Reforma &amp; consulta</p>",
+            "full_text": "Texto con <b>negritas</b> y ]]> en medio",
+            "published_at": "2025-01-15T10:30:00Z",
+            "category_id": "economia" if i % 2 else "seguridad",
+            "category_name": "Economía" if i % 2 else "Seguridad",
+            "_display_index": i,
+        }
+        for i in range(1, total + 1)
+    ]
+
+
+def test_item_valido():
+    """Texto plano escapado una vez, CDATA real, fecha RFC 822 y atom:link con el nombre del feed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = RSSGenerator().generar_rss(_articulos(1), SITIO, output_file=str(Path(tmp) / "feed.xml"))
+        canal = ET.parse(ruta).getroot().find("channel")
+
+    assert canal.findtext("title") == "Diario & Cía"
+    assert canal.find("atom:link", NS).get("href") == "https://diario.mx/feed.xml"
+
+    item = canal.find("item")
+    assert item.findtext("title") == "Nota 1 <urgente>"
+    assert item.findtext("link") == "https://diario.mx/article_1.html"
+    assert item.findtext("description") == "Reforma & consulta"
+    assert item.findtext("content:encoded", namespaces=NS) == "Texto con <b>negritas</b> y ]]> en medio"
+    assert item.findtext("pubDate") == "Wed, 15 Jan 2025 10:30:00 +0000"
+
+
+def test_feeds_en_una_pasada():
+    """Feed general y por categoría con el tope de items de cada uno"""
+    with tempfile.TemporaryDirectory() as tmp:
+        feeds = RSSGenerator(max_items=3).generar_feeds_por_categoria(_articulos(10), SITIO, tmp, verbose=False)
+        assert set(feeds) == {"general", "economia", "seguridad"}
+
+        general = ET.parse(feeds["general"]).getroot().find("channel")
+        assert [i.findtext("link")[-14:] for i in general.findall("item")] == ["article_1.html", "article_2.html", "article_3.html"]
+
+        economia = ET.parse(feeds["economia"]).getroot().find("channel")
+        assert [i.findtext("link").rsplit("/", 1)[1] for i in economia.findall("item")] == [
+            "article_1.html", "article_3.html", "article_5.html"
+        ]
+        assert economia.find("atom:link", NS).get("href") == "https://diario.mx/feed_economia.xml"
+
+
+def test_atom_y_json_feed():
+    """Los tres formatos con los mismos items y la fecha del artículo más reciente"""
+    articulos = _articulos(3)
+    articulos[1]["published_at"] = "2025-02-01T08:00:00Z"
+    with tempfile.TemporaryDirectory() as tmp:
+        RSSGenerator().generar_feeds_por_categoria(articulos, SITIO, tmp, verbose=False)
+        tmp = Path(tmp)
+
+        canal = ET.parse(tmp / "feed.xml").getroot().find("channel")
+        assert canal.findtext("lastBuildDate") == "Sat, 01 Feb 2025 08:00:00 +0000"
+
+        atom = ET.parse(tmp / "feed.atom").getroot()
+        assert atom.findtext(f"{ATOM}updated") == "2025-02-01T08:00:00Z"
+        entradas = atom.findall(f"{ATOM}entry")
+        assert [e.findtext(f"{ATOM}title") for e in entradas] == ["Nota 1 <urgente>", "Nota 2 <urgente>", "Nota 3 <urgente>"]
+        assert entradas[0].find(f"{ATOM}link").get("href") == "https://diario.mx/article_1.html"
+
+        with open(tmp / "feed.json", encoding="utf-8") as f:
+            feed = json.load(f)
+        assert feed["version"] == "https://jsonfeed.org/version/1.1"
+        assert feed["feed_url"] == "https://diario.mx/feed.json"
+        assert feed["items"][0]["summary"] == "Reforma & consulta"
+        assert feed["items"][1]["date_published"] == "2025-02-01T08:00:00Z"
+
+        with open(tmp / "feed_economia.json", encoding="utf-8") as f:
+            assert [i["url"][-14:] for i in json.load(f)["items"]] == ["article_1.html", "article_3.html"]
+
+
+def test_manifiesto_incremental():
+    """Una segunda generación igual no reescribe; un cambio solo toca sus feeds"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        generador = RSSGenerator()
+        articulos = _articulos(4)
+        generador.generar_feeds_por_categoria(articulos, SITIO, tmp, verbose=False)
+
+        with open(tmp / "feeds_manifest.json", encoding="utf-8") as f:
+            manifiesto = json.load(f)["feeds"]
+        assert len(manifiesto) == 9
+        general = manifiesto["feed.xml"]
+        assert general["etag"].startswith('"') and len(general["etag"]) == 34
+        assert general["last_modified"].endswith(" GMT")
+        assert general["content_type"] == "application/rss+xml; charset=utf-8"
+        assert manifiesto["feed.json"]["content_type"] == "application/feed+json; charset=utf-8"
+        assert general["bytes"] == (tmp / "feed.xml").stat().st_size
+
+        def _mtimes():
+            return {p.name: p.stat().st_mtime_ns for p in tmp.glob("feed*") if p.name != "feeds_manifest.json"}
+
+        mtimes = _mtimes()
+        generador.generar_feeds_por_categoria(articulos, SITIO, tmp, verbose=False)
+        assert _mtimes() == mtimes
+        with open(tmp / "feeds_manifest.json", encoding="utf-8") as f:
+            assert json.load(f)["feeds"] == manifiesto
+
+        # Un artículo de seguridad cambia: se reescriben general y seguridad, no economía
+        articulos[1]["title"] = "Nota 2 corregida"
+        generador.generar_feeds_por_categoria(articulos, SITIO, tmp, verbose=False)
+        cambiados = {nombre for nombre, mtime in _mtimes().items() if mtime != mtimes[nombre]}
+        assert cambiados == {"feed.xml", "feed.atom", "feed.json", "feed_seguridad.xml", "feed_seguridad.atom", "feed_seguridad.json"}
+
+        # Sin artículos de economía su feed desaparece
+        generador.generar_feeds_por_categoria([a for a in articulos if a["category_id"] != "economia"], SITIO, tmp, verbose=False)
+        assert not list(tmp.glob("feed_economia.*"))
+
+
+def main():
+    print("🧪 Test del generador RSS...")
+    test_item_valido()
+    print("✅ Item con escapes, CDATA y fecha RFC 822")
+    test_feeds_en_una_pasada()
+    print("✅ Feeds general y por categoría en una pasada")
+    test_atom_y_json_feed()
+    print("✅ Salidas Atom y JSON Feed")
+    test_manifiesto_incremental()
+    print("✅ Manifiesto con ETag/Last-Modified y feeds sin cambios omitidos")
+
+
+if __name__ == "__main__":
+    main()
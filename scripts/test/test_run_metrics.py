@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test del Almacén de Métricas de Ejecución
+Verifica la ingesta incremental de run_summary y los percentiles por paso
+"""
+
+import json
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from run_metrics import RunMetricsStore
+
+
+def _escribir_resumen(directorio: Path, run_id: str, articulos: int, segundos: float, site_num: int):
+    """Escribe un run_summary con la misma estructura que el orquestador"""
+    resumen = {
+        "success": True,
+        "run_id": run_id,
+        "sitios_generados": [
+            {"index_path": "index.html", "site_dir": f"site_{site_num}", "site_num": site_num, "num_articulos": articulos}
+        ],
+        "stats": {
+            "imagenes_generadas": articulos,
+            "sitios_creados": 1,
+            "tiempo_inicio": 1769000000.0,
+            "total_articulos": articulos,
+            "tiempo_total_segundos": segundos,
+        },
+        "tiempos_pasos": {"paso_1_descargar_noticias": segundos / 10, "paso_3_generar_imagenes": segundos / 2},
+    }
+    with open(directorio / f"run_summary_{run_id}.json", "w", encoding="utf-8") as f:
+        json.dump(resumen, f)
+
+
+def test_ingesta_incremental():
+    """Los resúmenes se ingieren una sola vez y los totales son reales"""
+    with tempfile.TemporaryDirectory() as tmp:
+        directorio = Path(tmp)
+        _escribir_resumen(directorio, "20260101_000000", 100, 600.0, 1)
+        _escribir_resumen(directorio, "20260102_000000", 80, 300.0, 2)
+
+        store = RunMetricsStore(directorio)
+        assert store.ingestar() == 2
+        assert store.ingestar() == 0
+
+        stats = store.obtener_estadisticas()
+        assert stats["total_articulos"] == 180
+        assert stats["total_runs"] == 2
+        assert stats["duracion_total"]["p50"] == 450.0
+        assert stats["pasos"]["paso_3_generar_imagenes"]["count"] == 2
+        assert store.obtener_sitio(2)["articulos"] == 80
+
+        # Un proceso nuevo reutiliza el almacén persistido
+        _escribir_resumen(directorio, "20260103_000000", 20, 60.0, 3)
+        store = RunMetricsStore(directorio)
+        assert store.ingestar() == 1
+        assert store.obtener_estadisticas()["total_articulos"] == 200
+
+
+def _ingestar_en_proceso(directorio: str) -> int:
+    return RunMetricsStore(directorio).ingestar()
+
+
+def test_escritores_concurrentes():
+    """Varios procesos ingiriendo a la vez no chocan y cada resumen cuenta una vez"""
+    with tempfile.TemporaryDirectory() as tmp:
+        directorio = Path(tmp)
+        for i in range(20):
+            _escribir_resumen(directorio, f"202601{i:02d}_000000", 10, 60.0, i)
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            ingeridos = list(executor.map(_ingestar_en_proceso, [tmp] * 8))
+
+        assert sum(ingeridos) == 20
+        stats = RunMetricsStore(directorio).obtener_estadisticas()
+        assert stats["total_runs"] == 20 and stats["total_articulos"] == 200
+        assert not list(directorio.glob("*.tmp"))
+
+
+def main():
+    print("🧪 Test del almacén de métricas de ejecución...")
+    test_ingesta_incremental()
+    print("✅ Ingesta incremental y agregados correctos")
+    test_escritores_concurrentes()
+    print("✅ Escritores concurrentes con lock y temporal único")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test del Índice de Búsqueda BM25
+Verifica búsqueda, artículos relacionados, etiquetas y páginas de etiqueta
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from benchmark_pipeline import generar_corpus
+from search_index import SearchIndex, tokenizar
+
+ARTICULOS = [
+    {"title": "Banxico recorta la tasa de interés", "full_text": "La inflación bajó y Banxico recortó la tasa de interés un cuarto de punto."},
+    {"title": "Selección mexicana gana en el Azteca", "full_text": "La selección venció 2-0 con goles en el segundo tiempo del partido."},
+    {"title": "La inflación de enero sorprende", "full_text": "El INEGI reportó que la inflación de enero quedó por debajo de lo esperado por Banxico."},
+    {"title": "Reforma electoral llega al Senado", "full_text": "Los senadores discutirán la reforma electoral enviada por el Ejecutivo."},
+    {"title": "El peso se aprecia tras decisión de tasa", "full_text": "El peso ganó terreno luego de que Banxico anunciara su decisión sobre la tasa de interés."},
+    {"title": "Partido amistoso de la selección", "full_text": "La selección mexicana jugará un partido amistoso en marzo."},
+]
+
+
+def test_tokenizar():
+    """Sin acentos, sin stopwords ni palabras cortas"""
+    assert tokenizar("La Selección ganó EN el estadio") == ["seleccion", "gano", "estadio"]
+
+
+def test_buscar_y_relacionados():
+    """La búsqueda ignora acentos y los relacionados comparten tema"""
+    indice = SearchIndex.desde_articulos(ARTICULOS)
+
+    assert indice.buscar("inflacion")[0][0] in (0, 2)
+    assert {doc for doc, _ in indice.buscar("selección partido", k=2)} == {1, 5}
+
+    assert set(indice.relacionados(0, k=2)) == {2, 4}
+    assert indice.relacionados(1, k=1) == [5]
+    assert 0 not in indice.relacionados(0)
+    assert "banxico" in indice.etiquetas(0)
+
+
+def test_etiquetas_y_temas():
+    """Páginas de etiqueta por relevancia y temas de un grupo de artículos"""
+    indice = SearchIndex.desde_articulos(ARTICULOS)
+    paginas = indice.documentos_por_etiqueta(3)
+
+    mostradas = {t for doc_id in range(len(ARTICULOS)) for t in indice.etiquetas(doc_id, 3)}
+    assert set(paginas) == mostradas
+    assert set(paginas["banxico"]) == {0, 2, 4}
+    pesos = dict(indice.postings["banxico"])
+    assert [pesos[d] for d in paginas["banxico"]] == sorted(pesos.values(), reverse=True)
+
+    temas = indice.etiquetas_de([0, 2, 4], k=2)
+    assert temas[0] == "banxico" and len(temas) == 2
+    assert indice.etiquetas_de([]) == []
+
+
+def test_relacionados_submilisegundo():
+    """Las consultas de relacionados no crecen con el tamaño del sitio"""
+    corpus = generar_corpus(1000)
+    indice = SearchIndex.desde_articulos(corpus)
+
+    inicio = time.perf_counter()
+    for doc_id in range(len(corpus)):
+        indice.relacionados(doc_id)
+    por_consulta = (time.perf_counter() - inicio) / len(corpus)
+    assert por_consulta < 0.001, f"{por_consulta * 1000:.3f}ms por consulta"
+
+
+def main():
+    print("🧪 Test del índice de búsqueda...")
+    test_tokenizar()
+    print("✅ Tokenización")
+    test_buscar_y_relacionados()
+    print("✅ Búsqueda y relacionados")
+    test_etiquetas_y_temas()
+    print("✅ Páginas de etiqueta y temas")
+    test_relacionados_submilisegundo()
+    print("✅ Relacionados en menos de 1ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test de la Paginación de Categorías
+Verifica el reparto portada/archivo, los enlaces rel=prev/next, los enlaces a
+los artículos del sitio y que al llegar artículos nuevos solo se reescriban las
+primeras páginas
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from section_generator import SectionGenerator
+
+METADATA = {"site_name": "Diario", "site_url": "https://diario.mx"}
+PALETA = {"primary": "#123456", "secondary": "#654321"}
+
+
+def _articulos(total: int):
+    """Más recientes primero, cada uno con su article_N.html estable"""
+    return [
+        {
+            "title": f"Nota {total - i}",
+            "published_at": f"2025-{(total - i) // 28 % 12 + 1:02d}-{(total - i) % 28 + 1:02d}",
+            "_display_index": total - i,
+        }
+        for i in range(total)
+    ]
+
+
+def test_reparto_y_enlaces():
+    """Archivo de páginas completas desde lo más antiguo y portada con el resto"""
+    generador = SectionGenerator(por_pagina=10)
+    with tempfile.TemporaryDirectory() as tmp:
+        cat_dir = Path(tmp)
+        resultado = generador.generar_paginas_categoria("economia", "Economía", _articulos(35), METADATA, PALETA, cat_dir)
+
+        assert resultado["paginas"] == 2
+        portada = (cat_dir / "economia.html").read_text(encoding="utf-8")
+        assert portada.count('class="article-card"') == 15
+        assert '<link rel="next" href="economia/page/2.html">' in portada
+        assert 'href="../article_35.html"' in portada
+
+        pagina_1 = (cat_dir / "economia/page/1.html").read_text(encoding="utf-8")
+        assert pagina_1.count('class="article-card"') == 10
+        assert ">Nota 10<" in pagina_1 and ">Nota 1<" in pagina_1
+        assert '<link rel="prev" href="2.html">' in pagina_1 and 'rel="next"' not in pagina_1
+        assert 'href="../../../article_1.html"' in pagina_1
+        assert 'href="../../../style.css"' in pagina_1
+
+        pagina_2 = (cat_dir / "economia/page/2.html").read_text(encoding="utf-8")
+        assert '<link rel="prev" href="../../economia.html">' in pagina_2
+        assert '<link rel="next" href="1.html">' in pagina_2
+
+
+def test_regeneracion_incremental():
+    """Los artículos nuevos solo reescriben la portada y las páginas recientes"""
+    generador = SectionGenerator(por_pagina=10)
+    with tempfile.TemporaryDirectory() as tmp:
+        cat_dir = Path(tmp)
+        generador.generar_paginas_categoria("economia", "Economía", _articulos(35), METADATA, PALETA, cat_dir)
+
+        # Sin cambios en el archivo: solo la portada
+        resultado = generador.generar_paginas_categoria("economia", "Economía", _articulos(38), METADATA, PALETA, cat_dir)
+        assert resultado["escritas"] == [str(cat_dir / "economia.html")]
+        assert resultado["omitidas"] == 2
+
+        # La portada se llena: nace la página 3 y la 2 cambia su enlace a recientes
+        resultado = generador.generar_paginas_categoria("economia", "Economía", _articulos(40), METADATA, PALETA, cat_dir)
+        assert resultado["paginas"] == 3
+        assert sorted(Path(r).name for r in resultado["escritas"]) == ["2.html", "3.html", "economia.html"]
+
+        # Menos artículos: se borran las páginas que sobran
+        generador.generar_paginas_categoria("economia", "Economía", _articulos(12), METADATA, PALETA, cat_dir)
+        assert not list((cat_dir / "economia/page").glob("*.html"))
+
+
+def test_orden_por_fecha():
+    """El orden del sitio (destacados primero) no altera el archivo: se pagina por fecha"""
+    generador = SectionGenerator(por_pagina=10)
+    articulos = _articulos(35)
+    # Destacados al frente, como los deja el gestor de destacados
+    orden_sitio = articulos[20:23] + articulos[:20] + articulos[23:]
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        generador.generar_paginas_categoria("economia", "Economía", articulos, METADATA, PALETA, Path(a))
+        generador.generar_paginas_categoria("economia", "Economía", orden_sitio, METADATA, PALETA, Path(b))
+        for ruta in ("economia.html", "economia/page/1.html", "economia/page/2.html"):
+            assert (Path(a) / ruta).read_text(encoding="utf-8") == (Path(b) / ruta).read_text(encoding="utf-8")
+
+
+def test_pagina_unica_compatible():
+    """generar_pagina_categoria sigue escribiendo todos los artículos en un archivo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = Path(tmp) / "economia.html"
+        SectionGenerator().generar_pagina_categoria("economia", "Economía", _articulos(30), METADATA, PALETA, str(ruta))
+        html = ruta.read_text(encoding="utf-8")
+
+    assert html.count('class="article-card"') == 30
+    assert "30 artículos" in html and html.rstrip().endswith("</html>")
+
+
+def main():
+    print("🧪 Test de paginación de categorías...")
+    test_reparto_y_enlaces()
+    print("✅ Portada, archivo y enlaces rel=prev/next")
+    test_regeneracion_incremental()
+    print("✅ Regeneración incremental")
+    test_orden_por_fecha()
+    print("✅ Archivo ordenado por fecha")
+    test_pagina_unica_compatible()
+    print("✅ Página única compatible")
+
+
+if __name__ == "__main__":
+    main()
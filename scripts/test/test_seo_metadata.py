@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test del Generador de Metadatos SEO
+Verifica el escape de atributos, el JSON-LD válido, el fragmento de sitio
+cacheado, la API por lote y el parseo de fechas
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from seo_metadata_generator import SEOMetadataGenerator
+from utils.fechas import fecha_iso, parsear_fecha
+
+SITIO = {"site_name": "Diario Nacional", "site_url": "https://diario.mx"}
+
+ARTICULO = {
+    "title": 'El "plan B" </script><b>electoral</b>',
+    "description": "Reforma & consulta",
+    "author": "O'Brien",
+    "category_name": "Política & Gobierno",
+    "published_at": "2025-01-15T10:30:00Z",
+    "image_url": "https://img.mx/a.jpg?x=1&y=2",
+}
+
+
+def _json_ld(html: str) -> dict:
+    return json.loads(re.search(r'<script type="application/ld\+json">(.*?)</script>', html, re.S).group(1))
+
+
+def test_escape_y_json_ld():
+    """Los atributos van escapados y el JSON-LD se parsea con el texto original"""
+    html = SEOMetadataGenerator().generar_meta_tags_articulo(ARTICULO, SITIO, "https://diario.mx/article_1.html")
+
+    assert '<meta property="og:title" content="El &quot;plan B&quot; &lt;/script&gt;&lt;b&gt;electoral&lt;/b&gt;">' in html
+    assert 'content="https://img.mx/a.jpg?x=1&amp;y=2"' in html
+    assert '<meta property="article:section" content="Política &amp; Gobierno">' in html
+    assert '<meta property="article:published_time" content="2025-01-15T10:30:00+00:00">' in html
+
+    datos = _json_ld(html)
+    assert datos["headline"] == ARTICULO["title"]
+    assert datos["author"]["name"] == "O'Brien"
+    assert datos["publisher"]["url"] == "https://diario.mx"
+
+
+def test_lote_y_fragmento_cacheado():
+    """El lote da lo mismo que artículo por artículo y reutiliza el head del sitio"""
+    generador = SEOMetadataGenerator()
+    articulos = [ARTICULO, {"title": "Otra nota", "published_at": "2025-02-01"}]
+
+    lote = generador.generar_meta_tags_lote(articulos, SITIO)
+    assert len(lote) == 2
+    assert 'href="https://diario.mx/article_2.html"' in lote[1]
+
+    sin_fecha_mod = lambda html: re.sub(r'(modified_time" content=|"dateModified": )"[^"]*"', "", html)
+    individual = generador.generar_meta_tags_articulo(articulos[1], SITIO, "https://diario.mx/article_2.html")
+    assert sin_fecha_mod(individual) == sin_fecha_mod(lote[1])
+
+    assert generador._fragmento_sitio(SITIO) is generador._fragmento_sitio(dict(SITIO))
+    assert len(generador._fragmentos) == 1
+
+
+def test_fechas():
+    """Fechas de proveedores con 'Z', con hora o solo día; inválidas -> None"""
+    assert fecha_iso("2025-01-15T10:30:00Z") == "2025-01-15T10:30:00+00:00"
+    assert fecha_iso("2025-01-15") == "2025-01-15T00:00:00"
+    assert parsear_fecha("2025-01-15 08:00:00").hour == 8
+    assert fecha_iso("ayer") is None and fecha_iso("") is None
+    assert parsear_fecha(1736935800) is None and fecha_iso(None) is None
+
+
+def main():
+    print("🧪 Test del generador de metadatos SEO...")
+    test_escape_y_json_ld()
+    print("✅ Escape de atributos y JSON-LD válido")
+    test_lote_y_fragmento_cacheado()
+    print("✅ Lote y fragmento de sitio cacheado")
+    test_fechas()
+    print("✅ Parseo de fechas")
+
+
+if __name__ == "__main__":
+    main()
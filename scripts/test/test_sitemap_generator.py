@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test del Generador de Sitemaps
+Verifica el índice y las partes, lastmod, la extensión de imágenes y que una
+reconstrucción solo reescriba las partes que cambiaron
+"""
+
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from sitemap_generator import SitemapGenerator, lastmod_w3c
+
+NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9", "image": "http://www.google.com/schemas/sitemap-image/1.1"}
+SITE_URL = "https://diario.mx"
+
+
+def _sitio(tmp: Path, total: int):
+    """Sitio mínimo en disco; el artículo N es el N-ésimo más reciente"""
+    (tmp / "images").mkdir(exist_ok=True)
+    (tmp / "categoria").mkdir(exist_ok=True)
+    for nombre in ("index.html", "categorias.html", "categoria/economia.html"):
+        (tmp / nombre).write_text("<html></html>", encoding="utf-8")
+    (tmp / "images" / "news_1.jpg").write_bytes(b"jpg")
+    return [{"title": f"Nota {i}", "published_at": f"2025-01-{(total - i) % 28 + 1:02d}T10:00:00Z"} for i in range(1, total + 1)]
+
+
+def _locs(ruta: Path):
+    return [u.findtext("sm:loc", namespaces=NS) for u in ET.parse(ruta).getroot().findall("sm:url", NS)]
+
+
+def test_indice_partes_e_imagenes():
+    """25 artículos + 3 páginas con 10 URLs por parte: 3 partes en el índice"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        articles = _sitio(tmp, 25)
+        generador = SitemapGenerator(max_urls=10)
+        resultado = generador.generar(tmp, SITE_URL, generador.entradas_sitio(tmp, SITE_URL, articles))
+
+        assert resultado == {"partes": 3, "urls": 28, "reescritas": 3, "omitidas": 0}
+        indice = ET.parse(tmp / "sitemap.xml").getroot()
+        assert [s.findtext("sm:loc", namespaces=NS) for s in indice] == [f"{SITE_URL}/sitemap-{n}.xml" for n in (1, 2, 3)]
+
+        # Del más antiguo al más nuevo; las páginas fijas al final
+        assert _locs(tmp / "sitemap-1.xml")[0] == f"{SITE_URL}/article_25.html"
+        assert _locs(tmp / "sitemap-3.xml")[-3:] == [f"{SITE_URL}/", f"{SITE_URL}/categorias.html", f"{SITE_URL}/categoria/economia.html"]
+
+        urls = ET.parse(tmp / "sitemap-3.xml").getroot().findall("sm:url", NS)
+        nuevo = next(u for u in urls if u.findtext("sm:loc", namespaces=NS).endswith("article_1.html"))
+        assert nuevo.findtext("image:image/image:loc", namespaces=NS) == f"{SITE_URL}/images/news_1.jpg"
+        assert nuevo.findtext("sm:lastmod", namespaces=NS) == "2025-01-25T10:00:00Z"
+
+
+def test_reescritura_incremental():
+    """Una URL nueva al final solo reescribe la última parte; las sobrantes se borran"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        generador = SitemapGenerator(max_urls=10)
+        entradas = [(f"{SITE_URL}/article_{i}.html", "2025-01-01", None) for i in range(25, 0, -1)]
+        generador.generar(tmp, SITE_URL, entradas)
+        mtime_1 = (tmp / "sitemap-1.xml").stat().st_mtime_ns
+
+        resultado = generador.generar(tmp, SITE_URL, entradas + [(f"{SITE_URL}/article_26.html", "2025-01-02", None)])
+        assert resultado == {"partes": 3, "urls": 26, "reescritas": 1, "omitidas": 2}
+        assert (tmp / "sitemap-1.xml").stat().st_mtime_ns == mtime_1
+        assert ET.parse(tmp / "sitemap.xml").getroot()[2].findtext("sm:lastmod", namespaces=NS) == "2025-01-02"
+
+        generador.generar(tmp, SITE_URL, entradas[:5])
+        assert not (tmp / "sitemap-2.xml").exists() and not (tmp / "sitemap-3.xml").exists()
+
+
+def test_limite_de_bytes():
+    """Una parte no supera max_bytes aunque no llegue a max_urls"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        entradas = [(f"{SITE_URL}/article_{i}.html", None, None) for i in range(100)]
+        resultado = SitemapGenerator(max_bytes=2000).generar(tmp, SITE_URL, entradas)
+
+        assert resultado["urls"] == 100 and resultado["partes"] > 1
+        for parte in tmp.glob("sitemap-*.xml"):
+            assert parte.stat().st_size <= 2000
+            ET.parse(parte)
+
+
+def test_lastmod_w3c():
+    assert lastmod_w3c("2025-01-15T10:30:00Z") == "2025-01-15T10:30:00Z"
+    assert lastmod_w3c("2025-01-15") == "2025-01-15"
+    assert lastmod_w3c("sin fecha") is None
+
+
+def main():
+    print("🧪 Test del generador de sitemaps...")
+    test_indice_partes_e_imagenes()
+    print("✅ Índice, partes, lastmod e imágenes")
+    test_reescritura_incremental()
+    print("✅ Reescritura incremental")
+    test_limite_de_bytes()
+    print("✅ Límite de bytes por parte")
+    test_lastmod_w3c()
+    print("✅ Formato de lastmod")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test del Servidor Estático Multi-sitio
+Verifica el enrutado por host y por prefijo, las variantes precomprimidas,
+las respuestas 304 con ETag/Last-Modified (incluidos los del manifiesto de
+feeds), los headers de caché y que las rutas no salgan del sitio
+"""
+
+import gzip
+import http.client
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from static_site_server import StaticSiteServer, codificaciones_aceptadas
+
+HTML = "<!DOCTYPE html><html><body>" + "Noticias del día. " * 200 + "</body></html>"
+
+
+def _sitios(tmp: Path):
+    for n in (1, 2):
+        sitio = tmp / f"site_{n}"
+        (sitio / "categoria").mkdir(parents=True)
+        (sitio / "index.html").write_text(HTML.replace("día", f"sitio {n}"), encoding="utf-8")
+        (sitio / "categoria" / "economia.html").write_text("<html>economía</html>", encoding="utf-8")
+        (sitio / "app.3f2a9c1b.js").write_text("console.log(1)", encoding="utf-8")
+        (sitio / "images").mkdir()
+        (sitio / "images" / "news_1.jpg").write_bytes(b"\xff\xd8jpg")
+    (tmp / "secreto.txt").write_text("no", encoding="utf-8")
+
+    indice = tmp / "site_1" / "index.html"
+    with open(indice.with_name("index.html.gz"), "wb") as f:
+        f.write(gzip.compress(indice.read_bytes()))
+
+    feed = tmp / "site_1" / "feed.xml"
+    feed.write_text("<rss/>", encoding="utf-8")
+    manifiesto = {"feeds": {"feed.xml": {"etag": '"abc123"', "bytes": 6, "last_modified": "Wed, 15 Jan 2025 10:30:00 GMT"}}}
+    (tmp / "site_1" / "feeds_manifest.json").write_text(json.dumps(manifiesto), encoding="utf-8")
+
+
+def _get(servidor: StaticSiteServer, ruta: str, headers: dict = None, metodo: str = "GET"):
+    host, port = servidor.httpd.server_address[:2]
+    conexion = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conexion.request(metodo, ruta, headers=headers or {})
+        respuesta = conexion.getresponse()
+        return respuesta.status, dict(respuesta.getheaders()), respuesta.read()
+    finally:
+        conexion.close()
+
+
+def test_enrutado():
+    """Por prefijo, por host, índice de sitios, redirecciones y 404 fuera del sitio"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _sitios(Path(tmp))
+        with StaticSiteServer(tmp) as servidor:
+            status, _, cuerpo = _get(servidor, "/site_2/")
+            assert status == 200 and b"sitio 2" in cuerpo
+
+            status, _, cuerpo = _get(servidor, "/", {"Host": "site_1.localhost:8000"})
+            assert status == 200 and b"sitio 1" in cuerpo
+
+            status, _, cuerpo = _get(servidor, "/")
+            assert status == 200 and b"site_1" in cuerpo and b"site_2" in cuerpo
+
+            status, headers, _ = _get(servidor, "/site_1")
+            assert status == 301 and headers["Location"] == "/site_1/"
+            status, headers, _ = _get(servidor, "/site_1/categoria")
+            assert status == 301 and headers["Location"] == "/site_1/categoria/"
+
+            assert _get(servidor, "/site_1/categoria/economia")[0] == 200
+            assert _get(servidor, "/site_1/../secreto.txt")[0] == 404
+            assert _get(servidor, "/site_1/%2e%2e/secreto.txt")[0] == 404
+            assert _get(servidor, "/site_9/")[0] == 404
+
+
+def test_precomprimidos_y_cache():
+    """Variante .gz si se acepta, Vary, caché inmutable para assets con hash"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _sitios(Path(tmp))
+        with StaticSiteServer(tmp) as servidor:
+            status, headers, cuerpo = _get(servidor, "/site_1/", {"Accept-Encoding": "br;q=0, gzip"})
+            assert status == 200 and headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(cuerpo).decode("utf-8").startswith("<!DOCTYPE html>")
+            assert headers["Vary"] == "Accept-Encoding" and headers["Cache-Control"] == "no-cache"
+            etag_gzip = headers["ETag"]
+
+            status, headers, cuerpo = _get(servidor, "/site_1/")
+            assert "Content-Encoding" not in headers and cuerpo.startswith(b"<!DOCTYPE html>")
+            assert headers["ETag"] != etag_gzip and int(headers["Content-Length"]) == len(cuerpo)
+
+            # Variante más vieja que el original: se ignora
+            indice = Path(tmp) / "site_1" / "index.html"
+            stat = indice.stat()
+            os.utime(indice.with_name("index.html.gz"), ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+            assert "Content-Encoding" not in _get(servidor, "/site_1/", {"Accept-Encoding": "gzip"})[1]
+
+            headers = _get(servidor, "/site_1/app.3f2a9c1b.js")[1]
+            assert headers["Cache-Control"] == "public, max-age=31536000, immutable"
+            assert headers["Content-Type"].startswith("text/javascript")
+            headers = _get(servidor, "/site_1/images/news_1.jpg")[1]
+            assert headers["Cache-Control"] == "public, max-age=3600" and "Vary" not in headers
+
+            status, headers, cuerpo = _get(servidor, "/site_1/", metodo="HEAD")
+            assert status == 200 and cuerpo == b"" and int(headers["Content-Length"]) > 0
+
+
+def test_peticiones_condicionales():
+    """304 con If-None-Match y If-Modified-Since; los feeds usan el manifiesto"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _sitios(Path(tmp))
+        with StaticSiteServer(tmp) as servidor:
+            _, headers, _ = _get(servidor, "/site_2/index.html")
+            status, _, cuerpo = _get(servidor, "/site_2/index.html", {"If-None-Match": headers["ETag"]})
+            assert status == 304 and cuerpo == b""
+            assert _get(servidor, "/site_2/index.html", {"If-Modified-Since": headers["Last-Modified"]})[0] == 304
+            assert _get(servidor, "/site_2/index.html", {"If-None-Match": '"otro"'})[0] == 200
+
+            status, headers, _ = _get(servidor, "/site_1/feed.xml")
+            assert headers["ETag"] == '"abc123"' and headers["Last-Modified"] == "Wed, 15 Jan 2025 10:30:00 GMT"
+            assert _get(servidor, "/site_1/feed.xml", {"If-None-Match": 'W/"abc123"'})[0] == 304
+            assert _get(servidor, "/site_1/feed.xml", {"If-Modified-Since": "Thu, 16 Jan 2025 00:00:00 GMT"})[0] == 304
+            assert _get(servidor, "/site_1/feed.xml", {"If-Modified-Since": "Tue, 14 Jan 2025 00:00:00 GMT"})[0] == 200
+
+
+def test_concurrencia():
+    """Muchas conexiones simultáneas contra varios sitios"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _sitios(Path(tmp))
+        with StaticSiteServer(tmp) as servidor:
+            rutas = [f"/site_{1 + i % 2}/" for i in range(200)]
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                resultados = list(executor.map(lambda r: _get(servidor, r), rutas))
+    assert all(status == 200 for status, _, _ in resultados)
+    assert sum(b"sitio 2" in cuerpo for _, _, cuerpo in resultados) == 100
+
+
+def test_codificaciones_aceptadas():
+    assert codificaciones_aceptadas("gzip, deflate, br") == ["gzip", "deflate", "br"]
+    assert codificaciones_aceptadas("br;q=0, gzip;q=0.5") == ["gzip"]
+    assert codificaciones_aceptadas("") == []
+
+
+def main():
+    print("🧪 Test del servidor estático...")
+    test_enrutado()
+    print("✅ Enrutado por host y prefijo")
+    test_precomprimidos_y_cache()
+    print("✅ Variantes precomprimidas y headers de caché")
+    test_peticiones_condicionales()
+    print("✅ Peticiones condicionales (304)")
+    test_concurrencia()
+    print("✅ Peticiones concurrentes")
+    test_codificaciones_aceptadas()
+    print("✅ Accept-Encoding")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Test del Storage de Sitios
+Verifica la escritura atómica en disco, la publicación en un bucket
+S3-compatible simulado (ClienteS3Local): subidas solo de lo que cambió,
+multipart para archivos grandes, sincronización de archivos escritos
+fuera del storage, los feeds, sitemaps, índice de búsqueda y logos escritos
+por el storage y los resúmenes de los workers del render
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Añadir directorio scripts al path
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from client_search import ClientSearchGenerator
+from logo_generator_svg import LogoGeneratorSVG
+from rss_generator import RSSGenerator
+from search_index import SearchIndex
+from sitemap_generator import SitemapGenerator
+from storage_backend import (
+    MANIFIESTO_BUCKET,
+    ClienteS3Local,
+    DiskStorage,
+    S3Storage,
+    crear_storage,
+)
+
+HTML = "<html><body>" + "<p>Noticias del día</p>" * 50 + "</body></html>"
+
+
+def test_disco():
+    """Escritura atómica: sin cambios no se reemplaza y un error no deja basura"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        storage = DiskStorage()
+        ruta = tmp / "site_1" / "index.html"
+
+        assert storage.escribir(ruta, HTML) is True
+        assert ruta.read_text(encoding="utf-8") == HTML
+        os.utime(ruta, ns=(1, 1))
+        assert storage.escribir(ruta, HTML.encode("utf-8")) is False
+        assert ruta.stat().st_mtime_ns == 1
+
+        try:
+            with storage.abrir(ruta) as f:
+                f.write("<html>a medias")
+                raise RuntimeError("fallo del generador")
+        except RuntimeError:
+            pass
+        assert ruta.read_text(encoding="utf-8") == HTML
+        assert [p.name for p in ruta.parent.iterdir()] == ["index.html"]
+
+        storage.eliminar(ruta)
+        assert not storage.existe(ruta) and storage.leer(ruta) is None
+        assert storage.esperar() == {"escritos": 1, "sin_cambios": 1}
+
+
+def test_s3_incremental():
+    """Primera publicación sube todo; otro build con el mismo contenido nada"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cliente = ClienteS3Local(tmp / "bucket")
+
+        storage = S3Storage(tmp / "build_1", "sitios", cliente=cliente, max_workers=4)
+        for n in range(1, 6):
+            storage.escribir(tmp / "build_1" / "site_1" / f"article_{n}.html", HTML + str(n))
+        storage.copiar(tmp / "build_1" / "site_1" / "article_1.html", tmp / "build_1" / "site_1" / "copia.html")
+        # Fuera de la raíz: solo disco
+        storage.escribir(tmp / "fuera.txt", "local")
+        stats = storage.esperar()
+
+        assert stats["subidos"] == 6 and stats["errores"] == []
+        objeto = tmp / "bucket" / "sitios" / "site_1" / "article_3.html"
+        assert objeto.read_text(encoding="utf-8") == HTML + "3"
+        indice = json.loads((tmp / "bucket" / "sitios" / MANIFIESTO_BUCKET).read_text(encoding="utf-8"))
+        assert len(indice) == 6 and "fuera.txt" not in str(indice)
+
+        # Disco efímero: otro directorio de build, el bucket ya tiene el contenido
+        storage = S3Storage(tmp / "build_2", "sitios", cliente=cliente)
+        for n in range(1, 6):
+            storage.escribir(tmp / "build_2" / "site_1" / f"article_{n}.html", HTML + str(n) + ("!" if n == 5 else ""))
+        storage.eliminar(tmp / "build_2" / "site_1" / "copia.html")
+        stats = storage.esperar()
+
+        assert stats["subidos"] == 1 and stats["ya_publicados"] == 4 and stats["eliminados"] == 1
+        assert not (tmp / "bucket" / "sitios" / "site_1" / "copia.html").exists()
+        indice = json.loads((tmp / "bucket" / "sitios" / MANIFIESTO_BUCKET).read_text(encoding="utf-8"))
+        assert len(indice) == 5
+
+
+def test_multipart():
+    """Archivos grandes en partes, con una parte en memoria a la vez"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cliente = ClienteS3Local(tmp / "bucket")
+        storage = S3Storage(tmp / "build", "sitios", prefijo="prod", cliente=cliente, tamano_parte=1)
+        datos = os.urandom(11 * 1024 * 1024)
+
+        with storage.abrir(tmp / "build" / "site_1" / "video.mp4", "wb") as f:
+            for inicio in range(0, len(datos), 1024 * 1024):
+                f.write(datos[inicio:inicio + 1024 * 1024])
+        stats = storage.esperar()
+
+        # El tamaño de parte se eleva al mínimo de S3 (5 MB): 5 + 5 + 1
+        assert cliente.llamadas["upload_part"] == 3
+        assert cliente.llamadas["complete_multipart_upload"] == 1
+        assert stats["bytes_subidos"] == len(datos)
+        assert (tmp / "bucket" / "sitios" / "prod" / "site_1" / "video.mp4").read_bytes() == datos
+        assert not any((tmp / "bucket" / ".multipart").iterdir())
+
+
+def test_sincronizar():
+    """Los archivos escritos directo a disco se publican, sin variantes precomprimidas"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        site_dir = tmp / "build" / "site_1"
+        storage = S3Storage(tmp / "build", "sitios", cliente=ClienteS3Local(tmp / "bucket"))
+        storage.escribir(site_dir / "index.html", HTML)
+        (site_dir / "sitemap.xml").write_text("<urlset/>", encoding="utf-8")
+        (site_dir / "index.html.gz").write_bytes(b"gz")
+
+        sincronizados = storage.sincronizar(site_dir)
+        stats = storage.esperar()
+
+        assert sincronizados == {"archivos": 2, "publicados": 1}
+        assert stats["subidos"] == 2
+        assert (tmp / "bucket" / "sitios" / "site_1" / "sitemap.xml").exists()
+        assert not (tmp / "bucket" / "sitios" / "site_1" / "index.html.gz").exists()
+
+        assert storage.sincronizar(site_dir)["publicados"] == 0
+
+
+def test_feeds_en_bucket():
+    """Los feeds y su manifiesto se publican al escribirse"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        storage = S3Storage(tmp / "build", "sitios", cliente=ClienteS3Local(tmp / "bucket"))
+        articulos = [
+            {"title": f"Nota {n}", "description": "Resumen", "category_id": "economia", "published_at": "2026-10-01T10:00:00"}
+            for n in range(1, 4)
+        ]
+        metadata = {"site_name": "Diario", "site_url": "https://diario.example"}
+        RSSGenerator(storage=storage).generar_feeds_por_categoria(
+            articulos, metadata, str(tmp / "build" / "site_1"), verbose=False
+        )
+        storage.esperar()
+
+        publicados = sorted(p.name for p in (tmp / "bucket" / "sitios" / "site_1").iterdir())
+        assert publicados == [
+            "feed.atom", "feed.json", "feed.xml",
+            "feed_economia.atom", "feed_economia.json", "feed_economia.xml",
+            "feeds_manifest.json",
+        ]
+
+
+def test_generadores_en_bucket():
+    """Sitemaps, búsqueda y logo se publican sin pasar por sincronizar"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        site_dir = tmp / "build" / "site_1"
+        storage = S3Storage(tmp / "build", "sitios", cliente=ClienteS3Local(tmp / "bucket"))
+        storage.escribir(site_dir / "index.html", HTML)
+
+        articles = [{"title": f"Nota {n}", "published_at": "2026-10-01T10:00:00Z"} for n in range(1, 4)]
+        sitemaps = SitemapGenerator(max_urls=2, storage=storage)
+        sitemaps.generar(site_dir, "https://diario.mx", sitemaps.entradas_sitio(site_dir, "https://diario.mx", articles))
+        indice = SearchIndex()
+        for article in articles:
+            indice.agregar(article["title"], "Presupuesto federal")
+        ClientSearchGenerator(storage=storage).generar(indice, site_dir, {"nombre": "Diario"}, lambda n: f"article_{n}.html")
+        LogoGeneratorSVG(storage=storage).save_logo("<svg/>", str(site_dir / "logo.svg"))
+        storage.esperar()
+
+        assert storage.sincronizar(site_dir)["publicados"] == 0
+        bucket = tmp / "bucket" / "sitios" / "site_1"
+        publicados = {p.relative_to(bucket).as_posix() for p in bucket.rglob("*")}
+        assert {"sitemap.xml", "sitemap-1.xml", "sitemap-2.xml", "sitemap-manifest.json", "search.js", "buscar.html", "logo.svg"} <= publicados
+        assert any(nombre.startswith("search/t_") for nombre in publicados)
+
+
+def test_resumen_de_workers():
+    """Lo publicado por un worker entra al manifiesto y a las stats del principal"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cliente = ClienteS3Local(tmp / "bucket")
+        principal = S3Storage(tmp / "build", "sitios", cliente=cliente)
+        worker = S3Storage(tmp / "build", "sitios", cliente=cliente)
+        for n in range(1, 4):
+            worker.escribir(tmp / "build" / "site_1" / f"article_{n}.html", HTML + str(n))
+        resumen = worker.tomar_resumen()
+
+        # El worker no guarda el manifiesto; sus contadores vuelven a cero
+        assert not (tmp / "bucket" / "sitios" / MANIFIESTO_BUCKET).exists()
+        assert len(resumen["publicados"]) == 3 and worker.stats["subidos"] == 0
+
+        principal.sumar_resumen(resumen)
+        stats = principal.esperar()
+        assert stats["subidos"] == 3 and stats["escritos"] == 3
+        indice = json.loads((tmp / "bucket" / "sitios" / MANIFIESTO_BUCKET).read_text(encoding="utf-8"))
+        assert indice == resumen["publicados"]
+
+        # Otro sitio con el mismo storage: estadísticas desde cero
+        principal.reiniciar_stats()
+        principal.escribir(tmp / "build" / "site_1" / "article_1.html", HTML + "1")
+        assert principal.esperar() == {**stats, "subidos": 0, "bytes_subidos": 0, "escritos": 0, "sin_cambios": 1, "ya_publicados": 1}
+
+
+def test_crear_storage():
+    with tempfile.TemporaryDirectory() as tmp:
+        anterior = {k: os.environ.get(k) for k in ("STORAGE_TYPE", "S3_LOCAL_DIR")}
+        try:
+            os.environ.pop("STORAGE_TYPE", None)
+            assert type(crear_storage(tmp)) is DiskStorage
+            os.environ["STORAGE_TYPE"] = "local"
+            os.environ["S3_LOCAL_DIR"] = os.path.join(tmp, "bucket")
+            storage = crear_storage(tmp)
+            assert isinstance(storage, S3Storage) and isinstance(storage.cliente, ClienteS3Local)
+            try:
+                crear_storage(tmp, "ftp")
+                assert False, "Debe rechazar tipos desconocidos"
+            except ValueError:
+                pass
+        finally:
+            for clave, valor in anterior.items():
+                if valor is None:
+                    os.environ.pop(clave, None)
+                else:
+                    os.environ[clave] = valor
+
+
+def main():
+    print("🧪 Test del storage de sitios...")
+    test_disco()
+    print("✅ Escritura atómica en disco")
+    test_s3_incremental()
+    print("✅ Publicación en bucket solo de lo que cambió")
+    test_multipart()
+    print("✅ Subida multipart de archivos grandes")
+    test_sincronizar()
+    print("✅ Sincronización de archivos escritos fuera del storage")
+    test_feeds_en_bucket()
+    print("✅ Feeds publicados en el bucket")
+    test_generadores_en_bucket()
+    print("✅ Sitemaps, búsqueda y logo publicados en el bucket")
+    test_resumen_de_workers()
+    print("✅ Resúmenes de los workers y estadísticas por sitio")
+    test_crear_storage()
+    print("✅ Selección por STORAGE_TYPE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Endpoint de Blackbox
+URL de chat compartida por los clientes de Blackbox. BLACKBOX_BASE_URL (o el
+base_url de cada cliente) permite apuntar a un servidor compatible, como
+mock_llm_server.py.
+"""
+
+import os
+from typing import Optional
+
+BLACKBOX_BASE_URL_DEFAULT = 'https://api.blackbox.ai'
+
+
+def api_url(base_url: Optional[str] = None) -> str:
+    """
+    URL de chat completions de Blackbox
+
+    Args:
+        base_url: Servidor compatible (default: BLACKBOX_BASE_URL o la API pública)
+
+    Returns:
+        URL de /chat/completions
+    """
+    base = base_url or os.getenv('BLACKBOX_BASE_URL') or BLACKBOX_BASE_URL_DEFAULT
+    return f"{base.rstrip('/')}/chat/completions"
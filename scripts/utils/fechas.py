@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Utilidades de fechas
+Parseo de las fechas que entregan los proveedores ('2025-01-15T10:00:00Z',
+'2025-01-15 10:00:00', '2025-01-15'). Un sitio repite muchas veces las mismas
+fechas entre artículos, feeds y metadatos, así que el parseo se cachea.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=4096)
+def parsear_fecha(valor: str) -> Optional[datetime]:
+    """
+    Convierte una fecha ISO 8601 (con 'Z' o sin hora) a datetime
+
+    Args:
+        valor: Fecha como la entregan los proveedores
+
+    Returns:
+        datetime (con zona si el texto la trae) o None si no se puede parsear
+        (o si no es un str, p. ej. un timestamp numérico)
+    """
+    if not valor or not isinstance(valor, str):
+        return None
+    try:
+        return datetime.fromisoformat(valor.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def fecha_iso(valor: str) -> Optional[str]:
+    """Fecha normalizada a isoformat() o None si no se puede parsear"""
+    dt = parsear_fecha(valor)
+    return dt.isoformat() if dt else None
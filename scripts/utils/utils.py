@@ -5,13 +5,16 @@ Funciones comunes de web scraping y guardado de datos
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List
 
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from pipeline_tracer import trazar
+
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)"}
 
 
@@ -28,8 +31,10 @@ def get_full_text(url: str, max_paragraphs: int = 10, max_chars: int = 5000) ->
         Texto completo del artículo
     """
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
+        with trazar("http.full_text", "http") as span:
+            resp = requests.get(url, headers=HEADERS, timeout=10)
+            span.registrar_respuesta(resp)
+            resp.raise_for_status()
 
         soup = BeautifulSoup(resp.content, "html.parser")
 
@@ -53,19 +58,33 @@ def get_full_text(url: str, max_paragraphs: int = 10, max_chars: int = 5000) ->
         return "Texto no disponible"
 
 
-def save_articles(articles: List[Dict], prefix: str, output_dir: str = None) -> tuple:
+def save_articles(
+    articles: List[Dict], prefix: str, output_dir: str = None, exportar: bool = False
+) -> tuple:
     """
-    Guarda artículos en formato JSON y CSV
+    Guarda artículos en el almacén de artículos (SQLite append-only) y,
+    opcionalmente, exporta la descarga a JSON y CSV
 
     Args:
         articles: Lista de artículos a guardar
-        prefix: Prefijo para los nombres de archivo
-        output_dir: Directorio de salida. Si es None, usa el directorio raíz del sitio
+        prefix: Prefijo del lote y de los nombres de archivo exportados
+        output_dir: Directorio de los archivos exportados. Si es None, usa el directorio raíz del sitio
+        exportar: Si True, escribe además {prefix}_{timestamp}.json y .csv
 
     Returns:
-        Tupla con (ruta_json, ruta_csv)
+        Tupla con (ruta_almacen, ruta_json, ruta_csv); las rutas exportadas son None si no se exporta
     """
+    from article_store import ArticleStore
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+
+    with ArticleStore() as store:
+        store.agregar(articles, lote=f"{prefix}_{timestamp}")
+        ruta_almacen = str(store.db_path)
+
+    if not exportar:
+        return ruta_almacen, None, None
+
     if output_dir is None:
         # Si no se especifica output_dir, usar el directorio raíz del sitio
         # Buscar el último sitio generado
@@ -89,11 +108,13 @@ def save_articles(articles: List[Dict], prefix: str, output_dir: str = None) ->
     with open(json_file, "w", encoding="utf-8") as f:
         json.dump(articles, f, ensure_ascii=False, indent=2)
 
-    # Guardar CSV
+    # Guardar CSV (pandas solo hace falta para exportar)
+    import pandas as pd
+
     df = pd.DataFrame(articles)
     df.to_csv(csv_file, index=False, encoding="utf-8")
 
-    return json_file, csv_file
+    return ruta_almacen, json_file, csv_file
 
 
 def normalize_article(article: Dict, source: str) -> Dict:
@@ -180,55 +201,75 @@ def normalize_article(article: Dict, source: str) -> Dict:
     return normalized
 
 
-def enrich_with_full_text(
-    articles: List[Dict], source: str, verbose: bool = True
+def completar_texto_completo(
+    articles: List[Dict], verbose: bool = True, max_workers: int = 8
 ) -> List[Dict]:
     """
-    Enriquece artículos con texto completo extraído
+    Extrae en paralelo el texto completo de los artículos ya normalizados
+    que no lo traen (modifica los artículos en sitio)
 
     Args:
-        articles: Lista de artículos
-        source: Nombre de la fuente
+        articles: Artículos normalizados
         verbose: Mostrar progreso
+        max_workers: Descargas simultáneas
 
     Returns:
-        Lista de artículos enriquecidos
+        La misma lista de artículos
     """
-    enriched = []
-    total = len(articles)
+    pendientes = [a for a in articles if not a.get("full_text") and a.get("url")]
+    if not pendientes:
+        return articles
+
+    total = len(pendientes)
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        futures = {executor.submit(get_full_text, a["url"]): a for a in pendientes}
+        for idx, future in enumerate(as_completed(futures), 1):
+            article = futures[future]
+            article["full_text"] = future.result()
+            if verbose:
+                print(
+                    f"  [{idx}/{total}] Extraído: {article.get('title', 'Sin título')[:60]}..."
+                )
 
-    for idx, article in enumerate(articles, 1):
-        if verbose:
-            print(
-                f"  [{idx}/{total}] Extrayendo: {article.get('title', 'Sin título')[:60]}..."
-            )
+    return articles
 
-        # Normalizar artículo
-        normalized = normalize_article(article, source)
 
-        # Si no tiene full_text, intentar extraerlo
-        if not normalized["full_text"] and normalized["url"]:
-            normalized["full_text"] = get_full_text(normalized["url"])
+def enrich_with_full_text(
+    articles: List[Dict], source: str, verbose: bool = True, max_workers: int = 8
+) -> List[Dict]:
+    """
+    Enriquece artículos con texto completo extraído
 
-        enriched.append(normalized)
+    Args:
+        articles: Lista de artículos
+        source: Nombre de la fuente
+        verbose: Mostrar progreso
+        max_workers: Descargas simultáneas de texto completo
 
-    return enriched
+    Returns:
+        Lista de artículos enriquecidos (mismo orden)
+    """
+    enriched = [normalize_article(article, source) for article in articles]
+    return completar_texto_completo(enriched, verbose=verbose, max_workers=max_workers)
 
 
-def print_summary(articles: List[Dict], source: str, json_file: str, csv_file: str):
+def print_summary(articles: List[Dict], source: str, *rutas: str):
     """
     Imprime resumen de descarga de artículos
 
     Args:
         articles: Lista de artículos
         source: Nombre de la fuente
-        json_file: Ruta del archivo JSON
-        csv_file: Ruta del archivo CSV
+        *rutas: Rutas retornadas por save_articles (las None se omiten)
     """
+    etiquetas = {".sqlite3": "Almacén", ".json": "JSON", ".csv": "CSV"}
+
     print(f"\n{'=' * 70}")
     print(f"✅ {source.upper()}: Descarga completada")
     print(f"{'=' * 70}")
     print(f"📰 Artículos descargados: {len(articles)}")
-    print(f"💾 JSON: {json_file}")
-    print(f"💾 CSV: {csv_file}")
+    for ruta in rutas:
+        if ruta:
+            etiqueta = etiquetas.get(os.path.splitext(ruta)[1], "Archivo")
+            print(f"💾 {etiqueta}: {ruta}")
     print(f"{'=' * 70}\n")